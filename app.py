@@ -3,9 +3,16 @@ FitPlan AI - 웹 애플리케이션
 Streamlit 기반 개인 맞춤형 운동 플랜 생성 서비스
 """
 
+import time
+from datetime import datetime
+
 import streamlit as st
-import plotly.graph_objects as go
-from fitness_plan_demo import UserProfile, FitnessPlanGenerator
+from fitness_plan_demo import UserProfile, FitnessPlanGenerator, PLAN_CACHE_FILE, build_plan_bundle
+from inbody_charts import inbody_chart
+from plan_cache import PlanCache
+from plan_document import MEAL_TIPS, build_plan_document, load_text, meal_plan_for, start_load_text
+from progress_charts import PROGRESS_METRICS, PROGRESS_RANGES, progress_chart, progress_series, range_start
+from progress_store import PROGRESS_FILE, ProgressStore
 
 # 페이지 설정 (모바일 최적화)
 st.set_page_config(
@@ -15,6 +22,62 @@ st.set_page_config(
     initial_sidebar_state="collapsed"  # 사이드바 기본 접힘
 )
 
+
+@st.cache_resource
+def get_plan_cache():
+    """서버 프로세스 전체에서 공유하는 플랜 캐시 (재시작 시 파일에서 불러옴)"""
+    return PlanCache(filename=PLAN_CACHE_FILE)
+
+
+def build_plan_view(planner, plan_cache=None):
+    """결과 화면에 필요한 계산을 한 번에 수행 (플랜 묶음, 신체 분석, 그래프 값, 권장 무게, 플랜 문서)"""
+    user = planner.user
+    if plan_cache is None:
+        bundle = build_plan_bundle(planner)
+    else:
+        bundle = plan_cache.get_or_create(planner, build_plan_bundle)
+        plan_cache.save()
+    
+    return {
+        "bundle": bundle,
+        "nutrition": planner.get_nutrition_targets(),
+        "analysis": user.analyze_body_composition(),
+        "bmi": user.weight / ((user.height / 100) ** 2),
+        "body_fat": user.body_fat_percentage,
+        "muscle_ratio": (user.skeletal_muscle_mass / user.weight) * 100,
+        "document": build_plan_document(planner, bundle),
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_plan_view(plan_key, _planner):
+    """입력값(plan_key)별로 캐시된 build_plan_view 결과 - 탭 전환/펼치기 시 재계산하지 않음"""
+    return build_plan_view(_planner, get_plan_cache())
+
+
+@st.cache_resource(show_spinner=False, max_entries=512)
+def create_inbody_chart(gender, metric, value):
+    """사용자별 인바디 그래프 (성별/지표/값별로 캐시, 공유 객체이므로 수정하지 마세요)"""
+    return inbody_chart(gender, metric, value)
+
+
+@st.cache_resource
+def get_progress_store():
+    """서버 프로세스 전체에서 공유하는 측정 기록 저장소"""
+    return ProgressStore(PROGRESS_FILE)
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def create_progress_chart(nickname, metric, range_label, max_points, version, gender, height):
+    """(프로필, 기간, 해상도)별 추세 그래프 - version(기록 수, 마지막 시각)이 바뀌면 새로 생성
+    
+    기록이 아무리 많아도 max_points개 이하로 줄여 보내므로 그래프 크기가 일정합니다.
+    """
+    series = get_progress_store().series(nickname)
+    times, values = progress_series(series, metric, PROGRESS_RANGES[range_label])
+    return progress_chart(gender, metric, times, values, max_points, height)
+
+
 # 커스텀 CSS (모바일 최적화)
 st.markdown("""
     <style>
@@ -380,8 +443,9 @@ if not st.session_state.plan_generated or st.session_state.show_input_form:
                 st.session_state.planner = planner
                 st.session_state.pain_areas = pain_areas
                 st.session_state.health_conditions = health_conditions
-                st.session_state.recommendations = planner.recommend_goal()
-                st.session_state.weekly_plan = planner.generate_weekly_plan()
+                # 같은 입력의 플랜은 캐시에서 재사용
+                st.session_state.plan_key = PlanCache.make_key(planner)
+                cached_plan_view(st.session_state.plan_key, planner)
                 st.session_state.plan_generated = True
                 st.session_state.show_input_form = False
                 
@@ -411,18 +475,34 @@ else:
     st.markdown("---")
     user = st.session_state.user_profile
     planner = st.session_state.planner
-    recommendations = st.session_state.recommendations
-    weekly_plan = st.session_state.weekly_plan
+    
+    # 성능 디버그: 재실행마다 계산에 걸린 시간 표시 (캐시 사용/미사용 비교)
+    debug_mode = st.sidebar.toggle("🛠 성능 디버그", key="debug_mode")
+    bypass_cache = debug_mode and st.sidebar.toggle("캐시 사용 안 함", key="debug_bypass_cache")
+    compute_started = time.perf_counter()
+    
+    if bypass_cache:
+        view = build_plan_view(planner)
+    else:
+        view = cached_plan_view(st.session_state.plan_key, planner)
+    bundle = view["bundle"]
+    recommendations = bundle["recommendations"]
+    weekly_plan = bundle["weekly_plan"]
+    chart_builder = create_inbody_chart.__wrapped__ if bypass_cache else create_inbody_chart
+    progress_chart_builder = create_progress_chart.__wrapped__ if bypass_cache else create_progress_chart
+    compute_seconds = time.perf_counter() - compute_started
     
     # 탭 생성
     tabs = ["📊 신체 분석", "💪 운동 플랜", "🍎 영양 가이드", "🍽️ 예시 식단"]
     if st.session_state.pain_areas:
         tabs.append("⚠️ 통증 주의사항")
+    tabs.append("📈 진행 상황")
     
     tab_objects = st.tabs(tabs)
     tab1, tab2, tab3, tab4 = tab_objects[:4]
-    if len(tab_objects) > 4:
+    if len(tab_objects) > 5:
         tab5 = tab_objects[4]
+    tab_progress = tab_objects[-1]
     
     with tab1:
         st.header("📊 신체 구성 분석")
@@ -442,7 +522,7 @@ else:
         st.markdown("---")
         
         # 분석 결과
-        analysis = user.analyze_body_composition()
+        analysis = view["analysis"]
         st.subheader("분석 결과")
         
         # BMI
@@ -480,108 +560,33 @@ else:
         st.subheader("📈 체성분 분석 그래프 (InBody 스타일)")
         
         # 데이터 준비
-        bmi = user.weight / ((user.height / 100) ** 2)
-        body_fat = user.body_fat_percentage
-        muscle_ratio = (user.skeletal_muscle_mass / user.weight) * 100
+        bmi = view["bmi"]
+        body_fat = view["body_fat"]
+        muscle_ratio = view["muscle_ratio"]
         
-        # 성별에 따른 정상 범위
-        if user.gender == "남성":
-            bmi_ranges = {"낮음": (0, 18.5), "정상": (18.5, 25), "높음": (25, 40)}
-            bf_ranges = {"낮음": (0, 10), "정상": (10, 20), "높음": (20, 50)}
-            muscle_ranges = {"낮음": (0, 37), "정상": (37, 50), "높음": (50, 100)}
-        else:  # 여성
-            bmi_ranges = {"낮음": (0, 18.5), "정상": (18.5, 25), "높음": (25, 40)}
-            bf_ranges = {"낮음": (0, 18), "정상": (18, 28), "높음": (28, 50)}
-            muscle_ranges = {"낮음": (0, 30), "정상": (30, 45), "높음": (45, 100)}
-        
-        # 그래프 생성 함수
-        def create_inbody_chart(value, ranges, title, unit, max_value):
-            fig = go.Figure()
-            
-            # 배경 범위 추가 (낮음 - 노란색, 정상 - 초록색, 높음 - 빨간색)
-            colors = {"낮음": "rgba(255, 193, 7, 0.3)", "정상": "rgba(76, 175, 80, 0.3)", "높음": "rgba(244, 67, 54, 0.3)"}
-            
-            for category, (start, end) in ranges.items():
-                fig.add_trace(go.Bar(
-                    y=[title],
-                    x=[end - start],
-                    base=[start],
-                    orientation='h',
-                    marker=dict(color=colors[category], line=dict(width=0)),
-                    showlegend=False,
-                    hoverinfo='skip'
-                ))
-            
-            # 현재 값 막대
-            bar_color = "rgba(33, 150, 243, 0.8)"  # 파란색
-            if value < ranges["정상"][0]:
-                bar_color = "rgba(255, 152, 0, 0.9)"  # 주황색 (낮음)
-            elif value > ranges["정상"][1]:
-                bar_color = "rgba(244, 67, 54, 0.9)"  # 빨간색 (높음)
-            else:
-                bar_color = "rgba(76, 175, 80, 0.9)"  # 초록색 (정상)
-            
-            fig.add_trace(go.Bar(
-                y=[title],
-                x=[value],
-                orientation='h',
-                marker=dict(color=bar_color, line=dict(width=2, color='white')),
-                text=[f"{value:.1f}{unit}"],
-                textposition='outside',
-                textfont=dict(size=12, color='black', family='Arial Black'),  # 모바일에 맞게 텍스트 크기 축소
-                showlegend=False,
-                hovertemplate=f'<b>{title}</b><br>현재 값: {value:.1f}{unit}<extra></extra>'
-            ))
-            
-            # 레이아웃 설정 (모바일 최적화)
-            fig.update_layout(
-                title=dict(
-                    text=f"<b>{title}</b>",
-                    font=dict(size=14, color='#333'),
-                    x=0.01,
-                    xanchor='left',
-                    y=0.95,
-                    yanchor='top'
-                ),
-                barmode='overlay',
-                height=120,  # 제목 공간을 위해 높이 약간 증가
-                margin=dict(l=5, r=5, t=30, b=5),  # 상단 여백 증가
-                xaxis=dict(
-                    range=[0, max_value],
-                    showgrid=True,
-                    gridcolor='lightgray',
-                    zeroline=False,
-                    showticklabels=True,
-                    tickfont=dict(size=9)
-                ),
-                yaxis=dict(
-                    showticklabels=False,
-                    showgrid=False
-                ),
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family='Arial', size=11)
-            )
-            
-            return fig
+        chart_started = time.perf_counter()
+        bmi_chart = chart_builder(user.gender, "bmi", bmi)
+        bf_chart = chart_builder(user.gender, "body_fat", body_fat)
+        muscle_chart = chart_builder(user.gender, "muscle_ratio", muscle_ratio)
+        compute_seconds += time.perf_counter() - chart_started
         
         # BMI 그래프
         st.plotly_chart(
-            create_inbody_chart(bmi, bmi_ranges, "BMI (체질량지수)", "", 40),
+            bmi_chart,
             use_container_width=True,
             config={'displayModeBar': False}
         )
         
         # 체지방률 그래프
         st.plotly_chart(
-            create_inbody_chart(body_fat, bf_ranges, "체지방률", "%", 50),
+            bf_chart,
             use_container_width=True,
             config={'displayModeBar': False}
         )
         
         # 골격근 비율 그래프
         st.plotly_chart(
-            create_inbody_chart(muscle_ratio, muscle_ranges, "골격근 비율", "%", 100),
+            muscle_chart,
             use_container_width=True,
             config={'displayModeBar': False}
         )
@@ -613,7 +618,7 @@ else:
             st.markdown("---")
             st.subheader("⚠️ 건강 상태별 운동 주의사항")
             
-            precautions = planner.get_medical_precautions()
+            precautions = bundle["medical_precautions"]
             
             for condition in st.session_state.health_conditions:
                 if condition in precautions:
@@ -698,11 +703,13 @@ else:
                 for idx, exercise in enumerate(large_muscle_exercises, 1):
                     st.write(f"**{idx}. {exercise['이름']}**")
                     
-                    # 권장 무게 가져오기
-                    weights = planner.get_weight_recommendation(exercise['이름'])
+                    # 권장 무게 (플랜 생성 시 계산된 필드)
+                    weights = exercise.get("무게")
                     if weights:
                         st.write(f"   - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
-                        st.caption(f"      💡 권장 무게: 초급 {weights['초급']}kg / 중급 {weights['중급']}kg / 고급 {weights['고급']}kg")
+                        st.caption(f"      {load_text(weights)}")
+                        if "시작_무게" in exercise:
+                            st.caption(f"      {start_load_text(exercise['시작_무게'])}")
                     else:
                         st.write(f"   - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
                     st.write("")
@@ -713,11 +720,13 @@ else:
                 for idx, exercise in enumerate(small_muscle_exercises, 1):
                     st.write(f"**{idx}. {exercise['이름']}**")
                     
-                    # 권장 무게 가져오기
-                    weights = planner.get_weight_recommendation(exercise['이름'])
+                    # 권장 무게 (플랜 생성 시 계산된 필드)
+                    weights = exercise.get("무게")
                     if weights:
                         st.write(f"   - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
-                        st.caption(f"      💡 권장 무게: 초급 {weights['초급']}kg / 중급 {weights['중급']}kg / 고급 {weights['고급']}kg")
+                        st.caption(f"      {load_text(weights)}")
+                        if "시작_무게" in exercise:
+                            st.caption(f"      {start_load_text(exercise['시작_무게'])}")
                     else:
                         st.write(f"   - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
                     st.write("")
@@ -727,10 +736,12 @@ else:
                 for exercise in day_plan['운동']:
                     if "횟수" in exercise:
                         st.write(f"✓ **{exercise['이름']}**")
-                        weights = planner.get_weight_recommendation(exercise['이름'])
+                        weights = exercise.get("무게")
                         if weights:
                             st.write(f"   - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
-                            st.caption(f"      💡 권장 무게: 초급 {weights['초급']}kg / 중급 {weights['중급']}kg / 고급 {weights['고급']}kg")
+                            st.caption(f"      {load_text(weights)}")
+                            if "시작_무게" in exercise:
+                                st.caption(f"      {start_load_text(exercise['시작_무게'])}")
                         else:
                             st.write(f"   - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
                     elif "시간" in exercise and "라운드" in exercise:
@@ -753,11 +764,12 @@ else:
             
             for exercise in day_plan['운동']:
                 exercise_name = exercise['이름']
-                # FitnessPlanGenerator의 EXERCISE_VIDEOS에서 링크 가져오기
-                if exercise_name in planner.EXERCISE_VIDEOS:
+                # 이름 색인으로 변형/별칭 이름까지 EXERCISE_VIDEOS 링크 찾기
+                video_url = planner.get_exercise_video(exercise_name)
+                if video_url:
                     exercise_videos.append({
                         'name': exercise_name,
-                        'url': planner.EXERCISE_VIDEOS[exercise_name]
+                        'url': video_url
                     })
             
             if exercise_videos:
@@ -775,7 +787,7 @@ else:
             
             # 3️⃣ 유산소 운동
             st.markdown("### 3️⃣ 유산소 운동 (20-30분)")
-            cardio = planner.get_cardio_details()
+            cardio = bundle["cardio"]
             st.write(f"""
             **🏃 {cardio['유형']}**
             - 권장 시간: {cardio['권장_시간']}
@@ -801,7 +813,7 @@ else:
         st.markdown("---")
         st.subheader("🏃 유산소 운동 가이드")
         
-        cardio = planner.get_cardio_details()
+        cardio = bundle["cardio"]
         
         # 런닝머신 기준 운동 강도 추출
         equipment_details = cardio.get('기구별_상세설정', {})
@@ -915,11 +927,13 @@ else:
                         if "횟수" in exercise:
                             st.write(f"✓ **{exercise['이름']}**")
                             
-                            # 권장 무게 가져오기
-                            weights = planner.get_weight_recommendation(exercise['이름'])
+                            # 권장 무게 (플랜 생성 시 계산된 필드)
+                            weights = exercise.get("무게")
                             if weights:
                                 st.write(f"   - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
-                                st.caption(f"      💡 권장 무게: 초급 {weights['초급']}kg / 중급 {weights['중급']}kg / 고급 {weights['고급']}kg")
+                                st.caption(f"      {load_text(weights)}")
+                                if "시작_무게" in exercise:
+                                    st.caption(f"      {start_load_text(exercise['시작_무게'])}")
                             else:
                                 st.write(f"   - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
                                 
@@ -998,81 +1012,40 @@ else:
     with tab3:
         st.header("🍎 맞춤 영양 가이드")
         
-        # BMR, TDEE 계산
+        # BMR, TDEE, 목표 칼로리 (프로필/목표/빈도별 캐시된 계산)
+        nutrition = view["nutrition"]
         weight = user.weight
-        height = user.height
-        age = user.age
-        
-        if user.gender == "남성":
-            bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
-        else:
-            bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
-        
-        activity_multipliers = {3: 1.375, 4: 1.55, 5: 1.725, 6: 1.9, 7: 1.9}
-        tdee = bmr * activity_multipliers.get(planner.frequency, 1.55)
-        
-        # 목표에 따른 칼로리 조정
-        if "체중 감량" in planner.goal and "근육 증가" not in planner.goal:
-            target_cal = tdee - 500
-            calorie_note = "체중 감량을 위한 칼로리 적자"
-        elif "근육 증가" in planner.goal and "체중 감량" not in planner.goal:
-            target_cal = tdee + 300
-            calorie_note = "근육 증가를 위한 칼로리 흑자"
-        elif "체중 감량 + 근육 증가" in planner.goal:
-            target_cal = tdee - 200
-            calorie_note = "바디 리컴포지션"
-        else:
-            target_cal = tdee
-            calorie_note = "체중 유지"
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("기초 대사량 (BMR)", f"{int(bmr)} kcal/일")
+            st.metric("기초 대사량 (BMR)", f"{int(nutrition.bmr)} kcal/일")
         with col2:
-            st.metric("총 에너지 소비 (TDEE)", f"{int(tdee)} kcal/일")
+            st.metric("총 에너지 소비 (TDEE)", f"{int(nutrition.tdee)} kcal/일")
         with col3:
-            st.metric("목표 섭취 칼로리", f"{int(target_cal)} kcal/일")
+            st.metric("목표 섭취 칼로리", f"{int(nutrition.target_calories)} kcal/일")
         
-        st.info(f"**💡 {calorie_note}**")
+        st.info(f"**💡 {nutrition.calorie_note}**")
         
         st.markdown("---")
         
-        # 영양소 비율
-        if "근육 증가" in planner.goal:
-            protein_min = weight * 1.8
-            protein_max = weight * 2.2
-        else:
-            protein_min = weight * 1.6
-            protein_max = weight * 2.0
-        
-        if "체중 감량" in planner.goal:
-            carb_ratio = 2.0
-            fat_ratio = 0.8
-        elif "근육 증가" in planner.goal:
-            carb_ratio = 4.0
-            fat_ratio = 1.0
-        else:
-            carb_ratio = 3.0
-            fat_ratio = 0.9
-        
         st.subheader("🥗 영양소 비율")
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("단백질", f"{round(protein_min, 1)}-{round(protein_max, 1)}g/일")
-            st.caption(f"체중 1kg당 {round(protein_min/weight, 1)}-{round(protein_max/weight, 1)}g")
+            st.metric("단백질", f"{round(nutrition.protein_min, 1)}-{round(nutrition.protein_max, 1)}g/일")
+            st.caption(f"체중 1kg당 {round(nutrition.protein_min/weight, 1)}-{round(nutrition.protein_max/weight, 1)}g")
         
         with col2:
-            st.metric("탄수화물", f"{round(weight * carb_ratio, 1)}-{round(weight * (carb_ratio + 0.5), 1)}g/일")
+            st.metric("탄수화물", f"{round(nutrition.carb_min, 1)}-{round(nutrition.carb_max, 1)}g/일")
         
         with col3:
-            st.metric("지방", f"{round(weight * fat_ratio, 1)}-{round(weight * (fat_ratio + 0.2), 1)}g/일")
+            st.metric("지방", f"{round(nutrition.fat_min, 1)}-{round(nutrition.fat_max, 1)}g/일")
         
         st.markdown("---")
         
-        st.metric("💧 수분 섭취", f"최소 {round(weight * 0.035, 1)}L/일")
+        st.metric("💧 수분 섭취", f"최소 {round(nutrition.water_liters, 1)}L/일")
         st.caption("체중 1kg당 35ml")
         
         # 영양 팁
@@ -1094,227 +1067,39 @@ else:
     with tab4:
         st.header("🍽️ 예시 식단")
         
-        # 목표에 따른 칼로리 계산
-        weight = user.weight
-        height = user.height
-        age = user.age
-        gender = user.gender
-        
-        if gender == "남성":
-            bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
-        else:
-            bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
-        
-        activity_multipliers = {3: 1.375, 4: 1.55, 5: 1.725, 6: 1.9, 7: 1.9}
-        tdee = bmr * activity_multipliers.get(frequency, 1.55)
-        
-        if "체중 감량" in goal and "근육 증가" not in goal:
-            target_cal = tdee - 500
-            meal_type = "체중 감량"
-        elif "근육 증가" in goal and "체중 감량" not in goal:
-            target_cal = tdee + 300
-            meal_type = "근육 증가"
-        elif "체중 감량 + 근육 증가" in goal:
-            target_cal = tdee - 200
-            meal_type = "체중 감량 + 근육 증가"
-        else:
-            target_cal = tdee
-            meal_type = "체중 유지"
+        # 목표에 따른 칼로리 (영양 가이드 탭과 같은 캐시된 계산 재사용)
+        nutrition = view["nutrition"]
+        meal_type = nutrition.meal_type
+        target_cal = nutrition.target_calories
         
         st.info(f"""
         **🎯 목표:** {meal_type}  
         **📊 목표 칼로리:** 약 {int(target_cal)}kcal/일
         """)
         
-        # 목표에 따른 식단 표시
-        if meal_type == "체중 감량":
-            st.subheader("예시 하루 식단 (체중 감량)")
-            
-            with st.expander("🌅 아침 (약 400kcal)", expanded=True):
-                st.markdown("""
-                - 현미밥 1/2공기 (150kcal)
-                - 계란 2개 (삶은 계란 또는 스크램블) (140kcal)
-                - 김치찌개 1인분 (80kcal)
-                - 샐러드 (오이, 토마토, 양상추) (30kcal)
-                
-                **➜ 단백질 20g, 탄수화물 45g, 지방 8g**
-                """)
-            
-            with st.expander("☀️ 점심 (약 500kcal)"):
-                st.markdown("""
-                - 닭가슴살 샐러드 200g (200kcal)
-                - 고구마 중 1개 (150g) (150kcal)
-                - 브로콜리 100g (30kcal)
-                - 올리브유 드레싱 1스푼 (120kcal)
-                
-                **➜ 단백질 35g, 탄수화물 40g, 지방 14g**
-                """)
-            
-            with st.expander("🌙 저녁 (약 450kcal)"):
-                st.markdown("""
-                - 현미밥 1/2공기 (150kcal)
-                - 생선구이 (고등어 또는 연어) 150g (250kcal)
-                - 된장찌개 1인분 (50kcal)
-                
-                **➜ 단백질 30g, 탄수화물 35g, 지방 12g**
-                """)
-            
-            with st.expander("🍎 간식 (약 200kcal)"):
-                st.markdown("""
-                - 그릭요거트 무지방 150g (100kcal)
-                - 아몬드 10알 (70kcal)
-                - 사과 1/2개 (30kcal)
-                
-                **➜ 단백질 12g, 탄수화물 15g, 지방 8g**
-                """)
-            
-            st.success("**📊 하루 총계:** 약 1,550kcal | 단백질: 97g | 탄수화물: 135g | 지방: 42g")
+        # 목표에 따른 식단 표시 (CLI와 같은 식단 표 사용)
+        meal_plan = meal_plan_for(meal_type)
+        st.subheader(f"예시 하루 식단 ({meal_plan['제목']})")
         
-        elif meal_type == "근육 증가":
-            st.subheader("예시 하루 식단 (근육 증가)")
-            
-            with st.expander("🌅 아침 (약 550kcal)", expanded=True):
-                st.markdown("""
-                - 현미밥 1공기 (300kcal)
-                - 계란 3개 (210kcal)
-                - 김치찌개 1인분 (80kcal)
-                
-                **➜ 단백질 28g, 탄수화물 60g, 지방 12g**
-                """)
-            
-            with st.expander("☀️ 점심 (약 700kcal)"):
-                st.markdown("""
-                - 현미밥 1공기 (300kcal)
-                - 닭가슴살 200g (220kcal)
-                - 고구마 중 1개 (150kcal)
-                - 샐러드 (30kcal)
-                
-                **➜ 단백질 50g, 탄수화물 85g, 지방 8g**
-                """)
-            
-            with st.expander("🌙 저녁 (약 650kcal)"):
-                st.markdown("""
-                - 현미밥 1공기 (300kcal)
-                - 소고기 등심 150g (300kcal)
-                - 된장찌개 1인분 (50kcal)
-                
-                **➜ 단백질 40g, 탄수화물 55g, 지방 18g**
-                """)
-            
-            with st.expander("🍎 간식/운동 전후 (약 500kcal)"):
-                st.markdown("""
-                - 단백질 쉐이크 (30g 단백질) (150kcal)
-                - 바나나 2개 (200kcal)
-                - 땅콩버터 2스푼 (150kcal)
-                
-                **➜ 단백질 35g, 탄수화물 55g, 지방 12g**
-                """)
-            
-            st.success("**📊 하루 총계:** 약 2,400kcal | 단백질: 153g | 탄수화물: 255g | 지방: 50g")
+        for idx, (meal, foods, macros) in enumerate(meal_plan["식사"]):
+            with st.expander(meal, expanded=idx == 0):
+                st.markdown("\n".join(f"- {food}" for food in foods) + f"\n\n**➜ {macros}**")
         
-        elif meal_type == "체중 감량 + 근육 증가":
-            st.subheader("예시 하루 식단 (바디 리컴포지션)")
-            
-            with st.expander("🌅 아침 (약 450kcal)", expanded=True):
-                st.markdown("""
-                - 현미밥 2/3공기 (200kcal)
-                - 계란 2개 + 계란흰자 2개 (160kcal)
-                - 김치찌개 1인분 (80kcal)
-                - 방울토마토 10개 (10kcal)
-                
-                **➜ 단백질 25g, 탄수화물 50g, 지방 10g**
-                """)
-            
-            with st.expander("☀️ 점심 (약 550kcal)"):
-                st.markdown("""
-                - 현미밥 2/3공기 (200kcal)
-                - 닭가슴살 150g (165kcal)
-                - 고구마 중 1개 (150kcal)
-                - 샐러드 + 발사믹 드레싱 (35kcal)
-                
-                **➜ 단백질 40g, 탄수화물 65g, 지방 6g**
-                """)
-            
-            with st.expander("🌙 저녁 (약 500kcal)"):
-                st.markdown("""
-                - 현미밥 2/3공기 (200kcal)
-                - 생선구이 (연어) 150g (250kcal)
-                - 된장찌개 1인분 (50kcal)
-                
-                **➜ 단백질 35g, 탄수화물 45g, 지방 14g**
-                """)
-            
-            with st.expander("🍎 간식 (약 300kcal)"):
-                st.markdown("""
-                - 그릭요거트 무지방 200g (130kcal)
-                - 프로틴바 1개 (150kcal)
-                - 블루베리 한줌 (20kcal)
-                
-                **➜ 단백질 25g, 탄수화물 25g, 지방 8g**
-                """)
-            
-            st.success("**📊 하루 총계:** 약 1,800kcal | 단백질: 125g | 탄수화물: 185g | 지방: 38g")
-        
-        else:  # 체중 유지
-            st.subheader("예시 하루 식단 (체중 유지 / 건강 관리)")
-            
-            with st.expander("🌅 아침 (약 500kcal)", expanded=True):
-                st.markdown("""
-                - 현미밥 1공기 (300kcal)
-                - 계란 2개 (140kcal)
-                - 김치찌개 1인분 (80kcal)
-                
-                **➜ 단백질 22g, 탄수화물 55g, 지방 10g**
-                """)
-            
-            with st.expander("☀️ 점심 (약 600kcal)"):
-                st.markdown("""
-                - 현미밥 1공기 (300kcal)
-                - 닭가슴살 150g 또는 두부 1모 (180kcal)
-                - 고구마 작은것 1개 (100kcal)
-                - 샐러드 (20kcal)
-                
-                **➜ 단백질 35g, 탄수화물 75g, 지방 8g**
-                """)
-            
-            with st.expander("🌙 저녁 (약 550kcal)"):
-                st.markdown("""
-                - 현미밥 1공기 (300kcal)
-                - 생선 또는 고기 150g (200kcal)
-                - 된장찌개 1인분 (50kcal)
-                
-                **➜ 단백질 35g, 탄수화물 50g, 지방 12g**
-                """)
-            
-            with st.expander("🍎 간식 (약 250kcal)"):
-                st.markdown("""
-                - 과일 (바나나, 사과 등) (100kcal)
-                - 견과류 한줌 (100kcal)
-                - 우유 200ml (50kcal)
-                
-                **➜ 단백질 10g, 탄수화물 30g, 지방 10g**
-                """)
-            
-            st.success("**📊 하루 총계:** 약 1,900kcal | 단백질: 102g | 탄수화물: 210g | 지방: 40g")
+        st.success(f"**📊 하루 총계:** {meal_plan['총계']} | {meal_plan['영양소']}")
         
         st.markdown("---")
         st.subheader("💡 식단 팁")
-        st.info("""
-        - 위 식단은 예시이며, 개인 취향에 맞게 조절하세요
-        - 비슷한 영양소를 가진 음식으로 대체 가능합니다
-        - 물은 하루 2-2.5L 이상 충분히 섭취하세요
-        - 가공식품과 설탕 섭취를 줄이세요
-        - 식사 시간은 일정하게 유지하는 것이 좋습니다
-        """)
+        st.info("\n".join(f"- {tip}" for tip in MEAL_TIPS))
     
     # 통증 주의사항 탭 (통증이 있을 경우에만)
-    if st.session_state.pain_areas and len(tab_objects) > 4:
+    if st.session_state.pain_areas and len(tab_objects) > 5:
         with tab5:
             st.header("⚠️ 통증 부위 주의사항 및 재활 운동")
             
             st.warning(f"**통증 부위:** {', '.join(st.session_state.pain_areas)}")
             
-            modifications, rehab_exercises = planner.get_pain_modifications()
+            modifications = bundle["pain_modifications"]
+            rehab_exercises = bundle["rehab_exercises"]
             
             for area in st.session_state.pain_areas:
                 if area in modifications:
@@ -1362,22 +1147,75 @@ else:
             - 호전되면 점진적으로 강도를 높이세요
             """)
     
+    # 진행 상황 탭 (측정 기록 추세)
+    with tab_progress:
+        st.header("📈 진행 상황")
+        
+        progress_store = get_progress_store()
+        nickname = st.text_input("별명", key="progress_nickname", placeholder="측정 기록을 저장/조회할 별명").strip()
+        
+        if nickname:
+            if st.button("📝 현재 신체 정보 기록", use_container_width=True, key="progress_record"):
+                progress_store.add(
+                    nickname, datetime.now().replace(microsecond=0),
+                    weight=user.weight,
+                    body_fat_percentage=user.body_fat_percentage,
+                    skeletal_muscle_mass=user.skeletal_muscle_mass
+                )
+                progress_store.save()
+                st.success("✅ 오늘의 측정값이 기록되었습니다.")
+            
+            series = progress_store.series(nickname)
+            if series is None:
+                st.info("아직 측정 기록이 없습니다. 위 버튼으로 현재 신체 정보를 기록하세요.")
+            else:
+                col_range, col_points = st.columns(2)
+                with col_range:
+                    range_label = st.selectbox("기간", list(PROGRESS_RANGES), index=1, key="progress_range")
+                with col_points:
+                    max_points = st.selectbox("그래프 해상도", [100, 200, 400], index=1,
+                                              format_func=lambda n: f"최대 {n}개 점", key="progress_points")
+                
+                trend = series.trend("weight", range_start(series, PROGRESS_RANGES[range_label]))
+                st.metric("체중 추세", f"{trend:+.2f}kg/주" if trend is not None else "기록 부족")
+                
+                chart_started = time.perf_counter()
+                version = (len(series), series.times[-1])
+                progress_figures = [
+                    progress_chart_builder(nickname, metric, range_label, max_points, version, user.gender, user.height)
+                    for metric in PROGRESS_METRICS
+                ]
+                compute_seconds += time.perf_counter() - chart_started
+                
+                for fig in progress_figures:
+                    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+                st.caption(f"🟨 낮음  |  🟩 정상  |  🟥 높음  ·  측정 {len(series)}회")
+    
+    if debug_mode:
+        st.sidebar.metric("이번 실행 계산 시간", f"{compute_seconds * 1000:.2f}ms")
+        st.sidebar.caption("캐시 사용 안 함" if bypass_cache else "캐시 사용 중 (st.cache_data)")
+        st.sidebar.json(get_plan_cache().stats())
+    
     # 하단 버튼 (모바일 최적화 - 세로 배치)
     st.markdown("---")
     
-    if st.button("✏️ 정보 수정", use_container_width=True):
+    if st.button("✏️ 정보 수정", use_container_width=True, key="edit_bottom"):
         st.session_state.plan_generated = False
         st.rerun()
     
-    if st.button("🔄 완전 초기화", use_container_width=True, type="primary"):
+    if st.button("🔄 완전 초기화", use_container_width=True, type="primary", key="reset_bottom"):
         # 모든 세션 상태 초기화
         for key in list(st.session_state.keys()):
             del st.session_state[key]
         st.success("✅ 모든 정보가 초기화되었습니다. 새로운 사용자로 시작하세요!")
         st.rerun()
     
-    # PDF 다운로드 기능은 추후 구현
-    st.button("💾 플랜 저장 (준비 중)", use_container_width=True, disabled=True)
+    # 플랜 저장 (결과 화면과 같은 플랜 문서를 Markdown/HTML로 렌더링)
+    document = view["document"]
+    st.download_button("💾 플랜 저장 (Markdown)", document.render("markdown"), file_name="fitplan.md",
+                       mime="text/markdown", use_container_width=True, key="download_markdown")
+    st.download_button("🌐 플랜 저장 (HTML)", document.render("html"), file_name="fitplan.html",
+                       mime="text/html", use_container_width=True, key="download_html")
 
 # 푸터 (모바일 최적화)
 st.markdown("---")
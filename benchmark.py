@@ -0,0 +1,811 @@
+"""
+FitPlan AI - 성능 측정 스크립트
+사용법: python benchmark.py <항목> [--rows N]
+"""
+
+import argparse
+import random
+import sys
+import io
+import time
+
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def _random_profiles(rows, seed=42):
+    """벤치마크용 임의 프로필 생성 (체지방률/골격근량은 일부만 입력)"""
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(rows):
+        profiles.append({
+            "height": round(rng.uniform(145, 200), 1),
+            "weight": round(rng.uniform(40, 140), 1),
+            "age": rng.randint(15, 90),
+            "gender": rng.choice(["남성", "여성"]),
+            "body_fat_percentage": round(rng.uniform(5, 50), 1) if rng.random() < 0.3 else None,
+            "skeletal_muscle_mass": round(rng.uniform(15, 50), 1) if rng.random() < 0.3 else None,
+        })
+    return profiles
+
+
+def _report(label, seconds, rows):
+    """소요 시간과 처리량 출력"""
+    print(f"  {label:28} {seconds * 1000:10.1f}ms  ({rows / seconds:,.0f} rows/sec)")
+
+
+def bench_body_composition(rows):
+    """UserProfile 스칼라 계산 vs BodyCompositionFrame 벡터 계산"""
+    from fitness_plan_demo import UserProfile
+    import numpy as np
+    from body_composition import BodyCompositionFrame
+
+    profiles = _random_profiles(rows)
+
+    started = time.perf_counter()
+    scalar = []
+    for p in profiles:
+        user = UserProfile(**p)
+        scalar.append((
+            user.calculate_bmi(),
+            user.body_fat_percentage,
+            user.skeletal_muscle_mass,
+            user.calculate_lean_body_mass(),
+            round((user.skeletal_muscle_mass / user.weight) * 100, 2),
+            user.get_bmi_category(),
+            user.get_body_fat_category(),
+        ))
+    scalar_seconds = time.perf_counter() - started
+
+    # 분석 파이프라인은 보통 컬럼 배열을 이미 갖고 있으므로 변환은 측정에서 제외
+    columns = {key: np.array([p[key] for p in profiles], dtype=object if key == "gender" else np.float64)
+               for key in profiles[0]}
+    columns["gender"] = columns["gender"].astype(str)
+    started = time.perf_counter()
+    frame = BodyCompositionFrame(**columns)
+    vector_seconds = time.perf_counter() - started
+
+    bmi_labels = frame.bmi_category_labels()
+    bf_labels = frame.body_fat_category_labels()
+    mismatches = 0
+    for i, expected in enumerate(scalar):
+        actual = (
+            frame.bmi[i],
+            frame.body_fat_percentage[i],
+            frame.skeletal_muscle_mass[i],
+            frame.lean_body_mass[i],
+            frame.muscle_ratio[i],
+            bmi_labels[i],
+            bf_labels[i],
+        )
+        if tuple(actual) != expected:
+            mismatches += 1
+
+    print(f"\n📊 신체 구성 분석 ({rows:,}명)")
+    _report("UserProfile (스칼라)", scalar_seconds, rows)
+    _report("BodyCompositionFrame (벡터)", vector_seconds, rows)
+    print(f"  속도 향상: {scalar_seconds / vector_seconds:.1f}배, 불일치: {mismatches}건")
+
+
+def bench_load_tables(rows):
+    """플랜 rows개의 운동별 권장 무게: 운동마다 조회 vs 플랜 단위 벡터 계산 vs 전체 사용자 한 번에"""
+    import numpy as np
+    from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+    from load_tables import exercise_ids, plan_loads, recommend_loads
+
+    rng = random.Random(21)
+    environments = ["헬스장", "홈트레이닝 (장비 있음)"]
+    planners = [
+        FitnessPlanGenerator(UserProfile(**p), "근육 증가", rng.choice(environments), rng.randint(3, 7), 60)
+        for p in _random_profiles(rows)
+    ]
+    plans = [planner.generate_weekly_plan() for planner in planners]
+
+    started = time.perf_counter()
+    scalar = []
+    for planner, plan in zip(planners, plans):
+        weights = {}
+        for day_plan in plan["주간_계획"]:
+            for exercise in day_plan["운동"]:
+                if exercise["이름"] not in weights:
+                    weights[exercise["이름"]] = planner.get_weight_recommendation(exercise["이름"])
+        scalar.append(weights)
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    per_plan = [plan_loads(planner.user.weight, planner.user.gender, plan) for planner, plan in zip(planners, plans)]
+    plan_seconds = time.perf_counter() - started
+
+    # 같은 운동 목록(템플릿)을 쓰는 사용자를 묶어 한 번에 계산
+    started = time.perf_counter()
+    groups = {}
+    for i, plan in enumerate(plans):
+        names = tuple(dict.fromkeys(e["이름"] for day in plan["주간_계획"] for e in day["운동"]))
+        groups.setdefault(names, []).append(i)
+    batched = 0
+    for names, members in groups.items():
+        loads = recommend_loads(
+            np.array([planners[i].user.weight for i in members]),
+            np.array([planners[i].user.gender for i in members]),
+            exercise_ids(names),
+        )
+        batched += loads.size
+    batch_seconds = time.perf_counter() - started
+
+    # 플랜 한 개를 여러 번 렌더링 (Streamlit 재실행): 렌더링마다 운동별 조회 vs 생성 시 넣은 필드 읽기
+    renders = 10
+    started = time.perf_counter()
+    annotated = [planner.generate_weekly_plan(with_loads=True) for planner in planners]
+    embed_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(renders):
+        for planner, plan in zip(planners, plans):
+            for day_plan in plan["주간_계획"]:
+                for exercise in day_plan["운동"]:
+                    planner.get_weight_recommendation(exercise["이름"])
+    lookup_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(renders):
+        for plan in annotated:
+            for day_plan in plan["주간_계획"]:
+                for exercise in day_plan["운동"]:
+                    exercise.get("무게")
+    field_seconds = time.perf_counter() - started
+
+    print(f"\n⚖️  운동별 권장 무게 ({rows:,}개 플랜)")
+    _report("운동마다 조회", scalar_seconds, rows)
+    _report("플랜 단위 (plan_loads)", plan_seconds, rows)
+    _report(f"템플릿별 일괄 ({len(groups)}개 묶음)", batch_seconds, rows)
+    _report("생성 시 무게 포함 (with_loads)", embed_seconds, rows)
+    _report(f"렌더링 {renders}회 - 운동마다 조회", lookup_seconds, rows)
+    _report(f"렌더링 {renders}회 - 필드 읽기", field_seconds, rows)
+    mismatches = sum(a != b for a, b in zip(scalar, per_plan))
+    mismatches += sum(
+        exercise.get("무게") != weights[exercise["이름"]]
+        for plan, weights in zip(annotated, scalar)
+        for day_plan in plan["주간_계획"]
+        for exercise in day_plan["운동"]
+    )
+    print(f"  계산한 무게 {batched:,}개, 불일치: {mismatches}건")
+
+
+def bench_one_rep_max(rows):
+    """플랜 rows개의 반복 범위별 작업 무게: 운동마다 공식 계산 vs 비율 표 + 플랜 단위 배열 연산"""
+    from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+    import numpy as np
+    from load_tables import LOAD_CATALOG, LOAD_LEVELS, MULTIPLIERS, gender_index, load_id
+    from one_rep_max import working_loads
+
+    rng = random.Random(24)
+    environments = ["헬스장", "홈트레이닝 (장비 있음)"]
+    planners = [
+        FitnessPlanGenerator(UserProfile(**p), "근육 증가", rng.choice(environments), rng.randint(3, 7), 60)
+        for p in _random_profiles(rows)
+    ]
+    plans = [planner.generate_weekly_plan() for planner in planners]
+
+    started = time.perf_counter()
+    scalar = []
+    for planner, plan in zip(planners, plans):
+        days = []
+        for day_plan, day_numbers in zip(plan["주간_계획"], planner.weekly_numbers()):
+            loads = []
+            for exercise, numbers in zip(day_plan["운동"], day_numbers):
+                catalog_id = load_id(exercise["이름"])
+                reps = min(numbers.reps_max, 30)
+                if catalog_id is None or not reps:
+                    loads.append(None)
+                    continue
+                percent = 1.0 if reps == 1 else 1 / (1 + reps / 30)  # Epley
+                multipliers = LOAD_CATALOG[catalog_id][2 + gender_index(planner.user.gender)]
+                loads.append({"반복": numbers.reps_max, **{
+                    level: round(planner.user.weight * m * percent, 1) for level, m in zip(LOAD_LEVELS, multipliers)
+                }})
+            days.append(loads)
+        scalar.append(tuple(days))
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    vector = [planner.get_rep_range_loads("epley") for planner in planners]
+    vector_seconds = time.perf_counter() - started
+
+    # 같은 템플릿(운동/반복 처방)을 쓰는 사용자를 묶어 (사용자, 운동, 3) 배열 한 번으로 계산
+    started = time.perf_counter()
+    groups = {}
+    for i, planner in enumerate(planners):
+        groups.setdefault(planner._template_key(), []).append(i)
+    batched = {}
+    for key, members in groups.items():
+        numbers = [n for day in FitnessPlanGenerator.template_days(*key) for n in day.numbers]
+        weights = np.array([planners[i].user.weight for i in members])
+        genders = np.array([gender_index(planners[i].user.gender) for i in members])
+        one_rep_maxes = weights[:, None, None] * MULTIPLIERS[genders[:, None], FitnessPlanGenerator.template_load_ids(*key)]
+        loads = working_loads(one_rep_maxes, np.array([n.reps_max for n in numbers]), "epley")
+        batched.update(zip(members, loads))
+    batch_seconds = time.perf_counter() - started
+
+    print(f"\n🏋️ 반복 범위별 작업 무게 ({rows:,}개 플랜, Epley)")
+    _report("운동마다 공식 계산", scalar_seconds, rows)
+    _report("비율 표 + 배열 (플랜 단위)", vector_seconds, rows)
+    _report(f"템플릿별 일괄 ({len(groups)}개 묶음)", batch_seconds, rows)
+    mismatches = sum(a != b for a, b in zip(scalar, vector))
+    mismatches += sum(
+        (loads is None) != np.isnan(row[0]) or (loads is not None and [loads[k] for k in LOAD_LEVELS] != row.tolist())
+        for i, plan_loads in enumerate(vector)
+        for loads, row in zip((x for day in plan_loads for x in day), batched[i])
+    )
+    print(f"  불일치: {mismatches}건")
+
+
+def bench_nutrition(rows):
+    """compute_nutrition_targets (스칼라) vs compute_nutrition_targets_batch (벡터)"""
+    import numpy as np
+    from fitness_plan_demo import compute_nutrition_targets
+    from nutrition_batch import BMR_FORMULAS, compute_nutrition_targets_batch
+
+    rng = random.Random(7)
+    profiles = _random_profiles(rows)
+    goals = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+    goal = [rng.choice(goals) for _ in range(rows)]
+    frequency = [rng.randint(3, 7) for _ in range(rows)]
+
+    started = time.perf_counter()
+    scalar = [
+        compute_nutrition_targets.__wrapped__(p["weight"], p["height"], p["age"], p["gender"], g, f)
+        for p, g, f in zip(profiles, goal, frequency)
+    ]
+    scalar_seconds = time.perf_counter() - started
+
+    columns = {
+        "weight": np.array([p["weight"] for p in profiles]),
+        "height": np.array([p["height"] for p in profiles]),
+        "age": np.array([p["age"] for p in profiles]),
+        "gender": np.array([p["gender"] for p in profiles]),
+        "goal": np.array(goal),
+        "frequency": np.array(frequency),
+    }
+    body_fat = np.array([p["body_fat_percentage"] for p in profiles], dtype=np.float64)
+
+    print(f"\n🍎 영양 목표 계산 ({rows:,}명)")
+    _report("스칼라 (Harris-Benedict)", scalar_seconds, rows)
+    for formula in BMR_FORMULAS:
+        started = time.perf_counter()
+        result = compute_nutrition_targets_batch(**columns, formula=formula, body_fat_percentage=body_fat)
+        _report(f"벡터 ({formula})", time.perf_counter() - started, rows)
+        if formula == "harris_benedict":
+            mismatches = sum(
+                1 for i, t in enumerate(scalar)
+                if any(result[field][i] != getattr(t, field) for field in result)
+            )
+    print(f"  Harris-Benedict 불일치: {mismatches}건")
+
+
+def bench_plan_numbers(rows):
+    """플랜 rows개의 주간 운동량 합계: 플랜마다 문구 해석 vs 템플릿에서 미리 계산한 수치"""
+    from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+    from plan_numbers import parse_days, summarize
+
+    rng = random.Random(19)
+    goals = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+    environments = ["헬스장", "홈트레이닝 (장비 있음)", "홈트레이닝 (장비 없음)"]
+    planners = [
+        FitnessPlanGenerator(UserProfile(**p), rng.choice(goals), rng.choice(environments), rng.randint(3, 7), 60)
+        for p in _random_profiles(rows)
+    ]
+    plans = [planner.generate_weekly_plan() for planner in planners]
+
+    started = time.perf_counter()
+    parsed = [summarize(parse_days(plan["주간_계획"])) for plan in plans]
+    parse_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    numbers = [summarize(planner.weekly_numbers()) for planner in planners]
+    numbers_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    summaries = [planner.weekly_volume() for planner in planners]
+    template_seconds = time.perf_counter() - started
+
+    total_sets = sum(summary.sets for summary in summaries)
+    print(f"\n🔢 주간 운동량 합계 ({rows:,}개)")
+    _report("플랜마다 문구 해석", parse_seconds, rows)
+    _report("템플릿 수치 (weekly_numbers)", numbers_seconds, rows)
+    _report("템플릿 합계 (weekly_volume)", template_seconds, rows)
+    mismatches = sum(a != b or b != c for a, b, c in zip(parsed, numbers, summaries))
+    print(f"  플랜당 평균 {total_sets / rows:.1f}세트, 불일치: {mismatches}건")
+
+
+def bench_plan_model(rows):
+    """주간 플랜 rows개를 메모리에 보관할 때 플랜당 메모리/생성 시간 (dict vs WeeklyPlan)"""
+    import tracemalloc
+    from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+    from plan_model import WeeklyPlan
+
+    rng = random.Random(20)
+    goals = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+    environments = ["헬스장", "홈트레이닝 (장비 있음)", "홈트레이닝 (장비 없음)"]
+    planners = [
+        FitnessPlanGenerator(UserProfile(**p), rng.choice(goals), rng.choice(environments), rng.randint(3, 7), 60)
+        for p in _random_profiles(rows)
+    ]
+    for planner in planners[:1000]:
+        planner.generate_weekly_plan(as_model=True)  # 템플릿은 측정에서 제외
+
+    dict_plans = [planner.generate_weekly_plan() for planner in planners]
+    builders = [
+        ("dict (generate_weekly_plan)", lambda: [planner.generate_weekly_plan() for planner in planners]),
+        ("WeeklyPlan (요일 공유)", lambda: [planner.generate_weekly_plan(as_model=True) for planner in planners]),
+        ("WeeklyPlan.from_dict (공유 없음)", lambda: [WeeklyPlan.from_dict(plan) for plan in dict_plans]),
+    ]
+    print(f"\n🧱 주간 플랜 모델 ({rows:,}개)")
+    results = []
+    for label, build in builders:
+        started = time.perf_counter()
+        plans = build()
+        seconds = time.perf_counter() - started
+        del plans
+
+        # tracemalloc은 실행을 느리게 하므로 메모리는 따로 측정
+        tracemalloc.start()
+        plans = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results.append(plans)
+        print(f"  {label:32} {seconds * 1000:9.1f}ms | 플랜당 {current / rows:8,.0f} bytes")
+    mismatches = sum(
+        plan != model.to_dict() or model != rebuilt
+        for plan, model, rebuilt in zip(results[0], results[1], results[2])
+    )
+    print(f"  to_dict 불일치: {mismatches}건")
+
+
+def bench_plan_schema(rows):
+    """플랜 rows/10개를 스키마 문서로 변환 + 직렬화/역직렬화 (표준 json vs orjson)"""
+    import json
+    from fitness_plan_demo import FitnessPlanGenerator, UserProfile, build_plan_bundle
+    import plan_schema
+
+    rng = random.Random(17)
+    goals = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+    environments = ["헬스장", "홈트레이닝 (장비 있음)", "홈트레이닝 (장비 없음)"]
+    count = max(1, rows // 10)
+    planners = [
+        FitnessPlanGenerator(UserProfile(**p), rng.choice(goals), rng.choice(environments), rng.randint(3, 6), 60,
+                             rng.sample(["허리", "무릎", "손목"], rng.randint(0, 2)),
+                             rng.sample(["고혈압", "당뇨병"], rng.randint(0, 1)))
+        for p in _random_profiles(count)
+    ]
+    bundles = [build_plan_bundle(planner) for planner in planners]
+
+    started = time.perf_counter()
+    documents = [plan_schema.plan_to_schema(planner, bundle) for planner, bundle in zip(planners, bundles)]
+    convert_seconds = time.perf_counter() - started
+
+    print(f"\n🧾 플랜 JSON 스키마 ({count:,}개, 기본 백엔드: {plan_schema.JSON_BACKEND})")
+    _report("스키마 변환", convert_seconds, count)
+
+    started = time.perf_counter()
+    size = sum(len(json.dumps(bundle, ensure_ascii=False).encode("utf-8")) for bundle in bundles)
+    _report("기존 묶음 json.dumps", time.perf_counter() - started, count)
+    print(f"  {'':28} 평균 {size / count / 1024:.1f}KB")
+
+    backends = {"json": (lambda document: json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+                         json.loads)}
+    if plan_schema.orjson is not None:
+        backends["orjson"] = (plan_schema.orjson.dumps, plan_schema.orjson.loads)
+    for name, (dumps, loads) in backends.items():
+        started = time.perf_counter()
+        encoded = [dumps(document) for document in documents]
+        _report(f"스키마 {name} 직렬화", time.perf_counter() - started, count)
+        started = time.perf_counter()
+        decoded = [loads(data) for data in encoded]
+        _report(f"스키마 {name} 역직렬화", time.perf_counter() - started, count)
+        mismatches = sum(1 for before, after in zip(documents, decoded) if before != after)
+        print(f"  {'':28} 평균 {sum(map(len, encoded)) / count / 1024:.1f}KB, 불일치: {mismatches}건")
+
+
+def bench_plan_templates(rows):
+    """분할 메서드로 매번 주간 계획 생성 vs 템플릿 복사 (generate_weekly_plan)"""
+    from fitness_plan_demo import FitnessPlanGenerator, UserProfile, get_environment_kind
+
+    rng = random.Random(11)
+    goals = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+    environments = ["헬스장", "홈트레이닝 (장비 있음)", "홈트레이닝 (장비 없음)"]
+    planners = [
+        FitnessPlanGenerator(UserProfile(**p), rng.choice(goals), rng.choice(environments), rng.randint(3, 7), 60)
+        for p in _random_profiles(rows)
+    ]
+
+    def build_without_template(planner):
+        frequency = planner.frequency if planner.frequency in (3, 4, 5) else 6
+        kind = get_environment_kind(planner.environment)
+        is_gym = kind == "gym"
+        has_equipment = kind in ("gym", "equipment")
+        has_cardio = "체중 감량" in planner.goal or "체력" in planner.goal
+        if frequency == 3:
+            return planner._generate_3day_split(is_gym, has_equipment, has_cardio)
+        if frequency == 4:
+            return planner._generate_4day_split(is_gym, has_equipment, planner.rep_tier, has_cardio)
+        if frequency == 5:
+            return planner._generate_5day_split(is_gym, has_equipment, planner.rep_tier, has_cardio)
+        return planner._generate_6day_split(is_gym, has_equipment)
+
+    # 결과를 모아 두면 GC 비용이 측정을 좌우하므로 생성 비용만 측정하고 비교는 따로 수행
+    started = time.perf_counter()
+    for planner in planners:
+        build_without_template(planner)
+    rebuild_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for planner in planners:
+        planner.generate_weekly_plan()
+    template_seconds = time.perf_counter() - started
+
+    mismatches = sum(
+        1 for planner in planners
+        if build_without_template(planner) != planner.generate_weekly_plan()["주간_계획"]
+    )
+    print(f"\n🏋️ 주간 계획 생성 ({rows:,}개)")
+    _report("분할 메서드 (매번 생성)", rebuild_seconds, rows)
+    _report("템플릿 복사", template_seconds, rows)
+    print(f"  플랜당 {rebuild_seconds / rows * 1e6:.1f}µs → {template_seconds / rows * 1e6:.1f}µs, "
+          f"템플릿 {FitnessPlanGenerator.weekly_template.cache_info().currsize}개, 불일치: {mismatches}건")
+
+
+def bench_plate_loading(rows):
+    """권장 무게 rows개를 장비로 만들 수 있는 무게로 맞추기: 매번 원판 조합 계산 vs 미리 만든 표 이진 탐색"""
+    import numpy as np
+    from plate_loading import COMMERCIAL_GYM, LoadingTable, loading_table
+
+    rng = random.Random(23)
+    targets = [round(rng.uniform(20, 200), 1) for _ in range(rows)]
+    naive_rows = max(rows // 100, 1)
+
+    # 표 없이: 질의마다 원판 부분합을 다시 계산
+    started = time.perf_counter()
+    naive = [LoadingTable(COMMERCIAL_GYM).round("barbell", kg) for kg in targets[:naive_rows]]
+    naive_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    table = loading_table(COMMERCIAL_GYM)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scalar = [table.round("barbell", kg) for kg in targets]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    vector = table.round_many("barbell", np.array(targets))
+    vector_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    plates = [table.plate_breakdown(kg) for kg in scalar]
+    plates_seconds = time.perf_counter() - started
+
+    print(f"\n🏋️ 바벨 무게 맞추기 ({rows:,}개, 가능한 무게 {len(table.loads['barbell'])}가지)")
+    _report(f"매번 조합 계산 ({naive_rows:,}개)", naive_seconds, naive_rows)
+    print(f"  {'표 생성 (1회)':28} {build_seconds * 1000:10.1f}ms")
+    _report("표 이진 탐색 (bisect)", scalar_seconds, rows)
+    _report("표 일괄 탐색 (searchsorted)", vector_seconds, rows)
+    _report("한쪽 원판 구성", plates_seconds, rows)
+    mismatches = sum(a != b for a, b in zip(naive, scalar)) + sum(a != b for a, b in zip(scalar, vector.tolist()))
+    print(f"  원판 구성 없음: {plates.count(None)}건, 불일치: {mismatches}건")
+
+
+def bench_plan_document(rows):
+    """플랜 문서 생성 + 형식별 렌더링 시간 (플랜 rows/100개)"""
+    from fitness_plan_demo import FitnessPlanGenerator, UserProfile, build_plan_bundle
+    from plan_document import RENDERERS, build_plan_document
+
+    rng = random.Random(13)
+    goals = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+    count = max(1, rows // 100)
+    planners = [
+        FitnessPlanGenerator(UserProfile(**p), rng.choice(goals), "헬스장", rng.randint(3, 6), 60,
+                             rng.sample(["허리", "무릎", "손목"], rng.randint(0, 2)),
+                             rng.sample(["고혈압", "당뇨병"], rng.randint(0, 1)))
+        for p in _random_profiles(count)
+    ]
+    bundles = [build_plan_bundle(planner) for planner in planners]
+
+    started = time.perf_counter()
+    documents = [build_plan_document(planner, bundle) for planner, bundle in zip(planners, bundles)]
+    build_seconds = time.perf_counter() - started
+
+    print(f"\n📄 플랜 문서 ({count:,}개)")
+    _report("문서 생성", build_seconds, count)
+    for fmt, render in RENDERERS.items():
+        started = time.perf_counter()
+        size = sum(len(render(document.sections)) for document in documents)
+        _report(f"{fmt} 렌더링", time.perf_counter() - started, count)
+        print(f"  {'':28} 평균 {size / count / 1024:.1f}KB")
+
+
+def bench_profile_writes(rows):
+    """저장소 크기(rows)별 프로필 한 건 수정 지연 시간 (json / sqlite / journal)"""
+    import json
+    import os
+    import tempfile
+    from fitness_plan_demo import ProfileManager
+    from profile_store import SQLiteProfileStore
+
+    records = {
+        f"member{i}": {**p, "created_at": "2024-01-01 00:00:00", "updated_at": "2024-01-01 00:00:00"}
+        for i, p in enumerate(_random_profiles(rows))
+    }
+    nicknames = list(records)
+    rng = random.Random(3)
+
+    print(f"\n💾 프로필 수정 지연 시간 (저장소 {rows:,}명)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("json", "sqlite", "journal"):
+            filename = os.path.join(tmp, "profiles.db" if backend == "sqlite" else f"profiles_{backend}.json")
+            if backend == "sqlite":
+                store = SQLiteProfileStore(filename)
+                store.put_many(records.items())
+                store.close()
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(records, f, ensure_ascii=False, indent=2)
+
+            started = time.perf_counter()
+            manager = ProfileManager(filename, backend=backend)
+            open_seconds = time.perf_counter() - started
+
+            # 전체 파일을 다시 쓰는 json은 큰 저장소에서 느리므로 횟수를 줄임
+            writes = 20 if backend == "json" else 1000
+            latencies = []
+            for _ in range(writes):
+                nickname = rng.choice(nicknames)
+                started = time.perf_counter()
+                manager.update_profile(nickname, {**records[nickname], "weight": 70.0})
+                latencies.append(time.perf_counter() - started)
+            manager.close()
+
+            latencies.sort()
+            p50 = latencies[len(latencies) // 2] * 1000
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+            print(f"  {backend:8} 열기 {open_seconds * 1000:9.1f}ms | 수정 p50 {p50:9.3f}ms, p99 {p99:9.3f}ms ({writes}회)")
+
+
+def bench_profile_open(rows):
+    """저장소 크기(rows)별 열기 + 목록 + 프로필 한 건 조회 시간/메모리 (json / lazy)"""
+    import os
+    import tempfile
+    import tracemalloc
+    from fitness_plan_demo import ProfileManager
+    from profile_store import JsonProfileStore
+
+    print(f"\n📂 프로필 저장소 열기 (저장소 {rows:,}명)")
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "profiles.json")
+        store = JsonProfileStore(filename)
+        store.profiles = {
+            f"member{i}": {**p, "created_at": "2024-01-01 00:00:00", "updated_at": "2024-01-01 00:00:00"}
+            for i, p in enumerate(_random_profiles(rows))
+        }
+        store.save()  # profiles.json + 색인(profiles.json.idx)
+        del store
+
+        def open_and_get(backend):
+            manager = ProfileManager(filename, backend=backend)
+            nicknames = manager.list_profiles()
+            assert manager.get_profile(nicknames[len(nicknames) // 2]) is not None
+            return manager
+
+        for backend in ("json", "lazy"):
+            started = time.perf_counter()
+            open_and_get(backend).close()
+            seconds = time.perf_counter() - started
+
+            # tracemalloc은 실행을 느리게 하므로 메모리는 따로 측정
+            tracemalloc.start()
+            manager = open_and_get(backend)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            manager.close()
+            print(f"  {backend:8} {seconds * 1000:9.1f}ms | 최대 메모리 {peak / 1024 / 1024:7.1f}MB")
+
+
+def bench_profile_query(rows):
+    """보조 색인 생성/조회/갱신 시간 vs 전체 검색 (프로필 rows명)"""
+    from fitness_plan_demo import PROFILE_INDEX_FIELDS
+    from profile_index import ProfileIndex
+
+    rng = random.Random(5)
+    goals = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+    profiles = {
+        f"member{i}": {
+            **p,
+            "goal": rng.choice(goals),
+            "updated_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:00:00",
+        }
+        for i, p in enumerate(_random_profiles(rows))
+    }
+    queries = {
+        "여성 40-60세 체중 감량": {"gender": "여성", "age": (40, 60), "goal": "체중 감량"},
+        "2024-02 이전 미갱신": {"updated_at": (None, "2024-02-01 00:00:00")},
+        "BMI 30 이상 남성": {"bmi": (30, None), "gender": "남성"},
+        "별명 member123 접두어": {"prefix": "member123"},
+    }
+
+    print(f"\n🔎 프로필 보조 색인 (프로필 {rows:,}명)")
+    index = ProfileIndex(PROFILE_INDEX_FIELDS)
+    started = time.perf_counter()
+    index.build(profiles.items())
+    print(f"  색인 생성        {(time.perf_counter() - started) * 1000:9.1f}ms")
+
+    for label, conditions in queries.items():
+        prefix = conditions.pop("prefix", None)
+        started = time.perf_counter()
+        found = index.query(prefix, **conditions)
+        indexed = time.perf_counter() - started
+
+        # 색인 없이: 모든 프로필의 값을 계산해 조건 확인
+        started = time.perf_counter()
+        scanned = []
+        for nickname, record in profiles.items():
+            if prefix is not None and not nickname.startswith(prefix):
+                continue
+            values = index._extract(record)
+            if all(index._matches(values.get(field), condition) for field, condition in conditions.items()):
+                scanned.append(nickname)
+        scan = time.perf_counter() - started
+        assert found == sorted(scanned)
+        print(f"  {label:18} 색인 {indexed * 1000:8.2f}ms | 전체 검색 {scan * 1000:9.1f}ms ({len(found):,}명)")
+
+    nicknames = list(profiles)
+    started = time.perf_counter()
+    for _ in range(1000):
+        nickname = rng.choice(nicknames)
+        index.add(nickname, {**profiles[nickname], "updated_at": "2025-01-01 00:00:00"})
+    print(f"  프로필 수정 반영  {(time.perf_counter() - started) * 1000 / 1000:9.3f}ms/건")
+
+
+def bench_progress(rows):
+    """측정 기록 저장소: 회원 rows/50명 × 3년 매일 기록 추가/저장/불러오기/집계"""
+    import os
+    import tempfile
+    from datetime import date, timedelta
+    from progress_store import ProgressStore
+
+    members = max(1, rows // 50)
+    days = [date(2022, 1, 1) + timedelta(days=i) for i in range(3 * 365)]
+    rng = random.Random(11)
+
+    print(f"\n📈 측정 기록 (회원 {members:,}명 × {len(days)}일 = {members * len(days):,}건)")
+    store = ProgressStore()
+    seconds = 0.0
+    for member in range(members):
+        weight = rng.uniform(50, 110)
+        points = []
+        for i, day in enumerate(days):
+            weight += rng.uniform(-0.3, 0.28)
+            points.append((day, weight, rng.uniform(10, 35) if i % 7 == 0 else None))
+        nickname = f"member{member}"
+        started = time.perf_counter()
+        for day, weight, body_fat in points:
+            store.add(nickname, day, weight=weight, body_fat_percentage=body_fat)
+        seconds += time.perf_counter() - started
+    column_bytes = sum(
+        series.times.itemsize * len(series) + sum(column.itemsize * len(column) for column in series.columns.values())
+        for series in map(store.series, store.nicknames())
+    )
+    print(f"  추가             {seconds / (members * len(days)) * 1e6:9.2f}µs/건 | 열 메모리 {column_bytes / 1024 / 1024:7.1f}MB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store.filename = os.path.join(tmp, "progress.npz")
+        started = time.perf_counter()
+        store.save()
+        print(f"  저장             {(time.perf_counter() - started) * 1000:9.1f}ms ({os.path.getsize(store.filename) / 1024 / 1024:.1f}MB)")
+        started = time.perf_counter()
+        store = ProgressStore(store.filename)
+        print(f"  불러오기         {(time.perf_counter() - started) * 1000:9.1f}ms")
+
+    series = store.series("member0")
+    for label, call in (
+        ("최근 90일 조회", lambda: series.range("2024-10-01", "2024-12-31")),
+        ("주간 집계 (3년)", lambda: series.aggregate("weight", "week")),
+        ("월간 집계 (3년)", lambda: series.aggregate("weight", "month")),
+        ("추세 기울기 (1년)", lambda: series.trend("weight", "2024-01-01", "2024-12-31")),
+    ):
+        started = time.perf_counter()
+        for _ in range(100):
+            call()
+        print(f"  {label:16} {(time.perf_counter() - started) * 10:9.3f}ms")
+
+
+def bench_workout_log(rows):
+    """운동 기록 rows건 추가 + 대시보드 요약: 추가할 때 갱신한 요약 읽기 vs 매번 전체 기록 다시 계산"""
+    import os
+    import tempfile
+    from datetime import datetime, timedelta
+    import numpy as np
+    from one_rep_max import estimate_1rm
+    from workout_log import WorkoutLogStore
+
+    members = max(1, rows // 10000)
+    per_member = rows // members
+    names = ("바벨 스쿼트", "벤치 프레스", "데드리프트", "랫 풀다운", "덤벨 컬", "푸시업")
+    rng = random.Random(5)
+    entries = []
+    for member in range(members):
+        moment = datetime(2023, 1, 1, 7)
+        for _ in range(per_member):
+            moment += timedelta(hours=rng.choice((0, 0, 24, 48)))
+            name = rng.choice(names)
+            entries.append((f"member{member}", moment, name, rng.randint(1, 5), rng.randint(1, 12),
+                            0.0 if name == "푸시업" else round(rng.uniform(20, 140), 1)))
+
+    print(f"\n🏋️ 운동 기록 (회원 {members:,}명 × {per_member:,}건)")
+    store = WorkoutLogStore()
+    started = time.perf_counter()
+    for entry in entries:
+        store.add(*entry)
+    seconds = time.perf_counter() - started
+    print(f"  추가 + 요약 갱신  {seconds / len(entries) * 1e6:9.2f}µs/건")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store.filename = os.path.join(tmp, "workouts.npz")
+        started = time.perf_counter()
+        store.save()
+        print(f"  저장             {(time.perf_counter() - started) * 1000:9.1f}ms ({os.path.getsize(store.filename) / 1024:.0f}KB)")
+        started = time.perf_counter()
+        store = WorkoutLogStore(store.filename)
+        print(f"  불러오기 (재계산) {(time.perf_counter() - started) * 1000:9.1f}ms")
+
+    def rescan(nickname, exercise):
+        # 전체 기록을 읽어 최고/최근 28일 추정 1RM과 이번 주 볼륨 계산
+        columns = store.log(nickname).range()
+        seconds = columns["time"].astype(np.int64)
+        mine = columns["exercise"] == store.exercise_id(exercise)
+        e1rm = estimate_1rm(columns["load"][mine], columns["reps"][mine])
+        recent = seconds[mine] >= seconds[-1] - 28 * 86400
+        days = seconds // 86400
+        weeks = days - (days + 3) % 7
+        this_week = weeks == weeks[-1]
+        volume = (columns["sets"][this_week] * columns["reps"][this_week] * columns["load"][this_week]).sum()
+        return e1rm.max(), e1rm[recent].max() if recent.any() else None, volume
+
+    nicknames = store.nicknames()
+    for label, call in (
+        ("요약 (O(1))", lambda nickname: store.summary(nickname, "벤치 프레스")),
+        ("전체 다시 계산", lambda nickname: rescan(nickname, "벤치 프레스")),
+    ):
+        started = time.perf_counter()
+        for _ in range(max(1, 1000 // len(nicknames))):
+            for nickname in nicknames:
+                call(nickname)
+        _report(label, time.perf_counter() - started, max(1, 1000 // len(nicknames)) * len(nicknames))
+
+
+BENCHMARKS = {
+    "body_composition": bench_body_composition,
+    "load_tables": bench_load_tables,
+    "nutrition": bench_nutrition,
+    "one_rep_max": bench_one_rep_max,
+    "plan_document": bench_plan_document,
+    "plan_model": bench_plan_model,
+    "plan_numbers": bench_plan_numbers,
+    "plan_schema": bench_plan_schema,
+    "plan_templates": bench_plan_templates,
+    "plate_loading": bench_plate_loading,
+    "profile_open": bench_profile_open,
+    "profile_query": bench_profile_query,
+    "profile_writes": bench_profile_writes,
+    "progress": bench_progress,
+    "workout_log": bench_workout_log,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FitPlan AI 성능 측정")
+    parser.add_argument("name", choices=sorted(BENCHMARKS) + ["all"], help="측정할 항목")
+    parser.add_argument("--rows", type=int, default=100_000, help="데이터 크기")
+    args = parser.parse_args()
+
+    names = sorted(BENCHMARKS) if args.name == "all" else [args.name]
+    for name in names:
+        BENCHMARKS[name](args.rows)
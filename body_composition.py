@@ -0,0 +1,167 @@
+"""
+FitPlan AI - 벡터화된 신체 구성 분석
+UserProfile의 BMI/체지방률/골격근량/제지방량 계산을 NumPy 배열 단위로 한 번에 수행합니다.
+결과는 UserProfile 스칼라 계산과 완전히 동일합니다.
+"""
+
+import numpy as np
+
+
+def _split(values):
+    """Veltkamp 분할 - 곱셈 오차를 정확히 구하기 위해 상위/하위 26비트로 나눔"""
+    t = values * 134217729.0  # 2**27 + 1
+    high = t - (t - values)
+    return high, values - high
+
+
+def py_round(values, ndigits):
+    """파이썬 내장 round()와 동일한 결과를 내는 배열 반올림
+
+    np.round는 x * 10**n의 반올림 오차 때문에 .5 근처 값에서 내장 round()와
+    결과가 달라질 수 있습니다. 곱셈의 정확한 오차(TwoProduct)를 함께 계산해
+    실제 값이 .5보다 큰지/작은지/같은지(같으면 짝수 쪽)를 판정합니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 0:
+        return py_round(values.reshape(1), ndigits)[0]
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    floor = np.floor(scaled)
+    offset = scaled - floor - 0.5
+    round_up = offset > 0
+
+    # .5에 아주 가까운 값만 정확한 곱셈 오차로 다시 판정: values * scale = scaled + error
+    near_half = np.abs(offset) < 1e-6
+    if near_half.any():
+        x = values[near_half]
+        s = scaled[near_half]
+        x_high, x_low = _split(x)
+        scale_high, scale_low = _split(np.float64(scale))
+        error = ((x_high * scale_high - s) + x_high * scale_low + x_low * scale_high) + x_low * scale_low
+        o = offset[near_half]
+        odd = np.fmod(floor[near_half], 2) != 0
+        round_up[near_half] = (o > 0) | ((o == 0) & ((error > 0) | ((error == 0) & odd)))
+    return (floor + round_up) / scale
+
+
+class BodyCompositionFrame:
+    """여러 사용자의 신체 구성 지표를 한 번에 계산하는 클래스
+
+    height, weight, age, gender는 같은 길이의 배열(또는 리스트)이며,
+    body_fat_percentage / skeletal_muscle_mass는 생략하거나 NaN(None)인 행만 추정합니다.
+    """
+
+    BMI_CATEGORIES = ("저체중", "정상", "과체중", "비만", "고도비만")
+    BMI_EDGES = np.array([18.5, 23, 25, 30], dtype=np.float64)
+
+    BODY_FAT_CATEGORIES = ("필수 지방", "운동선수 수준", "건강", "평균", "높음")
+    BODY_FAT_EDGES = {
+        "남성": np.array([6, 14, 18, 25], dtype=np.float64),
+        "여성": np.array([14, 21, 25, 32], dtype=np.float64),
+    }
+
+    def __init__(self, height, weight, age, gender, body_fat_percentage=None, skeletal_muscle_mass=None):
+        self.height = np.asarray(height, dtype=np.float64)
+        self.weight = np.asarray(weight, dtype=np.float64)
+        self.age = np.asarray(age, dtype=np.float64)
+        self.is_male = np.asarray(gender) == "남성"
+        n = len(self.height)
+
+        # BMI (UserProfile.calculate_bmi)
+        height_m = self.height / 100
+        self.bmi = py_round(self.weight / (height_m ** 2), 2)
+
+        # 체지방률: 입력값이 없는 행만 BMI 기반 추정 (UserProfile._estimate_body_fat)
+        body_fat = self._optional_column(body_fat_percentage, n)
+        missing = np.isnan(body_fat)
+        # 정수 입력값과 범위(5-50)로 잘린 추정값은 스칼라 계산에서 int이므로 analysis 문구("18%")를 맞추기 위해 표시
+        self._body_fat_int = self._integer_mask(body_fat_percentage, n)
+        if missing.any():
+            offset = np.where(self.is_male, -16.2, -5.4)
+            estimated = (1.20 * self.bmi) + (0.23 * self.age) + offset
+            self._body_fat_int |= missing & ((estimated >= 50) | (estimated <= 5))
+            estimated = py_round(np.maximum(5, np.minimum(50, estimated)), 1)
+            body_fat[missing] = estimated[missing]
+        self.body_fat_percentage = body_fat
+
+        # 골격근량: 입력값이 없는 행만 체중 비율로 추정 (UserProfile._estimate_skeletal_muscle)
+        muscle = self._optional_column(skeletal_muscle_mass, n)
+        self._muscle_int = self._integer_mask(skeletal_muscle_mass, n)
+        missing = np.isnan(muscle)
+        if missing.any():
+            ratio = np.where(self.is_male, 0.45, 0.36)
+            estimated = py_round(self.weight * ratio, 1)
+            muscle[missing] = estimated[missing]
+        self.skeletal_muscle_mass = muscle
+
+        # 제지방량 / 골격근 비율 (calculate_lean_body_mass, analyze_body_composition)
+        fat_mass = self.weight * (self.body_fat_percentage / 100)
+        self.lean_body_mass = py_round(self.weight - fat_mass, 2)
+        self.muscle_ratio = py_round((self.skeletal_muscle_mass / self.weight) * 100, 2)
+
+        # 카테고리 코드 (BMI_CATEGORIES / BODY_FAT_CATEGORIES의 인덱스)
+        self.bmi_category = np.searchsorted(self.BMI_EDGES, self.bmi, side="right").astype(np.int8)
+        self.body_fat_category = np.where(
+            self.is_male,
+            np.searchsorted(self.BODY_FAT_EDGES["남성"], self.body_fat_percentage, side="right"),
+            np.searchsorted(self.BODY_FAT_EDGES["여성"], self.body_fat_percentage, side="right"),
+        ).astype(np.int8)
+
+    @staticmethod
+    def _optional_column(values, n):
+        """선택 입력 컬럼을 float 배열로 변환 (None/생략은 NaN)"""
+        if values is None:
+            return np.full(n, np.nan)
+        return np.array(values, dtype=np.float64)
+
+    @staticmethod
+    def _integer_mask(values, n):
+        """선택 입력 컬럼에서 정수로 들어온 행 (스칼라 계산은 int를 그대로 표시하므로 "32kg"과 "32.0kg"을 구분)"""
+        if values is None:
+            return np.zeros(n, dtype=bool)
+        if isinstance(values, np.ndarray):
+            return np.full(n, values.dtype.kind in "iu")
+        return np.array([isinstance(value, (int, np.integer)) and not isinstance(value, bool) for value in values],
+                        dtype=bool)
+
+    @classmethod
+    def from_records(cls, records):
+        """프로필 dict 목록(ProfileManager 저장 형식)으로 생성"""
+        records = list(records)
+        return cls(
+            height=[r["height"] for r in records],
+            weight=[r["weight"] for r in records],
+            age=[r["age"] for r in records],
+            gender=[r["gender"] for r in records],
+            body_fat_percentage=[r.get("body_fat_percentage") for r in records],
+            skeletal_muscle_mass=[r.get("skeletal_muscle_mass") for r in records],
+        )
+
+    def __len__(self):
+        return len(self.height)
+
+    def bmi_category_labels(self):
+        """BMI 카테고리 이름 배열"""
+        return np.array(self.BMI_CATEGORIES)[self.bmi_category]
+
+    def body_fat_category_labels(self):
+        """체지방률 카테고리 이름 배열"""
+        return np.array(self.BODY_FAT_CATEGORIES)[self.body_fat_category]
+
+    def analysis(self, index):
+        """index번째 사용자의 분석 결과 (UserProfile.analyze_body_composition과 같은 형식)"""
+        body_fat = float(self.body_fat_percentage[index])
+        if self._body_fat_int[index]:
+            body_fat = int(body_fat)
+        muscle = float(self.skeletal_muscle_mass[index])
+        if self._muscle_int[index]:
+            muscle = int(muscle)
+        return {
+            "BMI": float(self.bmi[index]),
+            "BMI 카테고리": self.BMI_CATEGORIES[self.bmi_category[index]],
+            "체지방률": f"{body_fat}%",
+            "체지방률 카테고리": self.BODY_FAT_CATEGORIES[self.body_fat_category[index]],
+            "제지방량": f"{float(self.lean_body_mass[index])}kg",
+            "골격근량": f"{muscle}kg",
+            "골격근 비율": f"{float(self.muscle_ratio[index])}%"
+        }
@@ -0,0 +1,145 @@
+"""
+FitPlan AI - 운동 이름 색인
+플랜에 나오는 운동 이름(변형/별칭/괄호 설명 포함)을 EXERCISE_VIDEOS 카탈로그 항목으로 찾아줍니다.
+카탈로그 이름과 별칭을 Aho-Corasick 오토마톤으로 미리 묶어 두어, 이름 길이에 비례하는 시간에
+가장 긴 일치 항목을 찾습니다.
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+
+# 플랜에서 쓰는 이름 → 카탈로그 이름
+EXERCISE_ALIASES = {
+    "트라이셉스 푸시다운": "케이블 푸시다운",
+    "덤벨 사이드 레이즈": "사이드 레터럴 레이즈",
+    "사이드 레이즈": "사이드 레터럴 레이즈",
+    "워킹 런지": "런지 워킹",
+    "스쿼트 점프": "점프 스쿼트",
+    "딥스": "트라이셉스 딥스",
+    "리버스 플라이": "리어 델트 플라이",
+    "덤벨 오버헤드 익스텐션": "오버헤드 트라이셉스 익스텐션",
+    "덤벨 프레스": "인클라인 덤벨 프레스",
+}
+
+# 인스턴스별로 기억하는 해석 결과 수 (자유 입력 이름이 계속 들어와도 메모리가 일정하도록 오래된 것부터 제거)
+RESOLVE_CACHE_SIZE = 4096
+
+_PARENTHESES = re.compile(r"\([^)]*\)")
+_ALTERNATIVES = re.compile(r"\s+or\s+|/", re.IGNORECASE)
+
+
+def normalize_name(name):
+    """비교용 이름 정규화 (괄호 설명, 공백 제거, 소문자)"""
+    return "".join(_PARENTHESES.sub("", name).split()).lower()
+
+
+class ExerciseIndex:
+    """운동 이름 → 카탈로그 키 색인
+
+    catalog는 {카탈로그 이름: 값} dict입니다 (예: EXERCISE_VIDEOS).
+    해석 규칙:
+      1. 카탈로그 이름과 정확히 같으면 그대로 사용
+      2. "A or B" 처럼 대안이 여러 개면 앞에서부터 처음 해석되는 대안을 사용
+      3. 정규화한 이름이 카탈로그/별칭과 같으면 사용
+      4. 이름 안에 포함된 카탈로그/별칭 이름 중 가장 긴 것 → 가장 뒤에 나온 것 → 카탈로그 순서
+         (복합 이름은 뒤쪽이 실제 동작이므로 "플랭크 투 푸시업"은 푸시업)
+    """
+
+    def __init__(self, catalog, aliases=None):
+        self.catalog = catalog
+        aliases = EXERCISE_ALIASES if aliases is None else aliases
+
+        # 패턴(정규화된 이름) → (카탈로그 키, 우선순위); 카탈로그 이름이 별칭보다 우선
+        self._patterns = {}
+        for name in catalog:
+            self._patterns.setdefault(normalize_name(name), (name, len(self._patterns)))
+        for alias, target in aliases.items():
+            if target in catalog:
+                self._patterns.setdefault(normalize_name(alias), (target, len(self._patterns)))
+
+        self._build_automaton()
+        self._resolve_cached = lru_cache(maxsize=RESOLVE_CACHE_SIZE)(self._resolve)
+
+    def _build_automaton(self):
+        """Aho-Corasick 오토마톤 생성 (goto/fail/출력 테이블)"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for pattern in self._patterns:
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].append(pattern)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _find_best(self, text):
+        """text 안의 패턴 중 (가장 긴 것, 가장 뒤, 카탈로그 순서) 기준 최선의 카탈로그 키"""
+        best = None
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern in self._output[state]:
+                key, order = self._patterns[pattern]
+                rank = (-len(pattern), -end, order)
+                if best is None or rank < best[0]:
+                    best = (rank, key)
+        return best[1] if best else None
+
+    def _resolve_alternative(self, name):
+        normalized = normalize_name(name)
+        if not normalized:
+            return None
+        if normalized in self._patterns:
+            return self._patterns[normalized][0]
+        return self._find_best(normalized)
+
+    def resolve(self, name):
+        """운동 이름에 해당하는 카탈로그 키 (없으면 None, 최근 RESOLVE_CACHE_SIZE개 이름의 결과는 캐시)"""
+        return self._resolve_cached(name)
+
+    def _resolve(self, name):
+        if name in self.catalog:
+            return name
+        for alternative in _ALTERNATIVES.split(name):
+            key = self._resolve_alternative(alternative)
+            if key is not None:
+                return key
+        return None
+
+    def lookup(self, name):
+        """운동 이름에 해당하는 카탈로그 값 (없으면 None)"""
+        key = self.resolve(name)
+        return self.catalog[key] if key is not None else None
+
+    def resolve_plan(self, plan):
+        """주간 플랜의 모든 운동 이름을 한 번에 해석
+
+        Returns:
+            {운동 이름: 카탈로그 값 또는 None} (플랜에 처음 나온 순서)
+        """
+        resolved = {}
+        for day_plan in plan["주간_계획"]:
+            for exercise in day_plan["운동"]:
+                name = exercise["이름"]
+                if name not in resolved:
+                    resolved[name] = self.lookup(name)
+        return resolved
@@ -3,92 +3,217 @@ FitPlan AI - 운동 플랜 생성 데모
 사용자 신체 정보를 바탕으로 맞춤형 운동 플랜을 생성합니다.
 """
 
+import atexit
+import csv
 import json
 import os
+import time
+from collections import deque
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime
+from functools import lru_cache
+
+from exercise_index import ExerciseIndex
+from load_tables import exercise_ids, exercise_load_fields, plan_loads, recommend_load
+from one_rep_max import rep_range_loads
+from plan_cache import PlanCache
+from plan_numbers import parse_days, summarize
+from plan_model import DayPlan, WeeklyPlan
+from plan_document import (
+    SECTION_ORDER, build_plan_document, cardio_blocks, meal_plan_blocks, medical_blocks, nutrition_blocks, pain_blocks,
+    profile_blocks, recommendation_blocks, tips_blocks, weekly_plan_blocks, weight_guide_blocks, write_blocks,
+)
+from profile_index import ProfileIndex
+from profile_store import migrate_json_to_sqlite, open_profile_store
+from progress_store import PROGRESS_FILE, ProgressStore
+
+
+def profile_bmi(record):
+    """저장된 프로필의 BMI (UserProfile 계산식 사용)"""
+    return UserProfile(record["height"], record["weight"], record.get("age", 0), record.get("gender")).calculate_bmi()
+
+
+# 프로필 보조 색인 필드 → 저장된 프로필에서 값 추출
+PROFILE_INDEX_FIELDS = {
+    "age": lambda record: record.get("age"),
+    "gender": lambda record: record.get("gender"),
+    "goal": lambda record: record.get("goal"),
+    "updated_at": lambda record: record.get("updated_at"),
+    "bmi": profile_bmi,
+}
+
+PROFILE_PAGE_SIZE = 20  # 프로필 목록 한 페이지의 프로필 수
 
 
 class ProfileManager:
-    """프로필 저장/불러오기 관리 클래스"""
-    
-    def __init__(self, filename="profiles.json"):
-        self.filename = filename
-        self.profiles = self.load_profiles()
-    
-    def load_profiles(self):
-        """저장된 프로필 불러오기"""
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"⚠️  프로필 파일을 읽는 중 오류가 발생했습니다: {e}")
-                return {}
-        return {}
-    
-    def save_profiles(self):
-        """프로필을 파일에 저장"""
+    """프로필 저장/불러오기 관리 클래스
+    
+    backend: "json" (기본, profiles.json 전체 저장), "lazy" (profiles.json을 색인으로 열고 필요한 프로필만 읽음),
+             "sqlite" (프로필 단위 저장), "journal" (변경 사항만 저널에 추가)
+    filename을 생략하면 백엔드별 기본 파일을 사용합니다.
+    progress_store(ProgressStore)를 주면 프로필을 저장할 때마다 측정값(체중 등)을 측정 기록에도 추가하고,
+    삭제하면 측정 기록도 지웁니다. 측정 기록 파일은 전체를 다시 쓰므로 저장마다가 아니라 close()에서 한 번에 씁니다.
+    """
+    
+    def __init__(self, filename=None, backend="json", progress_store=None):
+        self.store = open_profile_store(filename, backend)
+        self.filename = self.store.filename
+        self.progress_store = progress_store
+        self._index = None
+    
+    @property
+    def index(self):
+        """보조 색인 (처음 사용할 때 전체 프로필로 생성, 이후 이 관리자의 저장/삭제 시 갱신)"""
+        if self._index is None:
+            self.rebuild_index()
+        return self._index
+    
+    def rebuild_index(self):
+        """보조 색인 다시 만들기 (다른 프로세스가 저장소를 바꾼 뒤 사용)"""
+        self._index = ProfileIndex(PROFILE_INDEX_FIELDS)
+        self._index.build(self.store.items())
+    
+    def query_profiles(self, prefix=None, **conditions):
+        """조건에 맞는 프로필 별명 목록 (별명 순)
+        
+        조건은 필드=값(같음) 또는 필드=(최소, 최대)(범위, None은 제한 없음)이며, prefix는 별명 접두어입니다.
+        필드: age, gender, goal, updated_at, bmi
+        예: query_profiles(gender="여성", age=(40, 60), goal="체중 감량")
+        """
+        return self.index.query(prefix, **conditions)
+    
+    @property
+    def profiles(self):
+        """전체 프로필 dict (별명 → 프로필)"""
+        return dict(self.store.items())
+    
+    def _save(self, nickname, record):
+        """프로필 한 건 저장"""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(self.profiles, f, ensure_ascii=False, indent=2)
-            return True
+            self.store.put(nickname, record)
         except Exception as e:
             print(f"❌ 프로필 저장 중 오류가 발생했습니다: {e}")
             return False
+        self._saved(nickname, record)
+        return True
+    
+    def _saved(self, nickname, record):
+        """저장한 프로필을 색인/측정 기록에 반영"""
+        if self._index is not None:
+            self._index.add(nickname, record)
+        if self.progress_store is not None:
+            self.progress_store.record_profile(nickname, record)
     
     def add_profile(self, nickname, profile_data):
         """새 프로필 추가"""
-        self.profiles[nickname] = {
+        return self._save(nickname, {
             **profile_data,
             "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        return self.save_profiles()
+        })
     
     def update_profile(self, nickname, profile_data):
-        """기존 프로필 업데이트"""
-        if nickname in self.profiles:
-            created_at = self.profiles[nickname].get("created_at", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            self.profiles[nickname] = {
-                **profile_data,
-                "created_at": created_at,
-                "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            return self.save_profiles()
-        return False
+        """기존 프로필 업데이트 (있는지 확인, created_at 유지, 저장을 저장소 잠금 하나 안에서 처리)"""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        def change(existing):
+            return {**profile_data, "created_at": existing.get("created_at", now), "updated_at": now}
+        
+        try:
+            record = self.store.update(nickname, change)
+        except Exception as e:
+            print(f"❌ 프로필 저장 중 오류가 발생했습니다: {e}")
+            return False
+        if record is None:
+            return False
+        self._saved(nickname, record)
+        return True
     
     def get_profile(self, nickname):
         """프로필 불러오기"""
-        return self.profiles.get(nickname)
+        return self.store.get(nickname)
     
     def delete_profile(self, nickname):
         """프로필 삭제"""
-        if nickname in self.profiles:
-            del self.profiles[nickname]
-            return self.save_profiles()
-        return False
+        try:
+            deleted = self.store.delete(nickname)
+        except Exception as e:
+            print(f"❌ 프로필 저장 중 오류가 발생했습니다: {e}")
+            return False
+        if deleted and self._index is not None:
+            self._index.remove(nickname)
+        if deleted and self.progress_store is not None:
+            self.progress_store.remove(nickname)
+        return deleted
     
     def list_profiles(self):
         """모든 프로필 목록 반환"""
-        return list(self.profiles.keys())
+        return self.store.keys()
     
-    def print_profile_list(self):
-        """프로필 목록 출력"""
-        if not self.profiles:
-            print("\n저장된 프로필이 없습니다.")
+    def save_progress(self):
+        """측정 기록의 변경 사항을 파일에 저장 (progress_store가 없으면 아무것도 하지 않음)"""
+        if self.progress_store is None:
             return
+        try:
+            self.progress_store.save()
+        except Exception as e:
+            print(f"⚠️  측정 기록 저장 중 오류가 발생했습니다: {e}")
+    
+    def close(self):
+        """측정 기록 저장 후 저장소 닫기 (SQLite 연결, 저널 파일)"""
+        self.save_progress()
+        self.store.close()
+    
+    def print_profile_list(self, page=None, page_size=PROFILE_PAGE_SIZE):
+        """프로필 목록 출력
+        
+        page를 지정하면 해당 페이지(1부터)의 프로필만 한 번에 읽어(get_many) 출력하고
+        (출력한 페이지, 전체 페이지 수)를 반환합니다.
+        """
+        if not len(self.store):
+            print("\n저장된 프로필이 없습니다.")
+            return None if page is None else (1, 1)
         
         print("\n" + "=" * 60)
         print("📋 저장된 프로필 목록")
         print("=" * 60)
         
-        for idx, (nickname, data) in enumerate(self.profiles.items(), 1):
+        if page is None:
+            start = 0
+            entries = self.store.items()
+        else:
+            nicknames = self.store.keys()
+            total_pages = max(1, -(-len(nicknames) // page_size))
+            page = min(max(1, page), total_pages)
+            start = (page - 1) * page_size
+            entries = self.store.get_many(nicknames[start:start + page_size])
+        
+        for idx, (nickname, data) in enumerate(entries, start + 1):
             print(f"\n{idx}. {nickname}")
             print(f"   - 성별: {data.get('gender', 'N/A')}, 나이: {data.get('age', 'N/A')}세")
             print(f"   - 키: {data.get('height', 'N/A')}cm, 몸무게: {data.get('weight', 'N/A')}kg")
             print(f"   - 마지막 업데이트: {data.get('updated_at', 'N/A')}")
         
+        if page is not None:
+            print(f"\n📄 {page}/{total_pages} 페이지 (전체 {len(nicknames)}명)")
         print("\n" + "=" * 60)
+        if page is not None:
+            return page, total_pages
+    
+    def prompt_nickname(self, prompt, page_size=PROFILE_PAGE_SIZE):
+        """프로필 목록을 페이지 단위로 출력하고 별명 입력 받기
+        
+        목록이 여러 페이지이면 n(다음)/p(이전)로 페이지를 넘깁니다 (같은 이름의 프로필이 있으면 별명으로 처리).
+        """
+        page = 1
+        while True:
+            page, total_pages = self.print_profile_list(page=page, page_size=page_size)
+            hint = " (다음 페이지: n, 이전 페이지: p)" if total_pages > 1 else ""
+            answer = input(f"\n{prompt}{hint}: ").strip()
+            if total_pages > 1 and answer.lower() in ("n", "p") and answer not in self.store:
+                page += 1 if answer.lower() == "n" else -1
+                continue
+            return answer
 
 
 class UserInput:
@@ -392,6 +517,22 @@ class UserProfile:
         if self.skeletal_muscle_mass is None:
             self.skeletal_muscle_mass = self._estimate_skeletal_muscle()
     
+    @classmethod
+    def from_progress(cls, profile_data, series):
+        """저장된 프로필 + 측정 기록(progress_store.MeasurementSeries)의 가장 최근 값으로 생성
+        
+        측정 기록에 없는 항목은 프로필에 저장된 값을 사용합니다.
+        """
+        latest = (series.latest() if series is not None else None) or {}
+        return cls(
+            profile_data['height'],
+            latest.get('weight', profile_data.get('weight')),
+            profile_data['age'],
+            profile_data['gender'],
+            latest.get('body_fat_percentage', profile_data.get('body_fat_percentage')),
+            latest.get('skeletal_muscle_mass', profile_data.get('skeletal_muscle_mass'))
+        )
+    
     def _estimate_body_fat(self):
         """BMI 기반 체지방률 추정"""
         bmi = self.calculate_bmi()
@@ -486,24 +627,165 @@ class UserProfile:
     
     def print_profile(self):
         """프로필 출력"""
-        print("=" * 60)
-        print("📊 사용자 신체 정보 분석")
-        print("=" * 60)
-        print(f"\n🔹 나이: {self.age}세")
-        print(f"🔹 성별: {self.gender}")
-        print(f"🔹 키: {self.height}cm")
-        print(f"🔹 몸무게: {self.weight}kg")
-        print(f"🔹 체지방률: {self.body_fat_percentage}%")
-        print(f"🔹 골격근량: {self.skeletal_muscle_mass}kg")
-        print("\n" + "-" * 60)
-        print("📈 신체 구성 분석 결과")
-        print("-" * 60)
-        
-        analysis = self.analyze_body_composition()
-        for key, value in analysis.items():
-            print(f"  • {key}: {value}")
-        
-        print("\n" + "=" * 60)
+        write_blocks(profile_blocks(self))
+
+
+# 운동 빈도별 활동 계수 (TDEE = BMR × 계수)
+ACTIVITY_MULTIPLIERS = {3: 1.375, 4: 1.55, 5: 1.725, 6: 1.9, 7: 1.9}
+
+
+@dataclass(frozen=True)
+class NutritionTargets:
+    """BMR/TDEE 기반 목표 칼로리 및 하루 영양소 범위 (g, L)"""
+    bmr: float
+    tdee: float
+    target_calories: float
+    calorie_note: str
+    meal_type: str
+    protein_min: float
+    protein_max: float
+    carb_min: float
+    carb_max: float
+    fat_min: float
+    fat_max: float
+    water_liters: float
+    
+    def to_dict(self):
+        """JSON 저장용 dict"""
+        return asdict(self)
+
+
+@lru_cache(maxsize=None)
+def nutrition_goal_rules(goal):
+    """목표별 칼로리 조정량과 영양소 비율
+    
+    반환: (칼로리 조정 kcal, 설명, 식단 유형, 단백질 (최소, 최대) g/kg, 탄수화물 g/kg, 지방 g/kg)
+    """
+    # 목표에 따른 칼로리 조정
+    if "체중 감량" in goal and "근육 증가" not in goal:
+        calorie_offset = -500  # 주당 0.5kg 감량
+        calorie_note = "체중 감량을 위한 칼로리 적자"
+        meal_type = "체중 감량"
+    elif "근육 증가" in goal and "체중 감량" not in goal:
+        calorie_offset = 300  # 근육 증가를 위한 칼로리 흑자
+        calorie_note = "근육 증가를 위한 칼로리 흑자"
+        meal_type = "근육 증가"
+    elif "체중 감량 + 근육 증가" in goal:
+        calorie_offset = -200  # 약간의 적자로 리컴포지션
+        calorie_note = "바디 리컴포지션 (체지방 감소 + 근육 유지/증가)"
+        meal_type = "체중 감량 + 근육 증가"
+    else:
+        calorie_offset = 0
+        calorie_note = "체중 유지"
+        meal_type = "체중 유지"
+    
+    # 목표에 따른 단백질 섭취량 (체중 1kg당 g)
+    if "근육 증가" in goal:
+        protein_ratio = (1.8, 2.2)
+    else:
+        protein_ratio = (1.6, 2.0)
+    
+    # 목표에 따른 탄수화물/지방 비율 (체중 1kg당 g)
+    if "체중 감량" in goal:
+        carb_ratio = 2.0
+        fat_ratio = 0.8
+    elif "근육 증가" in goal:
+        carb_ratio = 4.0
+        fat_ratio = 1.0
+    else:
+        carb_ratio = 3.0
+        fat_ratio = 0.9
+    
+    return calorie_offset, calorie_note, meal_type, protein_ratio, carb_ratio, fat_ratio
+
+
+@lru_cache(maxsize=1024)
+def compute_nutrition_targets(weight, height, age, gender, goal, frequency):
+    """영양 목표 계산 (같은 입력은 캐시된 결과를 재사용)"""
+    # Harris-Benedict 방정식으로 BMR 계산
+    if gender == "남성":
+        bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
+    else:
+        bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
+    
+    # 활동 수준에 따른 TDEE (운동 빈도 고려)
+    tdee = bmr * ACTIVITY_MULTIPLIERS.get(frequency, 1.55)
+    
+    calorie_offset, calorie_note, meal_type, protein_ratio, carb_ratio, fat_ratio = nutrition_goal_rules(goal)
+    target_cal = tdee + calorie_offset
+    
+    return NutritionTargets(
+        bmr=bmr,
+        tdee=tdee,
+        target_calories=target_cal,
+        calorie_note=calorie_note,
+        meal_type=meal_type,
+        protein_min=weight * protein_ratio[0],
+        protein_max=weight * protein_ratio[1],
+        carb_min=weight * carb_ratio,
+        carb_max=weight * (carb_ratio + 0.5),
+        fat_min=weight * fat_ratio,
+        fat_max=weight * (fat_ratio + 0.2),
+        water_liters=weight * 0.035
+    )
+
+
+# 나이 및 성별에 따른 강도/반복 설정 (고령자는 부상 방지를 위해 저강도 고반복 권장)
+REP_TIERS = {
+    "senior": {
+        "rep_range": "12-15회",  # 저강도 고반복
+        "rep_description": "저강도 고반복 (고령자 안전 운동 - 관절 보호 및 근력 유지)",
+        "main": "12-15회", "secondary": "15-18회", "accessory": "18-20회",
+    },
+    "male": {
+        "rep_range": "6-10회",  # 고강도 저반복
+        "rep_description": "고강도 저반복 (근력 및 근비대 중심)",
+        "main": "6-8회", "secondary": "8-10회", "accessory": "10-12회",
+    },
+    "female": {
+        "rep_range": "12-15회",  # 저강도 고반복
+        "rep_description": "저강도 고반복 (근지구력 및 탄탄한 몸매 중심)",
+        "main": "10-12회", "secondary": "12-15회", "accessory": "15-20회",
+    },
+}
+
+
+def get_rep_tier(age, gender):
+    """REP_TIERS 키 (60세 이상 → senior, 그 외 성별)"""
+    if age >= 60:
+        return "senior"
+    return "male" if gender == "남성" else "female"
+
+
+def get_environment_kind(environment):
+    """운동 환경 → 템플릿 키 (gym / equipment / bodyweight)"""
+    if "헬스장" in environment:
+        return "gym"
+    if "장비 있음" in environment:
+        return "equipment"
+    return "bodyweight"
+
+
+def _freeze_days(workouts):
+    """주간 계획(dict 리스트)을 템플릿으로 변환: ((요일 정보 dict, (운동 dict, ...), (ExerciseNumbers, ...)), ...)
+
+    처방 문구("12-15회", "90초" 등)의 수치도 이때 한 번만 해석해 함께 보관합니다.
+    템플릿 dict는 외부에 노출하지 않고 _thaw_days로 복사본만 내보냅니다.
+    """
+    return tuple(
+        ({k: v for k, v in day.items() if k != "운동"}, tuple(dict(e) for e in day["운동"]), numbers)
+        for day, numbers in zip(workouts, parse_days(workouts))
+    )
+
+
+def _thaw_days(template):
+    """템플릿의 수정 가능한 복사본 (dict.copy는 C 수준 얕은 복사라 리터럴 생성보다 빠름)"""
+    days = []
+    for info, exercises, _ in template:
+        day = info.copy()
+        day["운동"] = [e.copy() for e in exercises]
+        days.append(day)
+    return days
 
 
 class FitnessPlanGenerator:
@@ -596,20 +878,11 @@ class FitnessPlanGenerator:
         self.pain_areas = pain_areas or []
         self.medical_conditions = medical_conditions or []
         
-        # 나이 및 성별에 따른 강도/반복 설정
-        # 고령자(60세 이상)는 부상 방지를 위해 저강도 고반복 권장
-        if self.user.age >= 60:
-            self.rep_range = "12-15회"  # 저강도 고반복
-            self.rep_description = "저강도 고반복 (고령자 안전 운동 - 관절 보호 및 근력 유지)"
-            self.is_senior = True
-        elif self.user.gender == "남성":
-            self.rep_range = "6-10회"  # 고강도 저반복
-            self.rep_description = "고강도 저반복 (근력 및 근비대 중심)"
-            self.is_senior = False
-        else:  # 여성
-            self.rep_range = "12-15회"  # 저강도 고반복
-            self.rep_description = "저강도 고반복 (근지구력 및 탄탄한 몸매 중심)"
-            self.is_senior = False
+        # 나이 및 성별에 따른 강도/반복 설정 (REP_TIERS)
+        self.rep_tier = get_rep_tier(self.user.age, self.user.gender)
+        self.rep_range = REP_TIERS[self.rep_tier]["rep_range"]
+        self.rep_description = REP_TIERS[self.rep_tier]["rep_description"]
+        self.is_senior = self.rep_tier == "senior"
     
     def get_cardio_details(self):
         """목표에 따른 유산소 운동 상세 정보"""
@@ -918,67 +1191,20 @@ class FitnessPlanGenerator:
         
         return modifications, rehab_exercises
     
+    def get_nutrition_targets(self):
+        """목표 칼로리 및 영양소 (프로필/목표/빈도별로 한 번만 계산)"""
+        return compute_nutrition_targets(
+            self.user.weight, self.user.height, self.user.age, self.user.gender,
+            self.goal, self.frequency
+        )
+    
     def get_weight_recommendation(self, exercise_name):
-        """운동별 무게 추천 (체중 기준)"""
-        weight = self.user.weight
-        gender = self.user.gender
-        
-        # 성별에 따른 기본 배율
-        if gender == "남성":
-            multipliers = {
-                # 하체 운동
-                "바벨 스쿼트": (1.0, 1.5, 2.0),  # 초급, 중급, 고급
-                "레그 프레스": (1.5, 2.0, 2.5),
-                "데드리프트": (1.0, 1.5, 2.0),
-                "루마니안 데드리프트": (0.7, 1.0, 1.3),
-                
-                # 상체 밀기
-                "벤치 프레스": (0.5, 0.8, 1.2),
-                "인클라인 덤벨 프레스": (0.15, 0.25, 0.35),  # 각 손
-                "숄더 프레스": (0.3, 0.5, 0.7),
-                "덤벨 숄더 프레스": (0.12, 0.20, 0.28),  # 각 손
-                
-                # 상체 당기기
-                "랫 풀다운": (0.5, 0.8, 1.0),
-                "시티드 로우": (0.5, 0.8, 1.0),
-                "덤벨 로우": (0.15, 0.25, 0.35),  # 각 손
-                
-                # 팔 운동
-                "바벨 컬": (0.2, 0.3, 0.45),
-                "덤벨 컬": (0.08, 0.12, 0.18),  # 각 손
-            }
-        else:  # 여성
-            multipliers = {
-                # 하체 운동
-                "바벨 스쿼트": (0.5, 0.8, 1.2),
-                "레그 프레스": (1.0, 1.5, 2.0),
-                "데드리프트": (0.5, 0.8, 1.2),
-                "루마니안 데드리프트": (0.4, 0.6, 0.9),
-                
-                # 상체 밀기
-                "벤치 프레스": (0.2, 0.4, 0.6),
-                "인클라인 덤벨 프레스": (0.08, 0.12, 0.18),  # 각 손
-                "숄더 프레스": (0.15, 0.25, 0.4),
-                "덤벨 숄더 프레스": (0.06, 0.10, 0.15),  # 각 손
-                
-                # 상체 당기기
-                "랫 풀다운": (0.3, 0.5, 0.7),
-                "시티드 로우": (0.3, 0.5, 0.7),
-                "덤벨 로우": (0.08, 0.12, 0.18),  # 각 손
-                
-                # 팔 운동
-                "바벨 컬": (0.1, 0.15, 0.25),
-                "덤벨 컬": (0.04, 0.06, 0.10),  # 각 손
-            }
-        
-        if exercise_name in multipliers:
-            beginner, intermediate, advanced = multipliers[exercise_name]
-            return {
-                "초급": round(weight * beginner, 1),
-                "중급": round(weight * intermediate, 1),
-                "고급": round(weight * advanced, 1)
-            }
-        return None
+        """운동별 무게 추천 (체중 기준, 무게 기준이 없는 운동은 None)"""
+        return recommend_load(self.user.weight, self.user.gender, exercise_name)
+    
+    def get_plan_weight_recommendations(self, plan):
+        """주간 플랜의 모든 운동 무게 추천을 한 번에 계산 {운동 이름: 추천 또는 None}"""
+        return plan_loads(self.user.weight, self.user.gender, plan)
         
     def recommend_goal(self):
         """추천 운동 목표"""
@@ -1020,8 +1246,30 @@ class FitnessPlanGenerator:
         
         return recommendations
     
-    def generate_weekly_plan(self):
-        """주간 운동 플랜 생성"""
+    def generate_weekly_plan(self, as_model=False, with_loads=False):
+        """주간 운동 플랜 생성
+        
+        as_model=True이면 dict 대신 불변 WeeklyPlan을 반환합니다 (요일은 템플릿의 DayPlan을 공유하므로
+        플랜을 많이 보관할 때 메모리가 적게 듭니다). WeeklyPlan.to_dict()는 기본 반환값과 같습니다.
+        
+        with_loads=True이면 무게 기준이 있는 운동에 권장 무게 "무게"({"초급", "중급", "고급"} kg)를,
+        고령자는 50-60% 시작 무게 "시작_무게"도 함께 넣습니다 (플랜 전체를 한 번에 계산).
+        """
+        key = self._template_key()
+        loads = self._exercise_load_fields(key) if with_loads else None
+        
+        if as_model:
+            days = self.template_days(*key)
+            if loads:
+                fields = iter(loads)
+                days = tuple(
+                    replace(day, exercises=tuple(
+                        exercise.with_loads(field) if (field := next(fields)) else exercise
+                        for exercise in day.exercises
+                    ))
+                    for day in days
+                )
+            return WeeklyPlan(self.goal, self.environment, self.frequency, self.duration, days)
         
         plan = {
             "목표": self.goal,
@@ -1031,23 +1279,106 @@ class FitnessPlanGenerator:
             "주간_계획": []
         }
         
-        # 환경에 따른 운동 종류 결정
-        is_gym = "헬스장" in self.environment
-        has_equipment = "장비 있음" in self.environment or is_gym
+        plan["주간_계획"] = _thaw_days(self.weekly_template(*key))
+        if loads:
+            fields = iter(loads)
+            for day in plan["주간_계획"]:
+                for exercise in day["운동"]:
+                    field = next(fields)
+                    if field:
+                        exercise.update(field)
+        
+        return plan
+    
+    def _exercise_load_fields(self, key):
+        """템플릿 운동 순서대로 무게 필드 (load_tables.exercise_load_fields)"""
+        return exercise_load_fields(self.user.weight, self.user.gender, self.template_load_ids(*key), self.is_senior)
+    
+    def get_rep_range_loads(self, formula="epley"):
+        """운동별 반복 범위에 맞춘 작업 무게 (generate_weekly_plan의 요일/운동 순서와 같음)
+        
+        권장 무게(초급/중급/고급)를 1RM 추정치로 보고 처방된 최대 반복 횟수의 1RM 비율을 곱합니다.
+        formula: "epley" / "brzycki" (one_rep_max.FORMULAS)
+        
+        Returns:
+            ([{"반복": 8, "초급": kg, "중급": kg, "고급": kg} 또는 None, ...], ...) - 요일별
+        """
+        key = self._template_key()
+        days = self.weekly_numbers()
+        loads = iter(rep_range_loads(
+            self.user.weight, self.user.gender, self.template_load_ids(*key),
+            [numbers for day in days for numbers in day], formula
+        ))
+        return tuple([next(loads) for _ in day] for day in days)
+    
+    def weekly_numbers(self):
+        """주간 플랜의 요일별 처방 수치 (generate_weekly_plan의 운동 순서와 같음, 템플릿에서 공유하는 불변 객체)
+        
+        Returns:
+            ((ExerciseNumbers, ...), ...)
+        """
+        return tuple(numbers for _, _, numbers in self.weekly_template(*self._template_key()))
+    
+    def weekly_volume(self):
+        """주간 운동량 합계 (VolumeSummary - 세트, 반복, 시간 운동, 휴식)"""
+        return self.template_volume(*self._template_key())
+    
+    def _template_key(self):
+        # 분할 구성은 (빈도, 환경, 반복 등급, 유산소 여부)에만 의존하므로 미리 만든 템플릿을 사용
+        has_cardio = "체중 감량" in self.goal or "체력" in self.goal
+        return (
+            self.frequency if self.frequency in (3, 4, 5) else 6,
+            get_environment_kind(self.environment),
+            self.rep_tier,
+            has_cardio
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def template_days(cls, frequency, environment_kind, rep_tier, has_cardio):
+        """템플릿의 DayPlan 튜플 (처음 한 번만 생성, WeeklyPlan끼리 공유)"""
+        template = cls.weekly_template(frequency, environment_kind, rep_tier, has_cardio)
+        return tuple(DayPlan.from_dict({**info, "운동": exercises}) for info, exercises, _ in template)
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def template_load_ids(cls, frequency, environment_kind, rep_tier, has_cardio):
+        """템플릿의 모든 운동(요일 순서대로 펼침)의 무게 카탈로그 id 배열 (처음 한 번만 해석)"""
+        template = cls.weekly_template(frequency, environment_kind, rep_tier, has_cardio)
+        return exercise_ids([exercise["이름"] for _, exercises, _ in template for exercise in exercises])
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def template_volume(cls, frequency, environment_kind, rep_tier, has_cardio):
+        """템플릿별 주간 운동량 합계 (처음 한 번만 계산)"""
+        template = cls.weekly_template(frequency, environment_kind, rep_tier, has_cardio)
+        return summarize([numbers for _, _, numbers in template])
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def weekly_template(cls, frequency, environment_kind, rep_tier, has_cardio):
+        """주간 계획 템플릿 (키별로 처음 한 번만 생성, 직접 수정하지 말고 _thaw_days로 복사)
+        
+        frequency: 3 / 4 / 5 / 6 (6은 주 6-7회)
+        environment_kind: get_environment_kind 결과
+        rep_tier: REP_TIERS 키
+        """
+        is_gym = environment_kind == "gym"
+        has_equipment = environment_kind in ("gym", "equipment")
         
         # 빈도에 따라 다른 분할 적용
-        if self.frequency == 3:
-            plan["주간_계획"] = self._generate_3day_split(is_gym, has_equipment)
-        elif self.frequency == 4:
-            plan["주간_계획"] = self._generate_4day_split(is_gym, has_equipment)
-        elif self.frequency == 5:
-            plan["주간_계획"] = self._generate_5day_split(is_gym, has_equipment)
+        if frequency == 3:
+            workouts = cls._generate_3day_split(is_gym, has_equipment, has_cardio)
+        elif frequency == 4:
+            workouts = cls._generate_4day_split(is_gym, has_equipment, rep_tier, has_cardio)
+        elif frequency == 5:
+            workouts = cls._generate_5day_split(is_gym, has_equipment, rep_tier, has_cardio)
         else:  # 6-7일
-            plan["주간_계획"] = self._generate_6day_split(is_gym, has_equipment)
-        
-        return plan
+            workouts = cls._generate_6day_split(is_gym, has_equipment)
+        return _freeze_days(workouts)
     
-    def _generate_3day_split(self, is_gym, has_equipment):
+    @staticmethod
+    def _generate_3day_split(is_gym, has_equipment, has_cardio):
         """주 3회 전신 운동"""
         days = ["월요일", "수요일", "금요일"]
         workouts = []
@@ -1095,31 +1426,23 @@ class FitnessPlanGenerator:
                 }
             
             # 목표에 따라 유산소 추가
-            if "체중 감량" in self.goal or "체력" in self.goal:
+            if has_cardio:
                 workout["운동"].append({"이름": "유산소 운동", "시간": "20-30분", "강도": "중강도"})
             
             workouts.append(workout)
         
         return workouts
     
-    def _generate_4day_split(self, is_gym, has_equipment):
+    @staticmethod
+    def _generate_4day_split(is_gym, has_equipment, rep_tier, has_cardio):
         """주 4회 상하체 분할"""
         workouts = []
         days = ["월요일", "화요일", "목요일", "금요일"]
         
         # 나이와 성별에 따른 반복 횟수
-        if self.user.age >= 60:  # 고령자
-            main_reps = "12-15회"
-            secondary_reps = "15-18회"
-            accessory_reps = "18-20회"
-        elif self.user.gender == "남성":
-            main_reps = "6-8회"
-            secondary_reps = "8-10회"
-            accessory_reps = "10-12회"
-        else:  # 여성
-            main_reps = "10-12회"
-            secondary_reps = "12-15회"
-            accessory_reps = "15-20회"
+        main_reps = REP_TIERS[rep_tier]["main"]
+        secondary_reps = REP_TIERS[rep_tier]["secondary"]
+        accessory_reps = REP_TIERS[rep_tier]["accessory"]
         
         # Day 1: 하체
         if is_gym:
@@ -1264,17 +1587,18 @@ class FitnessPlanGenerator:
             }
         
         # 목표에 따라 유산소 추가
-        if "체중 감량" in self.goal or "체력" in self.goal:
+        if has_cardio:
             for workout in [lower1, lower2]:
                 workout["운동"].append({"이름": "유산소 운동", "시간": "15-20분", "강도": "중-고강도"})
         
         workouts = [lower1, upper_push, lower2, upper_pull]
         return workouts
     
-    def _generate_5day_split(self, is_gym, has_equipment):
+    @classmethod
+    def _generate_5day_split(cls, is_gym, has_equipment, rep_tier, has_cardio):
         """주 5회 분할"""
         # 4일 분할에 복근/유산소 데이 추가
-        workouts = self._generate_4day_split(is_gym, has_equipment)
+        workouts = cls._generate_4day_split(is_gym, has_equipment, rep_tier, has_cardio)
         
         # Day 5: 복근 & 유산소 & 유연성
         day5 = {
@@ -1294,7 +1618,8 @@ class FitnessPlanGenerator:
         workouts.append(day5)
         return workouts
     
-    def _generate_6day_split(self, is_gym, has_equipment):
+    @staticmethod
+    def _generate_6day_split(is_gym, has_equipment):
         """주 6-7회 분할 (Push/Pull/Legs 2회)"""
         workouts = []
         days = ["월요일", "화요일", "수요일", "금요일", "토요일", "일요일"]
@@ -1381,648 +1706,115 @@ class FitnessPlanGenerator:
             
             workouts.append(workout)
         
-        # 7일이면 마지막 날 삭제
-        if self.frequency == 6:
-            workouts = workouts[:6]
-        
+        # 7일도 6일 분할 사용 (마지막 날은 휴식)
         return workouts
     
+    @classmethod
+    @lru_cache(maxsize=None)
+    def exercise_index(cls):
+        """EXERCISE_VIDEOS 이름 색인 (처음 호출할 때 한 번만 생성)"""
+        return ExerciseIndex(cls.EXERCISE_VIDEOS)
+    
     def get_exercise_video(self, exercise_name):
-        """운동 이름으로 유튜브 링크 찾기"""
-        # 정확히 일치하는 것 먼저 찾기
-        if exercise_name in self.EXERCISE_VIDEOS:
-            return self.EXERCISE_VIDEOS[exercise_name]
-        
-        # 부분 일치 찾기 (괄호 제거 후)
-        clean_name = exercise_name.split('(')[0].strip()
-        if clean_name in self.EXERCISE_VIDEOS:
-            return self.EXERCISE_VIDEOS[clean_name]
-        
-        for key in self.EXERCISE_VIDEOS:
-            if key in exercise_name or exercise_name in key:
-                return self.EXERCISE_VIDEOS[key]
-        
-        return None
+        """운동 이름으로 유튜브 링크 찾기 (별칭/변형/괄호 설명 포함)"""
+        return self.exercise_index().lookup(exercise_name)
+    
+    def get_plan_videos(self, plan):
+        """주간 플랜 전체의 운동 이름 → 유튜브 링크 (링크가 없으면 None)"""
+        return self.exercise_index().resolve_plan(plan)
     
     def print_weekly_plan(self, plan):
         """주간 플랜 출력 (유튜브 링크 포함)"""
-        print("\n" + "=" * 60)
-        print("💪 맞춤형 주간 운동 플랜")
-        print("=" * 60)
-        print(f"\n🎯 운동 목표: {plan['목표']}")
-        print(f"📅 주간 운동일: {plan['주간_운동일']}일")
-        print(f"⏱  1회 운동 시간: {plan['운동_시간']}")
-        
-        # 고령자를 위한 안내
-        if self.user.age >= 60:
-            print("\n" + "⚠️ " * 30)
-            print("👴👵 고령자 맞춤 안전 운동 플랜")
-            print("=" * 60)
-            print("귀하의 연령({age}세)을 고려하여 관절과 근육을 보호하는".format(age=self.user.age))
-            print("저강도 고반복 운동 플랜으로 구성되었습니다.")
-            print("무게는 가볍게 시작하여 천천히 증가시키세요.")
-            print("=" * 60)
-        
-        print("\n" + "-" * 60)
-        
-        for idx, day_plan in enumerate(plan["주간_계획"], 1):
-            print(f"\n📌 Day {idx} - {day_plan['요일']}: {day_plan['주제']}")
-            print("-" * 60)
-            
-            for exercise in day_plan["운동"]:
-                if "횟수" in exercise:
-                    print(f"  ✓ {exercise['이름']}")
-                    print(f"    - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
-                    
-                    # 유튜브 링크 추가
-                    video_url = self.get_exercise_video(exercise['이름'])
-                    if video_url:
-                        print(f"    📹 운동 방법: {video_url}")
-                    
-                elif "시간" in exercise and "라운드" in exercise:
-                    print(f"  ✓ {exercise['이름']}")
-                    print(f"    - {exercise['라운드']}라운드, 총 {exercise['총시간']}")
-                    
-                    video_url = self.get_exercise_video(exercise['이름'])
-                    if video_url:
-                        print(f"    📹 운동 방법: {video_url}")
-                    
-                elif "시간" in exercise:
-                    print(f"  ✓ {exercise['이름']}")
-                    print(f"    - 시간: {exercise['시간']}" + (f", 강도: {exercise['강도']}" if "강도" in exercise else ""))
-                    
-                    video_url = self.get_exercise_video(exercise['이름'])
-                    if video_url:
-                        print(f"    📹 운동 방법: {video_url}")
-        
-        print("\n" + "=" * 60)
+        write_blocks(weekly_plan_blocks(self, plan))
     
     def print_nutrition_guide(self):
         """영양 가이드 출력"""
-        # Harris-Benedict 방정식으로 BMR 계산
-        weight = self.user.weight
-        height = self.user.height
-        age = self.user.age
-        
-        if self.user.gender == "남성":
-            bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
-        else:
-            bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
-        
-        # 활동 수준에 따른 TDEE (운동 빈도 고려)
-        activity_multipliers = {3: 1.375, 4: 1.55, 5: 1.725, 6: 1.9, 7: 1.9}
-        tdee = bmr * activity_multipliers.get(self.frequency, 1.55)
-        
-        # 목표에 따른 칼로리 조정
-        if "체중 감량" in self.goal and "근육 증가" not in self.goal:
-            target_cal = tdee - 500  # 주당 0.5kg 감량
-            calorie_note = "체중 감량을 위한 칼로리 적자"
-        elif "근육 증가" in self.goal and "체중 감량" not in self.goal:
-            target_cal = tdee + 300  # 근육 증가를 위한 칼로리 흑자
-            calorie_note = "근육 증가를 위한 칼로리 흑자"
-        elif "체중 감량 + 근육 증가" in self.goal:
-            target_cal = tdee - 200  # 약간의 적자로 리컴포지션
-            calorie_note = "바디 리컴포지션 (체지방 감소 + 근육 유지/증가)"
-        else:
-            target_cal = tdee
-            calorie_note = "체중 유지"
-        
-        # 목표에 따른 단백질 섭취량
-        if "근육 증가" in self.goal:
-            protein_min = weight * 1.8
-            protein_max = weight * 2.2
-        else:
-            protein_min = weight * 1.6
-            protein_max = weight * 2.0
-        
-        print("\n" + "=" * 60)
-        print("🍎 맞춤 영양 가이드")
-        print("=" * 60)
-        print(f"\n💡 기초 대사량 (BMR): 약 {int(bmr)}kcal/일")
-        print(f"💡 총 에너지 소비량 (TDEE): 약 {int(tdee)}kcal/일")
-        print(f"💡 목표 섭취 칼로리: 약 {int(target_cal)}kcal/일")
-        print(f"   → {calorie_note}")
-        
-        print(f"\n🥗 영양소 비율 ({self.goal}):")
-        print(f"  • 단백질: {round(protein_min, 1)}g - {round(protein_max, 1)}g/일")
-        print(f"    (체중 1kg당 {round(protein_min/weight, 1)}-{round(protein_max/weight, 1)}g)")
-        
-        if "체중 감량" in self.goal:
-            carb_ratio = 2.0
-            fat_ratio = 0.8
-        elif "근육 증가" in self.goal:
-            carb_ratio = 4.0
-            fat_ratio = 1.0
-        else:
-            carb_ratio = 3.0
-            fat_ratio = 0.9
-        
-        print(f"  • 탄수화물: {round(weight * carb_ratio, 1)}g - {round(weight * (carb_ratio + 0.5), 1)}g/일")
-        print(f"  • 지방: {round(weight * fat_ratio, 1)}g - {round(weight * (fat_ratio + 0.2), 1)}g/일")
-        
-        print(f"\n💧 수분 섭취: 최소 {round(weight * 0.035, 1)}L/일 (체중 1kg당 35ml)")
-        
-        print("\n📌 영양 섭취 팁:")
-        if "체중 감량" in self.goal:
-            print("  • 고단백, 저지방 식품 위주 (닭가슴살, 생선, 두부)")
-            print("  • 복합 탄수화물 선택 (현미, 고구마, 귀리)")
-            print("  • 채소를 많이 섭취하여 포만감 유지")
-        elif "근육 증가" in self.goal:
-            print("  • 운동 전후 단백질 + 탄수화물 섭취")
-            print("  • 하루 5-6끼로 나눠 먹기")
-            print("  • 양질의 지방 섭취 (견과류, 아보카도, 올리브유)")
-        
-        print("\n" + "=" * 60)
+        write_blocks(nutrition_blocks(self.goal, self.user.weight, self.get_nutrition_targets().to_dict()))
     
     def print_meal_plan(self):
         """예시 식단 출력"""
-        print("\n" + "=" * 60)
-        print("🍽️  예시 식단")
-        print("=" * 60)
-        
-        weight = self.user.weight
-        gender = self.user.gender
-        
-        # 목표에 따른 칼로리 계산 (print_nutrition_guide와 동일한 로직)
-        height = self.user.height
-        age = self.user.age
-        
-        if gender == "남성":
-            bmr = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
-        else:
-            bmr = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
-        
-        activity_multipliers = {3: 1.375, 4: 1.55, 5: 1.725, 6: 1.9, 7: 1.9}
-        tdee = bmr * activity_multipliers.get(self.frequency, 1.55)
-        
-        if "체중 감량" in self.goal and "근육 증가" not in self.goal:
-            target_cal = tdee - 500
-            meal_type = "체중 감량"
-        elif "근육 증가" in self.goal and "체중 감량" not in self.goal:
-            target_cal = tdee + 300
-            meal_type = "근육 증가"
-        elif "체중 감량 + 근육 증가" in self.goal:
-            target_cal = tdee - 200
-            meal_type = "체중 감량 + 근육 증가"
-        else:
-            target_cal = tdee
-            meal_type = "체중 유지"
-        
-        print(f"\n🎯 목표: {meal_type}")
-        print(f"📊 목표 칼로리: 약 {int(target_cal)}kcal/일")
-        
-        # 목표에 따른 식단 제시
-        if meal_type == "체중 감량":
-            self._print_weight_loss_meal()
-        elif meal_type == "근육 증가":
-            self._print_muscle_gain_meal()
-        elif meal_type == "체중 감량 + 근육 증가":
-            self._print_recomp_meal()
-        else:
-            self._print_maintenance_meal()
-        
-        print("\n" + "-" * 60)
-        print("💡 식단 팁")
-        print("-" * 60)
-        print("\n  • 위 식단은 예시이며, 개인 취향에 맞게 조절하세요")
-        print("  • 비슷한 영양소를 가진 음식으로 대체 가능합니다")
-        print("  • 물은 하루 2-2.5L 이상 충분히 섭취하세요")
-        print("  • 가공식품과 설탕 섭취를 줄이세요")
-        print("  • 식사 시간은 일정하게 유지하는 것이 좋습니다")
-        
-        print("\n" + "=" * 60)
-    
-    def _print_weight_loss_meal(self):
-        """체중 감량 식단"""
-        print("\n" + "-" * 60)
-        print("예시 하루 식단 (체중 감량)")
-        print("-" * 60)
-        
-        print("\n🌅 아침 (약 400kcal)")
-        print("  • 현미밥 1/2공기 (150kcal)")
-        print("  • 계란 2개 (삶은 계란 또는 스크램블) (140kcal)")
-        print("  • 김치찌개 1인분 (80kcal)")
-        print("  • 샐러드 (오이, 토마토, 양상추) (30kcal)")
-        print("  ➜ 단백질 20g, 탄수화물 45g, 지방 8g")
-        
-        print("\n☀️ 점심 (약 500kcal)")
-        print("  • 닭가슴살 샐러드 200g (200kcal)")
-        print("  • 고구마 중 1개 (150g) (150kcal)")
-        print("  • 브로콜리 100g (30kcal)")
-        print("  • 올리브유 드레싱 1스푼 (120kcal)")
-        print("  ➜ 단백질 35g, 탄수화물 40g, 지방 14g")
-        
-        print("\n🌙 저녁 (약 450kcal)")
-        print("  • 현미밥 1/2공기 (150kcal)")
-        print("  • 생선구이 (고등어 또는 연어) 150g (250kcal)")
-        print("  • 된장찌개 1인분 (50kcal)")
-        print("  ➜ 단백질 30g, 탄수화물 35g, 지방 12g")
-        
-        print("\n🍎 간식 (약 200kcal)")
-        print("  • 그릭요거트 무지방 150g (100kcal)")
-        print("  • 아몬드 10알 (70kcal)")
-        print("  • 사과 1/2개 (30kcal)")
-        print("  ➜ 단백질 12g, 탄수화물 15g, 지방 8g")
-        
-        print("\n📊 하루 총계: 약 1,550kcal")
-        print("  단백질: 97g | 탄수화물: 135g | 지방: 42g")
-    
-    def _print_muscle_gain_meal(self):
-        """근육 증가 식단"""
-        print("\n" + "-" * 60)
-        print("예시 하루 식단 (근육 증가)")
-        print("-" * 60)
-        
-        print("\n🌅 아침 (약 550kcal)")
-        print("  • 현미밥 1공기 (300kcal)")
-        print("  • 계란 3개 (210kcal)")
-        print("  • 김치찌개 1인분 (80kcal)")
-        print("  ➜ 단백질 28g, 탄수화물 60g, 지방 12g")
-        
-        print("\n☀️ 점심 (약 700kcal)")
-        print("  • 현미밥 1공기 (300kcal)")
-        print("  • 닭가슴살 200g (220kcal)")
-        print("  • 고구마 중 1개 (150kcal)")
-        print("  • 샐러드 (30kcal)")
-        print("  ➜ 단백질 50g, 탄수화물 85g, 지방 8g")
-        
-        print("\n🌙 저녁 (약 650kcal)")
-        print("  • 현미밥 1공기 (300kcal)")
-        print("  • 소고기 등심 150g (300kcal)")
-        print("  • 된장찌개 1인분 (50kcal)")
-        print("  ➜ 단백질 40g, 탄수화물 55g, 지방 18g")
-        
-        print("\n🍎 간식/운동 전후 (약 500kcal)")
-        print("  • 단백질 쉐이크 (30g 단백질) (150kcal)")
-        print("  • 바나나 2개 (200kcal)")
-        print("  • 땅콩버터 2스푼 (150kcal)")
-        print("  ➜ 단백질 35g, 탄수화물 55g, 지방 12g")
-        
-        print("\n📊 하루 총계: 약 2,400kcal")
-        print("  단백질: 153g | 탄수화물: 255g | 지방: 50g")
-    
-    def _print_recomp_meal(self):
-        """바디 리컴포지션 식단"""
-        print("\n" + "-" * 60)
-        print("예시 하루 식단 (체중 감량 + 근육 증가)")
-        print("-" * 60)
-        
-        print("\n🌅 아침 (약 450kcal)")
-        print("  • 현미밥 2/3공기 (200kcal)")
-        print("  • 계란 2개 + 계란흰자 2개 (160kcal)")
-        print("  • 김치찌개 1인분 (80kcal)")
-        print("  • 방울토마토 10개 (10kcal)")
-        print("  ➜ 단백질 25g, 탄수화물 50g, 지방 10g")
-        
-        print("\n☀️ 점심 (약 550kcal)")
-        print("  • 현미밥 2/3공기 (200kcal)")
-        print("  • 닭가슴살 150g (165kcal)")
-        print("  • 고구마 중 1개 (150kcal)")
-        print("  • 샐러드 + 발사믹 드레싱 (35kcal)")
-        print("  ➜ 단백질 40g, 탄수화물 65g, 지방 6g")
-        
-        print("\n🌙 저녁 (약 500kcal)")
-        print("  • 현미밥 2/3공기 (200kcal)")
-        print("  • 생선구이 (연어) 150g (250kcal)")
-        print("  • 된장찌개 1인분 (50kcal)")
-        print("  ➜ 단백질 35g, 탄수화물 45g, 지방 14g")
-        
-        print("\n🍎 간식 (약 300kcal)")
-        print("  • 그릭요거트 무지방 200g (130kcal)")
-        print("  • 프로틴바 1개 (150kcal)")
-        print("  • 블루베리 한줌 (20kcal)")
-        print("  ➜ 단백질 25g, 탄수화물 25g, 지방 8g")
-        
-        print("\n📊 하루 총계: 약 1,800kcal")
-        print("  단백질: 125g | 탄수화물: 185g | 지방: 38g")
-    
-    def _print_maintenance_meal(self):
-        """체중 유지 식단"""
-        print("\n" + "-" * 60)
-        print("예시 하루 식단 (체중 유지 / 건강 관리)")
-        print("-" * 60)
-        
-        print("\n🌅 아침 (약 500kcal)")
-        print("  • 현미밥 1공기 (300kcal)")
-        print("  • 계란 2개 (140kcal)")
-        print("  • 김치찌개 1인분 (80kcal)")
-        print("  ➜ 단백질 22g, 탄수화물 55g, 지방 10g")
-        
-        print("\n☀️ 점심 (약 600kcal)")
-        print("  • 현미밥 1공기 (300kcal)")
-        print("  • 닭가슴살 150g 또는 두부 1모 (180kcal)")
-        print("  • 고구마 작은것 1개 (100kcal)")
-        print("  • 샐러드 (20kcal)")
-        print("  ➜ 단백질 35g, 탄수화물 75g, 지방 8g")
-        
-        print("\n🌙 저녁 (약 550kcal)")
-        print("  • 현미밥 1공기 (300kcal)")
-        print("  • 생선 또는 고기 150g (200kcal)")
-        print("  • 된장찌개 1인분 (50kcal)")
-        print("  ➜ 단백질 35g, 탄수화물 50g, 지방 12g")
-        
-        print("\n🍎 간식 (약 250kcal)")
-        print("  • 과일 (바나나, 사과 등) (100kcal)")
-        print("  • 견과류 한줌 (100kcal)")
-        print("  • 우유 200ml (50kcal)")
-        print("  ➜ 단백질 10g, 탄수화물 30g, 지방 10g")
-        
-        print("\n📊 하루 총계: 약 1,900kcal")
-        print("  단백질: 102g | 탄수화물: 210g | 지방: 40g")
+        write_blocks(meal_plan_blocks(self.get_nutrition_targets().to_dict()))
     
     def print_weight_guide(self):
         """무게 가이드라인 출력"""
-        print("\n" + "=" * 60)
-        print("⚖️  무게 가이드라인")
-        print("=" * 60)
-        
-        print(f"\n💪 성별: {self.user.gender}")
-        print(f"📊 체중: {self.user.weight}kg")
-        print(f"🎯 권장 반복 횟수: {self.rep_description}")
-        
-        print("\n" + "-" * 60)
-        print("주요 운동별 추천 무게 (kg)")
-        print("-" * 60)
-        
-        # 주요 운동 목록
-        major_exercises = [
-            "바벨 스쿼트",
-            "데드리프트",
-            "벤치 프레스",
-            "숄더 프레스",
-            "랫 풀다운",
-            "시티드 로우",
-            "바벨 컬"
-        ]
-        
-        for exercise in major_exercises:
-            weights = self.get_weight_recommendation(exercise)
-            if weights:
-                print(f"\n  • {exercise}")
-                print(f"    - 초급: {weights['초급']}kg")
-                print(f"    - 중급: {weights['중급']}kg")
-                print(f"    - 고급: {weights['고급']}kg")
-        
-        print("\n" + "-" * 60)
-        print("📌 무게 선택 가이드")
-        print("-" * 60)
-        
-        if self.user.age >= 60:
-            print("\n  👴👵 고령자 (저강도 고반복 - 안전 중심):")
-            print("  • ⚠️  위 추천 무게의 50-60% 수준으로 시작하세요")
-            print("  • 목표 반복 횟수를 편안하게 완료할 수 있는 무게 사용")
-            print("  • 무게보다 정확한 자세와 균형 유지가 더 중요합니다")
-            print("  • 관절에 무리가 가지 않는 범위 내에서만 운동하세요")
-            print("  • 매주 증가량은 1-2kg 이하로 천천히 증가시키세요")
-            print("  • 통증이나 불편함이 느껴지면 즉시 중단하세요")
-        elif self.user.gender == "남성":
-            print("\n  남성 (고강도 저반복):")
-            print("  • 목표 반복 횟수의 마지막 1-2개가 힘들어야 합니다")
-            print("  • 세트 마지막에 더 이상 들 수 없는 무게가 적절합니다")
-            print("  • 근력 증가가 목표라면 더 무거운 무게로 도전하세요")
-        else:
-            print("\n  여성 (저강도 고반복):")
-            print("  • 목표 반복 횟수를 완료할 수 있되, 마지막 2-3개가 약간 힘들어야 합니다")
-            print("  • 세트 후 2-3회 더 할 수 있는 정도의 무게가 적절합니다")
-            print("  • 근지구력과 탄탄한 근육 라인이 목표입니다")
-        
-        print("\n  공통 원칙:")
-        print("  • 처음에는 가벼운 무게로 시작하여 자세를 익히세요")
-        print("  • 매주 2.5-5kg씩 점진적으로 증가시키세요")
-        print("  • 자세가 흐트러지면 무게를 줄이세요")
-        print("  • 위 무게는 참고용이며, 개인 체력에 맞게 조절하세요")
-        
-        print("\n" + "=" * 60)
+        write_blocks(weight_guide_blocks(self))
     
     def print_cardio_guide(self):
         """유산소 운동 가이드 출력"""
-        print("\n" + "=" * 60)
-        print("🏃 유산소 운동 가이드")
-        print("=" * 60)
-        
-        cardio = self.get_cardio_details()
-        
-        print(f"\n🎯 목표: {self.goal}")
-        print(f"📊 최대 심박수: {cardio['최대_심박수']}")
-        print(f"💓 목표 심박수: {cardio['목표_심박수']}")
-        print(f"⚡ 강도: {cardio['강도']}")
-        print(f"🏋️ 유형: {cardio['유형']}")
-        print(f"⏱  권장 시간: {cardio['권장_시간']}")
-        print(f"💡 설명: {cardio['설명']}")
-        
-        print("\n" + "-" * 60)
-        print("🎯 기구별 구체적인 운동 설정")
-        print("-" * 60)
-        print("본인의 체력 수준에 맞는 단계를 선택하세요\n")
-        
-        equipment_details = cardio.get('기구별_상세설정', {})
-        
-        for equipment_name, settings in equipment_details.items():
-            print(f"\n💪 {equipment_name}")
-            print("  " + "─" * 55)
-            print(f"  🟢 초급자 (운동 경험 3개월 미만)")
-            print(f"     {settings['초급']}")
-            print(f"\n  🟡 중급자 (운동 경험 3-12개월)")
-            print(f"     {settings['중급']}")
-            print(f"\n  🔴 고급자 (운동 경험 1년 이상)")
-            print(f"     {settings['고급']}")
-            print(f"\n  💡 팁: {settings['팁']}")
-        
-        print("\n" + "-" * 60)
-        print("📖 용어 설명")
-        print("-" * 60)
-        print("\n  • RPM (Revolutions Per Minute): 분당 회전수 - 사이클에서 페달을 밟는 속도")
-        print("  • SPM (Strokes Per Minute): 분당 스트로크 수 - 로잉머신에서 당기는 횟수")
-        print("  • 인클라인: 런닝머신 경사도 (% 또는 각도)")
-        
-        print("\n" + "-" * 60)
-        print("📌 심박수 측정 방법")
-        print("-" * 60)
-        print("\n  1. 스마트워치/밴드 착용")
-        print("  2. 운동 기구 내장 심박수 센서")
-        print("  3. 목이나 손목 맥박 직접 측정 (15초 × 4)")
-        print("  4. 자각적 강도 (RPE): 10점 만점에 7-8점 수준")
-        
-        print("\n" + "-" * 60)
-        print("💡 유산소 운동 팁")
-        print("-" * 60)
-        
-        if "체중 감량" in self.goal and "근육 증가" not in self.goal:
-            print("\n  체중 감량 유산소:")
-            print("  • 대화가 가능한 정도의 강도 유지")
-            print("  • 너무 힘들면 지방 대신 근육이 분해됩니다")
-            print("  • 일정한 페이스로 오래 하는 것이 중요")
-            print("  • 아침 공복 유산소가 효과적 (선택)")
-            print("  • 심박수 모니터링으로 목표 구간 유지")
-        else:
-            print("\n  HIIT (고강도 인터벌):")
-            print("  • 전력 질주 20-30초 + 휴식 30-60초 반복")
-            print("  • 땀이 많이 나고 숨이 가쁜 것이 정상")
-            print("  • 주 2-3회가 적당 (과훈련 주의)")
-            print("  • 기초대사량 증가 효과 (운동 후 24-48시간)")
-            print("  • 워밍업/쿨다운 각 5분씩 필수")
-        
-        print("\n" + "=" * 60)
+        write_blocks(cardio_blocks(self.goal, self.get_cardio_details()))
     
     def print_medical_guidance(self):
         """지병 주의사항 출력"""
-        if not self.medical_conditions:
-            return
-        
-        print("\n" + "=" * 60)
-        print("💊 지병 관련 운동 주의사항")
-        print("=" * 60)
-        
-        print(f"\n현재 지병: {', '.join(self.medical_conditions)}")
-        
-        precautions = self.get_medical_precautions()
-        
-        for condition in self.medical_conditions:
-            if condition in precautions:
-                print("\n" + "█" * 60)
-                print(f"  {condition} 관련 주의사항")
-                print("█" * 60)
-                
-                prec = precautions[condition]
-                
-                print("\n⚠️ 주의사항:")
-                for item in prec["주의사항"]:
-                    print(f"  • {item}")
-                
-                print("\n✅ 권장 운동:")
-                for exercise in prec["권장_운동"]:
-                    print(f"  ✓ {exercise}")
-                
-                print("\n🚫 피해야 할 운동:")
-                for exercise in prec["피할_운동"]:
-                    print(f"  ✗ {exercise}")
-                
-                # 추가 정보
-                if "운동_전_섭취" in prec:
-                    print("\n🍎 운동 전 섭취 권장:")
-                    for food in prec["운동_전_섭취"]:
-                        print(f"  • {food}")
-                
-                if "운동_시간" in prec:
-                    print(f"\n⏰ 운동 시간: {prec['운동_시간']}")
-                
-                if "운동_강도" in prec:
-                    print(f"\n💪 운동 강도: {prec['운동_강도']}")
-                
-                if "수분" in prec:
-                    print(f"\n💧 수분 섭취: {prec['수분']}")
-                
-                if "응급_상황" in prec:
-                    print(f"\n🚨 응급 상황: {prec['응급_상황']}")
-        
-        print("\n" + "=" * 60)
-        print("⚠️  중요 안내")
-        print("=" * 60)
-        print("\n  • 위 내용은 일반적인 가이드라인입니다")
-        print("  • 반드시 담당 의사와 상담 후 운동을 시작하세요")
-        print("  • 운동 중 이상 증상 발생 시 즉시 중단하세요")
-        print("  • 약물 복용 중이라면 운동 시간과 약물 복용 시간 조절 필요")
-        print("  • 정기적으로 건강 상태를 체크하세요")
-        
-        print("\n" + "=" * 60)
+        if self.medical_conditions:
+            write_blocks(medical_blocks(self.medical_conditions, self.get_medical_precautions()))
     
     def print_pain_guidance(self):
         """통증 부위 주의사항 및 재활 운동 출력"""
-        if not self.pain_areas:
-            return
-        
-        print("\n" + "=" * 60)
-        print("⚠️  통증 부위 주의사항 및 재활 운동")
-        print("=" * 60)
-        
-        print(f"\n통증 부위: {', '.join(self.pain_areas)}")
-        
-        modifications, rehab_exercises = self.get_pain_modifications()
-        
-        for area in self.pain_areas:
-            if area in modifications:
-                print("\n" + "█" * 60)
-                print(f"  {area} 관련 주의사항")
-                print("█" * 60)
-                
-                mod = modifications[area]
-                
-                print("\n🚫 피해야 할 운동:")
-                for exercise in mod["피해야_할_운동"]:
-                    print(f"  ✗ {exercise}")
-                
-                print("\n⚠️ 주의가 필요한 운동:")
-                for exercise in mod["주의_운동"]:
-                    print(f"  ⚡ {exercise}")
-                
-                print("\n✅ 대체 운동:")
-                for exercise in mod["대체_운동"]:
-                    print(f"  ✓ {exercise}")
-                
-                if area in rehab_exercises:
-                    print(f"\n💊 {area} 재활/강화 운동:")
-                    print("-" * 60)
-                    for exercise in rehab_exercises[area]:
-                        if "시간" in exercise:
-                            print(f"  • {exercise['이름']}")
-                            print(f"    - {exercise['세트']}세트 × {exercise['시간']}, 휴식 {exercise['휴식']}")
-                        elif "각" in exercise:
-                            print(f"  • {exercise['이름']}")
-                            print(f"    - {exercise['세트']}세트 × {exercise['각']}")
-                        else:
-                            print(f"  • {exercise['이름']}")
-                            print(f"    - {exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}")
-        
-        print("\n" + "=" * 60)
-        print("⚠️  중요 안내")
-        print("=" * 60)
-        print("\n  • 재활 운동은 매우 가벼운 무게나 맨몸으로 시작하세요")
-        print("  • 통증이 심하거나 지속되면 전문의 상담이 필요합니다")
-        print("  • 재활 운동은 주 3-4회, 본 운동 전 또는 휴식일에 수행")
-        print("  • 운동 중 통증이 느껴지면 즉시 중단하세요")
-        print("  • 호전되면 점진적으로 강도를 높이세요")
-        
-        print("\n" + "=" * 60)
+        if self.pain_areas:
+            write_blocks(pain_blocks(self.pain_areas, *self.get_pain_modifications()))
     
     def print_tips(self):
         """운동 팁 출력"""
-        print("\n" + "=" * 60)
-        print("💡 운동 성공을 위한 팁")
-        print("=" * 60)
-        
-        # 고령자를 위한 특별 팁
-        if self.user.age >= 60:
-            print("\n⚠️  고령자 맞춤 운동 주의사항")
-            print("-" * 60)
-            senior_tips = [
-                "매우 가벼운 무게로 시작하여 천천히 증가시키세요",
-                "관절에 무리가 가는 고중량 운동은 피하세요",
-                "균형 운동을 꼭 포함하여 낙상을 예방하세요",
-                "탈수 방지를 위해 운동 중 자주 물을 마시세요",
-                "운동 전후 충분한 워밍업(10-15분)과 스트레칭(10분) 필수",
-                "어지럼증이나 가슴 통증 발생 시 즉시 중단하고 의사 상담",
-                "약물 복용 중이라면 운동 시작 전 의사와 상담하세요",
-                "가능하면 트레이너나 동반자와 함께 운동하세요"
-            ]
-            for idx, tip in enumerate(senior_tips, 1):
-                print(f"  {idx}. {tip}")
-            print("\n" + "-" * 60)
-            print("📌 일반 운동 팁")
-        
-        tips = [
-            "워밍업은 필수! 운동 전 5-10분 가벼운 유산소와 동적 스트레칭",
-            "운동 후 쿨다운과 정적 스트레칭으로 근육 회복 촉진",
-            "충분한 수면 (7-8시간)은 근육 회복과 성장에 필수적입니다",
-            "점진적 과부하: 매주 조금씩 무게나 횟수를 늘려가세요",
-            "운동 일지를 작성하여 진행 상황을 추적하세요",
-            "통증이 느껴지면 즉시 중단하고 휴식을 취하세요",
-            "일주일에 2-3일은 충분한 휴식일을 가지세요"
-        ]
-        
-        for idx, tip in enumerate(tips, 1):
-            print(f"\n  {idx}. {tip}")
-        
-        print("\n" + "=" * 60)
+        write_blocks(tips_blocks(self.user.age))
+    
+    def plan_document(self, bundle=None):
+        """플랜 문서 (bundle을 넘기면 그 결과를 사용, 없으면 build_plan_bundle로 생성)"""
+        return build_plan_document(self, bundle or build_plan_bundle(self))
+
+
+# ============================================================
+# 플랜 묶음 - CLI/앱/배치 공용
+# ============================================================
+
+PLAN_CACHE_FILE = "plan_cache.json"
+
+# 플랜 내보내기 선택 → (문서 형식, 확장자)
+PLAN_EXPORT_FORMATS = {"md": ("markdown", "md"), "html": ("html", "html")}
+BUNDLE_STAGES = ["recommend_goal", "weekly_plan", "nutrition", "cardio", "guidance"]
+
+
+def build_plan_bundle(planner, timings=None):
+    """플랜 생성기의 결과를 JSON으로 저장 가능한 dict 하나로 묶기
+    
+    timings(dict)를 넘기면 BUNDLE_STAGES 단계별 소요 시간(초)을 누적합니다.
+    """
+    if timings is None:
+        timings = dict.fromkeys(BUNDLE_STAGES, 0.0)
+    bundle = {}
+    
+    started = time.perf_counter()
+    bundle["recommendations"] = planner.recommend_goal()
+    now = time.perf_counter()
+    timings["recommend_goal"] += now - started
+    started = now
+    
+    bundle["weekly_plan"] = planner.generate_weekly_plan(with_loads=True)
+    now = time.perf_counter()
+    timings["weekly_plan"] += now - started
+    started = now
+    
+    bundle["nutrition"] = planner.get_nutrition_targets().to_dict()
+    now = time.perf_counter()
+    timings["nutrition"] += now - started
+    started = now
+    
+    bundle["cardio"] = planner.get_cardio_details()
+    now = time.perf_counter()
+    timings["cardio"] += now - started
+    started = now
+    
+    modifications, rehab_exercises = planner.get_pain_modifications()
+    bundle["medical_precautions"] = planner.get_medical_precautions()
+    bundle["pain_modifications"] = modifications
+    bundle["rehab_exercises"] = rehab_exercises
+    timings["guidance"] += time.perf_counter() - started
+    
+    return bundle
+
+
+def print_recommendations(recommendations):
+    """추천 목표 출력"""
+    write_blocks(recommendation_blocks(recommendations))
 
 
 def main():
@@ -2042,8 +1834,9 @@ def main():
     
     print("\n환영합니다! 맞춤형 운동 플랜을 생성하기 위해 몇 가지 질문을 드리겠습니다.")
     
-    # 프로필 매니저 초기화
-    profile_manager = ProfileManager()
+    # 프로필 매니저 초기화 (프로필을 저장할 때마다 측정 기록도 추가, 종료할 때 한 번에 저장하고 닫음)
+    profile_manager = ProfileManager(progress_store=ProgressStore(PROGRESS_FILE))
+    atexit.register(profile_manager.close)
     current_nickname = None
     
     # 저장된 프로필 확인
@@ -2060,13 +1853,9 @@ def main():
             
             if choice == "1":
                 # 프로필 불러오기
-                profile_manager.print_profile_list()
-                profiles = profile_manager.list_profiles()
+                nickname = profile_manager.prompt_nickname("프로필 별명을 입력하세요")
                 
-                print("\n프로필 별명을 입력하세요:")
-                nickname = input("별명: ").strip()
-                
-                if nickname in profiles:
+                if nickname in profile_manager.list_profiles():
                     profile_data = profile_manager.get_profile(nickname)
                     current_nickname = nickname
                     
@@ -2136,9 +1925,7 @@ def main():
             
             elif choice == "3":
                 # 프로필 관리
-                profile_manager.print_profile_list()
-                
-                delete_nickname = input("\n삭제할 프로필 별명 (취소하려면 Enter): ").strip()
+                delete_nickname = profile_manager.prompt_nickname("삭제할 프로필 별명 (취소하려면 Enter)")
                 
                 if delete_nickname:
                     if profile_manager.delete_profile(delete_nickname):
@@ -2283,30 +2070,26 @@ def main():
     # 플랜 생성기 초기화
     planner = FitnessPlanGenerator(user, goal, environment, frequency, duration, pain_areas, medical_conditions)
     
-    # 추천 목표 출력
-    print("\n" + "=" * 60)
-    print("🎯 AI 분석 결과")
-    print("=" * 60)
-    
-    recommendations = planner.recommend_goal()
-    if recommendations:
-        print("\n귀하의 신체 분석 결과, 다음 목표들을 추천드립니다:")
-        for idx, rec in enumerate(recommendations, 1):
-            print(f"\n{idx}. {rec['목표']}")
-            print(f"   우선순위: {rec['우선순위']}")
-            print(f"   이유: {rec['이유']}")
+    # 같은 입력의 플랜은 캐시에서 재사용 (재시작 후에도 plan_cache.json에서 불러옴)
+    plan_cache = PlanCache(filename=PLAN_CACHE_FILE)
+    bundle = plan_cache.get_or_create(planner, build_plan_bundle)
+    plan_cache.save()
     
-    print("\n" + "=" * 60)
-    
-    # 주간 운동 플랜 생성 및 출력
-    weekly_plan = planner.generate_weekly_plan()
-    planner.print_weekly_plan(weekly_plan)
-    
-    # 영양 가이드 출력
-    planner.print_nutrition_guide()
+    # 플랜 문서를 한 번 만들어 추천 목표/주간 플랜/영양 가이드/운동 팁 출력
+    document = planner.plan_document(bundle)
+    document.write(sections=["recommendations", "weekly_plan", "nutrition", "tips"])
     
-    # 운동 팁 출력
-    planner.print_tips()
+    # 전체 플랜을 파일로 내보내기
+    export_choice = input("\n전체 플랜을 파일로 저장하시겠습니까? (md/html/n): ").strip().lower()
+    if export_choice in PLAN_EXPORT_FORMATS:
+        fmt, extension = PLAN_EXPORT_FORMATS[export_choice]
+        export_filename = f"fitplan_{current_nickname or 'plan'}.{extension}"
+        try:
+            with open(export_filename, 'w', encoding='utf-8') as f:
+                document.write(f, fmt)
+            print(f"\n✅ 플랜을 {export_filename}에 저장했습니다!")
+        except OSError as e:
+            print(f"\n❌ 플랜 저장 중 오류가 발생했습니다: {e}")
     
     # 프로필 업데이트 (운동 계획 정보 포함)
     if current_nickname:
@@ -2406,59 +2189,256 @@ def test_mode():
     # 플랜 생성기 초기화
     planner = FitnessPlanGenerator(user, goal, environment, frequency, duration, pain_areas, medical_conditions)
     
-    # 추천 목표 출력
-    print("\n" + "=" * 60)
-    print("🎯 AI 분석 결과")
-    print("=" * 60)
+    # 플랜 묶음 생성 (캐시 경유, 테스트 모드는 파일에 저장하지 않음)
+    bundle = PlanCache().get_or_create(planner, build_plan_bundle)
     
-    recommendations = planner.recommend_goal()
-    if recommendations:
-        print("\n귀하의 신체 분석 결과, 다음 목표들을 추천드립니다:")
-        for idx, rec in enumerate(recommendations, 1):
-            print(f"\n{idx}. {rec['목표']}")
-            print(f"   우선순위: {rec['우선순위']}")
-            print(f"   이유: {rec['이유']}")
+    # 플랜 문서를 한 번 만들어 추천 목표부터 운동 팁까지 한 번에 출력
+    planner.plan_document(bundle).write(sections=SECTION_ORDER[1:])
     
     print("\n" + "=" * 60)
+    print("✨ FitPlan AI와 함께 건강한 변화를 시작하세요! ✨")
+    print("=" * 60)
+    print("\n💾 이 플랜을 저장하거나 인쇄하여 활용하세요!")
+    print("📊 매주 진행 상황을 기록하고 필요시 플랜을 조정하세요!")
+    print("\n")
+
+
+# ============================================================
+# 배치 모드 - 대량 프로필 플랜 생성
+# ============================================================
+
+BATCH_STAGES = ["profile"] + BUNDLE_STAGES
+
+
+def _parse_list_field(value):
+    """CSV 셀("a;b") 또는 JSONL 리스트를 문자열 리스트로 변환"""
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item.strip() for item in str(value).split(";") if item.strip()]
+
+
+def _parse_optional_float(value):
+    """빈 값이면 None, 아니면 float"""
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _normalize_gender(value):
+    """남/여/M/F 입력을 '남성'/'여성'으로 변환"""
+    gender = str(value).strip().upper()
+    if gender in ['남', '남성', 'M', 'MALE']:
+        return '남성'
+    if gender in ['여', '여성', 'F', 'FEMALE']:
+        return '여성'
+    raise ValueError(f"알 수 없는 성별: {value}")
+
+
+def iter_batch_profiles(path):
+    """CSV 또는 JSONL 파일에서 프로필을 한 줄씩 읽기 (스트리밍)
+    
+    CSV는 행 dict, JSONL은 줄 문자열 그대로 돌려줍니다. JSON 해석은 워커에서 행별로 하므로
+    잘못된 줄이 있어도 그 줄만 오류 레코드가 됩니다 (parse_batch_row).
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                yield row
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+
+def parse_batch_row(row):
+    """iter_batch_profiles의 행 → 프로필 dict (JSONL 줄은 해석, 객체가 아니면 TypeError)"""
+    if isinstance(row, str):
+        row = json.loads(row)
+    if not isinstance(row, dict):
+        raise TypeError(f"프로필은 JSON 객체여야 합니다 ({type(row).__name__})")
+    return row
+
+
+def build_plan_record(row, timings=None):
+    """프로필 한 건으로 전체 플랜을 생성해 구조화된 결과(dict)로 반환"""
+    if timings is None:
+        timings = dict.fromkeys(BATCH_STAGES, 0.0)
     
-    # 주간 운동 플랜 생성 및 출력
-    weekly_plan = planner.generate_weekly_plan()
-    planner.print_weekly_plan(weekly_plan)
-    
-    # 영양 가이드 출력
-    planner.print_nutrition_guide()
-    
-    # 예시 식단 출력
-    planner.print_meal_plan()
-    
-    # 유산소 운동 가이드 출력
-    planner.print_cardio_guide()
-    
-    # 무게 가이드라인 출력
-    planner.print_weight_guide()
+    started = time.perf_counter()
+    user = UserProfile(
+        height=float(row['height']),
+        weight=float(row['weight']),
+        age=int(row['age']),
+        gender=_normalize_gender(row['gender']),
+        body_fat_percentage=_parse_optional_float(row.get('body_fat_percentage')),
+        skeletal_muscle_mass=_parse_optional_float(row.get('skeletal_muscle_mass'))
+    )
+    planner = FitnessPlanGenerator(
+        user,
+        row.get('goal') or "건강 유지",
+        row.get('environment') or "헬스장",
+        int(row.get('frequency') or 3),
+        int(row.get('duration') or 60),
+        _parse_list_field(row.get('pain_areas')),
+        _parse_list_field(row.get('medical_conditions'))
+    )
+    record = {
+        "nickname": row.get('nickname'),
+        "profile": user.analyze_body_composition()
+    }
+    timings["profile"] += time.perf_counter() - started
     
-    # 지병 주의사항 출력
-    planner.print_medical_guidance()
+    record.update(build_plan_bundle(planner, timings))
+    return record
+
+
+def _process_batch_chunk(rows):
+    """워커 프로세스에서 청크 단위로 플랜 생성 후 JSON 문자열로 직렬화"""
+    timings = dict.fromkeys(BATCH_STAGES, 0.0)
+    lines = []
+    errors = 0
+    for row in rows:
+        try:
+            row = parse_batch_row(row)
+            record = build_plan_record(row, timings)
+        except (KeyError, ValueError, TypeError) as e:
+            nickname = row.get('nickname') if isinstance(row, dict) else None
+            record = {"nickname": nickname, "error": f"{type(e).__name__}: {e}"}
+            errors += 1
+        lines.append(json.dumps(record, ensure_ascii=False))
+    return lines, timings, errors
+
+
+def _iter_chunks(iterable, chunksize):
+    """이터러블을 chunksize 크기의 리스트로 나누기"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(input_path, output_path, workers=None, chunksize=64):
+    """입력 파일의 모든 프로필로 플랜을 생성해 JSONL로 저장
+    
+    입력은 청크 단위로 읽고, 처리 중인 청크 수를 워커 수의 2배로 제한하며,
+    결과는 입력 순서대로 즉시 기록하므로 입력 크기와 무관하게 메모리가 일정합니다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    workers = workers or os.cpu_count() or 1
+    totals = dict.fromkeys(BATCH_STAGES, 0.0)
+    count = 0
+    errors = 0
+    started = time.perf_counter()
+    
+    def collect(result):
+        nonlocal count, errors
+        lines, timings, chunk_errors = result
+        out.write("\n".join(lines) + "\n")
+        for stage, seconds in timings.items():
+            totals[stage] += seconds
+        count += len(lines)
+        errors += chunk_errors
+    
+    chunks = _iter_chunks(iter_batch_profiles(input_path), chunksize)
+    with open(output_path, 'w', encoding='utf-8') as out:
+        if workers == 1:
+            for chunk in chunks:
+                collect(_process_batch_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(_process_batch_chunk, chunk))
+                    if len(pending) >= workers * 2:
+                        collect(pending.popleft().result())
+                while pending:
+                    collect(pending.popleft().result())
+    
+    elapsed = time.perf_counter() - started
+    plans = count - errors
+    return {
+        "rows": count,
+        "plans": plans,
+        "errors": errors,
+        "elapsed": elapsed,
+        "plans_per_sec": plans / elapsed if elapsed > 0 else 0.0,
+        "stage_seconds": totals
+    }
+
+
+def batch_mode(argv):
+    """배치 모드 - 명령줄 인자를 받아 run_batch 실행 후 처리량 출력"""
+    import argparse
+    import sys
+    import io
+    if sys.platform == "win32":
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     
-    # 통증 부위 주의사항 출력
-    planner.print_pain_guidance()
+    parser = argparse.ArgumentParser(
+        prog="fitness_plan_demo.py batch",
+        description="CSV/JSONL 프로필 파일로 플랜을 일괄 생성해 JSONL로 저장합니다."
+    )
+    parser.add_argument("input", help="입력 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("output", help="출력 파일 (.jsonl)")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--chunksize", type=int, default=64, help="워커에 한 번에 넘길 프로필 수")
+    args = parser.parse_args(argv)
     
-    # 운동 팁 출력
-    planner.print_tips()
+    stats = run_batch(args.input, args.output, args.workers, args.chunksize)
     
     print("\n" + "=" * 60)
-    print("✨ FitPlan AI와 함께 건강한 변화를 시작하세요! ✨")
+    print("📦 배치 플랜 생성 결과")
     print("=" * 60)
-    print("\n💾 이 플랜을 저장하거나 인쇄하여 활용하세요!")
-    print("📊 매주 진행 상황을 기록하고 필요시 플랜을 조정하세요!")
-    print("\n")
+    print(f"\n  • 입력 프로필: {stats['rows']}건")
+    print(f"  • 생성 성공: {stats['plans']}건")
+    print(f"  • 생성 실패: {stats['errors']}건")
+    print(f"  • 소요 시간: {stats['elapsed']:.2f}초")
+    print(f"  • 처리량: {stats['plans_per_sec']:.1f} plans/sec")
+    print("\n  단계별 누적 시간 (전체 워커 합계):")
+    for stage, seconds in stats['stage_seconds'].items():
+        per_plan = seconds / stats['plans'] * 1000 if stats['plans'] else 0.0
+        print(f"    - {stage:15} {seconds:8.3f}초  ({per_plan:.3f}ms/플랜)")
+    print("\n" + "=" * 60)
+
+
+def migrate_mode(argv):
+    """profiles.json → SQLite 저장소 일괄 이전"""
+    import argparse
+    import sys
+    import io
+    if sys.platform == "win32":
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    
+    parser = argparse.ArgumentParser(
+        prog="fitness_plan_demo.py migrate",
+        description="JSON 프로필 파일을 SQLite 저장소로 옮깁니다."
+    )
+    parser.add_argument("source", nargs="?", default="profiles.json", help="JSON 프로필 파일")
+    parser.add_argument("target", nargs="?", default="profiles.db", help="SQLite 파일")
+    args = parser.parse_args(argv)
+    
+    count = migrate_json_to_sqlite(args.source, args.target)
+    print(f"\n✅ {count}개 프로필을 {args.target}(으)로 옮겼습니다.")
 
 
 if __name__ == "__main__":
     import sys
     
-    # 명령줄 인자로 테스트 모드 실행
+    # 명령줄 인자로 테스트 모드 / 배치 모드 / 저장소 이전 실행
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         test_mode()
+    elif len(sys.argv) > 1 and sys.argv[1] == "batch":
+        batch_mode(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == "migrate":
+        migrate_mode(sys.argv[2:])
     else:
         main()
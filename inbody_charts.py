@@ -0,0 +1,117 @@
+"""
+FitPlan AI - 인바디 스타일 그래프
+배경 범위(낮음/정상/높음)는 성별에만 의존하므로 성별/지표별 기본 Figure를 한 번만 만들고,
+사용자별 그래프는 기본 Figure를 복제해 현재 값 막대만 바꿉니다.
+배경 범위는 막대 trace 대신 shape로 그려 브라우저로 보내는 Figure JSON을 줄입니다.
+"""
+
+from functools import lru_cache
+
+import plotly.graph_objects as go
+
+# 지표 → (제목, 단위, x축 최대값)
+INBODY_METRICS = {
+    "bmi": ("BMI (체질량지수)", "", 40),
+    "body_fat": ("체지방률", "%", 50),
+    "muscle_ratio": ("골격근 비율", "%", 100),
+}
+
+# 성별에 따른 정상 범위
+INBODY_RANGES = {
+    "남성": {
+        "bmi": {"낮음": (0, 18.5), "정상": (18.5, 25), "높음": (25, 40)},
+        "body_fat": {"낮음": (0, 10), "정상": (10, 20), "높음": (20, 50)},
+        "muscle_ratio": {"낮음": (0, 37), "정상": (37, 50), "높음": (50, 100)},
+    },
+    "여성": {
+        "bmi": {"낮음": (0, 18.5), "정상": (18.5, 25), "높음": (25, 40)},
+        "body_fat": {"낮음": (0, 18), "정상": (18, 28), "높음": (28, 50)},
+        "muscle_ratio": {"낮음": (0, 30), "정상": (30, 45), "높음": (45, 100)},
+    },
+}
+
+# 배경 범위 (낮음 - 노란색, 정상 - 초록색, 높음 - 빨간색)
+BAND_COLORS = {"낮음": "rgba(255, 193, 7, 0.3)", "정상": "rgba(76, 175, 80, 0.3)", "높음": "rgba(244, 67, 54, 0.3)"}
+
+# 현재 값 막대 (낮음 - 주황색, 정상 - 초록색, 높음 - 빨간색)
+VALUE_COLORS = {"낮음": "rgba(255, 152, 0, 0.9)", "정상": "rgba(76, 175, 80, 0.9)", "높음": "rgba(244, 67, 54, 0.9)"}
+
+
+@lru_cache(maxsize=None)
+def base_figure(gender, metric):
+    """성별/지표별 기본 Figure (배경 범위 shape + 빈 값 막대) - 직접 수정하지 말고 inbody_chart로 복제"""
+    title, unit, max_value = INBODY_METRICS[metric]
+    ranges = INBODY_RANGES["남성" if gender == "남성" else "여성"][metric]
+
+    fig = go.Figure(go.Bar(
+        y=[title],
+        x=[0],
+        orientation='h',
+        marker=dict(color=VALUE_COLORS["정상"], line=dict(width=2, color='white')),
+        textposition='outside',
+        textfont=dict(size=12, color='black', family='Arial Black'),  # 모바일에 맞게 텍스트 크기 축소
+        showlegend=False
+    ))
+
+    # 배경 범위는 막대(0.8 폭)와 같은 높이의 사각형 shape로 표시
+    for category, (start, end) in ranges.items():
+        fig.add_shape(
+            type="rect", xref="x", yref="paper",
+            x0=start, x1=end, y0=0.1, y1=0.9,
+            fillcolor=BAND_COLORS[category], line=dict(width=0), layer="below"
+        )
+
+    # 레이아웃 설정 (모바일 최적화)
+    # 기본 plotly 템플릿은 Figure JSON의 대부분을 차지하고 Streamlit 테마가 덮어쓰므로 제외
+    fig.update_layout(
+        template="none",
+        title=dict(
+            text=f"<b>{title}</b>",
+            font=dict(size=14, color='#333'),
+            x=0.01,
+            xanchor='left',
+            y=0.95,
+            yanchor='top'
+        ),
+        height=120,  # 제목 공간을 위해 높이 약간 증가
+        margin=dict(l=5, r=5, t=30, b=5),  # 상단 여백 증가
+        xaxis=dict(
+            range=[0, max_value],
+            showgrid=True,
+            gridcolor='lightgray',
+            zeroline=False,
+            showticklabels=True,
+            tickfont=dict(size=9)
+        ),
+        yaxis=dict(
+            showticklabels=False,
+            showgrid=False
+        ),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family='Arial', size=11)
+    )
+    return fig
+
+
+def value_category(gender, metric, value):
+    """현재 값이 속한 범위 (낮음/정상/높음)"""
+    normal_start, normal_end = INBODY_RANGES["남성" if gender == "남성" else "여성"][metric]["정상"]
+    if value < normal_start:
+        return "낮음"
+    if value > normal_end:
+        return "높음"
+    return "정상"
+
+
+def inbody_chart(gender, metric, value):
+    """사용자별 인바디 그래프 (기본 Figure 복제 후 값 막대만 갱신)"""
+    title, unit, _ = INBODY_METRICS[metric]
+    fig = go.Figure(base_figure(gender, metric))
+    fig.update_traces(
+        x=[value],
+        marker_color=VALUE_COLORS[value_category(gender, metric, value)],
+        text=[f"{value:.1f}{unit}"],
+        hovertemplate=f'<b>{title}</b><br>현재 값: {value:.1f}{unit}<extra></extra>'
+    )
+    return fig
@@ -0,0 +1,180 @@
+"""
+FitPlan AI - 권장 무게 표
+운동별 체중 배율(초급/중급/고급)을 성별 NumPy 배열로 모듈 로드 시 한 번만 만들어 두고,
+운동 이름은 정규화한 이름/별칭으로 카탈로그 id에 연결합니다.
+한 운동은 recommend_load, 주간 플랜 전체나 여러 사용자는 recommend_loads / plan_loads로 한 번에 계산합니다.
+결과는 내장 round()와 같은 반올림(py_round)을 사용하므로 스칼라 계산과 동일합니다.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from body_composition import py_round
+from exercise_index import normalize_name
+
+LOAD_LEVELS = ("초급", "중급", "고급")
+GENDERS = ("남성", "여성")
+SENIOR_START_RATIOS = (0.5, 0.6)  # 고령자: 추천 무게의 50-60%로 시작
+
+# 이름, 기구, 남성 배율 (초급, 중급, 고급), 여성 배율 - 덤벨은 덤벨 한 개 무게 기준
+LOAD_CATALOG = (
+    # 하체 운동
+    ("바벨 스쿼트", "barbell", (1.0, 1.5, 2.0), (0.5, 0.8, 1.2)),
+    ("프론트 스쿼트", "barbell", (0.8, 1.2, 1.6), (0.4, 0.65, 1.0)),
+    ("레그 프레스", "machine", (1.5, 2.0, 2.5), (1.0, 1.5, 2.0)),
+    ("데드리프트", "barbell", (1.0, 1.5, 2.0), (0.5, 0.8, 1.2)),
+    ("루마니안 데드리프트", "barbell", (0.7, 1.0, 1.3), (0.4, 0.6, 0.9)),
+    ("스티프 레그 데드리프트", "barbell", (0.7, 1.0, 1.3), (0.4, 0.6, 0.9)),
+    ("레그 컬", "machine", (0.3, 0.45, 0.6), (0.2, 0.3, 0.45)),
+    ("레그 익스텐션", "machine", (0.4, 0.6, 0.8), (0.25, 0.4, 0.55)),
+    ("덤벨 스쿼트", "dumbbell", (0.15, 0.25, 0.35), (0.08, 0.12, 0.18)),
+    ("덤벨 고블릿 스쿼트", "dumbbell", (0.2, 0.35, 0.5), (0.1, 0.2, 0.3)),
+    ("덤벨 루마니안 데드리프트", "dumbbell", (0.2, 0.3, 0.45), (0.1, 0.15, 0.25)),
+    ("불가리안 스플릿 스쿼트", "dumbbell", (0.1, 0.2, 0.3), (0.05, 0.1, 0.15)),
+
+    # 상체 밀기
+    ("벤치 프레스", "barbell", (0.5, 0.8, 1.2), (0.2, 0.4, 0.6)),
+    ("인클라인 벤치 프레스", "barbell", (0.4, 0.65, 1.0), (0.15, 0.3, 0.5)),
+    ("인클라인 덤벨 프레스", "dumbbell", (0.15, 0.25, 0.35), (0.08, 0.12, 0.18)),
+    ("덤벨 벤치 프레스", "dumbbell", (0.18, 0.28, 0.4), (0.08, 0.13, 0.2)),
+    ("덤벨 플라이", "dumbbell", (0.1, 0.15, 0.22), (0.05, 0.08, 0.12)),
+    ("숄더 프레스", "barbell", (0.3, 0.5, 0.7), (0.15, 0.25, 0.4)),
+    ("덤벨 숄더 프레스", "dumbbell", (0.12, 0.20, 0.28), (0.06, 0.10, 0.15)),
+    ("사이드 레터럴 레이즈", "dumbbell", (0.05, 0.08, 0.12), (0.03, 0.05, 0.07)),
+
+    # 상체 당기기
+    ("랫 풀다운", "cable", (0.5, 0.8, 1.0), (0.3, 0.5, 0.7)),
+    ("시티드 로우", "cable", (0.5, 0.8, 1.0), (0.3, 0.5, 0.7)),
+    ("덤벨 로우", "dumbbell", (0.15, 0.25, 0.35), (0.08, 0.12, 0.18)),
+    ("덤벨 풀오버", "dumbbell", (0.15, 0.25, 0.35), (0.08, 0.12, 0.18)),
+    ("페이스 풀", "cable", (0.15, 0.25, 0.35), (0.08, 0.12, 0.2)),
+    ("리어 델트 플라이", "dumbbell", (0.04, 0.07, 0.1), (0.02, 0.04, 0.06)),
+
+    # 팔 운동
+    ("바벨 컬", "barbell", (0.2, 0.3, 0.45), (0.1, 0.15, 0.25)),
+    ("덤벨 컬", "dumbbell", (0.08, 0.12, 0.18), (0.04, 0.06, 0.10)),
+    ("해머 컬", "dumbbell", (0.08, 0.12, 0.18), (0.04, 0.06, 0.10)),
+    ("케이블 푸시다운", "cable", (0.2, 0.3, 0.45), (0.1, 0.15, 0.25)),
+    ("오버헤드 트라이셉스 익스텐션", "dumbbell", (0.1, 0.18, 0.25), (0.05, 0.08, 0.12)),
+)
+
+# 플랜에서 쓰는 이름 → 카탈로그 이름
+LOAD_ALIASES = {
+    "덤벨 프레스": "덤벨 벤치 프레스",
+    "덤벨 사이드 레이즈": "사이드 레터럴 레이즈",
+    "사이드 레이즈": "사이드 레터럴 레이즈",
+    "리버스 플라이": "리어 델트 플라이",
+    "트라이셉스 푸시다운": "케이블 푸시다운",
+    "덤벨 오버헤드 익스텐션": "오버헤드 트라이셉스 익스텐션",
+}
+
+CATALOG_NAMES = tuple(name for name, _, _, _ in LOAD_CATALOG)
+EQUIPMENT = tuple(equipment for _, equipment, _, _ in LOAD_CATALOG)
+
+# MULTIPLIERS[성별 번호, 카탈로그 id] = (초급, 중급, 고급) 배율; 마지막 행(id -1)은 무게 없는 운동용 NaN
+MULTIPLIERS = np.full((len(GENDERS), len(LOAD_CATALOG) + 1, len(LOAD_LEVELS)), np.nan)
+MULTIPLIERS[0, :-1] = [male for _, _, male, _ in LOAD_CATALOG]
+MULTIPLIERS[1, :-1] = [female for _, _, _, female in LOAD_CATALOG]
+MULTIPLIERS.setflags(write=False)
+
+_IDS = {normalize_name(name): i for i, name in enumerate(CATALOG_NAMES)}
+_IDS.update({normalize_name(alias): _IDS[normalize_name(target)] for alias, target in LOAD_ALIASES.items()})
+_ALTERNATIVES = re.compile(r"\s+or\s+|/", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def load_id(name):
+    """운동 이름 → 카탈로그 id (무게 기준이 없는 운동은 None)
+
+    정규화한 이름(괄호 설명/공백 제거)이 카탈로그 이름이나 별칭과 같을 때만 연결합니다.
+    "벤치 프레스 or 푸시업"처럼 대안이 있으면 앞에서부터 처음 연결되는 대안을 사용합니다.
+    "싱글 레그 데드리프트" 같은 맨몸 변형은 부분 일치로 연결하지 않습니다.
+    """
+    for alternative in _ALTERNATIVES.split(name):
+        catalog_id = _IDS.get(normalize_name(alternative))
+        if catalog_id is not None:
+            return catalog_id
+    return None
+
+
+def gender_index(gender):
+    """MULTIPLIERS 성별 번호 (남성 0, 그 외 1)"""
+    return 0 if gender == "남성" else 1
+
+
+def recommend_load(weight, gender, name):
+    """운동 한 개의 권장 무게 {"초급": kg, "중급": kg, "고급": kg} (무게 기준이 없으면 None)"""
+    catalog_id = load_id(name)
+    if catalog_id is None:
+        return None
+    multipliers = LOAD_CATALOG[catalog_id][2 + gender_index(gender)]
+    return {level: round(weight * m, 1) for level, m in zip(LOAD_LEVELS, multipliers)}
+
+
+def exercise_ids(names):
+    """운동 이름 목록 → 카탈로그 id 배열 (무게 기준이 없으면 -1)"""
+    ids = [load_id(name) for name in names]
+    return np.array([-1 if i is None else i for i in ids], dtype=np.intp)
+
+
+def recommend_loads(weights, genders, ids):
+    """여러 사용자 × 여러 운동의 권장 무게를 한 번에 계산
+
+    Args:
+        weights: 체중 (스칼라 또는 사용자 수 길이 배열)
+        genders: 성별 (weights와 같은 모양, "남성"/"여성" 또는 gender_index 번호)
+        ids: exercise_ids() 결과
+
+    Returns:
+        (사용자 수, 운동 수, 3) 배열 (스칼라 체중이면 (운동 수, 3)), 무게 기준이 없는 운동은 NaN
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    genders = np.asarray(genders)
+    if genders.dtype.kind in "UO":
+        genders = np.where(genders == "남성", 0, 1)
+    multipliers = MULTIPLIERS[genders[..., None], np.asarray(ids)]
+    return py_round(weights[..., None, None] * multipliers, 1)
+
+
+@lru_cache(maxsize=256)
+def _names_ids(names):
+    # 같은 템플릿의 플랜은 운동 목록이 같으므로 이름 해석은 목록별로 한 번만
+    ids = exercise_ids(names)
+    return ids, tuple(i >= 0 for i in ids.tolist())
+
+
+def plan_loads(weight, gender, plan):
+    """주간 플랜에 나오는 운동별 권장 무게 {운동 이름: {"초급", "중급", "고급"} 또는 None} (처음 나온 순서)"""
+    names = tuple(dict.fromkeys(
+        exercise["이름"] for day_plan in plan["주간_계획"] for exercise in day_plan["운동"]
+    ))
+    ids, loaded = _names_ids(names)
+    loads = py_round(weight * MULTIPLIERS[gender_index(gender), ids], 1).tolist()
+    return {
+        name: dict(zip(LOAD_LEVELS, row)) if has_load else None
+        for name, row, has_load in zip(names, loads, loaded)
+    }
+
+
+def exercise_load_fields(weight, gender, ids, senior=False):
+    """운동별 플랜 무게 필드 목록 (ids 순서, 무게 기준이 없으면 None)
+
+    {"무게": {"초급": kg, "중급": kg, "고급": kg}}이고, senior이면 단계별 시작 무게
+    "시작_무게": {"초급": [50%, 60%], ...}(추천 무게 기준)를 함께 넣습니다.
+    필드 dict는 운동마다 새로 만들므로 수정해도 다른 운동에 영향이 없습니다.
+    """
+    loads = py_round(weight * MULTIPLIERS[gender_index(gender), ids], 1)
+    rows = loads.tolist()
+    starts = py_round(loads[..., None] * np.array(SENIOR_START_RATIOS), 1).tolist() if senior else None
+    fields = []
+    for i, catalog_id in enumerate(ids.tolist()):
+        if catalog_id < 0:
+            fields.append(None)
+            continue
+        field = {"무게": dict(zip(LOAD_LEVELS, rows[i]))}
+        if senior:
+            field["시작_무게"] = dict(zip(LOAD_LEVELS, starts[i]))
+        fields.append(field)
+    return fields
@@ -0,0 +1,113 @@
+"""
+FitPlan AI - 벡터화된 영양 목표 계산
+여러 회원의 BMR/TDEE/목표 칼로리/영양소 범위를 NumPy 배열 단위로 한 번에 계산합니다.
+Harris-Benedict 공식 결과는 compute_nutrition_targets (스칼라) 결과와 완전히 동일합니다.
+"""
+
+import numpy as np
+
+from body_composition import BodyCompositionFrame
+from fitness_plan_demo import ACTIVITY_MULTIPLIERS, nutrition_goal_rules
+
+BMR_FORMULAS = ("harris_benedict", "mifflin_st_jeor", "katch_mcardle")
+GOALS = ("체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지")
+
+# 운동 빈도(0-7) → 활동 계수 조회표, 표에 없는 빈도는 1.55 (compute_nutrition_targets와 동일)
+_ACTIVITY_TABLE = np.array([ACTIVITY_MULTIPLIERS.get(f, 1.55) for f in range(8)])
+
+
+def _activity_multiplier(frequency, n):
+    """운동 빈도 배열을 활동 계수 배열로 변환
+
+    스칼라 계산의 dict 조회와 같이 정수 값(4, 4.0)만 표에서 찾고, 4.9 같은 소수는 잘라내지 않고 1.55입니다.
+    """
+    frequency = np.broadcast_to(np.asarray(frequency, dtype=np.float64), (n,))
+    in_table = (frequency == np.floor(frequency)) & (frequency >= 0) & (frequency < len(_ACTIVITY_TABLE))
+    index = np.where(in_table, frequency, 0).astype(np.int64)
+    return np.where(in_table, _ACTIVITY_TABLE[index], 1.55)
+
+
+def _goal_columns(goal, n):
+    """목표(문자열 또는 문자열 배열)를 칼로리 조정량/영양소 비율 배열로 변환"""
+    if isinstance(goal, str):
+        offset, _, _, protein, carb, fat = nutrition_goal_rules(goal)
+        return (np.full(n, float(offset)), np.full(n, protein[0]), np.full(n, protein[1]),
+                np.full(n, carb), np.full(n, fat))
+
+    # 앱/CLI에서 선택 가능한 목표는 비교 마스크로 바로 코드화하고 (정렬 없이 O(n)),
+    # 그 밖의 자유 입력 목표만 np.unique로 묶어 목표별로 한 번씩 규칙을 계산
+    goal = np.asarray(goal)
+    codes = np.full(n, -1, dtype=np.int64)
+    names = list(GOALS)
+    for code, name in enumerate(GOALS):
+        codes[goal == name] = code
+    unknown = codes < 0
+    if unknown.any():
+        extra, inverse = np.unique(goal[unknown], return_inverse=True)
+        codes[unknown] = len(names) + inverse.reshape(-1)
+        names.extend(str(g) for g in extra)
+
+    rules = [nutrition_goal_rules(name) for name in names]
+    table = np.array([(r[0], r[3][0], r[3][1], r[4], r[5]) for r in rules], dtype=np.float64)
+    columns = table[codes]
+    return tuple(columns[:, i] for i in range(5))
+
+
+def compute_bmr(weight, height, age, gender, formula="harris_benedict", lean_body_mass=None):
+    """BMR 배열 계산
+
+    - harris_benedict: 기존 print_nutrition_guide 공식
+    - mifflin_st_jeor: 10×체중 + 6.25×키 - 5×나이 + 5(남) / -161(여)
+    - katch_mcardle: 370 + 21.6×제지방량 (lean_body_mass 필요)
+    """
+    weight = np.asarray(weight, dtype=np.float64)
+    height = np.asarray(height, dtype=np.float64)
+    age = np.asarray(age, dtype=np.float64)
+    is_male = np.asarray(gender) == "남성"
+
+    if formula == "harris_benedict":
+        male = 88.362 + (13.397 * weight) + (4.799 * height) - (5.677 * age)
+        female = 447.593 + (9.247 * weight) + (3.098 * height) - (4.330 * age)
+        return np.where(is_male, male, female)
+    if formula == "mifflin_st_jeor":
+        return (10 * weight) + (6.25 * height) - (5 * age) + np.where(is_male, 5.0, -161.0)
+    if formula == "katch_mcardle":
+        if lean_body_mass is None:
+            raise ValueError("katch_mcardle 공식에는 제지방량(lean_body_mass)이 필요합니다.")
+        return 370 + (21.6 * np.asarray(lean_body_mass, dtype=np.float64))
+    raise ValueError(f"알 수 없는 BMR 공식: {formula} (사용 가능: {', '.join(BMR_FORMULAS)})")
+
+
+def compute_nutrition_targets_batch(weight, height, age, gender, goal, frequency,
+                                    formula="harris_benedict", body_fat_percentage=None):
+    """여러 회원의 영양 목표를 한 번에 계산
+
+    goal과 frequency는 모든 행에 공통인 스칼라이거나 행별 배열일 수 있습니다.
+    katch_mcardle 공식은 UserProfile.calculate_lean_body_mass와 같은 방식으로 제지방량을 구하며,
+    체지방률이 없는 행은 BMI 기반으로 추정합니다.
+    반환값은 NutritionTargets의 숫자 필드 이름을 키로 하는 배열 dict입니다.
+    """
+    weight = np.asarray(weight, dtype=np.float64)
+    n = len(weight)
+
+    lean_body_mass = None
+    if formula == "katch_mcardle":
+        frame = BodyCompositionFrame(height, weight, age, gender, body_fat_percentage=body_fat_percentage)
+        lean_body_mass = frame.lean_body_mass
+
+    bmr = compute_bmr(weight, height, age, gender, formula, lean_body_mass)
+    tdee = bmr * _activity_multiplier(frequency, n)
+    offset, protein_min, protein_max, carb, fat = _goal_columns(goal, n)
+
+    return {
+        "bmr": bmr,
+        "tdee": tdee,
+        "target_calories": tdee + offset,
+        "protein_min": weight * protein_min,
+        "protein_max": weight * protein_max,
+        "carb_min": weight * carb,
+        "carb_max": weight * (carb + 0.5),
+        "fat_min": weight * fat,
+        "fat_max": weight * (fat + 0.2),
+        "water_liters": weight * 0.035,
+    }
@@ -0,0 +1,76 @@
+"""
+FitPlan AI - 1RM 기반 반복 범위별 무게
+체중 배율 권장 무게(load_tables, 초급/중급/고급)를 1RM 추정치로 보고, 운동마다 처방된 반복 횟수에 맞는
+작업 무게(1RM × 반복 횟수별 비율)를 계산합니다. 비율 표는 공식(Epley/Brzycki)별로 모듈 로드 시 한 번만 만들고,
+주간 플랜의 모든 운동은 배열 연산 한 번으로 계산합니다.
+"""
+
+import numpy as np
+
+from body_composition import py_round
+from load_tables import LOAD_LEVELS, MULTIPLIERS, gender_index
+
+FORMULAS = ("epley", "brzycki")
+MAX_REPS = 30  # 이보다 많은 반복은 30회 비율 사용 (Brzycki는 37회 이상에서 정의되지 않음)
+
+_REPS = np.arange(MAX_REPS + 1, dtype=np.float64)
+
+# PERCENT_OF_1RM[공식][반복 횟수] = 그 횟수를 할 수 있는 무게 / 1RM (0회는 NaN - 반복 처방 없음)
+PERCENT_OF_1RM = {
+    "epley": np.where(_REPS == 1, 1.0, 1 / (1 + _REPS / 30)),  # 1RM = 무게 × (1 + 반복/30), 1회는 그대로
+    "brzycki": (37 - _REPS) / 36,                               # 1RM = 무게 × 36 / (37 - 반복)
+}
+for _table in PERCENT_OF_1RM.values():
+    _table[0] = np.nan
+    _table.setflags(write=False)
+
+
+def check_formula(formula):
+    """1RM 공식 이름 확인 (FORMULAS에 없으면 ValueError)"""
+    if formula not in PERCENT_OF_1RM:
+        raise ValueError(f"알 수 없는 1RM 공식: {formula} (가능: {', '.join(FORMULAS)})")
+    return formula
+
+
+def _percent_table(formula):
+    return PERCENT_OF_1RM[check_formula(formula)]
+
+
+def percent_of_1rm(reps, formula="epley"):
+    """반복 횟수 → 1RM 대비 비율 (배열 가능, 0회는 NaN)"""
+    table = _percent_table(formula)
+    return table[np.clip(np.asarray(reps, dtype=np.intp), 0, MAX_REPS)]
+
+
+def estimate_1rm(load, reps, formula="epley"):
+    """무게 × 반복 횟수 → 추정 1RM (배열 가능)"""
+    return np.asarray(load, dtype=np.float64) / percent_of_1rm(reps, formula)
+
+
+def working_loads(one_rep_maxes, reps, formula="epley"):
+    """1RM (..., 3) × 반복 횟수 (...) → 작업 무게 (..., 3), 0.1kg 반올림
+
+    반복 처방이 없는 운동(0회)과 무게 기준이 없는 운동(NaN)은 NaN입니다.
+    """
+    percents = percent_of_1rm(reps, formula)
+    return py_round(np.asarray(one_rep_maxes, dtype=np.float64) * percents[..., None], 1)
+
+
+def rep_range_loads(weight, gender, ids, numbers, formula="epley"):
+    """플랜 운동별 반복 범위 작업 무게 (ids/numbers 순서, 무게 기준이나 반복 처방이 없으면 None)
+
+    ids는 load_tables.exercise_ids, numbers는 ExerciseNumbers 목록입니다.
+    반복 범위의 최대 횟수(예: "6-8회" → 8회)를 모든 세트에서 채울 수 있는 무게를 사용합니다.
+
+    Returns:
+        [{"반복": 8, "초급": kg, "중급": kg, "고급": kg} 또는 None, ...]
+    """
+    reps = np.array([n.reps_max for n in numbers], dtype=np.intp)
+    one_rep_maxes = weight * MULTIPLIERS[gender_index(gender), ids]
+    loads = working_loads(one_rep_maxes, reps, formula)
+    valid = ~np.isnan(loads[:, 0])
+    rows = loads.tolist()
+    return [
+        {"반복": n.reps_max, **dict(zip(LOAD_LEVELS, row))} if ok else None
+        for n, row, ok in zip(numbers, rows, valid.tolist())
+    ]
@@ -0,0 +1,160 @@
+"""
+FitPlan AI - 플랜 캐시
+같은 입력(신체 정보, 목표, 환경, 빈도, 시간, 통증 부위, 지병)으로 만든 플랜 묶음을
+크기 제한이 있는 LRU 캐시에 보관하고, 필요하면 JSON 파일로 저장해 재시작 후에도 재사용합니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+class PlanCache:
+    """플랜 묶음 LRU 캐시
+
+    maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    filename을 지정하면 생성 시 파일에서 불러오고, save() 호출 시 변경 사항을 저장합니다.
+    캐시된 플랜 묶음은 여러 호출이 공유하므로 수정하지 말고 읽기만 하세요.
+    여러 스레드(Streamlit 세션)가 한 인스턴스를 함께 써도 됩니다.
+    """
+
+    VERSION = 2  # 2: 주간 플랜 운동에 "무게"/"시작_무게" 포함
+
+    def __init__(self, maxsize=256, filename=None):
+        self.maxsize = maxsize
+        self.filename = filename
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 파일 쓰기는 한 번에 하나만 (쓰는 동안에도 get/put 가능)
+        self._dirty = False
+        self._changes = 0  # 변경 횟수 - 저장 중에 바뀐 내용이 있으면 다음 save()에서 다시 저장
+        if filename:
+            self.load()
+
+    @staticmethod
+    def make_key(planner):
+        """FitnessPlanGenerator 입력값을 정규화한 캐시 키 (JSON 문자열)
+
+        숫자는 float로 통일하고(70 == 70.0), 문자열은 앞뒤 공백을 제거합니다.
+        체지방률/골격근량은 추정값이 채워진 UserProfile 값을 사용합니다.
+        통증 부위/지병은 출력 순서에 영향을 주므로 순서를 유지합니다.
+        """
+        user = planner.user
+        key = [
+            float(user.height), float(user.weight), int(user.age), user.gender,
+            float(user.body_fat_percentage), float(user.skeletal_muscle_mass),
+            planner.goal.strip(), planner.environment.strip(),
+            int(planner.frequency), int(planner.duration),
+            [area.strip() for area in planner.pain_areas],
+            [condition.strip() for condition in planner.medical_conditions],
+        ]
+        return json.dumps(key, ensure_ascii=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """캐시된 값 (없으면 None), 사용한 항목은 가장 최근으로 이동"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """값 저장 (maxsize 초과 시 가장 오래된 항목 제거)"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._dirty = True
+            self._changes += 1
+
+    def get_or_create(self, planner, factory):
+        """planner 입력에 해당하는 플랜 묶음, 없으면 factory(planner)로 만들어 저장"""
+        key = self.make_key(planner)
+        value = self.get(key)
+        if value is None:
+            value = factory(planner)
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """모든 항목과 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self._dirty = True
+            self._changes += 1
+
+    def stats(self):
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def load(self):
+        """파일에서 캐시 불러오기 (파일이 없거나 손상되었으면 빈 캐시로 시작)"""
+        if not self.filename or not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        # 최상위가 객체가 아니거나 버전/항목 형식이 다르면 캐시 미스와 같이 빈 캐시로 시작
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        try:
+            entries = OrderedDict(data.get("entries", [])[-self.maxsize:])
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._entries = entries
+            self._dirty = False
+
+    def save(self):
+        """변경 사항이 있으면 파일에 저장 (고유한 임시 파일에 쓴 뒤 교체, 실패하면 다음 호출에서 다시 시도)"""
+        if not self.filename or not self._dirty:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                data = {"version": self.VERSION, "entries": list(self._entries.items())}
+                changes = self._changes
+            directory, name = os.path.split(os.path.abspath(self.filename))
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, prefix=f"{name}.",
+                                             suffix=".tmp", delete=False) as f:
+                tmp_filename = f.name
+                try:
+                    json.dump(data, f, ensure_ascii=False)
+                except BaseException:
+                    f.close()
+                    os.remove(tmp_filename)
+                    raise
+            try:
+                os.replace(tmp_filename, self.filename)
+            except OSError:
+                os.remove(tmp_filename)
+                raise
+            with self._lock:
+                if self._changes == changes:
+                    self._dirty = False
@@ -0,0 +1,840 @@
+"""
+FitPlan AI - 플랜 문서
+플랜 생성기의 결과(프로필 분석, 추천 목표, 주간 플랜, 영양, 식단, 유산소, 무게, 지병/통증 안내, 팁)를
+블록 목록으로 한 번 만들어 두고, 터미널 텍스트/Markdown/HTML/JSON으로 렌더링합니다.
+렌더러는 전체 문서를 문자열 하나로 만든 뒤 스트림에 한 번에 씁니다.
+터미널 텍스트는 기존 print_* 출력과 글자 하나까지 같습니다.
+"""
+
+import html
+import json
+import sys
+from functools import lru_cache
+from typing import NamedTuple
+
+RULE_WIDTH = 60
+
+
+class Block(NamedTuple):
+    """문서 블록 한 개 (문서 하나에 수백 개를 만들므로 생성이 빠른 NamedTuple)
+
+    kind:
+      title       섹션 제목 (= 줄 사이)
+      heading     소제목 (- 줄 사이)
+      subheading  소제목 (아래에만 - 줄, 예: Day 1)
+      banner      강조 제목 (█ 줄 사이, 지병/통증 항목)
+      label       짧은 굵은 제목 (예: 식사 이름)
+      text        일반 문장
+      item        목록 항목 (marker: •, ✓, ✗, 1. 등)
+      link        링크 (text 뒤에 url)
+      rule        구분선 (text가 구분선 문자열, 터미널 텍스트에만 표시)
+      blank       빈 줄 (터미널 텍스트에만 표시)
+    gap: 앞에 넣을 빈 줄 수, indent: 터미널 텍스트 들여쓰기
+    """
+    kind: str
+    text: str = ""
+    indent: int = 0
+    marker: str = ""
+    url: str = ""
+    gap: int = 0
+
+
+def _title(text, gap=1):
+    return Block("title", text, gap=gap)
+
+
+def _heading(text):
+    return Block("heading", text, gap=1)
+
+
+def _text(text, indent=0, gap=0):
+    return Block("text", text, indent=indent, gap=gap)
+
+
+def _item(text, marker="•", indent=2, gap=0):
+    return Block("item", text, indent=indent, marker=marker, gap=gap)
+
+
+def _rule(char="=", gap=1):
+    return Block("rule", char * RULE_WIDTH, gap=gap)
+
+
+def _items(texts, marker="•", indent=2, gap=1):
+    """목록 항목 여러 개 (첫 항목 앞에만 gap)"""
+    return [_item(text, marker, indent, gap if i == 0 else 0) for i, text in enumerate(texts)]
+
+
+# ============================================================
+# 고정 문구
+# ============================================================
+
+# 예시 식단 (식단 종류 → 제목, [(식사, [음식], 영양소)], 하루 총계, 하루 영양소)
+MEAL_PLANS = {
+    "체중 감량": {
+        "제목": "체중 감량",
+        "식사": [
+            ("🌅 아침 (약 400kcal)", [
+                "현미밥 1/2공기 (150kcal)",
+                "계란 2개 (삶은 계란 또는 스크램블) (140kcal)",
+                "김치찌개 1인분 (80kcal)",
+                "샐러드 (오이, 토마토, 양상추) (30kcal)",
+            ], "단백질 20g, 탄수화물 45g, 지방 8g"),
+            ("☀️ 점심 (약 500kcal)", [
+                "닭가슴살 샐러드 200g (200kcal)",
+                "고구마 중 1개 (150g) (150kcal)",
+                "브로콜리 100g (30kcal)",
+                "올리브유 드레싱 1스푼 (120kcal)",
+            ], "단백질 35g, 탄수화물 40g, 지방 14g"),
+            ("🌙 저녁 (약 450kcal)", [
+                "현미밥 1/2공기 (150kcal)",
+                "생선구이 (고등어 또는 연어) 150g (250kcal)",
+                "된장찌개 1인분 (50kcal)",
+            ], "단백질 30g, 탄수화물 35g, 지방 12g"),
+            ("🍎 간식 (약 200kcal)", [
+                "그릭요거트 무지방 150g (100kcal)",
+                "아몬드 10알 (70kcal)",
+                "사과 1/2개 (30kcal)",
+            ], "단백질 12g, 탄수화물 15g, 지방 8g"),
+        ],
+        "총계": "약 1,550kcal",
+        "영양소": "단백질: 97g | 탄수화물: 135g | 지방: 42g",
+    },
+    "근육 증가": {
+        "제목": "근육 증가",
+        "식사": [
+            ("🌅 아침 (약 550kcal)", [
+                "현미밥 1공기 (300kcal)",
+                "계란 3개 (210kcal)",
+                "김치찌개 1인분 (80kcal)",
+            ], "단백질 28g, 탄수화물 60g, 지방 12g"),
+            ("☀️ 점심 (약 700kcal)", [
+                "현미밥 1공기 (300kcal)",
+                "닭가슴살 200g (220kcal)",
+                "고구마 중 1개 (150kcal)",
+                "샐러드 (30kcal)",
+            ], "단백질 50g, 탄수화물 85g, 지방 8g"),
+            ("🌙 저녁 (약 650kcal)", [
+                "현미밥 1공기 (300kcal)",
+                "소고기 등심 150g (300kcal)",
+                "된장찌개 1인분 (50kcal)",
+            ], "단백질 40g, 탄수화물 55g, 지방 18g"),
+            ("🍎 간식/운동 전후 (약 500kcal)", [
+                "단백질 쉐이크 (30g 단백질) (150kcal)",
+                "바나나 2개 (200kcal)",
+                "땅콩버터 2스푼 (150kcal)",
+            ], "단백질 35g, 탄수화물 55g, 지방 12g"),
+        ],
+        "총계": "약 2,400kcal",
+        "영양소": "단백질: 153g | 탄수화물: 255g | 지방: 50g",
+    },
+    "체중 감량 + 근육 증가": {
+        "제목": "체중 감량 + 근육 증가",
+        "식사": [
+            ("🌅 아침 (약 450kcal)", [
+                "현미밥 2/3공기 (200kcal)",
+                "계란 2개 + 계란흰자 2개 (160kcal)",
+                "김치찌개 1인분 (80kcal)",
+                "방울토마토 10개 (10kcal)",
+            ], "단백질 25g, 탄수화물 50g, 지방 10g"),
+            ("☀️ 점심 (약 550kcal)", [
+                "현미밥 2/3공기 (200kcal)",
+                "닭가슴살 150g (165kcal)",
+                "고구마 중 1개 (150kcal)",
+                "샐러드 + 발사믹 드레싱 (35kcal)",
+            ], "단백질 40g, 탄수화물 65g, 지방 6g"),
+            ("🌙 저녁 (약 500kcal)", [
+                "현미밥 2/3공기 (200kcal)",
+                "생선구이 (연어) 150g (250kcal)",
+                "된장찌개 1인분 (50kcal)",
+            ], "단백질 35g, 탄수화물 45g, 지방 14g"),
+            ("🍎 간식 (약 300kcal)", [
+                "그릭요거트 무지방 200g (130kcal)",
+                "프로틴바 1개 (150kcal)",
+                "블루베리 한줌 (20kcal)",
+            ], "단백질 25g, 탄수화물 25g, 지방 8g"),
+        ],
+        "총계": "약 1,800kcal",
+        "영양소": "단백질: 125g | 탄수화물: 185g | 지방: 38g",
+    },
+    "체중 유지": {
+        "제목": "체중 유지 / 건강 관리",
+        "식사": [
+            ("🌅 아침 (약 500kcal)", [
+                "현미밥 1공기 (300kcal)",
+                "계란 2개 (140kcal)",
+                "김치찌개 1인분 (80kcal)",
+            ], "단백질 22g, 탄수화물 55g, 지방 10g"),
+            ("☀️ 점심 (약 600kcal)", [
+                "현미밥 1공기 (300kcal)",
+                "닭가슴살 150g 또는 두부 1모 (180kcal)",
+                "고구마 작은것 1개 (100kcal)",
+                "샐러드 (20kcal)",
+            ], "단백질 35g, 탄수화물 75g, 지방 8g"),
+            ("🌙 저녁 (약 550kcal)", [
+                "현미밥 1공기 (300kcal)",
+                "생선 또는 고기 150g (200kcal)",
+                "된장찌개 1인분 (50kcal)",
+            ], "단백질 35g, 탄수화물 50g, 지방 12g"),
+            ("🍎 간식 (약 250kcal)", [
+                "과일 (바나나, 사과 등) (100kcal)",
+                "견과류 한줌 (100kcal)",
+                "우유 200ml (50kcal)",
+            ], "단백질 10g, 탄수화물 30g, 지방 10g"),
+        ],
+        "총계": "약 1,900kcal",
+        "영양소": "단백질: 102g | 탄수화물: 210g | 지방: 40g",
+    },
+}
+
+MEAL_TIPS = [
+    "위 식단은 예시이며, 개인 취향에 맞게 조절하세요",
+    "비슷한 영양소를 가진 음식으로 대체 가능합니다",
+    "물은 하루 2-2.5L 이상 충분히 섭취하세요",
+    "가공식품과 설탕 섭취를 줄이세요",
+    "식사 시간은 일정하게 유지하는 것이 좋습니다",
+]
+
+
+def meal_plan_for(meal_type):
+    """식단 종류에 해당하는 예시 식단 (목록에 없으면 체중 유지 식단)"""
+    return MEAL_PLANS.get(meal_type, MEAL_PLANS["체중 유지"])
+
+
+NUTRITION_TIPS = {
+    "체중 감량": [
+        "고단백, 저지방 식품 위주 (닭가슴살, 생선, 두부)",
+        "복합 탄수화물 선택 (현미, 고구마, 귀리)",
+        "채소를 많이 섭취하여 포만감 유지",
+    ],
+    "근육 증가": [
+        "운동 전후 단백질 + 탄수화물 섭취",
+        "하루 5-6끼로 나눠 먹기",
+        "양질의 지방 섭취 (견과류, 아보카도, 올리브유)",
+    ],
+}
+
+WEIGHT_GUIDE_EXERCISES = ["바벨 스쿼트", "데드리프트", "벤치 프레스", "숄더 프레스", "랫 풀다운", "시티드 로우", "바벨 컬"]
+
+WEIGHT_SELECTION_GUIDES = {
+    "senior": ("👴👵 고령자 (저강도 고반복 - 안전 중심):", [
+        "⚠️  위 추천 무게의 50-60% 수준으로 시작하세요",
+        "목표 반복 횟수를 편안하게 완료할 수 있는 무게 사용",
+        "무게보다 정확한 자세와 균형 유지가 더 중요합니다",
+        "관절에 무리가 가지 않는 범위 내에서만 운동하세요",
+        "매주 증가량은 1-2kg 이하로 천천히 증가시키세요",
+        "통증이나 불편함이 느껴지면 즉시 중단하세요",
+    ]),
+    "male": ("남성 (고강도 저반복):", [
+        "목표 반복 횟수의 마지막 1-2개가 힘들어야 합니다",
+        "세트 마지막에 더 이상 들 수 없는 무게가 적절합니다",
+        "근력 증가가 목표라면 더 무거운 무게로 도전하세요",
+    ]),
+    "female": ("여성 (저강도 고반복):", [
+        "목표 반복 횟수를 완료할 수 있되, 마지막 2-3개가 약간 힘들어야 합니다",
+        "세트 후 2-3회 더 할 수 있는 정도의 무게가 적절합니다",
+        "근지구력과 탄탄한 근육 라인이 목표입니다",
+    ]),
+}
+
+WEIGHT_COMMON_RULES = [
+    "처음에는 가벼운 무게로 시작하여 자세를 익히세요",
+    "매주 2.5-5kg씩 점진적으로 증가시키세요",
+    "자세가 흐트러지면 무게를 줄이세요",
+    "위 무게는 참고용이며, 개인 체력에 맞게 조절하세요",
+]
+
+CARDIO_TERMS = [
+    "RPM (Revolutions Per Minute): 분당 회전수 - 사이클에서 페달을 밟는 속도",
+    "SPM (Strokes Per Minute): 분당 스트로크 수 - 로잉머신에서 당기는 횟수",
+    "인클라인: 런닝머신 경사도 (% 또는 각도)",
+]
+
+HEART_RATE_METHODS = [
+    "스마트워치/밴드 착용",
+    "운동 기구 내장 심박수 센서",
+    "목이나 손목 맥박 직접 측정 (15초 × 4)",
+    "자각적 강도 (RPE): 10점 만점에 7-8점 수준",
+]
+
+CARDIO_TIPS = {
+    "steady": ("체중 감량 유산소:", [
+        "대화가 가능한 정도의 강도 유지",
+        "너무 힘들면 지방 대신 근육이 분해됩니다",
+        "일정한 페이스로 오래 하는 것이 중요",
+        "아침 공복 유산소가 효과적 (선택)",
+        "심박수 모니터링으로 목표 구간 유지",
+    ]),
+    "hiit": ("HIIT (고강도 인터벌):", [
+        "전력 질주 20-30초 + 휴식 30-60초 반복",
+        "땀이 많이 나고 숨이 가쁜 것이 정상",
+        "주 2-3회가 적당 (과훈련 주의)",
+        "기초대사량 증가 효과 (운동 후 24-48시간)",
+        "워밍업/쿨다운 각 5분씩 필수",
+    ]),
+}
+
+MEDICAL_NOTICE = [
+    "위 내용은 일반적인 가이드라인입니다",
+    "반드시 담당 의사와 상담 후 운동을 시작하세요",
+    "운동 중 이상 증상 발생 시 즉시 중단하세요",
+    "약물 복용 중이라면 운동 시간과 약물 복용 시간 조절 필요",
+    "정기적으로 건강 상태를 체크하세요",
+]
+
+PAIN_NOTICE = [
+    "재활 운동은 매우 가벼운 무게나 맨몸으로 시작하세요",
+    "통증이 심하거나 지속되면 전문의 상담이 필요합니다",
+    "재활 운동은 주 3-4회, 본 운동 전 또는 휴식일에 수행",
+    "운동 중 통증이 느껴지면 즉시 중단하세요",
+    "호전되면 점진적으로 강도를 높이세요",
+]
+
+SENIOR_TIPS = [
+    "매우 가벼운 무게로 시작하여 천천히 증가시키세요",
+    "관절에 무리가 가는 고중량 운동은 피하세요",
+    "균형 운동을 꼭 포함하여 낙상을 예방하세요",
+    "탈수 방지를 위해 운동 중 자주 물을 마시세요",
+    "운동 전후 충분한 워밍업(10-15분)과 스트레칭(10분) 필수",
+    "어지럼증이나 가슴 통증 발생 시 즉시 중단하고 의사 상담",
+    "약물 복용 중이라면 운동 시작 전 의사와 상담하세요",
+    "가능하면 트레이너나 동반자와 함께 운동하세요",
+]
+
+GENERAL_TIPS = [
+    "워밍업은 필수! 운동 전 5-10분 가벼운 유산소와 동적 스트레칭",
+    "운동 후 쿨다운과 정적 스트레칭으로 근육 회복 촉진",
+    "충분한 수면 (7-8시간)은 근육 회복과 성장에 필수적입니다",
+    "점진적 과부하: 매주 조금씩 무게나 횟수를 늘려가세요",
+    "운동 일지를 작성하여 진행 상황을 추적하세요",
+    "통증이 느껴지면 즉시 중단하고 휴식을 취하세요",
+    "일주일에 2-3일은 충분한 휴식일을 가지세요",
+]
+
+
+# ============================================================
+# 섹션 블록 생성
+# ============================================================
+
+def profile_blocks(user):
+    """사용자 신체 정보 분석 (UserProfile)"""
+    blocks = [
+        _title("📊 사용자 신체 정보 분석", gap=0),
+        _item(f"나이: {user.age}세", "🔹", 0, gap=1),
+        _item(f"성별: {user.gender}", "🔹", 0),
+        _item(f"키: {user.height}cm", "🔹", 0),
+        _item(f"몸무게: {user.weight}kg", "🔹", 0),
+        _item(f"체지방률: {user.body_fat_percentage}%", "🔹", 0),
+        _item(f"골격근량: {user.skeletal_muscle_mass}kg", "🔹", 0),
+        _heading("📈 신체 구성 분석 결과"),
+    ]
+    blocks += _items([f"{key}: {value}" for key, value in user.analyze_body_composition().items()], gap=0)
+    blocks.append(_rule())
+    return blocks
+
+
+def recommendation_blocks(recommendations):
+    """AI 추천 목표"""
+    blocks = [_title("🎯 AI 분석 결과")]
+    if recommendations:
+        blocks.append(_text("귀하의 신체 분석 결과, 다음 목표들을 추천드립니다:", gap=1))
+        for idx, rec in enumerate(recommendations, 1):
+            blocks += [
+                _item(rec['목표'], f"{idx}.", 0, gap=1),
+                _text(f"우선순위: {rec['우선순위']}", 3),
+                _text(f"이유: {rec['이유']}", 3),
+            ]
+    blocks.append(_rule())
+    return blocks
+
+
+def _exercise_detail(exercise):
+    """주간 플랜 운동 한 개의 세부 내용 (세트/횟수, 라운드, 시간)"""
+    if "횟수" in exercise:
+        return f"{exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}"
+    if "라운드" in exercise:
+        return f"{exercise['라운드']}라운드, 총 {exercise['총시간']}"
+    return f"시간: {exercise['시간']}" + (f", 강도: {exercise['강도']}" if "강도" in exercise else "")
+
+
+def load_text(loads):
+    """"무게" 필드 → 권장 무게 한 줄 (초급/중급/고급 kg)"""
+    return f"💡 권장 무게: 초급 {loads['초급']}kg / 중급 {loads['중급']}kg / 고급 {loads['고급']}kg"
+
+
+def start_load_text(starts):
+    """"시작_무게" 필드 → 고령자 시작 무게 한 줄 (단계별 최소-최대 kg)"""
+    ranges = " / ".join(f"{level} {low}-{high}kg" for level, (low, high) in starts.items())
+    return f"👴 시작 무게 (추천의 50-60%): {ranges}"
+
+
+def weekly_plan_blocks(planner, plan):
+    """주간 운동 플랜 (운동 영상 링크 포함)"""
+    blocks = [
+        _title("💪 맞춤형 주간 운동 플랜"),
+        _text(f"🎯 운동 목표: {plan['목표']}", gap=1),
+        _text(f"📅 주간 운동일: {plan['주간_운동일']}일"),
+        _text(f"⏱  1회 운동 시간: {plan['운동_시간']}"),
+    ]
+
+    # 고령자를 위한 안내
+    if planner.user.age >= 60:
+        blocks += [
+            _text("⚠️ " * 30, gap=1),
+            _text("👴👵 고령자 맞춤 안전 운동 플랜"),
+            _rule(gap=0),
+            _text(f"귀하의 연령({planner.user.age}세)을 고려하여 관절과 근육을 보호하는"),
+            _text("저강도 고반복 운동 플랜으로 구성되었습니다."),
+            _text("무게는 가볍게 시작하여 천천히 증가시키세요."),
+            _rule(gap=0),
+        ]
+
+    blocks.append(_rule("-"))
+    for idx, day_plan in enumerate(plan["주간_계획"], 1):
+        blocks.append(Block("subheading", f"📌 Day {idx} - {day_plan['요일']}: {day_plan['주제']}", gap=1))
+        for exercise in day_plan["운동"]:
+            if "횟수" not in exercise and "시간" not in exercise:
+                continue
+            blocks.append(_item(exercise['이름'], "✓"))
+            blocks.append(_item(_exercise_detail(exercise), "-", 4))
+            if "무게" in exercise:
+                blocks.append(_item(load_text(exercise["무게"]), "-", 4))
+            if "시작_무게" in exercise:
+                blocks.append(_item(start_load_text(exercise["시작_무게"]), "-", 4))
+            video_url = planner.get_exercise_video(exercise['이름'])
+            if video_url:
+                blocks.append(Block("link", "📹 운동 방법: ", indent=4, url=video_url))
+    blocks.append(_rule())
+    return blocks
+
+
+def nutrition_blocks(goal, weight, nutrition):
+    """맞춤 영양 가이드 (nutrition은 NutritionTargets.to_dict() 형식)"""
+    blocks = [
+        _title("🍎 맞춤 영양 가이드"),
+        _text(f"💡 기초 대사량 (BMR): 약 {int(nutrition['bmr'])}kcal/일", gap=1),
+        _text(f"💡 총 에너지 소비량 (TDEE): 약 {int(nutrition['tdee'])}kcal/일"),
+        _text(f"💡 목표 섭취 칼로리: 약 {int(nutrition['target_calories'])}kcal/일"),
+        _text(f"→ {nutrition['calorie_note']}", 3),
+        _text(f"🥗 영양소 비율 ({goal}):", gap=1),
+        _item(f"단백질: {round(nutrition['protein_min'], 1)}g - {round(nutrition['protein_max'], 1)}g/일"),
+        _text(f"(체중 1kg당 {round(nutrition['protein_min']/weight, 1)}-{round(nutrition['protein_max']/weight, 1)}g)", 4),
+        _item(f"탄수화물: {round(nutrition['carb_min'], 1)}g - {round(nutrition['carb_max'], 1)}g/일"),
+        _item(f"지방: {round(nutrition['fat_min'], 1)}g - {round(nutrition['fat_max'], 1)}g/일"),
+        _text(f"💧 수분 섭취: 최소 {round(nutrition['water_liters'], 1)}L/일 (체중 1kg당 35ml)", gap=1),
+        _text("📌 영양 섭취 팁:", gap=1),
+    ]
+    if "체중 감량" in goal:
+        blocks += _items(NUTRITION_TIPS["체중 감량"], gap=0)
+    elif "근육 증가" in goal:
+        blocks += _items(NUTRITION_TIPS["근육 증가"], gap=0)
+    blocks.append(_rule())
+    return blocks
+
+
+@lru_cache(maxsize=None)
+def _meal_plan_body(meal_type):
+    """식단 종류별 고정 블록 (식사 목록 ~ 식단 팁)"""
+    meal_plan = meal_plan_for(meal_type)
+    blocks = [_heading(f"예시 하루 식단 ({meal_plan['제목']})")]
+    for meal, foods, macros in meal_plan["식사"]:
+        blocks.append(Block("label", meal, gap=1))
+        blocks += _items(foods, gap=0)
+        blocks.append(_item(macros, "➜"))
+    blocks += [
+        _text(f"📊 하루 총계: {meal_plan['총계']}", gap=1),
+        _text(meal_plan['영양소'], 2),
+        _heading("💡 식단 팁"),
+    ]
+    blocks += _items(MEAL_TIPS)
+    blocks.append(_rule())
+    return tuple(blocks)
+
+
+def meal_plan_blocks(nutrition):
+    """예시 식단 (nutrition은 NutritionTargets.to_dict() 형식)"""
+    return [
+        _title("🍽️  예시 식단"),
+        _text(f"🎯 목표: {nutrition['meal_type']}", gap=1),
+        _text(f"📊 목표 칼로리: 약 {int(nutrition['target_calories'])}kcal/일"),
+        *_meal_plan_body(nutrition['meal_type']),
+    ]
+
+
+def weight_guide_blocks(planner):
+    """무게 가이드라인 (주요 운동별 추천 무게)"""
+    user = planner.user
+    blocks = [
+        _title("⚖️  무게 가이드라인"),
+        _text(f"💪 성별: {user.gender}", gap=1),
+        _text(f"📊 체중: {user.weight}kg"),
+        _text(f"🎯 권장 반복 횟수: {planner.rep_description}"),
+        _heading("주요 운동별 추천 무게 (kg)"),
+    ]
+    for exercise in WEIGHT_GUIDE_EXERCISES:
+        weights = planner.get_weight_recommendation(exercise)
+        if weights:
+            blocks.append(_item(exercise, gap=1))
+            blocks += _items([f"{level}: {weights[level]}kg" for level in ("초급", "중급", "고급")], "-", 4, gap=0)
+
+    blocks.append(_heading("📌 무게 선택 가이드"))
+    if user.age >= 60:
+        label, rules = WEIGHT_SELECTION_GUIDES["senior"]
+    elif user.gender == "남성":
+        label, rules = WEIGHT_SELECTION_GUIDES["male"]
+    else:
+        label, rules = WEIGHT_SELECTION_GUIDES["female"]
+    blocks.append(_text(label, 2, gap=1))
+    blocks += _items(rules, gap=0)
+    blocks.append(_text("공통 원칙:", 2, gap=1))
+    blocks += _items(WEIGHT_COMMON_RULES, gap=0)
+    blocks.append(_rule())
+    return blocks
+
+
+def cardio_blocks(goal, cardio):
+    """유산소 운동 가이드 (cardio는 get_cardio_details() 결과)"""
+    blocks = [
+        _title("🏃 유산소 운동 가이드"),
+        _text(f"🎯 목표: {goal}", gap=1),
+        _text(f"📊 최대 심박수: {cardio['최대_심박수']}"),
+        _text(f"💓 목표 심박수: {cardio['목표_심박수']}"),
+        _text(f"⚡ 강도: {cardio['강도']}"),
+        _text(f"🏋️ 유형: {cardio['유형']}"),
+        _text(f"⏱  권장 시간: {cardio['권장_시간']}"),
+        _text(f"💡 설명: {cardio['설명']}"),
+        _heading("🎯 기구별 구체적인 운동 설정"),
+        _text("본인의 체력 수준에 맞는 단계를 선택하세요"),
+        Block("blank"),
+    ]
+    for equipment_name, settings in cardio.get('기구별_상세설정', {}).items():
+        blocks += [
+            Block("label", f"💪 {equipment_name}", gap=1),
+            Block("rule", "─" * 55, indent=2),
+            _text("🟢 초급자 (운동 경험 3개월 미만)", 2),
+            _text(settings['초급'], 5),
+            _text("🟡 중급자 (운동 경험 3-12개월)", 2, gap=1),
+            _text(settings['중급'], 5),
+            _text("🔴 고급자 (운동 경험 1년 이상)", 2, gap=1),
+            _text(settings['고급'], 5),
+            _text(f"💡 팁: {settings['팁']}", 2, gap=1),
+        ]
+
+    blocks.append(_heading("📖 용어 설명"))
+    blocks += _items(CARDIO_TERMS)
+    blocks.append(_heading("📌 심박수 측정 방법"))
+    blocks += [_item(method, f"{idx}.", gap=1 if idx == 1 else 0) for idx, method in enumerate(HEART_RATE_METHODS, 1)]
+    blocks.append(_heading("💡 유산소 운동 팁"))
+    label, tips = CARDIO_TIPS["steady" if "체중 감량" in goal and "근육 증가" not in goal else "hiit"]
+    blocks.append(_text(label, 2, gap=1))
+    blocks += _items(tips, gap=0)
+    blocks.append(_rule())
+    return blocks
+
+
+def medical_blocks(medical_conditions, precautions):
+    """지병 관련 운동 주의사항 (지병이 없으면 빈 목록)"""
+    if not medical_conditions:
+        return []
+    blocks = [
+        _title("💊 지병 관련 운동 주의사항"),
+        _text(f"현재 지병: {', '.join(medical_conditions)}", gap=1),
+    ]
+    for condition in medical_conditions:
+        if condition not in precautions:
+            continue
+        prec = precautions[condition]
+        blocks.append(Block("banner", f"{condition} 관련 주의사항", gap=1))
+        blocks.append(_text("⚠️ 주의사항:", gap=1))
+        blocks += _items(prec["주의사항"], gap=0)
+        blocks.append(_text("✅ 권장 운동:", gap=1))
+        blocks += _items(prec["권장_운동"], "✓", gap=0)
+        blocks.append(_text("🚫 피해야 할 운동:", gap=1))
+        blocks += _items(prec["피할_운동"], "✗", gap=0)
+
+        # 추가 정보
+        if "운동_전_섭취" in prec:
+            blocks.append(_text("🍎 운동 전 섭취 권장:", gap=1))
+            blocks += _items(prec["운동_전_섭취"], gap=0)
+        for key, label in (("운동_시간", "⏰ 운동 시간"), ("운동_강도", "💪 운동 강도"),
+                           ("수분", "💧 수분 섭취"), ("응급_상황", "🚨 응급 상황")):
+            if key in prec:
+                blocks.append(_text(f"{label}: {prec[key]}", gap=1))
+
+    blocks.append(_title("⚠️  중요 안내"))
+    blocks += _items(MEDICAL_NOTICE)
+    blocks.append(_rule())
+    return blocks
+
+
+def _rehab_detail(exercise):
+    if "시간" in exercise:
+        return f"{exercise['세트']}세트 × {exercise['시간']}, 휴식 {exercise['휴식']}"
+    if "각" in exercise:
+        return f"{exercise['세트']}세트 × {exercise['각']}"
+    return f"{exercise['세트']}세트 × {exercise['횟수']}, 휴식 {exercise['휴식']}"
+
+
+def pain_blocks(pain_areas, modifications, rehab_exercises):
+    """통증 부위 주의사항 및 재활 운동 (통증 부위가 없으면 빈 목록)"""
+    if not pain_areas:
+        return []
+    blocks = [
+        _title("⚠️  통증 부위 주의사항 및 재활 운동"),
+        _text(f"통증 부위: {', '.join(pain_areas)}", gap=1),
+    ]
+    for area in pain_areas:
+        if area not in modifications:
+            continue
+        mod = modifications[area]
+        blocks.append(Block("banner", f"{area} 관련 주의사항", gap=1))
+        blocks.append(_text("🚫 피해야 할 운동:", gap=1))
+        blocks += _items(mod["피해야_할_운동"], "✗", gap=0)
+        blocks.append(_text("⚠️ 주의가 필요한 운동:", gap=1))
+        blocks += _items(mod["주의_운동"], "⚡", gap=0)
+        blocks.append(_text("✅ 대체 운동:", gap=1))
+        blocks += _items(mod["대체_운동"], "✓", gap=0)
+
+        if area in rehab_exercises:
+            blocks.append(_text(f"💊 {area} 재활/강화 운동:", gap=1))
+            blocks.append(_rule("-", gap=0))
+            for exercise in rehab_exercises[area]:
+                blocks.append(_item(exercise['이름']))
+                blocks.append(_item(_rehab_detail(exercise), "-", 4))
+
+    blocks.append(_title("⚠️  중요 안내"))
+    blocks += _items(PAIN_NOTICE)
+    blocks.append(_rule())
+    return blocks
+
+
+@lru_cache(maxsize=None)
+def _tips_blocks(senior):
+    blocks = [_title("💡 운동 성공을 위한 팁")]
+    if senior:
+        blocks += [_text("⚠️  고령자 맞춤 운동 주의사항", gap=1), _rule("-", gap=0)]
+        blocks += [_item(tip, f"{idx}.") for idx, tip in enumerate(SENIOR_TIPS, 1)]
+        blocks += [_rule("-"), _text("📌 일반 운동 팁")]
+    blocks += [_item(tip, f"{idx}.", gap=1) for idx, tip in enumerate(GENERAL_TIPS, 1)]
+    blocks.append(_rule())
+    return tuple(blocks)
+
+
+def tips_blocks(age):
+    """운동 성공을 위한 팁 (60세 이상은 고령자 주의사항 포함, 블록은 나이대별로 한 번만 생성)"""
+    return list(_tips_blocks(age >= 60))
+
+
+# ============================================================
+# 렌더러
+# ============================================================
+
+def _text_lines(block):
+    prefix = "\n" * block.gap
+    indent = " " * block.indent
+    kind = block.kind
+    if kind == "title":
+        return f"{prefix}{'=' * RULE_WIDTH}\n{block.text}\n{'=' * RULE_WIDTH}"
+    if kind == "heading":
+        return f"{prefix}{'-' * RULE_WIDTH}\n{block.text}\n{'-' * RULE_WIDTH}"
+    if kind == "subheading":
+        return f"{prefix}{block.text}\n{'-' * RULE_WIDTH}"
+    if kind == "banner":
+        return f"{prefix}{'█' * RULE_WIDTH}\n  {block.text}\n{'█' * RULE_WIDTH}"
+    if kind == "item":
+        return f"{prefix}{indent}{block.marker} {block.text}"
+    if kind == "link":
+        return f"{prefix}{indent}{block.text}{block.url}"
+    return f"{prefix}{indent}{block.text}"  # text, label, rule, blank
+
+
+def render_text(sections):
+    """터미널 텍스트 (기존 print_* 출력과 동일)"""
+    return "".join(_text_lines(block) + "\n" for blocks in sections.values() for block in blocks)
+
+
+def _list_level(block):
+    return max(0, (block.indent - 2) // 2)
+
+
+def _markdown_item(block):
+    marker = block.marker
+    if block.kind == "link":
+        body = f"{block.text}[{block.url}]({block.url})"
+    elif marker[:-1].isdigit() and marker.endswith("."):
+        return "   " * _list_level(block) + f"{marker} {block.text}"
+    elif marker in ("•", "-"):
+        body = block.text
+    else:
+        body = f"{marker} {block.text}"
+    return "  " * _list_level(block) + f"- {body}"
+
+
+def render_markdown(sections):
+    """Markdown (제목 → ##, 소제목 → ###, 목록 → -, 구분선/빈 줄은 생략)"""
+    chunks = []
+    previous_list = False
+    for blocks in sections.values():
+        for block in blocks:
+            kind = block.kind
+            if kind in ("rule", "blank"):
+                continue
+            is_list = kind in ("item", "link")
+            if kind == "title":
+                line = f"## {block.text.strip()}"
+            elif kind in ("heading", "subheading"):
+                line = f"### {block.text.strip()}"
+            elif kind == "banner":
+                line = f"#### {block.text.strip()}"
+            elif kind == "label":
+                line = f"**{block.text.strip()}**"
+            elif is_list:
+                line = _markdown_item(block)
+            else:
+                line = block.text.strip()
+            if chunks:
+                chunks.append("\n" if is_list and previous_list else "\n\n")
+            chunks.append(line)
+            previous_list = is_list
+    chunks.append("\n")
+    return "".join(chunks)
+
+
+_HTML_STYLE = (
+    "body{font-family:-apple-system,'Apple SD Gothic Neo','Malgun Gothic',sans-serif;"
+    "max-width:720px;margin:0 auto;padding:1rem;line-height:1.5;color:#222}"
+    "h2{border-bottom:2px solid #4CAF50;padding-bottom:.3rem}h4{background:#f5f5f5;padding:.4rem}"
+)
+
+
+def render_html(sections, title="FitPlan AI 운동 플랜"):
+    """단독 HTML 문서 (목록은 들여쓰기에 따라 중첩 <ul>)"""
+    escape = html.escape
+    chunks = [
+        "<!DOCTYPE html>\n<html lang=\"ko\">\n<head>\n<meta charset=\"utf-8\">\n",
+        "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n",
+        f"<title>{escape(title)}</title>\n<style>{_HTML_STYLE}</style>\n</head>\n<body>\n",
+    ]
+    for key, blocks in sections.items():
+        if not blocks:
+            continue
+        chunks.append(f"<section id=\"{escape(key)}\">\n")
+        depth = 0  # 열려 있는 <ul> 수
+        for block in blocks:
+            kind = block.kind
+            if kind in ("rule", "blank"):
+                continue
+            if kind in ("item", "link"):
+                level = _list_level(block) + 1
+                while depth < level:
+                    chunks.append("<ul>\n")
+                    depth += 1
+                while depth > level:
+                    chunks.append("</ul>\n")
+                    depth -= 1
+                if kind == "link":
+                    url = escape(block.url)
+                    body = f"{escape(block.text)}<a href=\"{url}\">{url}</a>"
+                elif block.marker in ("•", "-"):
+                    body = escape(block.text)
+                else:
+                    body = f"{escape(block.marker)} {escape(block.text)}"
+                chunks.append(f"<li>{body}</li>\n")
+                continue
+            while depth:
+                chunks.append("</ul>\n")
+                depth -= 1
+            text = escape(block.text.strip())
+            if kind == "title":
+                chunks.append(f"<h2>{text}</h2>\n")
+            elif kind in ("heading", "subheading"):
+                chunks.append(f"<h3>{text}</h3>\n")
+            elif kind == "banner":
+                chunks.append(f"<h4>{text}</h4>\n")
+            elif kind == "label":
+                chunks.append(f"<p><strong>{text}</strong></p>\n")
+            else:
+                chunks.append(f"<p>{text}</p>\n")
+        chunks.append("</ul>\n" * depth)
+        chunks.append("</section>\n")
+    chunks.append("</body>\n</html>\n")
+    return "".join(chunks)
+
+
+def render_json(sections):
+    """블록 목록 JSON ({"version": 1, "sections": [{"name", "blocks"}]}, 기본값 필드는 생략)"""
+    defaults = Block("")
+    data = {
+        "version": 1,
+        "sections": [
+            {"name": key, "blocks": [{field: value for field, value, default in zip(Block._fields, block, defaults)
+                                      if field == "kind" or value != default}
+                                     for block in blocks]}
+            for key, blocks in sections.items()
+        ],
+    }
+    return json.dumps(data, ensure_ascii=False) + "\n"
+
+
+RENDERERS = {
+    "text": render_text,
+    "markdown": render_markdown,
+    "html": render_html,
+    "json": render_json,
+}
+
+
+def write_blocks(blocks, stream=None):
+    """블록 목록을 터미널 텍스트로 한 번에 쓰기 (print_* 메서드용)"""
+    (stream or sys.stdout).write(render_text({"section": blocks}))
+
+
+# ============================================================
+# 문서
+# ============================================================
+
+SECTION_ORDER = [
+    "profile", "recommendations", "weekly_plan", "nutrition", "meal_plan",
+    "cardio", "weight_guide", "medical", "pain", "tips",
+]
+
+
+class PlanDocument:
+    """섹션 이름 → 블록 목록
+
+    build_plan_document(planner, bundle)로 한 번 만든 뒤 render()/write()로 원하는 형식으로 출력합니다.
+    """
+
+    def __init__(self, sections):
+        self.sections = dict(sections)
+
+    def _select(self, sections):
+        if sections is None:
+            return self.sections
+        return {key: self.sections[key] for key in sections if key in self.sections}
+
+    def render(self, fmt="text", sections=None):
+        """문서 전체(또는 sections에 지정한 섹션만)를 fmt(text/markdown/html/json) 문자열로"""
+        if fmt not in RENDERERS:
+            raise ValueError(f"알 수 없는 문서 형식: {fmt} (사용 가능: {', '.join(RENDERERS)})")
+        return RENDERERS[fmt](self._select(sections))
+
+    def write(self, stream=None, fmt="text", sections=None):
+        """렌더링 결과를 stream(기본 sys.stdout)에 한 번에 쓰기"""
+        (stream or sys.stdout).write(self.render(fmt, sections))
+
+
+def build_plan_document(planner, bundle):
+    """플랜 생성기 + build_plan_bundle() 결과로 문서 만들기 (추가 계산은 운동 영상/추천 무게 조회뿐)"""
+    user = planner.user
+    return PlanDocument([
+        ("profile", profile_blocks(user)),
+        ("recommendations", recommendation_blocks(bundle["recommendations"])),
+        ("weekly_plan", weekly_plan_blocks(planner, bundle["weekly_plan"])),
+        ("nutrition", nutrition_blocks(planner.goal, user.weight, bundle["nutrition"])),
+        ("meal_plan", meal_plan_blocks(bundle["nutrition"])),
+        ("cardio", cardio_blocks(planner.goal, bundle["cardio"])),
+        ("weight_guide", weight_guide_blocks(planner)),
+        ("medical", medical_blocks(planner.medical_conditions, bundle["medical_precautions"])),
+        ("pain", pain_blocks(planner.pain_areas, bundle["pain_modifications"], bundle["rehab_exercises"])),
+        ("tips", tips_blocks(user.age)),
+    ])
@@ -0,0 +1,131 @@
+"""
+FitPlan AI - 주간 플랜 모델
+generate_weekly_plan()의 dict/list 구조를 슬롯 dataclass(Exercise, DayPlan, WeeklyPlan)로 표현합니다.
+모든 객체가 불변이라 같은 템플릿의 요일(DayPlan)은 플랜끼리 공유되고, 플랜마다 새로 만드는 것은
+WeeklyPlan 한 개뿐입니다. 기존 dict 형태가 필요하면 to_dict()를 사용하세요.
+"""
+
+from dataclasses import dataclass, field, replace
+
+from load_tables import LOAD_LEVELS
+from plan_numbers import ExerciseNumbers, parse_exercise
+
+# dict 키 ↔ 속성 (to_dict는 이 순서로 값이 있는 키만 만듦 - 기존 플랜의 키 순서와 같음)
+EXERCISE_KEYS = (
+    ("이름", "name"),
+    ("세트", "sets"),
+    ("횟수", "reps"),
+    ("시간", "time"),
+    ("휴식", "rest"),
+    ("강도", "intensity"),
+    ("무게", "load"),
+    ("시작_무게", "start_load"),
+)
+EXERCISE_ATTRIBUTES = dict(EXERCISE_KEYS)
+
+
+@dataclass(frozen=True, slots=True)
+class Exercise:
+    """운동 한 개 (문구는 플랜 그대로, numbers는 해석한 수치)"""
+    name: str
+    sets: int = None
+    reps: str = None
+    time: str = None
+    rest: str = None
+    intensity: str = None
+    load: tuple = None        # (초급, 중급, 고급) kg - generate_weekly_plan(with_loads=True)
+    start_load: tuple = None  # 고령자 시작 무게 ((최소, 최대) kg, ...) - 초급/중급/고급 순
+    numbers: ExerciseNumbers = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.numbers is None:
+            object.__setattr__(self, "numbers", parse_exercise(self.to_dict()))
+
+    @classmethod
+    def from_dict(cls, exercise):
+        """플랜 운동 dict → Exercise (모르는 키는 KeyError)"""
+        return cls(**_attributes(exercise))
+
+    def with_loads(self, fields):
+        """load_tables.exercise_load_fields()의 필드({"무게": ..., "시작_무게": ...})를 채운 복사본"""
+        return replace(self, **_attributes(fields))
+
+    def to_dict(self):
+        """기존 플랜 운동 dict ({"이름": ..., "세트": ..., ...})"""
+        exercise = {}
+        for key, attribute in EXERCISE_KEYS:
+            value = getattr(self, attribute)
+            if value is None:
+                continue
+            if attribute == "load":
+                value = dict(zip(LOAD_LEVELS, value))
+            elif attribute == "start_load":
+                value = {level: list(bounds) for level, bounds in zip(LOAD_LEVELS, value)}
+            exercise[key] = value
+        return exercise
+
+
+def _attributes(exercise):
+    # dict 키 → 속성 (단계별 무게 dict는 LOAD_LEVELS 순서의 튜플로)
+    attributes = {EXERCISE_ATTRIBUTES[key]: value for key, value in exercise.items()}
+    if "load" in attributes:
+        attributes["load"] = tuple(attributes["load"][level] for level in LOAD_LEVELS)
+    if "start_load" in attributes:
+        attributes["start_load"] = tuple(tuple(attributes["start_load"][level]) for level in LOAD_LEVELS)
+    return attributes
+
+
+@dataclass(frozen=True, slots=True)
+class DayPlan:
+    """하루 운동 (요일, 주제, 운동 목록)"""
+    day: str
+    focus: str
+    exercises: tuple = ()
+
+    @classmethod
+    def from_dict(cls, day):
+        return cls(day["요일"], day["주제"], tuple(Exercise.from_dict(e) for e in day["운동"]))
+
+    def to_dict(self):
+        return {"요일": self.day, "주제": self.focus, "운동": [e.to_dict() for e in self.exercises]}
+
+    @property
+    def numbers(self):
+        """(ExerciseNumbers, ...) - plan_numbers.summarize에 바로 넘길 수 있음"""
+        return tuple(e.numbers for e in self.exercises)
+
+
+@dataclass(frozen=True, slots=True)
+class WeeklyPlan:
+    """주간 운동 플랜 (duration은 분 단위 정수)"""
+    goal: str
+    environment: str
+    frequency: int
+    duration: int
+    days: tuple = ()
+
+    @classmethod
+    def from_dict(cls, plan):
+        """generate_weekly_plan() 결과 → WeeklyPlan"""
+        return cls(
+            plan["목표"],
+            plan["운동_환경"],
+            plan["주간_운동일"],
+            int(plan["운동_시간"].removesuffix("분")),
+            tuple(DayPlan.from_dict(day) for day in plan["주간_계획"]),
+        )
+
+    def to_dict(self):
+        """기존 generate_weekly_plan() dict (매번 새로 만들므로 수정해도 됨)"""
+        return {
+            "목표": self.goal,
+            "운동_환경": self.environment,
+            "주간_운동일": self.frequency,
+            "운동_시간": f"{self.duration}분",
+            "주간_계획": [day.to_dict() for day in self.days],
+        }
+
+    @property
+    def numbers(self):
+        """요일별 처방 수치 (FitnessPlanGenerator.weekly_numbers()와 같은 형태)"""
+        return tuple(day.numbers for day in self.days)
@@ -0,0 +1,162 @@
+"""
+FitPlan AI - 운동 처방 수치
+플랜의 "12-15회", "각 다리 10회", "90초", "45-60초", "20-30분" 같은 문구를 한 번만 해석해
+슬롯 dataclass(ExerciseNumbers)로 보관합니다. 주간 플랜 템플릿을 만들 때 함께 계산되므로
+플랜마다 다시 해석하지 않고 세트/반복/휴식/운동 시간 합계를 바로 계산할 수 있습니다.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+_RANGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(?:\s*-\s*(\d+(?:\.\d+)?))?")
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(?:\s*-\s*(\d+(?:\.\d+)?))?\s*(초|분|시간)")
+_UNIT_SECONDS = {"초": 1, "분": 60, "시간": 3600}
+
+
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+@lru_cache(maxsize=1024)
+def range_bounds(text):
+    """"12-15회" → (12, 15), "155 bpm" → (155, 155) (숫자가 없으면 None, 문구별로 캐시)"""
+    match = _RANGE_PATTERN.search(text)
+    if not match:
+        return None
+    low = _number(match.group(1))
+    return low, _number(match.group(2)) if match.group(2) else low
+
+
+@lru_cache(maxsize=1024)
+def second_bounds(text):
+    """"45-60초" → (45, 60), "20-30분" → (1200, 1800) (시간 단위가 없으면 None, 문구별로 캐시)"""
+    match = _DURATION_PATTERN.search(text)
+    if not match:
+        return None
+    unit = _UNIT_SECONDS[match.group(3)]
+    low = _number(match.group(1)) * unit
+    high = _number(match.group(2)) * unit if match.group(2) else low
+    return int(low), int(high)
+
+
+@dataclass(frozen=True, slots=True)
+class ExerciseNumbers:
+    """운동 한 개의 처방 수치 (값이 없는 항목은 0)
+
+    kind: "reps" (횟수), "timed" (세트 × 시간), "rounds" (라운드), "cardio" (세트 없는 유산소)
+    per_side: "각 다리/팔/방향/사이드"처럼 한쪽씩 하는 운동 (반복/시간은 한쪽 기준)
+    to_failure: "최대한" (반복 횟수 없음)
+    """
+    kind: str
+    sets: int = 0
+    reps_min: int = 0
+    reps_max: int = 0
+    per_side: bool = False
+    to_failure: bool = False
+    rest_seconds: int = 0
+    duration_min_seconds: int = 0
+    duration_max_seconds: int = 0
+    rounds: int = 0
+
+    @property
+    def sides(self):
+        return 2 if self.per_side else 1
+
+    @property
+    def total_reps(self):
+        """(최소, 최대) 총 반복 횟수 = 세트 × 반복 × 쪽 수"""
+        scale = self.sets * self.sides
+        return self.reps_min * scale, self.reps_max * scale
+
+    @property
+    def work_seconds(self):
+        """(최소, 최대) 시간 운동 합계 (세트가 있으면 세트 × 시간 × 쪽 수, 유산소는 시간 그대로)"""
+        scale = max(self.sets, 1) * self.sides
+        return self.duration_min_seconds * scale, self.duration_max_seconds * scale
+
+    @property
+    def total_rest_seconds(self):
+        """세트 사이 휴식 합계 (마지막 세트 뒤 휴식 제외)"""
+        return self.rest_seconds * max(self.sets - 1, 0)
+
+
+@lru_cache(maxsize=4096)
+def _parse(sets, reps_text, time_text, rest_text, rounds, total_time_text):
+    if rounds:
+        kind = "rounds"
+    elif reps_text is not None:
+        kind = "reps"
+    elif sets:
+        kind = "timed"
+    else:
+        kind = "cardio"
+    reps = range_bounds(reps_text) if reps_text else None
+    duration = second_bounds(time_text or total_time_text or "")
+    rest = second_bounds(rest_text) if rest_text else None
+    label = reps_text or time_text or ""
+    return ExerciseNumbers(
+        kind=kind,
+        sets=sets or 0,
+        reps_min=reps[0] if reps else 0,
+        reps_max=reps[1] if reps else 0,
+        per_side="각" in label,
+        to_failure=reps_text == "최대한",
+        rest_seconds=rest[0] if rest else 0,
+        duration_min_seconds=duration[0] if duration else 0,
+        duration_max_seconds=duration[1] if duration else 0,
+        rounds=rounds or 0,
+    )
+
+
+def parse_exercise(exercise):
+    """플랜 운동 dict → ExerciseNumbers (같은 처방 문구는 한 번만 해석)
+
+    맥길 빅3처럼 "각": "10회"로 적힌 재활 운동은 "각"을 반복 횟수로 읽습니다 (한쪽씩 운동은 아님).
+    """
+    return _parse(
+        exercise.get("세트"),
+        exercise.get("횟수") or exercise.get("각"),
+        exercise.get("시간"),
+        exercise.get("휴식"),
+        exercise.get("라운드"),
+        exercise.get("총시간"),
+    )
+
+
+def parse_days(days):
+    """주간 계획(dict 리스트) → 요일별 ExerciseNumbers 튜플의 튜플"""
+    return tuple(tuple(parse_exercise(exercise) for exercise in day["운동"]) for day in days)
+
+
+@dataclass(frozen=True, slots=True)
+class VolumeSummary:
+    """주간 또는 하루 운동량 합계"""
+    exercises: int = 0
+    sets: int = 0
+    reps_min: int = 0
+    reps_max: int = 0
+    work_min_seconds: int = 0
+    work_max_seconds: int = 0
+    rest_seconds: int = 0
+
+
+def summarize(numbers):
+    """ExerciseNumbers 목록(하루) 또는 목록의 목록(주간)의 운동량 합계"""
+    if numbers and not isinstance(numbers[0], ExerciseNumbers):
+        numbers = [exercise for day in numbers for exercise in day]
+    sets = reps_min = reps_max = work_min = work_max = rest = 0
+    for exercise in numbers:
+        # total_reps / work_seconds / total_rest_seconds와 같은 계산 (대량 집계용으로 풀어 씀)
+        sides = 2 if exercise.per_side else 1
+        sets += exercise.sets
+        scale = exercise.sets * sides
+        reps_min += exercise.reps_min * scale
+        reps_max += exercise.reps_max * scale
+        scale = (exercise.sets or 1) * sides
+        work_min += exercise.duration_min_seconds * scale
+        work_max += exercise.duration_max_seconds * scale
+        if exercise.sets > 1:
+            rest += exercise.rest_seconds * (exercise.sets - 1)
+    return VolumeSummary(len(numbers), sets, reps_min, reps_max, work_min, work_max, rest)
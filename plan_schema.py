@@ -0,0 +1,423 @@
+"""
+FitPlan AI - 플랜 JSON 스키마
+플랜 묶음(build_plan_bundle 결과, 한글 키 + "12-15회"/"90초" 같은 문자열 값)을
+영어 키와 숫자 값으로 된 버전 있는 JSON 문서로 변환합니다.
+직렬화는 orjson이 설치되어 있으면 orjson, 없으면 표준 json을 사용합니다.
+
+문서 구조 (SCHEMA_VERSION 2, 전체 정의는 PLAN_JSON_SCHEMA):
+    {"schema": "fitplan.plan", "version": 2,
+     "settings": {...}, "weekly_plan": {...}, "nutrition": {...}, "cardio": {...},
+     "weight_guide": {...}, "precautions": {"medical": [...], "pain": [...]}}
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 표준 json 사용
+    orjson = None
+
+from plan_document import WEIGHT_GUIDE_EXERCISES
+from plan_numbers import parse_days, parse_exercise, range_bounds, second_bounds
+
+SCHEMA_NAME = "fitplan.plan"
+SCHEMA_VERSION = 2  # 2: 운동에 권장 무게 load_kg / 고령자 시작 무게 senior_start_kg 추가
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+WEEKDAYS = ("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일")
+
+# 무게 단계 (한글 키 → 영어 키)
+LEVELS = {"초급": "beginner", "중급": "intermediate", "고급": "advanced"}
+
+
+# ============================================================
+# 문자열 값 → 숫자
+# ============================================================
+
+def parse_range(text):
+    """"12-15회" → {"min": 12, "max": 15}, "155 bpm" → {"min": 155, "max": 155} (숫자가 없으면 None)"""
+    bounds = range_bounds(text) if text else None
+    return {"min": bounds[0], "max": bounds[1]} if bounds else None
+
+
+def parse_seconds(text):
+    """"45-60초" → {"min": 45, "max": 60}, "20-30분" → {"min": 1200, "max": 1800} (단위가 없으면 None)"""
+    bounds = second_bounds(text) if text else None
+    return {"min": bounds[0], "max": bounds[1]} if bounds else None
+
+
+def _bounds(low, high):
+    return {"min": low, "max": high} if high else None
+
+
+def _levels(values, convert=None):
+    """{"초급": ..., "중급": ..., "고급": ...} → {"beginner": ..., ...} (값이 없으면 None)"""
+    if not values:
+        return None
+    return {key: convert(values[level]) if convert else values[level] for level, key in LEVELS.items()}
+
+
+def exercise_to_schema(exercise, numbers=None):
+    """주간 플랜/재활 운동 한 개 → 스키마 dict
+
+    수치는 numbers(ExerciseNumbers, 주간 플랜은 템플릿에서 미리 계산한 값)를 사용하고,
+    없으면 parse_exercise로 해석합니다. 원래 문구("각 다리 12-15회", "30초 유지" 등)는 label에 남깁니다.
+    권장 무게("무게")와 고령자 시작 무게("시작_무게")는 kg 단위 load_kg / senior_start_kg이며, 없으면 None입니다.
+    """
+    if numbers is None:
+        numbers = parse_exercise(exercise)
+    return {
+        "name": exercise["이름"],
+        "kind": numbers.kind,
+        "sets": numbers.sets or None,
+        "reps": _bounds(numbers.reps_min, numbers.reps_max),
+        "to_failure": numbers.to_failure,
+        "per_side": numbers.per_side,
+        "duration_seconds": _bounds(numbers.duration_min_seconds, numbers.duration_max_seconds),
+        "rest_seconds": numbers.rest_seconds or None,
+        "rounds": numbers.rounds or None,
+        "intensity": exercise.get("강도"),
+        "label": exercise.get("횟수") or exercise.get("각") or exercise.get("시간") or "",
+        "load_kg": _levels(exercise.get("무게")),
+        "senior_start_kg": _levels(exercise.get("시작_무게"), lambda bounds: {"min": bounds[0], "max": bounds[1]}),
+    }
+
+
+# ============================================================
+# 플랜 묶음 → 스키마 문서
+# ============================================================
+
+def weekly_plan_to_schema(plan, numbers=None):
+    """generate_weekly_plan() 결과 → 스키마 dict (numbers는 FitnessPlanGenerator.weekly_numbers())"""
+    if numbers is None:
+        numbers = parse_days(plan["주간_계획"])
+    return {
+        "goal": plan["목표"],
+        "environment": plan["운동_환경"],
+        "days_per_week": plan["주간_운동일"],
+        "session_minutes": parse_range(plan["운동_시간"])["min"],
+        "days": [
+            {
+                "weekday": WEEKDAYS.index(day["요일"]),
+                "focus": day["주제"],
+                "exercises": [exercise_to_schema(exercise, n) for exercise, n in zip(day["운동"], day_numbers)],
+            }
+            for day, day_numbers in zip(plan["주간_계획"], numbers)
+        ],
+    }
+
+
+def nutrition_to_schema(nutrition):
+    """NutritionTargets.to_dict() → 스키마 dict (kcal, g, L, 소수점 첫째 자리)"""
+    return {
+        "bmr_kcal": round(nutrition["bmr"], 1),
+        "tdee_kcal": round(nutrition["tdee"], 1),
+        "target_kcal": round(nutrition["target_calories"], 1),
+        "calorie_note": nutrition["calorie_note"],
+        "meal_type": nutrition["meal_type"],
+        "protein_g": {"min": round(nutrition["protein_min"], 1), "max": round(nutrition["protein_max"], 1)},
+        "carbs_g": {"min": round(nutrition["carb_min"], 1), "max": round(nutrition["carb_max"], 1)},
+        "fat_g": {"min": round(nutrition["fat_min"], 1), "max": round(nutrition["fat_max"], 1)},
+        "water_liters": round(nutrition["water_liters"], 1),
+    }
+
+
+def cardio_to_schema(cardio):
+    """get_cardio_details() → 스키마 dict (심박수 bpm, 권장 시간 초)"""
+    return {
+        "type": cardio["유형"],
+        "intensity": cardio["강도"],
+        "description": cardio["설명"],
+        "max_heart_rate_bpm": parse_range(cardio["최대_심박수"])["min"],
+        "target_heart_rate_bpm": parse_range(cardio["목표_심박수"]),
+        "duration_seconds": parse_seconds(cardio["권장_시간"]),
+        "duration_label": cardio["권장_시간"],
+        "equipment": [
+            {
+                "name": name,
+                "beginner": settings["초급"],
+                "intermediate": settings["중급"],
+                "advanced": settings["고급"],
+                "tip": settings["팁"],
+            }
+            for name, settings in cardio.get("기구별_상세설정", {}).items()
+        ],
+    }
+
+
+def weight_guide_to_schema(planner):
+    """주요 운동별 추천 무게 (kg, 체중 기준)"""
+    exercises = []
+    for name in WEIGHT_GUIDE_EXERCISES:
+        weights = planner.get_weight_recommendation(name)
+        if weights:
+            exercises.append({
+                "name": name,
+                "beginner_kg": weights["초급"],
+                "intermediate_kg": weights["중급"],
+                "advanced_kg": weights["고급"],
+            })
+    return {
+        "rep_tier": planner.rep_tier,
+        "rep_description": planner.rep_description,
+        "senior": planner.user.age >= 60,
+        "exercises": exercises,
+    }
+
+
+# 지병 주의사항 선택 항목 (한글 키 → 영어 키)
+_MEDICAL_NOTES = {
+    "운동_시간": "timing",
+    "운동_강도": "intensity",
+    "수분": "hydration",
+    "약물": "medication",
+    "환경": "environment",
+    "응급_상황": "emergency",
+}
+
+
+def precautions_to_schema(medical_conditions, precautions, pain_areas, modifications, rehab_exercises):
+    """지병/통증 부위 안내 (입력 순서 유지, 안내가 없는 항목은 제외)"""
+    medical = []
+    for condition in medical_conditions:
+        if condition not in precautions:
+            continue
+        prec = precautions[condition]
+        medical.append({
+            "condition": condition,
+            "cautions": list(prec["주의사항"]),
+            "recommended": list(prec["권장_운동"]),
+            "avoid": list(prec["피할_운동"]),
+            "pre_exercise_food": list(prec.get("운동_전_섭취", [])),
+            "notes": {key: prec[source] for source, key in _MEDICAL_NOTES.items() if source in prec},
+        })
+    pain = []
+    for area in pain_areas:
+        if area not in modifications:
+            continue
+        mod = modifications[area]
+        pain.append({
+            "area": area,
+            "avoid": list(mod["피해야_할_운동"]),
+            "caution": list(mod["주의_운동"]),
+            "alternatives": list(mod["대체_운동"]),
+            "rehab": [exercise_to_schema(exercise) for exercise in rehab_exercises.get(area, [])],
+        })
+    return {"medical": medical, "pain": pain}
+
+
+def plan_to_schema(planner, bundle):
+    """플랜 생성기 + build_plan_bundle() 결과 → 스키마 문서"""
+    return {
+        "schema": SCHEMA_NAME,
+        "version": SCHEMA_VERSION,
+        "settings": {
+            "goal": planner.goal,
+            "environment": planner.environment,
+            "frequency": planner.frequency,
+            "duration_minutes": planner.duration,
+            "medical_conditions": list(planner.medical_conditions),
+            "pain_areas": list(planner.pain_areas),
+        },
+        "weekly_plan": weekly_plan_to_schema(bundle["weekly_plan"], planner.weekly_numbers()),
+        "nutrition": nutrition_to_schema(bundle["nutrition"]),
+        "cardio": cardio_to_schema(bundle["cardio"]),
+        "weight_guide": weight_guide_to_schema(planner),
+        "precautions": precautions_to_schema(
+            planner.medical_conditions, bundle["medical_precautions"],
+            planner.pain_areas, bundle["pain_modifications"], bundle["rehab_exercises"],
+        ),
+    }
+
+
+# ============================================================
+# 직렬화
+# ============================================================
+
+def dumps(document):
+    """스키마 문서 → UTF-8 JSON bytes (공백 없음)"""
+    if orjson is not None:
+        return orjson.dumps(document)
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """JSON bytes/str → 스키마 문서 (버전이 다르면 ValueError)"""
+    document = orjson.loads(data) if orjson is not None else json.loads(data)
+    if document.get("schema") != SCHEMA_NAME or document.get("version") != SCHEMA_VERSION:
+        raise ValueError(f"지원하지 않는 플랜 문서: {document.get('schema')} v{document.get('version')}")
+    return document
+
+
+# ============================================================
+# JSON Schema (draft 2020-12) 정의와 간단한 검사
+# ============================================================
+
+def _object(properties, nullable=False):
+    return {
+        "type": ["object", "null"] if nullable else "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def _array(items):
+    return {"type": "array", "items": items}
+
+
+_STRING = {"type": "string"}
+_STRINGS = _array(_STRING)
+_INTEGER = {"type": "integer"}
+_NUMBER = {"type": "number"}
+_BOOLEAN = {"type": "boolean"}
+_INT_RANGE = _object({"min": _INTEGER, "max": _INTEGER})
+_NUMBER_RANGE = _object({"min": _NUMBER, "max": _NUMBER})
+
+
+def _nullable(schema):
+    return dict(schema, type=[schema["type"], "null"])
+
+
+_EXERCISE = _object({
+    "name": _STRING,
+    "kind": {"type": "string", "enum": ["reps", "timed", "rounds", "cardio"]},
+    "sets": _nullable(_INTEGER),
+    "reps": _object(_INT_RANGE["properties"], nullable=True),
+    "to_failure": _BOOLEAN,
+    "per_side": _BOOLEAN,
+    "duration_seconds": _object(_INT_RANGE["properties"], nullable=True),
+    "rest_seconds": _nullable(_INTEGER),
+    "rounds": _nullable(_INTEGER),
+    "intensity": _nullable(_STRING),
+    "label": _STRING,
+    "load_kg": _object({key: _NUMBER for key in LEVELS.values()}, nullable=True),
+    "senior_start_kg": _object({key: _NUMBER_RANGE for key in LEVELS.values()}, nullable=True),
+})
+
+PLAN_JSON_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "$id": f"{SCHEMA_NAME}/v{SCHEMA_VERSION}",
+    **_object({
+        "schema": {"type": "string", "enum": [SCHEMA_NAME]},
+        "version": {"type": "integer", "enum": [SCHEMA_VERSION]},
+        "settings": _object({
+            "goal": _STRING,
+            "environment": _STRING,
+            "frequency": _INTEGER,
+            "duration_minutes": _INTEGER,
+            "medical_conditions": _STRINGS,
+            "pain_areas": _STRINGS,
+        }),
+        "weekly_plan": _object({
+            "goal": _STRING,
+            "environment": _STRING,
+            "days_per_week": _INTEGER,
+            "session_minutes": _INTEGER,
+            "days": _array(_object({
+                "weekday": {"type": "integer", "minimum": 0, "maximum": 6},
+                "focus": _STRING,
+                "exercises": _array(_EXERCISE),
+            })),
+        }),
+        "nutrition": _object({
+            "bmr_kcal": _NUMBER,
+            "tdee_kcal": _NUMBER,
+            "target_kcal": _NUMBER,
+            "calorie_note": _STRING,
+            "meal_type": _STRING,
+            "protein_g": _NUMBER_RANGE,
+            "carbs_g": _NUMBER_RANGE,
+            "fat_g": _NUMBER_RANGE,
+            "water_liters": _NUMBER,
+        }),
+        "cardio": _object({
+            "type": _STRING,
+            "intensity": _STRING,
+            "description": _STRING,
+            "max_heart_rate_bpm": _INTEGER,
+            "target_heart_rate_bpm": _INT_RANGE,
+            "duration_seconds": _object(_INT_RANGE["properties"], nullable=True),
+            "duration_label": _STRING,
+            "equipment": _array(_object({
+                "name": _STRING, "beginner": _STRING, "intermediate": _STRING, "advanced": _STRING, "tip": _STRING,
+            })),
+        }),
+        "weight_guide": _object({
+            "rep_tier": _STRING,
+            "rep_description": _STRING,
+            "senior": _BOOLEAN,
+            "exercises": _array(_object({
+                "name": _STRING, "beginner_kg": _NUMBER, "intermediate_kg": _NUMBER, "advanced_kg": _NUMBER,
+            })),
+        }),
+        "precautions": _object({
+            "medical": _array(_object({
+                "condition": _STRING,
+                "cautions": _STRINGS,
+                "recommended": _STRINGS,
+                "avoid": _STRINGS,
+                "pre_exercise_food": _STRINGS,
+                "notes": {"type": "object", "additionalProperties": _STRING},
+            })),
+            "pain": _array(_object({
+                "area": _STRING,
+                "avoid": _STRINGS,
+                "caution": _STRINGS,
+                "alternatives": _STRINGS,
+                "rehab": _array(_EXERCISE),
+            })),
+        }),
+    }),
+}
+
+_TYPE_CHECKS = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+
+def validate(document, schema=PLAN_JSON_SCHEMA, path="$"):
+    """PLAN_JSON_SCHEMA에 맞지 않는 곳의 목록 (type/enum/minimum/maximum/properties/required/items만 검사)"""
+    types = schema.get("type")
+    if types is not None:
+        types = types if isinstance(types, list) else [types]
+        if not any(_TYPE_CHECKS[name](document) for name in types):
+            return [f"{path}: {'/'.join(types)} 필요 ({type(document).__name__})"]
+    if document is None:
+        return []
+    errors = []
+    if "enum" in schema and document not in schema["enum"]:
+        errors.append(f"{path}: {schema['enum']} 중 하나여야 함 ({document!r})")
+    if "minimum" in schema and document < schema["minimum"]:
+        errors.append(f"{path}: {schema['minimum']} 이상이어야 함 ({document})")
+    if "maximum" in schema and document > schema["maximum"]:
+        errors.append(f"{path}: {schema['maximum']} 이하여야 함 ({document})")
+    if isinstance(document, dict):
+        properties = schema.get("properties", {})
+        for key in schema.get("required", []):
+            if key not in document:
+                errors.append(f"{path}.{key}: 필수 항목 없음")
+        extra = schema.get("additionalProperties", True)
+        for key, value in document.items():
+            if key in properties:
+                errors += validate(value, properties[key], f"{path}.{key}")
+            elif extra is False:
+                errors.append(f"{path}.{key}: 정의되지 않은 항목")
+            elif isinstance(extra, dict):
+                errors += validate(value, extra, f"{path}.{key}")
+    elif isinstance(document, list) and "items" in schema:
+        for idx, item in enumerate(document):
+            errors += validate(item, schema["items"], f"{path}[{idx}]")
+    return errors
+
+
+if __name__ == "__main__":
+    # JSON Schema 파일로 내보내기: python plan_schema.py > plan_schema.json
+    print(json.dumps(PLAN_JSON_SCHEMA, ensure_ascii=False, indent=2))
@@ -0,0 +1,212 @@
+"""
+FitPlan AI - 원판/덤벨 무게 맞추기
+권장 무게(예: 45.6kg)를 실제 헬스장 장비로 만들 수 있는 무게로 맞추고, 한쪽 원판 구성과 워밍업 세트를 계산합니다.
+장비 구성(EquipmentProfile)별로 만들 수 있는 무게 표를 처음 한 번만 계산하고(원판 재고에 대한 부분합),
+이후 질의는 정렬된 표에서 이진 탐색으로 답합니다. 무게는 오차가 없도록 내부적으로 g 단위 정수로 다룹니다.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from load_tables import EQUIPMENT, LOAD_LEVELS, load_id
+
+ROUNDING_MODES = ("nearest", "down", "up")
+
+# 워밍업: (작업 무게 대비 비율, 반복 횟수) - 바벨은 빈 봉 세트를 먼저 추가
+WARMUP_SCHEME = ((0.4, 8), (0.6, 5), (0.8, 3))
+
+
+def _grams(kg):
+    return int(round(kg * 1000))
+
+
+def _kg(grams):
+    return grams / 1000
+
+
+@dataclass(frozen=True)
+class EquipmentProfile:
+    """헬스장 장비 구성
+
+    plates: ((원판 kg, 한쪽 최대 개수), ...)
+    dumbbells: 보유한 고정 덤벨 무게 (kg)
+    machine_step / cable_step: 머신/케이블 스택 한 칸 무게 (0이면 장비 없음), *_max: 최대 무게
+    """
+    name: str
+    bar_weight: float = 20.0
+    plates: tuple = ((25, 4), (20, 2), (15, 2), (10, 2), (5, 2), (2.5, 2), (1.25, 2))
+    dumbbells: tuple = tuple(range(1, 11)) + tuple(range(12, 52, 2))
+    machine_step: float = 5.0
+    machine_max: float = 200.0
+    cable_step: float = 2.5
+    cable_max: float = 100.0
+
+
+COMMERCIAL_GYM = EquipmentProfile("헬스장")
+HOME_GYM = EquipmentProfile(
+    "홈트레이닝 (장비 있음)",
+    bar_weight=15.0,
+    plates=((10, 2), (5, 2), (2.5, 2), (1.25, 2)),
+    dumbbells=tuple(range(2, 26, 2)),
+    machine_step=0,
+    cable_step=0,
+)
+
+# 운동 환경 → 기본 장비 구성
+EQUIPMENT_PROFILES = {profile.name: profile for profile in (COMMERCIAL_GYM, HOME_GYM)}
+
+
+class LoadingTable:
+    """장비 구성 하나의 기구별 "만들 수 있는 무게" 표 (g 단위 정렬 리스트)와 바벨 원판 구성"""
+
+    def __init__(self, profile):
+        self.profile = profile
+        bar = _grams(profile.bar_weight)
+        per_side = self._plate_sums(profile.plates)
+        self.plates = {bar + 2 * side: combo for side, combo in per_side.items()}
+        self.loads = {
+            "barbell": sorted(self.plates),
+            "dumbbell": sorted({_grams(kg) for kg in profile.dumbbells}),
+            "machine": self._stack(profile.machine_step, profile.machine_max),
+            "cable": self._stack(profile.cable_step, profile.cable_max),
+        }
+        self.arrays = {equipment: np.array(loads, dtype=np.int64) for equipment, loads in self.loads.items()}
+
+    @staticmethod
+    def _plate_sums(plates):
+        """한쪽 원판 부분합 → 그 무게를 만드는 가장 적은 원판 구성 (무거운 원판부터, g 단위 튜플)
+
+        원판 종류별 최대 개수가 정해진 부분합(bounded subset-sum)을 원판 종류마다 한 번씩 확장합니다.
+        """
+        reachable = {0: ()}
+        for kg, count in sorted(plates, reverse=True):
+            plate = _grams(kg)
+            extended = dict(reachable)
+            for total, combo in reachable.items():
+                for n in range(1, count + 1):
+                    candidate = total + plate * n
+                    known = extended.get(candidate)
+                    if known is None or len(known) > len(combo) + n:
+                        extended[candidate] = combo + (plate,) * n
+            reachable = extended
+        return reachable
+
+    @staticmethod
+    def _stack(step, maximum):
+        if not step:
+            return []
+        step = _grams(step)
+        return list(range(step, _grams(maximum) + 1, step))
+
+    def round(self, equipment, kg, mode="nearest"):
+        """kg에 가장 가까운 만들 수 있는 무게 (kg, 해당 기구가 없으면 None)
+
+        mode: "nearest" (같은 거리면 가벼운 쪽), "down" (이하 중 최대), "up" (이상 중 최소)
+        범위를 벗어나면 가장 가볍거나 무거운 무게를 돌려줍니다.
+        """
+        if mode not in ROUNDING_MODES:
+            raise ValueError(f"알 수 없는 반올림 방식: {mode} (가능: {', '.join(ROUNDING_MODES)})")
+        loads = self.loads[equipment]
+        if not loads:
+            return None
+        target = _grams(kg)
+        if mode == "down":
+            i = bisect_right(loads, target) - 1
+        elif mode == "up":
+            i = bisect_left(loads, target)
+        else:
+            i = bisect_left(loads, target)
+            if i == len(loads) or (i > 0 and target - loads[i - 1] <= loads[i] - target):
+                i -= 1
+        return _kg(loads[min(max(i, 0), len(loads) - 1)])
+
+    def round_many(self, equipment, kg, mode="nearest"):
+        """배열 버전 round (np.searchsorted, 해당 기구가 없으면 NaN)"""
+        if mode not in ROUNDING_MODES:
+            raise ValueError(f"알 수 없는 반올림 방식: {mode} (가능: {', '.join(ROUNDING_MODES)})")
+        kg = np.asarray(kg, dtype=np.float64)
+        loads = self.arrays[equipment]
+        if not len(loads):
+            return np.full(kg.shape, np.nan)
+        target = np.round(kg * 1000).astype(np.int64)
+        last = len(loads) - 1
+        if mode == "down":
+            i = np.searchsorted(loads, target, side="right") - 1
+        elif mode == "up":
+            i = np.searchsorted(loads, target, side="left")
+        else:
+            i = np.searchsorted(loads, target, side="left")
+            upper = loads[np.minimum(i, last)]
+            lower = loads[np.maximum(i - 1, 0)]
+            i = np.where((i > last) | ((i > 0) & (target - lower <= upper - target)), i - 1, i)
+        return loads[np.clip(i, 0, last)] / 1000
+
+    def plate_breakdown(self, total_kg):
+        """바벨 총 무게 → 한쪽에 끼울 원판 목록 (kg, 무거운 순, 만들 수 없는 무게면 None)"""
+        combo = self.plates.get(_grams(total_kg))
+        return None if combo is None else [_kg(plate) for plate in combo]
+
+    def warmup(self, equipment, working_kg, scheme=WARMUP_SCHEME):
+        """워밍업 세트 [(kg, 반복), ...] - 작업 무게의 비율을 만들 수 있는 무게로 내림, 중복/작업 무게 이상은 제외"""
+        sets = []
+        if equipment == "barbell":
+            sets.append((self.profile.bar_weight, 10))
+        for ratio, reps in scheme:
+            kg = self.round(equipment, working_kg * ratio, "down")
+            if kg is None or kg >= working_kg or (sets and kg <= sets[-1][0]):
+                continue
+            sets.append((kg, reps))
+        if sets and sets[0][0] >= working_kg:
+            return []
+        return sets
+
+
+@lru_cache(maxsize=None)
+def loading_table(profile=COMMERCIAL_GYM):
+    """장비 구성별 LoadingTable (처음 한 번만 계산)"""
+    return LoadingTable(profile)
+
+
+def equipment_for(name):
+    """운동 이름 → 기구 종류 (barbell / dumbbell / machine / cable, 무게 기준이 없으면 None)"""
+    catalog_id = load_id(name)
+    return None if catalog_id is None else EQUIPMENT[catalog_id]
+
+
+def loadable_weights(plan, profile=COMMERCIAL_GYM, mode="nearest"):
+    """generate_weekly_plan(with_loads=True) 플랜의 권장 무게를 장비로 만들 수 있는 무게로 맞춤
+
+    Returns:
+        {운동 이름: {"기구": 종류, "초급": kg, "중급": kg, "고급": kg, "원판": {단계: 한쪽 원판 목록}}}
+        (원판은 바벨만, 해당 기구가 없는 운동은 단계 값이 None)
+    """
+    table = loading_table(profile)
+    result = {}
+    for day_plan in plan["주간_계획"]:
+        for exercise in day_plan["운동"]:
+            name = exercise["이름"]
+            if "무게" not in exercise or name in result:
+                continue
+            equipment = equipment_for(name)
+            entry = {"기구": equipment}
+            for level in LOAD_LEVELS:
+                entry[level] = table.round(equipment, exercise["무게"][level], mode)
+            if equipment == "barbell":
+                entry["원판"] = {level: table.plate_breakdown(entry[level]) for level in LOAD_LEVELS}
+            result[name] = entry
+    return result
+
+
+if __name__ == "__main__":
+    table = loading_table()
+    print(f"🏋️ {table.profile.name}: 바벨 {len(table.loads['barbell'])}가지 무게 "
+          f"({_kg(table.loads['barbell'][0])}-{_kg(table.loads['barbell'][-1])}kg)")
+    for kg in (45.6, 61.3, 102.4):
+        total = table.round("barbell", kg)
+        print(f"  {kg}kg → {total}kg, 한쪽 원판 {table.plate_breakdown(total)}, 워밍업 {table.warmup('barbell', total)}")
+    for name in ("덤벨 컬", "레그 프레스", "랫 풀다운"):
+        equipment = equipment_for(name)
+        print(f"  {name} ({equipment}): 23.7kg → {table.round(equipment, 23.7)}kg")
@@ -0,0 +1,140 @@
+"""
+FitPlan AI - 프로필 보조 색인
+저장된 프로필을 별명 외의 값(나이, 성별, 목표, 마지막 업데이트, BMI 등)으로 찾기 위한 메모리 색인입니다.
+필드별로 (값, 별명) 정렬 리스트를 두고 bisect로 같음/범위 조건을 찾으며,
+별명 정렬 리스트로 접두어 검색을 합니다. 프로필을 저장/삭제할 때 해당 항목만 갱신합니다.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+_MAX_CHAR = chr(0x10FFFF)
+
+
+class ProfileIndex:
+    """필드별 정렬 색인
+
+    fields는 {필드 이름: 추출 함수(record) → 값} dict입니다.
+    추출 함수가 None을 돌려주거나 예외(KeyError/TypeError/ValueError 등)를 내면 그 필드에는 색인하지 않습니다.
+    같은 필드의 값끼리는 서로 비교할 수 있어야 합니다 (숫자끼리, 문자열끼리).
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self._sorted = {field: [] for field in fields}
+        self._values = {}  # 별명 → {필드: 값}
+        self._nicknames = []
+
+    def _extract(self, record):
+        values = {}
+        for field, extract in self.fields.items():
+            try:
+                value = extract(record)
+            except (KeyError, TypeError, ValueError, ZeroDivisionError):
+                value = None
+            if value is not None:
+                values[field] = value
+        return values
+
+    def build(self, items):
+        """(별명, 프로필) 목록으로 색인 전체를 다시 만들기 (한 번에 정렬)"""
+        self._values = {nickname: self._extract(record) for nickname, record in items}
+        self._nicknames = sorted(self._values)
+        for field in self.fields:
+            self._sorted[field] = sorted(
+                (values[field], nickname) for nickname, values in self._values.items() if field in values
+            )
+
+    def add(self, nickname, record):
+        """프로필 추가/수정 반영"""
+        self.remove(nickname)
+        values = self._extract(record)
+        self._values[nickname] = values
+        insort(self._nicknames, nickname)
+        for field, value in values.items():
+            insort(self._sorted[field], (value, nickname))
+
+    def remove(self, nickname):
+        """프로필 삭제 반영 (없으면 무시)"""
+        values = self._values.pop(nickname, None)
+        if values is None:
+            return
+        del self._nicknames[bisect_left(self._nicknames, nickname)]
+        for field, value in values.items():
+            entries = self._sorted[field]
+            del entries[bisect_left(entries, (value, nickname))]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, nickname):
+        return nickname in self._values
+
+    def _bounds(self, field, condition):
+        """조건에 맞는 self._sorted[field]의 [시작, 끝) 위치
+
+        condition이 (low, high) 튜플이면 low <= 값 <= high (None은 제한 없음), 그 외에는 같은 값.
+        """
+        entries = self._sorted[field]
+        if isinstance(condition, tuple):
+            low, high = condition
+        else:
+            low = high = condition
+        start = 0 if low is None else bisect_left(entries, (low,))
+        # (high, 가장 큰 문자)로 찾아야 값이 high인 항목까지 모두 포함됨
+        end = len(entries) if high is None else bisect_right(entries, (high, _MAX_CHAR))
+        return start, end
+
+    @staticmethod
+    def _matches(value, condition):
+        if value is None:
+            return False
+        if isinstance(condition, tuple):
+            low, high = condition
+            return (low is None or value >= low) and (high is None or value <= high)
+        return value == condition
+
+    def _prefix_bounds(self, prefix):
+        start = bisect_left(self._nicknames, prefix)
+        end = bisect_left(self._nicknames, prefix + _MAX_CHAR) if prefix else len(self._nicknames)
+        return start, end
+
+    def query(self, prefix=None, **conditions):
+        """조건에 맞는 별명 목록 (별명 순)
+
+        예: query(gender="여성", age=(40, 60), goal="체중 감량")
+            query(updated_at=(None, "2024-01-01 00:00:00"))
+            query(prefix="kim")
+
+        후보가 가장 적은 조건 하나로 범위를 좁힌 뒤 나머지 조건을 확인합니다.
+        """
+        for field in conditions:
+            if field not in self.fields:
+                raise ValueError(f"색인되지 않은 필드: {field} (사용 가능: {', '.join(self.fields)})")
+
+        # (후보 수, 필드 또는 None(접두어), 시작, 끝)
+        ranges = []
+        for field, condition in conditions.items():
+            start, end = self._bounds(field, condition)
+            ranges.append((end - start, field, start, end))
+        if prefix is not None:
+            start, end = self._prefix_bounds(prefix)
+            ranges.append((end - start, None, start, end))
+        if not ranges:
+            return list(self._nicknames)
+
+        _, used_field, start, end = min(ranges, key=lambda entry: entry[0])
+        if used_field is None:
+            nicknames = self._nicknames[start:end]
+        else:
+            nicknames = [nickname for _, nickname in self._sorted[used_field][start:end]]
+        result = []
+        for nickname in nicknames:
+            if prefix is not None and not nickname.startswith(prefix):
+                continue
+            values = self._values[nickname]
+            if all(field == used_field or self._matches(values.get(field), condition)
+                   for field, condition in conditions.items()):
+                result.append(nickname)
+        if used_field is not None:
+            result.sort()
+        return result
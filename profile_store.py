@@ -0,0 +1,683 @@
+"""
+FitPlan AI - 프로필 저장소
+ProfileManager가 사용하는 저장 백엔드입니다.
+- JsonProfileStore: profiles.json 파일 하나에 전체 저장 (기본값, 소규모 설치용)
+- SQLiteProfileStore: 프로필 한 건씩 upsert/delete (sqlite3, 대규모 설치용)
+- LazyJsonProfileStore: profiles.json과 같은 파일을 색인(profiles.json.idx)으로 열고 필요한 프로필만 읽음
+- JournalProfileStore: 변경 사항을 저널 파일에 한 줄씩 추가하고 주기적으로 스냅샷에 합침
+
+모든 저장소는 같은 메서드(get/get_many/put/update/delete/keys/items/__contains__/__len__/close)를 제공하며,
+created_at/updated_at 값은 ProfileManager가 채운 레코드를 그대로 저장합니다.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path):
+    """프로세스 간 배타적 잠금 (권고 잠금, path 파일을 잠금용으로 사용)
+
+    POSIX는 fcntl.flock, Windows는 msvcrt.locking을 사용합니다.
+    """
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK은 10초 후 실패하므로 다시 대기
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _file_stamp(path):
+    """파일 변경 감지용 (inode, 수정 시각, 크기), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def encode_profiles(profiles):
+    """프로필 한 건당 한 줄인 JSON 객체로 직렬화하면서 프로필별 위치 기록
+
+    json.dump(indent=2)보다 빠르고(C 인코더 사용) 사람이 읽기에도 불편하지 않습니다.
+
+    Returns:
+        (UTF-8 바이트, {별명: (값 시작 바이트 위치, 바이트 길이)})
+    """
+    if not profiles:
+        return b"{}", {}
+    chunks = [b"{\n"]
+    position = 2
+    offsets = {}
+    for i, (nickname, record) in enumerate(profiles.items()):
+        key = ((",\n  " if i else "  ") + _ENCODER.encode(nickname) + ": ").encode('utf-8')
+        value = _ENCODER.encode(record).encode('utf-8')
+        position += len(key)
+        offsets[nickname] = (position, len(value))
+        position += len(value)
+        chunks.append(key)
+        chunks.append(value)
+    chunks.append(b"\n}")
+    return b"".join(chunks), offsets
+
+
+def scan_offsets(data):
+    """임의 형식의 JSON 객체 파일(바이트)에서 최상위 값별 위치 찾기 (색인이 없거나 오래된 경우)"""
+    text = data.decode('utf-8')
+    decoder = json.JSONDecoder()
+    ascii_only = len(text) == len(data)
+    offsets = {}
+    byte_position = char_position = 0
+
+    def to_bytes(index):
+        # 비ASCII 문자가 있으면 직전 위치부터 이어서 바이트 수를 셈
+        nonlocal byte_position, char_position
+        if ascii_only:
+            return index
+        byte_position += len(text[char_position:index].encode('utf-8'))
+        char_position = index
+        return byte_position
+
+    def skip(index):
+        while index < len(text) and text[index] in " \t\r\n":
+            index += 1
+        return index
+
+    index = skip(0)
+    if text[index:index + 1] != "{":
+        raise ValueError("프로필 파일은 JSON 객체여야 합니다")
+    index = skip(index + 1)
+    while text[index:index + 1] != "}":
+        nickname, index = decoder.raw_decode(text, index)
+        index = skip(index)
+        if text[index:index + 1] != ":":
+            raise ValueError(f"{index}번째 문자에 ':'가 필요합니다")
+        start = skip(index + 1)
+        _, end = decoder.raw_decode(text, start)
+        start_byte = to_bytes(start)
+        offsets[nickname] = (start_byte, to_bytes(end) - start_byte)
+        index = skip(end)
+        if text[index:index + 1] == ",":
+            index = skip(index + 1)
+    return offsets
+
+
+class JsonProfileStore:
+    """JSON 파일 저장소 - 변경할 때마다 전체 파일을 다시 씀
+
+    여러 프로세스(CLI 여러 개, Streamlit 서버)가 같은 파일을 써도 변경이 사라지지 않도록
+    쓰기는 잠금 파일(profiles.json.lock)을 잡은 채 최신 파일을 다시 읽고 → 수정 → 임시 파일에 쓴 뒤
+    os.replace로 교체합니다. 읽기는 파일이 바뀌었을 때(inode/수정 시각/크기)만 다시 불러옵니다.
+    """
+
+    def __init__(self, filename="profiles.json"):
+        self.filename = filename
+        self.lock_filename = f"{filename}.lock"
+        self.index_filename = f"{filename}.idx"
+        self._stamp = None
+        self.profiles = self.load()
+
+    def load(self):
+        """파일에서 전체 프로필 dict 불러오기 (읽을 수 없으면 빈 dict)"""
+        self._stamp = _file_stamp(self.filename)
+        if self._stamp is not None:
+            try:
+                with open(self.filename, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"⚠️  프로필 파일을 읽는 중 오류가 발생했습니다: {e}")
+                return {}
+        return {}
+
+    def refresh(self):
+        """다른 프로세스가 파일을 바꿨으면 다시 불러오기"""
+        if _file_stamp(self.filename) != self._stamp:
+            self.profiles = self.load()
+
+    def save(self):
+        """전체 프로필을 파일에 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 끊겨도 기존 파일 유지)
+
+        LazyJsonProfileStore가 바로 쓸 수 있도록 프로필별 위치 색인(.idx)도 함께 씁니다.
+
+        Returns:
+            {별명: (바이트 위치, 바이트 길이)}
+        """
+        data, offsets = encode_profiles(self.profiles)
+        tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, self.filename)
+        self._stamp = _file_stamp(self.filename)
+        self.save_index(offsets)
+        return offsets
+
+    def save_index(self, offsets):
+        """색인 파일 저장 - 데이터 파일의 (inode, 수정 시각, 크기)를 함께 기록해 오래된 색인을 구분
+
+        색인은 언제든 데이터 파일에서 다시 만들 수 있으므로 실패해도 무시합니다.
+        """
+        tmp_filename = f"{self.index_filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                json.dump({"stamp": self._stamp, "offsets": offsets}, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_filename, self.index_filename)
+        except OSError:
+            pass
+
+    def _modify(self, change):
+        """잠금 상태에서 최신 파일 다시 읽기 → change(profiles) → 저장"""
+        with file_lock(self.lock_filename):
+            # 쓰기는 어차피 전체 파일을 다시 쓰므로 잠금 안에서는 항상 최신 내용을 읽음
+            self.profiles = self.load()
+            changed = change(self.profiles)
+            if changed is not False:
+                self.save()
+            return changed
+
+    def get(self, nickname):
+        self.refresh()
+        return self.profiles.get(nickname)
+
+    def get_many(self, nicknames):
+        """여러 프로필 [(별명, 프로필), ...] (nicknames 순서, 없는 별명은 건너뜀)"""
+        self.refresh()
+        return [(nickname, self.profiles[nickname]) for nickname in nicknames if nickname in self.profiles]
+
+    def put(self, nickname, record):
+        def change(profiles):
+            profiles[nickname] = record
+        self._modify(change)
+
+    def update(self, nickname, change):
+        """기존 프로필을 잠금 안에서 change(기존 레코드)의 결과로 교체 (새 레코드 반환, 없으면 None)"""
+        updated = []
+
+        def modify(profiles):
+            if nickname not in profiles:
+                return False
+            profiles[nickname] = change(profiles[nickname])
+            updated.append(profiles[nickname])
+        self._modify(modify)
+        return updated[0] if updated else None
+
+    def delete(self, nickname):
+        def change(profiles):
+            if nickname not in profiles:
+                return False
+            del profiles[nickname]
+            return True
+        return self._modify(change)
+
+    def keys(self):
+        self.refresh()
+        return list(self.profiles.keys())
+
+    def items(self):
+        self.refresh()
+        return iter(list(self.profiles.items()))
+
+    def __contains__(self, nickname):
+        self.refresh()
+        return nickname in self.profiles
+
+    def __len__(self):
+        self.refresh()
+        return len(self.profiles)
+
+    def close(self):
+        pass
+
+
+class LazyJsonProfileStore(JsonProfileStore):
+    """색인 기반 JSON 저장소 - 열 때는 색인(별명 → 바이트 위치)만 읽고 프로필은 필요할 때 한 건씩 읽음
+
+    JsonProfileStore와 같은 profiles.json을 사용하며, 색인은 profiles.json.idx에 저장합니다.
+    색인이 없거나 데이터 파일과 맞지 않으면(다른 도구가 파일을 바꾼 경우) 파일을 한 번 훑어 다시 만듭니다.
+    읽은 프로필은 파일이 바뀔 때까지 메모리에 보관합니다.
+    쓰기는 JsonProfileStore와 같이 잠금 안에서 전체 파일을 다시 쓰므로, 읽기가 많은 큰 저장소에 적합합니다.
+    """
+
+    def __init__(self, filename="profiles.json"):
+        self.filename = filename
+        self.lock_filename = f"{filename}.lock"
+        self.index_filename = f"{filename}.idx"
+        self.profiles = None
+        self._cache = {}
+        self._stamp = None
+        self._offsets = {}
+        self.load_index()
+
+    def load_index(self, locked=False):
+        """색인 불러오기 (오래되었으면 데이터 파일을 훑어 다시 만듦)
+
+        다시 만들 때는 쓰기와 같은 잠금을 잡고(locked=True는 이미 잡은 상태) 색인을 한 번 더 확인한 뒤
+        훑어서 저장하므로, 다른 프로세스가 그 사이 쓴 새 색인을 이전 데이터 파일의 위치로 덮어쓰지 않습니다.
+        """
+        self._cache = {}
+        self._stamp = _file_stamp(self.filename)
+        self._offsets = {}
+        if self._stamp is None:
+            return
+        try:
+            with open(self.index_filename, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if tuple(index["stamp"]) == self._stamp:
+                self._offsets = index["offsets"]
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        if not locked:
+            with file_lock(self.lock_filename):
+                return self.load_index(locked=True)
+        try:
+            with open(self.filename, 'rb') as f:
+                self._stamp = _file_stamp(self.filename)
+                self._offsets = scan_offsets(f.read())
+        except Exception as e:
+            print(f"⚠️  프로필 파일을 읽는 중 오류가 발생했습니다: {e}")
+            return
+        self.save_index(self._offsets)
+
+    def refresh(self):
+        """다른 프로세스가 파일을 바꿨으면 색인 다시 불러오기"""
+        if _file_stamp(self.filename) != self._stamp:
+            self.load_index()
+
+    @contextmanager
+    def _open_data(self):
+        """현재 색인과 같은 버전의 데이터 파일 열기 (그 사이 교체되었으면 색인을 다시 불러옴)"""
+        for _ in range(3):
+            try:
+                f = open(self.filename, 'rb')
+            except FileNotFoundError:
+                self.load_index()
+                break
+            stat = os.fstat(f.fileno())
+            if (stat.st_ino, stat.st_mtime_ns, stat.st_size) == self._stamp:
+                with f:
+                    yield f
+                return
+            f.close()
+            self.load_index()
+        yield None
+
+    def _read(self, f, nickname):
+        if nickname not in self._cache:
+            offset, length = self._offsets[nickname]
+            f.seek(offset)
+            self._cache[nickname] = json.loads(f.read(length).decode('utf-8'))
+        return self._cache[nickname]
+
+    def _modify(self, change):
+        """잠금 상태에서 전체 파일 읽기 → change(profiles) → 저장 후 메모리에서 해제"""
+        with file_lock(self.lock_filename):
+            stamp = self._stamp
+            profiles = self.load()
+            changed = change(profiles)
+            if changed is not False:
+                self.profiles = profiles
+                try:
+                    self._offsets = self.save()
+                finally:
+                    self.profiles = None
+                self._cache = {}
+            elif self._stamp != stamp:
+                self.load_index(locked=True)
+            return changed
+
+    def get(self, nickname):
+        self.refresh()
+        if nickname in self._cache:
+            return self._cache[nickname]
+        if nickname not in self._offsets:
+            return None
+        with self._open_data() as f:
+            if f is None or nickname not in self._offsets:
+                return None
+            return self._read(f, nickname)
+
+    def get_many(self, nicknames):
+        """여러 프로필을 파일을 한 번만 열어 읽기 (없는 별명은 건너뜀)"""
+        self.refresh()
+        with self._open_data() as f:
+            if f is None:
+                return []
+            return [(nickname, self._read(f, nickname)) for nickname in nicknames if nickname in self._offsets]
+
+    def keys(self):
+        self.refresh()
+        return list(self._offsets)
+
+    def items(self):
+        """전체 프로필을 한 건씩 읽어 반환 (메모리에 보관하지 않음)"""
+        self.refresh()
+        with self._open_data() as f:
+            if f is None:
+                return
+            for nickname, (offset, length) in list(self._offsets.items()):
+                if nickname in self._cache:
+                    yield nickname, self._cache[nickname]
+                else:
+                    f.seek(offset)
+                    yield nickname, json.loads(f.read(length).decode('utf-8'))
+
+    def __contains__(self, nickname):
+        self.refresh()
+        return nickname in self._offsets
+
+    def __len__(self):
+        self.refresh()
+        return len(self._offsets)
+
+
+class SQLiteProfileStore:
+    """SQLite 저장소 - 프로필 한 건 단위로 upsert/delete
+
+    프로필 전체는 data 컬럼에 JSON으로, 조회용 created_at/updated_at은 별도 컬럼에 저장합니다.
+    목록 순서는 처음 추가된 순서(rowid)이며 수정해도 바뀌지 않습니다 (JSON 저장소와 동일).
+    """
+
+    def __init__(self, filename="profiles.db"):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS profiles ("
+                " nickname TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " created_at TEXT,"
+                " updated_at TEXT)"
+            )
+
+    def get(self, nickname):
+        row = self.conn.execute("SELECT data FROM profiles WHERE nickname = ?", (nickname,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, nicknames):
+        """여러 프로필을 IN 조회로 한 번에 읽기 (nicknames 순서, 없는 별명은 건너뜀)"""
+        nicknames = list(nicknames)
+        found = {}
+        for start in range(0, len(nicknames), 500):  # SQLite 바인딩 변수 개수 제한
+            chunk = nicknames[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            query = f"SELECT nickname, data FROM profiles WHERE nickname IN ({placeholders})"
+            found.update(self.conn.execute(query, chunk).fetchall())
+        return [(nickname, json.loads(found[nickname])) for nickname in nicknames if nickname in found]
+
+    def put(self, nickname, record):
+        self.put_many([(nickname, record)])
+
+    def put_many(self, items):
+        """여러 프로필을 한 트랜잭션으로 upsert"""
+        rows = [
+            (nickname, json.dumps(record, ensure_ascii=False), record.get("created_at"), record.get("updated_at"))
+            for nickname, record in items
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO profiles (nickname, data, created_at, updated_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(nickname) DO UPDATE SET"
+                " data = excluded.data, created_at = excluded.created_at, updated_at = excluded.updated_at",
+                rows
+            )
+
+    def update(self, nickname, change):
+        """기존 프로필을 한 쓰기 트랜잭션 안에서 change(기존 레코드)의 결과로 교체 (새 레코드 반환, 없으면 None)"""
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")  # 읽기부터 쓰기 잠금 - 그 사이 다른 연결의 수정/삭제 방지
+            row = self.conn.execute("SELECT data FROM profiles WHERE nickname = ?", (nickname,)).fetchone()
+            if row is None:
+                return None
+            record = change(json.loads(row[0]))
+            self.conn.execute(
+                "UPDATE profiles SET data = ?, created_at = ?, updated_at = ? WHERE nickname = ?",
+                (json.dumps(record, ensure_ascii=False), record.get("created_at"), record.get("updated_at"), nickname)
+            )
+        return record
+
+    def delete(self, nickname):
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM profiles WHERE nickname = ?", (nickname,))
+        return cursor.rowcount > 0
+
+    def keys(self):
+        return [row[0] for row in self.conn.execute("SELECT nickname FROM profiles ORDER BY rowid")]
+
+    def items(self):
+        for nickname, data in self.conn.execute("SELECT nickname, data FROM profiles ORDER BY rowid"):
+            yield nickname, json.loads(data)
+
+    def __contains__(self, nickname):
+        return self.conn.execute("SELECT 1 FROM profiles WHERE nickname = ?", (nickname,)).fetchone() is not None
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class JournalProfileStore:
+    """추가 전용 저널 저장소 - 변경 한 건당 저널에 JSON 한 줄만 추가 (O(1) 쓰기)
+
+    파일 구성 (filename이 profiles.json일 때):
+      profiles.json                      스냅샷 (JsonProfileStore와 같은 형식)
+      profiles.json.journal              스냅샷 이후 변경 사항 {"op": "put"/"delete", ...}
+      profiles.json.journal.compacting   스냅샷에 합치는 중인 이전 저널
+
+    불러올 때는 스냅샷 → 합치는 중이던 저널 → 저널 순서로 재생합니다.
+    저장 중 프로세스가 종료되어 마지막 줄이 잘렸다면 그 줄만 버립니다.
+    저널이 compact_threshold 바이트를 넘으면 새 저널로 교체하고, 이전 저널 내용은
+    백그라운드 스레드가 새 스냅샷으로 합칩니다 (임시 파일에 쓴 뒤 교체).
+
+    한 프로세스 전용입니다. 프로필은 메모리에 두고 자기 저널만 재생하므로 다른 프로세스가 같은 파일에
+    쓴 변경은 보이지 않습니다 (여러 프로세스는 JsonProfileStore/SQLiteProfileStore 사용).
+    스냅샷 교체는 JsonProfileStore와 같은 잠금 파일(profiles.json.lock)을 잡고 고유한 임시 파일로 하므로
+    같은 스냅샷을 읽거나 이전하는 다른 도구와 겹치지 않습니다.
+    """
+
+    def __init__(self, filename="profiles.json", compact_threshold=1024 * 1024, sync=False):
+        self.filename = filename
+        self.lock_filename = f"{filename}.lock"
+        self.journal_filename = f"{filename}.journal"
+        self.compacting_filename = f"{filename}.journal.compacting"
+        self.compact_threshold = compact_threshold
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._compactor = None
+
+        self.profiles = JsonProfileStore(filename).profiles
+        recovered = os.path.exists(self.compacting_filename)
+        if recovered:
+            self._replay(self.compacting_filename)
+        self._replay(self.journal_filename)
+        if recovered:
+            # 합치기 도중 종료된 경우: 지금 상태로 스냅샷을 다시 만들고 이전 저널 정리
+            self._write_snapshot(dict(self.profiles))
+            os.remove(self.compacting_filename)
+
+        self._journal = open(self.journal_filename, 'a', encoding='utf-8')
+
+    def _replay(self, path):
+        """저널 파일을 재생해 self.profiles에 반영 (잘린 마지막 줄은 잘라냄)"""
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb+') as f:
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                f.truncate(end)
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+
+    def _apply(self, entry):
+        if entry["op"] == "put":
+            self.profiles[entry["nickname"]] = entry["record"]
+        elif entry["op"] == "delete":
+            self.profiles.pop(entry["nickname"], None)
+
+    def _append(self, entry):
+        """저널에 한 줄 추가 후 메모리에 반영, 필요하면 합치기 시작 (self._lock 안에서 호출)"""
+        self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._journal.flush()
+        if self.sync:
+            os.fsync(self._journal.fileno())
+        self._apply(entry)
+        if self._journal.tell() >= self.compact_threshold:
+            self._start_compaction()
+
+    def _start_compaction(self):
+        """저널 교체 후 백그라운드 스레드에서 스냅샷 생성 (self._lock 안에서 호출)"""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._journal.close()
+        if os.path.exists(self.compacting_filename):
+            # 이전 합치기가 실패해 남은 저널: 덮어쓰면 그 변경이 메모리에만 남으므로 뒤에 이어 붙임
+            with open(self.journal_filename, 'rb') as source, open(self.compacting_filename, 'ab') as target:
+                shutil.copyfileobj(source, target)
+                target.flush()
+                os.fsync(target.fileno())
+            os.remove(self.journal_filename)
+        else:
+            os.replace(self.journal_filename, self.compacting_filename)
+        self._journal = open(self.journal_filename, 'a', encoding='utf-8')
+        snapshot = dict(self.profiles)
+        self._compactor = threading.Thread(target=self._compact, args=(snapshot,), name="profile-compactor")
+        self._compactor.start()
+
+    def _compact(self, snapshot):
+        """스냅샷 쓰기 (실패하면 .compacting을 남겨 두고 다음 합치기에서 다시 시도)"""
+        try:
+            self._write_snapshot(snapshot)
+            os.remove(self.compacting_filename)
+        except Exception as e:
+            print(f"⚠️  프로필 저널을 스냅샷에 합치는 중 오류가 발생했습니다: {e}")
+
+    def _write_snapshot(self, profiles):
+        directory, name = os.path.split(os.path.abspath(self.filename))
+        with file_lock(self.lock_filename):
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, prefix=f"{name}.",
+                                             suffix=".tmp", delete=False) as f:
+                tmp_filename = f.name
+                json.dump(profiles, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, self.filename)
+
+    def compact(self):
+        """지금 바로 저널을 스냅샷에 합치고 끝날 때까지 대기"""
+        with self._lock:
+            self._wait_for_compaction()
+            if self._journal.tell() > 0 or os.path.exists(self.compacting_filename):
+                self._start_compaction()
+        self._wait_for_compaction()
+
+    def _wait_for_compaction(self):
+        if self._compactor is not None:
+            self._compactor.join()
+
+    def get(self, nickname):
+        return self.profiles.get(nickname)
+
+    def get_many(self, nicknames):
+        return [(nickname, self.profiles[nickname]) for nickname in nicknames if nickname in self.profiles]
+
+    def put(self, nickname, record):
+        with self._lock:
+            self._append({"op": "put", "nickname": nickname, "record": record})
+
+    def update(self, nickname, change):
+        """기존 프로필을 change(기존 레코드)의 결과로 교체 (새 레코드 반환, 없으면 None)"""
+        with self._lock:
+            if nickname not in self.profiles:
+                return None
+            record = change(self.profiles[nickname])
+            self._append({"op": "put", "nickname": nickname, "record": record})
+            return record
+
+    def delete(self, nickname):
+        with self._lock:
+            if nickname not in self.profiles:
+                return False
+            self._append({"op": "delete", "nickname": nickname})
+            return True
+
+    def keys(self):
+        return list(self.profiles.keys())
+
+    def items(self):
+        return iter(list(self.profiles.items()))
+
+    def __contains__(self, nickname):
+        return nickname in self.profiles
+
+    def __len__(self):
+        return len(self.profiles)
+
+    def close(self):
+        """진행 중인 합치기를 기다리고 저널 닫기"""
+        self._wait_for_compaction()
+        self._journal.close()
+
+
+PROFILE_BACKENDS = {
+    "json": (JsonProfileStore, "profiles.json"),
+    "lazy": (LazyJsonProfileStore, "profiles.json"),
+    "sqlite": (SQLiteProfileStore, "profiles.db"),
+    "journal": (JournalProfileStore, "profiles.json"),
+}
+
+
+def open_profile_store(filename=None, backend="json"):
+    """백엔드 이름으로 저장소 열기 (filename 생략 시 백엔드별 기본 파일)"""
+    if backend not in PROFILE_BACKENDS:
+        raise ValueError(f"알 수 없는 저장소 백엔드: {backend} (사용 가능: {', '.join(PROFILE_BACKENDS)})")
+    store_class, default_filename = PROFILE_BACKENDS[backend]
+    return store_class(filename or default_filename)
+
+
+def migrate_json_to_sqlite(json_filename="profiles.json", sqlite_filename="profiles.db"):
+    """profiles.json의 모든 프로필을 SQLite 저장소로 한 번에 옮기기 (같은 별명은 덮어씀)
+
+    Returns:
+        옮긴 프로필 수
+    """
+    source = JsonProfileStore(json_filename)
+    target = SQLiteProfileStore(sqlite_filename)
+    try:
+        target.put_many(source.items())
+        return len(source)
+    finally:
+        target.close()
@@ -0,0 +1,141 @@
+"""
+FitPlan AI - 측정 기록 추세 그래프
+몇 년치 매일 기록도 브라우저로 보내는 점 수가 일정하도록 LTTB(Largest-Triangle-Three-Buckets)로
+모양을 유지하며 줄인 뒤 그립니다. 배경 범위(낮음/정상/높음)는 인바디 그래프와 같은 색을 사용합니다.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+import plotly.graph_objects as go
+
+from inbody_charts import BAND_COLORS, INBODY_RANGES
+
+# 추세 그래프 지표 → (제목, 단위, 인바디 범위 지표)
+PROGRESS_METRICS = {
+    "weight": ("체중", "kg", "bmi"),
+    "body_fat": ("체지방률", "%", "body_fat"),
+    "muscle_ratio": ("골격근 비율", "%", "muscle_ratio"),
+}
+
+# 조회 기간 → 일 수 (None은 전체)
+PROGRESS_RANGES = {"1개월": 31, "3개월": 92, "1년": 366, "전체": None}
+
+
+def lttb(x, y, threshold):
+    """LTTB 다운샘플링 - 첫/마지막 점을 유지하고 구간마다 삼각형 넓이가 가장 큰 점 하나를 고름
+
+    Args:
+        x, y: 같은 길이의 숫자 배열 (x는 오름차순)
+        threshold: 남길 점 수 (3 미만이거나 점 수 이하면 그대로 반환)
+
+    Returns:
+        고른 점의 위치 배열
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # 첫/마지막 점을 뺀 나머지를 threshold - 2개 구간으로 나눔
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 구간 평균점 (마지막 구간은 마지막 점)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            average_x = x[next_start:next_end].mean()
+            average_y = y[next_start:next_end].mean()
+        else:
+            average_x, average_y = x[-1], y[-1]
+        areas = np.abs(
+            (x[previous] - average_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (average_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+
+def range_start(series, days):
+    """마지막 기록 기준 최근 days일의 시작 시각 (days가 None이면 None = 전체)
+
+    현재 시각이 아닌 마지막 기록 기준이므로 새 기록이 없으면 같은 범위(같은 캐시 키)가 유지됩니다.
+    """
+    if days is None or series is None or not len(series):
+        return None
+    return series.latest()["time"] - timedelta(days=days)
+
+
+def progress_series(series, metric, days=None):
+    """MeasurementSeries에서 지표 값 추출 (최근 days일, 값이 없는 측정은 제외)
+
+    Returns:
+        (datetime64[s] 배열, float64 값 배열)
+    """
+    if series is None or not len(series):
+        return np.empty(0, dtype="datetime64[s]"), np.empty(0)
+    start = range_start(series, days)
+    if metric == "weight":
+        data = series.range(start, fields=["weight"])
+        values = data["weight"].astype(np.float64)
+    elif metric == "body_fat":
+        data = series.range(start, fields=["body_fat_percentage"])
+        values = data["body_fat_percentage"].astype(np.float64)
+    else:
+        data = series.range(start, fields=["weight", "skeletal_muscle_mass"])
+        values = data["skeletal_muscle_mass"].astype(np.float64) / data["weight"].astype(np.float64) * 100
+    measured = ~np.isnan(values)
+    return data["time"][measured], values[measured]
+
+
+def progress_chart(gender, metric, times, values, max_points=200, height_cm=None):
+    """측정 기록 추세 그래프 (max_points개 이하로 다운샘플링)
+
+    체중 그래프의 배경 범위는 height_cm이 있으면 BMI 범위를 체중으로 환산해 표시합니다.
+    """
+    title, unit, band_metric = PROGRESS_METRICS[metric]
+    keep = lttb(times.astype(np.int64), values, max_points)
+    times, values = times[keep], values[keep]
+
+    fig = go.Figure(go.Scatter(
+        x=times.astype("datetime64[ms]").tolist(),
+        y=np.round(values, 2).tolist(),
+        mode="lines+markers" if len(values) <= 60 else "lines",
+        line=dict(color="#333", width=2),
+        marker=dict(size=5),
+        hovertemplate=f"%{{x|%Y-%m-%d}}<br>{title}: %{{y:.1f}}{unit}<extra></extra>",
+        showlegend=False
+    ))
+
+    bands = INBODY_RANGES["남성" if gender == "남성" else "여성"][band_metric]
+    scale = (height_cm / 100) ** 2 if metric == "weight" and height_cm else None
+    if metric != "weight" or scale:
+        for category, (start, end) in bands.items():
+            fig.add_hrect(
+                y0=start * scale if scale else start, y1=end * scale if scale else end,
+                fillcolor=BAND_COLORS[category], line_width=0, layer="below"
+            )
+
+    if len(values):
+        margin = max(1.0, (values.max() - values.min()) * 0.2)
+        y_range = [float(values.min() - margin), float(values.max() + margin)]
+    else:
+        y_range = None
+    fig.update_layout(
+        template="none",
+        title=dict(text=f"<b>{title}</b>", font=dict(size=14, color='#333'), x=0.01, xanchor='left'),
+        height=220,
+        margin=dict(l=35, r=10, t=35, b=30),
+        xaxis=dict(showgrid=False, tickfont=dict(size=9)),
+        yaxis=dict(range=y_range, gridcolor='lightgray', tickfont=dict(size=9), ticksuffix=unit),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family='Arial', size=11)
+    )
+    return fig
@@ -0,0 +1,369 @@
+"""
+FitPlan AI - 신체 측정 기록 저장소
+프로필별 측정값(체중, 체지방률, 골격근량, 둘레)을 시간순 열(column) 배열로 보관합니다.
+열은 array.array(시각은 int64 초, 측정값은 float32)이므로 한 건 추가가 O(1)이고 메모리를 적게 쓰며,
+조회/집계는 필요한 시각 범위만 NumPy 배열로 읽어 계산합니다.
+"""
+
+import io
+import os
+import tempfile
+import threading
+import zipfile
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from profile_store import file_lock
+
+# 측정 항목 (kg, %, kg, 둘레는 cm)
+MEASUREMENT_FIELDS = (
+    "weight", "body_fat_percentage", "skeletal_muscle_mass",
+    "waist", "hip", "chest", "arm", "thigh",
+)
+
+AGGREGATE_PERIODS = ("day", "week", "month")
+
+PROGRESS_FILE = "progress.npz"
+
+_SECONDS_PER_DAY = 86400
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def to_seconds(value):
+    """datetime/date/ISO 문자열("2024-01-31" 또는 "2024-01-31 07:30:00") → 저장용 초 (시간대 없이 그대로)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return ((value.toordinal() - _EPOCH_ORDINAL) * _SECONDS_PER_DAY
+                + value.hour * 3600 + value.minute * 60 + value.second)
+    if isinstance(value, date):
+        return (value.toordinal() - _EPOCH_ORDINAL) * _SECONDS_PER_DAY
+    return int(value)
+
+
+def from_seconds(seconds):
+    """저장용 초 → datetime"""
+    return datetime.fromtimestamp(int(seconds), timezone.utc).replace(tzinfo=None)
+
+
+class MeasurementSeries:
+    """한 프로필의 측정 기록 (시각순 정렬 유지)
+
+    측정값이 없는 칸은 NaN입니다. 둘레처럼 가끔만 재는 항목은 처음 값이 들어올 때 열을 만듭니다.
+    """
+
+    def __init__(self):
+        self.times = array('q')
+        self.columns = {}
+        # NumPy 뷰가 버퍼를 잡고 있는 동안 append하면 BufferError가 나므로 추가/읽기를 잠금으로 직렬화
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.times)
+
+    def _column(self, field):
+        if field not in self.columns:
+            if field not in MEASUREMENT_FIELDS:
+                raise ValueError(f"알 수 없는 측정 항목: {field} (사용 가능: {', '.join(MEASUREMENT_FIELDS)})")
+            self.columns[field] = array('f', [float("nan")]) * len(self.times)
+        return self.columns[field]
+
+    def append(self, time, **values):
+        """측정값 한 건 추가 (마지막 기록 이후 시각이면 O(1), 이전 시각이면 정렬 위치에 삽입)"""
+        seconds = to_seconds(time)
+        with self._lock:
+            self._append(seconds, values)
+
+    def _append(self, seconds, values):
+        for field, value in values.items():
+            if value is not None:
+                self._column(field)
+        if not self.times or seconds >= self.times[-1]:
+            self.times.append(seconds)
+            for field, column in self.columns.items():
+                value = values.get(field)
+                column.append(float("nan") if value is None else value)
+        else:
+            position = bisect_right(self.times, seconds)
+            self.times.insert(position, seconds)
+            for field, column in self.columns.items():
+                value = values.get(field)
+                column.insert(position, float("nan") if value is None else value)
+
+    def _bounds(self, start=None, end=None):
+        """[start, end] 시각 범위의 위치 (None은 제한 없음)"""
+        low = 0 if start is None else bisect_left(self.times, to_seconds(start))
+        high = len(self.times) if end is None else bisect_right(self.times, to_seconds(end))
+        return low, high
+
+    def range(self, start=None, end=None, fields=None):
+        """시각 범위의 기록 (범위만 복사한 NumPy 배열)
+
+        Returns:
+            {"time": datetime64[s] 배열, 항목: float32 배열, ...}
+        """
+        with self._lock:
+            low, high = self._bounds(start, end)
+            result = {"time": np.frombuffer(self.times, dtype=np.int64)[low:high].astype("datetime64[s]")}
+            for field in fields or self.columns:
+                if field in self.columns:
+                    # 뷰를 돌려주면 원본 array가 버퍼를 내보내는 중이라 append가 실패하므로 복사
+                    result[field] = np.frombuffer(self.columns[field], dtype=np.float32)[low:high].copy()
+                else:
+                    result[field] = np.full(high - low, np.nan, dtype=np.float32)
+        return result
+
+    def latest(self):
+        """항목별 가장 최근 측정값 {"time": 마지막 기록 시각, 항목: 값} (기록이 없으면 None)"""
+        with self._lock:
+            if not self.times:
+                return None
+            point = {"time": from_seconds(self.times[-1])}
+            for field, column in self.columns.items():
+                values = np.frombuffer(column, dtype=np.float32)
+                measured = np.flatnonzero(~np.isnan(values))
+                if len(measured):
+                    point[field] = round(float(values[measured[-1]]), 2)
+                del values  # 잠금을 풀기 전에 뷰 해제
+        return point
+
+    def aggregate(self, field, period="week", start=None, end=None):
+        """기간(day/week/month)별 평균/최소/최대/측정 횟수
+
+        주는 월요일, 월은 1일부터 시작합니다. 측정값이 없는 기간은 포함하지 않습니다.
+
+        Returns:
+            [{"period": 기간 시작 date, "mean": 평균, "min": 최소, "max": 최대, "count": 측정 횟수}, ...]
+        """
+        if period not in AGGREGATE_PERIODS:
+            raise ValueError(f"알 수 없는 집계 기간: {period} (사용 가능: {', '.join(AGGREGATE_PERIODS)})")
+        data = self.range(start, end, fields=[field])
+        values = data[field].astype(np.float64)
+        measured = ~np.isnan(values)
+        if not measured.any():
+            return []
+        days = data["time"][measured].astype("datetime64[D]")
+        values = values[measured]
+
+        if period == "week":
+            # 1970-01-01은 목요일이므로 3일을 더해 월요일 기준 주로 맞춤
+            day_numbers = days.astype(np.int64)
+            keys = (day_numbers - (day_numbers + 3) % 7).astype("datetime64[D]")
+        elif period == "month":
+            keys = days.astype("datetime64[M]").astype("datetime64[D]")
+        else:
+            keys = days
+
+        # 시각순 정렬이므로 같은 기간은 연속 구간 → reduceat으로 한 번에 집계
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        counts = np.diff(np.r_[starts, len(values)])
+        sums = np.add.reduceat(values, starts)
+        minimums = np.minimum.reduceat(values, starts)
+        maximums = np.maximum.reduceat(values, starts)
+        return [
+            {
+                "period": keys[i].item(),
+                "mean": round(float(total / count), 2),
+                "min": round(float(minimum), 2),
+                "max": round(float(maximum), 2),
+                "count": int(count),
+            }
+            for i, total, count, minimum, maximum in zip(starts, sums, counts, minimums, maximums)
+        ]
+
+    def trend(self, field, start=None, end=None):
+        """최소제곱 직선 기울기 (주당 변화량, 예: kg/주), 측정이 2일 미만이면 None"""
+        data = self.range(start, end, fields=[field])
+        values = data[field].astype(np.float64)
+        measured = ~np.isnan(values)
+        days = data["time"][measured].astype(np.int64) / _SECONDS_PER_DAY
+        values = values[measured]
+        if len(values) < 2 or days[0] == days[-1]:
+            return None
+        days = days - days.mean()
+        slope = float(np.dot(days, values - values.mean()) / np.dot(days, days))
+        return round(slope * 7, 3)
+
+
+class ProgressStore:
+    """프로필 별명 → MeasurementSeries
+
+    filename을 지정하면 생성 시 파일에서 불러오고, save() 호출 시 변경 사항을 저장합니다.
+    파일은 모든 프로필의 열을 이어 붙인 NumPy .npz 형식입니다 (임시 파일에 쓴 뒤 교체).
+
+    여러 프로세스(CLI, Streamlit 서버)가 같은 파일을 써도 기록이 사라지지 않도록, save()는 잠금 파일
+    (progress.npz.lock)을 잡은 채 다른 프로세스가 파일을 바꿨으면 다시 읽고, 마지막 저장 이후의
+    추가/삭제를 그 위에 다시 적용해 씁니다. 파일 전체를 다시 쓰므로 추가할 때마다가 아니라 모아서 저장하세요.
+    """
+
+    VERSION = 1
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self._series = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 파일 쓰기는 한 번에 하나만 (쓰는 동안에도 add 가능)
+        self._pending = []  # 마지막 저장 이후 변경 [("add", 별명, 초, 값 dict) 또는 ("remove", 별명), ...]
+        self._stamp = None  # 마지막으로 읽거나 쓴 파일의 (inode, 수정 시각, 크기)
+        if filename:
+            self.load()
+
+    def __len__(self):
+        return len(self._series)
+
+    def __contains__(self, nickname):
+        return nickname in self._series
+
+    def nicknames(self):
+        return list(self._series)
+
+    def series(self, nickname):
+        """프로필의 측정 기록 (없으면 None)"""
+        return self._series.get(nickname)
+
+    @property
+    def lock_filename(self):
+        """저장할 때 잡는 잠금 파일 (filename + ".lock")"""
+        return f"{self.filename}.lock"
+
+    @property
+    def dirty(self):
+        """저장하지 않은 변경 사항이 있는지"""
+        return bool(self._pending)
+
+    @staticmethod
+    def _apply(series_map, change):
+        """변경 한 건을 {별명: MeasurementSeries}에 적용"""
+        if change[0] == "add":
+            _, nickname, seconds, values = change
+            series = series_map.get(nickname)
+            if series is None:
+                series = series_map[nickname] = MeasurementSeries()
+            series.append(seconds, **values)
+            return True
+        return series_map.pop(change[1], None) is not None
+
+    def add(self, nickname, time, **values):
+        """측정값 한 건 추가"""
+        change = ("add", nickname, to_seconds(time), values)
+        with self._lock:
+            self._apply(self._series, change)
+            self._pending.append(change)
+
+    def record_profile(self, nickname, profile_data, time=None):
+        """ProfileManager에 저장하는 프로필 dict에서 측정값만 골라 기록 (time 생략 시 지금)"""
+        values = {field: profile_data[field] for field in MEASUREMENT_FIELDS if profile_data.get(field) is not None}
+        if values:
+            self.add(nickname, time or datetime.now().replace(microsecond=0), **values)
+
+    def remove(self, nickname):
+        """프로필의 측정 기록 전체 삭제 (다른 프로세스가 저장한 기록도 다음 save()에서 삭제)"""
+        change = ("remove", nickname)
+        with self._lock:
+            removed = self._apply(self._series, change)
+            self._pending.append(change)
+            return removed
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _read(self):
+        """파일 → {별명: MeasurementSeries} (파일이 없거나 손상되었으면 빈 dict)"""
+        if not os.path.exists(self.filename):
+            return {}
+        try:
+            with np.load(self.filename, allow_pickle=False) as data:
+                if int(data["version"]) != self.VERSION:
+                    return {}
+                nicknames = data["nicknames"].tolist()
+                bounds = np.r_[0, np.cumsum(data["counts"])]
+                times = data["times"]
+                columns = {field: data[field] for field in MEASUREMENT_FIELDS if field in data.files}
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            print(f"⚠️  측정 기록 파일을 읽는 중 오류가 발생했습니다: {e}")
+            return {}
+
+        loaded = {}
+        for i, nickname in enumerate(nicknames):
+            low, high = bounds[i], bounds[i + 1]
+            series = MeasurementSeries()
+            series.times.frombytes(times[low:high].astype(np.int64).tobytes())
+            for field, column in columns.items():
+                values = column[low:high].astype(np.float32)
+                if not np.isnan(values).all():
+                    series.columns[field] = array('f', values.tobytes())
+            loaded[nickname] = series
+        return loaded
+
+    def load(self):
+        """파일에서 불러오기 (파일이 없거나 손상되었으면 빈 저장소로 시작, 저장하지 않은 변경은 버림)"""
+        if not self.filename:
+            return
+        self._stamp = self._file_stamp()
+        loaded = self._read()
+        with self._lock:
+            self._series = loaded
+            self._pending = []
+
+    def save(self):
+        """변경 사항이 있으면 파일에 저장 (고유한 임시 파일에 쓴 뒤 교체, 실패하면 다음 호출에서 다시 시도)"""
+        if not self.filename or not self._pending:
+            return
+        with self._save_lock, file_lock(self.lock_filename):
+            # 다른 프로세스가 저장했으면 최신 파일에 이 저장소의 변경만 다시 적용
+            merged = self._read() if self._file_stamp() != self._stamp else None
+            with self._lock:
+                changes = list(self._pending)
+                if merged is not None:
+                    for change in changes:
+                        self._apply(merged, change)
+                series_map = self._series if merged is None else merged
+                nicknames = list(series_map)
+                # range()는 시리즈 잠금 안에서 복사본을 만들므로 저장 중에 다른 스레드가 추가해도 안전
+                snapshots = [series_map[nickname].range() for nickname in nicknames]
+            arrays = {
+                "version": np.array(self.VERSION),
+                "nicknames": np.array(nicknames, dtype=str),
+                "counts": np.array([len(data["time"]) for data in snapshots], dtype=np.int64),
+                "times": np.concatenate([data["time"].astype(np.int64) for data in snapshots] or [np.empty(0, np.int64)]),
+            }
+            for field in MEASUREMENT_FIELDS:
+                if any(field in data for data in snapshots):
+                    arrays[field] = np.concatenate([
+                        data[field] if field in data else np.full(len(data["time"]), np.nan, dtype=np.float32)
+                        for data in snapshots
+                    ])
+
+            buffer = io.BytesIO()
+            np.savez(buffer, **arrays)
+            directory, name = os.path.split(os.path.abspath(self.filename))
+            with tempfile.NamedTemporaryFile('wb', dir=directory, prefix=f"{name}.", suffix=".tmp", delete=False) as f:
+                tmp_filename = f.name
+                try:
+                    f.write(buffer.getbuffer())
+                    f.flush()
+                    os.fsync(f.fileno())
+                except BaseException:
+                    f.close()
+                    os.remove(tmp_filename)
+                    raise
+            try:
+                os.replace(tmp_filename, self.filename)
+            except OSError:
+                os.remove(tmp_filename)
+                raise
+            with self._lock:
+                self._stamp = self._file_stamp()
+                del self._pending[:len(changes)]
+                if merged is not None:
+                    # 저장하는 동안 추가된 기록은 아직 이전 시리즈에만 있으므로 새 시리즈에도 적용
+                    for change in self._pending:
+                        self._apply(merged, change)
+                    self._series = merged
@@ -0,0 +1,98 @@
+"""
+배치 플랜 생성 테스트 (CSV 입력 → JSONL 출력, 잘못된 행은 오류 레코드)
+실행: python -m pytest test_batch.py  또는  python test_batch.py
+"""
+
+import contextlib
+import csv
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from fitness_plan_demo import batch_mode, iter_batch_profiles, run_batch
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+FIELDS = ["nickname", "height", "weight", "age", "gender", "goal", "environment", "frequency", "duration",
+          "body_fat_percentage", "skeletal_muscle_mass", "pain_areas", "medical_conditions"]
+ROWS = [
+    ["kim", "175", "72.5", "30", "남성", "근육 증가", "헬스장", "4", "60", "18", "", "", ""],
+    ["lee", "162", "58", "67", "F", "체중 감량", "홈트레이닝 (장비 없음)", "3", "45", "", "", "무릎;허리", "고혈압"],
+    ["bad", "170", "not-a-number", "40", "남성", "", "", "", "", "", "", "", ""],
+    ["park", "181", "90", "45", "M", "", "", "", "", "", "", "", ""],
+]
+
+
+def _write_csv(path):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        writer.writerows(ROWS)
+
+
+def _run(tmp_path, workers):
+    source = Path(tmp_path) / "profiles.csv"
+    target = Path(tmp_path) / f"plans_{workers}.jsonl"
+    _write_csv(source)
+    stats = run_batch(str(source), str(target), workers=workers, chunksize=2)
+    records = [json.loads(line) for line in target.read_text(encoding='utf-8').splitlines()]
+    return stats, records
+
+
+def test_csv_round_trip_with_invalid_row(tmp_path):
+    _write_csv(tmp_path / "in.csv")
+    assert [row["nickname"] for row in iter_batch_profiles(str(tmp_path / "in.csv"))] == ["kim", "lee", "bad", "park"]
+
+    stats, records = _run(tmp_path, workers=1)
+    assert (stats["rows"], stats["plans"], stats["errors"]) == (4, 3, 1)
+    assert [record["nickname"] for record in records] == ["kim", "lee", "bad", "park"]  # 입력 순서 유지
+    assert records[2]["error"].startswith("ValueError")
+    for record in records[:2] + records[3:]:
+        assert "error" not in record
+        assert record["profile"] and record["weekly_plan"]["주간_계획"]
+    assert records[0]["weekly_plan"]["주간_운동일"] == 4 and records[3]["weekly_plan"]["목표"] == "건강 유지"
+
+    # 프로세스 풀도 같은 결과를 같은 순서로
+    pooled_stats, pooled = _run(tmp_path, workers=2)
+    assert (pooled_stats["plans"], pooled_stats["errors"]) == (3, 1)
+    assert pooled == records
+
+
+def test_jsonl_bad_lines_become_error_records(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    good = [dict(zip(FIELDS, row)) for row in ROWS if row[0] != "bad"]
+    lines = [json.dumps(good[0], ensure_ascii=False), '{"nickname": "broken", "height": ', "[1, 2]", '"x"',
+             json.dumps(good[1], ensure_ascii=False), "", json.dumps(good[2], ensure_ascii=False)]
+    source.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+    for workers in (1, 2):
+        target = tmp_path / f"plans_{workers}.jsonl"
+        stats = run_batch(str(source), str(target), workers=workers, chunksize=2)
+        records = [json.loads(line) for line in target.read_text(encoding='utf-8').splitlines()]
+        assert (stats["rows"], stats["plans"], stats["errors"]) == (6, 3, 3)
+        assert [record["nickname"] for record in records] == ["kim", None, None, None, "lee", "park"]
+        assert records[1]["error"].startswith("JSONDecodeError")
+        assert records[2]["error"].startswith("TypeError") and records[3]["error"].startswith("TypeError")
+        assert all(record["weekly_plan"]["주간_계획"] for record in records[:1] + records[4:])
+
+
+def test_batch_mode_reports_success_and_failure(tmp_path):
+    source = tmp_path / "profiles.csv"
+    _write_csv(source)
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        batch_mode([str(source), str(tmp_path / "plans.jsonl"), "--workers", "1"])
+    output = printed.getvalue()
+    assert "입력 프로필: 4건" in output
+    assert "생성 성공: 3건" in output and "생성 실패: 1건" in output
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        test_csv_round_trip_with_invalid_row(Path(tmp))
+        test_batch_mode_reports_success_and_failure(Path(tmp))
+        test_jsonl_bad_lines_become_error_records(Path(tmp))
+    print("✅ 배치 플랜 생성 테스트 통과")
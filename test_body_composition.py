@@ -0,0 +1,93 @@
+"""
+신체 구성 벡터 계산 테스트 (BodyCompositionFrame / py_round = UserProfile 스칼라 계산, 내장 round())
+실행: python -m pytest test_body_composition.py  또는  python test_body_composition.py
+"""
+
+import io
+import random
+import sys
+
+from body_composition import BodyCompositionFrame, py_round
+from fitness_plan_demo import UserProfile
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def _random_profiles(rows=2000, seed=3):
+    """임의 프로필 (체지방률/골격근량은 일부만 입력, 키/체중은 소수점 첫째 자리)"""
+    rng = random.Random(seed)
+    return [{
+        "height": round(rng.uniform(145, 200), 1),
+        "weight": round(rng.uniform(40, 140), 1),
+        "age": rng.randint(15, 90),
+        "gender": rng.choice(["남성", "여성"]),
+        "body_fat_percentage": round(rng.uniform(5, 50), 1) if rng.random() < 0.3 else None,
+        "skeletal_muscle_mass": round(rng.uniform(15, 50), 1) if rng.random() < 0.3 else None,
+    } for _ in range(rows)]
+
+
+def test_py_round_matches_builtin_round():
+    # .5 경계: 이진수로 정확히 .5인 값(짝수 쪽), .5보다 살짝 작거나 큰 값(2.675 → 2.67, 1.005 → 1.0)
+    edges = [0.5, 1.5, 2.5, -0.5, -1.5, 0.125, 0.375, 2.675, 1.005, 1.115, 0.285, 8.345, -2.675,
+             1234.5651, 99.995, 0.0, -0.0, 1e-9, 23.45, 24.35, 17.5, 25.0]
+    for ndigits in (0, 1, 2, 3):
+        expected = [round(value, ndigits) for value in edges]
+        assert py_round(edges, ndigits).tolist() == expected
+        assert py_round(edges[7], ndigits) == round(edges[7], ndigits)
+
+    rng = random.Random(11)
+    values = [rng.randint(-10**6, 10**6) / 1000 + rng.choice((0, 0.0005, -0.0005)) for _ in range(20000)]
+    for ndigits in (1, 2):
+        assert py_round(values, ndigits).tolist() == [round(value, ndigits) for value in values]
+
+
+def test_body_composition_frame_matches_user_profile():
+    profiles = _random_profiles()
+    frame = BodyCompositionFrame.from_records(profiles)
+    bmi_labels = frame.bmi_category_labels().tolist()
+    body_fat_labels = frame.body_fat_category_labels().tolist()
+    for i, profile in enumerate(profiles):
+        user = UserProfile(**profile)
+        assert frame.bmi[i] == user.calculate_bmi()
+        assert frame.body_fat_percentage[i] == user.body_fat_percentage
+        assert frame.skeletal_muscle_mass[i] == user.skeletal_muscle_mass
+        assert frame.lean_body_mass[i] == user.calculate_lean_body_mass()
+        assert bmi_labels[i] == user.get_bmi_category()
+        assert body_fat_labels[i] == user.get_body_fat_category()
+        assert frame.analysis(i) == user.analyze_body_composition()
+
+
+def test_clamped_body_fat_estimate_matches_scalar_text():
+    # 추정 체지방률이 5-50 범위를 벗어나면 스칼라 계산은 정수 5/50 ("50%")
+    profiles = [
+        {"height": 150, "weight": 140, "age": 90, "gender": "여성"},
+        {"height": 200, "weight": 45, "age": 15, "gender": "남성"},
+        {"height": 150, "weight": 140, "age": 90, "gender": "여성", "body_fat_percentage": 50.0},
+    ]
+    frame = BodyCompositionFrame.from_records(profiles)
+    analyses = [frame.analysis(i)["체지방률"] for i in range(len(profiles))]
+    assert analyses == ["50%", "5%", "50.0%"]
+    assert analyses == [UserProfile(**p).analyze_body_composition()["체지방률"] for p in profiles]
+
+
+def test_integer_inputs_match_scalar_text():
+    # 정수로 입력한 체지방률/골격근량은 스칼라 계산에서 그대로 "18%", "32kg"
+    profiles = [
+        {"height": 175, "weight": 70, "age": 25, "gender": "남성", "body_fat_percentage": 18, "skeletal_muscle_mass": 32},
+        {"height": 162, "weight": 55, "age": 40, "gender": "여성", "body_fat_percentage": 27.0, "skeletal_muscle_mass": 21},
+        {"height": 180, "weight": 82, "age": 33, "gender": "남성", "body_fat_percentage": 20, "skeletal_muscle_mass": None},
+        {"height": 170, "weight": 64, "age": 29, "gender": "여성"},
+    ]
+    frame = BodyCompositionFrame.from_records(profiles)
+    assert frame.analysis(0)["체지방률"] == "18%" and frame.analysis(0)["골격근량"] == "32kg"
+    for i, profile in enumerate(profiles):
+        assert frame.analysis(i) == UserProfile(**profile).analyze_body_composition()
+
+
+if __name__ == "__main__":
+    test_py_round_matches_builtin_round()
+    test_body_composition_frame_matches_user_profile()
+    test_clamped_body_fat_estimate_matches_scalar_text()
+    test_integer_inputs_match_scalar_text()
+    print("✅ 신체 구성 벡터 계산 테스트 통과")
@@ -0,0 +1,158 @@
+"""
+운동 이름 색인 테스트 (생성되는 모든 분할의 운동 이름 → 영상 카탈로그 항목 고정)
+실행: python -m pytest test_exercise_index.py  또는  python test_exercise_index.py
+"""
+
+import io
+import itertools
+import sys
+
+from exercise_index import RESOLVE_CACHE_SIZE, ExerciseIndex, normalize_name
+from fitness_plan_demo import REP_TIERS, FitnessPlanGenerator, UserProfile
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# 템플릿에 나오는 모든 운동 이름 → 카탈로그 키 (영상이 없으면 None)
+EXPECTED = {
+    '스쿼트': '스쿼트',
+    '벤치 프레스 or 푸시업': '벤치 프레스',
+    '랫 풀다운': '랫 풀다운',
+    '숄더 프레스': '숄더 프레스',
+    '루마니안 데드리프트': '루마니안 데드리프트',
+    '플랭크': '플랭크',
+    '유산소 운동': None,
+    '덤벨 스쿼트': '스쿼트',
+    '푸시업': '푸시업',
+    '덤벨 로우': '덤벨 로우',
+    '덤벨 숄더 프레스': '덤벨 숄더 프레스',
+    '런지': '런지',
+    '인버티드 로우 (테이블 활용)': '인버티드 로우',
+    '파이크 푸시업': '파이크 푸시업',
+    '버피': '버피',
+    '바벨 스쿼트': '바벨 스쿼트',
+    '레그 프레스': '레그 프레스',
+    '레그 컬': '레그 컬',
+    '카프 레이즈': '카프 레이즈',
+    '벤치 프레스': '벤치 프레스',
+    '인클라인 덤벨 프레스': '인클라인 덤벨 프레스',
+    '사이드 레터럴 레이즈': '사이드 레터럴 레이즈',
+    '트라이셉스 딥스': '트라이셉스 딥스',
+    '케이블 푸시다운': '케이블 푸시다운',
+    '프론트 스쿼트': '프론트 스쿼트',
+    '런지 워킹': '런지 워킹',
+    '레그 익스텐션': '레그 익스텐션',
+    '스티프 레그 데드리프트': '스티프 레그 데드리프트',
+    '점프 스쿼트': '점프 스쿼트',
+    '데드리프트': '데드리프트',
+    '시티드 로우': '시티드 로우',
+    '페이스 풀': '페이스 풀',
+    '바벨 컬': '바벨 컬',
+    '해머 컬': '해머 컬',
+    '덤벨 고블릿 스쿼트': '스쿼트',
+    '덤벨 루마니안 데드리프트': '루마니안 데드리프트',
+    '불가리안 스플릿 스쿼트': '불가리안 스플릿 스쿼트',
+    '싱글 레그 데드리프트': '데드리프트',
+    '푸시업 (높은 난이도)': '푸시업',
+    '덤벨 프레스': '인클라인 덤벨 프레스',
+    '덤벨 사이드 레이즈': '사이드 레터럴 레이즈',
+    '덤벨 오버헤드 익스텐션': '오버헤드 트라이셉스 익스텐션',
+    '스쿼트 점프': '점프 스쿼트',
+    '워킹 런지': '런지 워킹',
+    '싱글 레그 스쿼트 (보조)': '스쿼트',
+    '사이드 런지': '사이드 런지',
+    '마운틴 클라이머': '마운틴 클라이머',
+    '리버스 플라이': '리어 델트 플라이',
+    '덤벨 풀오버': None,
+    '덤벨 컬': '덤벨 컬',
+    '싱글 레그 루마니안 데드리프트': '루마니안 데드리프트',
+    '푸시업 (다양한 변형)': '푸시업',
+    '다이아몬드 푸시업': '다이아몬드 푸시업',
+    '딥스 (의자 활용)': '트라이셉스 딥스',
+    '플랭크 투 푸시업': '푸시업',
+    '슈퍼맨': None,
+    '플랭크 로우 (교차)': '플랭크',
+    '도어프레임 컬 (타월 활용)': None,
+    '바이시클 크런치': '바이시클 크런치',
+    '사이드 플랭크': '사이드 플랭크',
+    '레그 레이즈': '레그 레이즈',
+    '러시안 트위스트': '러시안 트위스트',
+    'HIIT 유산소': None,
+    '전신 스트레칭': None,
+    '덤벨 플라이': '덤벨 플라이',
+    '트라이셉스 푸시다운': '케이블 푸시다운',
+    '딥스': '트라이셉스 딥스',
+    '인버티드 로우': '인버티드 로우',
+    '플랭크 로우': '플랭크',
+}
+
+
+def _template_names():
+    names = {}
+    for key in itertools.product((3, 4, 5, 6), ("gym", "equipment", "bodyweight"), REP_TIERS, (False, True)):
+        for _, exercises, _ in FitnessPlanGenerator.weekly_template(*key):
+            for exercise in exercises:
+                names.setdefault(exercise["이름"], None)
+    return list(names)
+
+
+def test_every_template_name_is_pinned():
+    index = FitnessPlanGenerator.exercise_index()
+    names = _template_names()
+    assert set(names) == set(EXPECTED)  # 새 운동 이름이 생기면 여기에 결과를 추가
+    for name in names:
+        assert index.resolve(name) == EXPECTED[name], name
+        expected = EXPECTED[name]
+        assert index.lookup(name) == (FitnessPlanGenerator.EXERCISE_VIDEOS[expected] if expected else None)
+
+
+def test_longest_match_alias_and_alternatives():
+    index = FitnessPlanGenerator.exercise_index()
+    # 가장 긴 일치: "루마니안 데드리프트" > "데드리프트", "사이드 플랭크" > "플랭크"
+    assert index.resolve("덤벨 루마니안 데드리프트") == "루마니안 데드리프트"
+    assert index.resolve("사이드 플랭크") == "사이드 플랭크"
+    # 같은 길이면 뒤쪽(실제 동작)
+    assert index.resolve("플랭크 투 푸시업") == "푸시업"
+    # 별칭 (정확히 같을 때와 포함될 때)
+    assert index.resolve("덤벨 사이드 레이즈") == "사이드 레터럴 레이즈"
+    assert index.resolve("딥스 (의자 활용)") == "트라이셉스 딥스"
+    assert index.resolve("스쿼트 점프") == "점프 스쿼트"
+    # 대안은 앞에서부터, 정규화(공백/괄호/대소문자)
+    assert index.resolve("벤치 프레스 or 푸시업") == "벤치 프레스"
+    assert index.resolve("없는 운동 OR 푸시업") == "푸시업"
+    assert index.resolve("벤치프레스 (바벨)") == "벤치 프레스"
+    assert normalize_name(" Bench  Press (Barbell) ") == "benchpress"
+    assert index.resolve("유산소 운동") is None
+
+    # 카탈로그 이름이 별칭보다 우선, 카탈로그에 없는 별칭 대상은 무시
+    custom = ExerciseIndex({"A 로우": 1, "B": 2}, aliases={"A 로우": "B", "C": "없음"})
+    assert custom.resolve("A로우") == "A 로우" and custom.resolve("C") is None
+
+
+def test_resolve_plan_matches_lookup():
+    user = UserProfile(170, 70, 30, "여성")
+    for environment in ("헬스장", "홈트레이닝 (장비 있음)", "홈트레이닝 (장비 없음)"):
+        planner = FitnessPlanGenerator(user, "체중 감량", environment, 5, 60)
+        plan = planner.generate_weekly_plan()
+        videos = planner.get_plan_videos(plan)
+        names = [exercise["이름"] for day in plan["주간_계획"] for exercise in day["운동"]]
+        assert list(videos) == list(dict.fromkeys(names))
+        assert videos == {name: planner.get_exercise_video(name) for name in names}
+
+
+def test_resolve_cache_is_bounded():
+    index = ExerciseIndex({"스쿼트": 1, "푸시업": 2})
+    for i in range(RESOLVE_CACHE_SIZE + 500):  # 자유 입력 이름이 계속 들어와도
+        assert index.resolve(f"회원 메모 {i} 스쿼트") == "스쿼트"
+    info = index._resolve_cached.cache_info()
+    assert info.currsize == RESOLVE_CACHE_SIZE and info.misses == RESOLVE_CACHE_SIZE + 500
+    assert index.resolve("푸시업") == "푸시업" and index.resolve("푸시업") == "푸시업"
+    assert index._resolve_cached.cache_info().hits == 1
+
+
+if __name__ == "__main__":
+    test_every_template_name_is_pinned()
+    test_longest_match_alias_and_alternatives()
+    test_resolve_plan_matches_lookup()
+    test_resolve_cache_is_bounded()
+    print("✅ 운동 이름 색인 테스트 통과")
@@ -0,0 +1,93 @@
+"""
+권장 무게 표 테스트
+실행: python -m pytest test_load_tables.py  또는  python test_load_tables.py
+"""
+
+import sys
+import io
+
+import numpy as np
+
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+from load_tables import (
+    CATALOG_NAMES, EQUIPMENT, LOAD_ALIASES, MULTIPLIERS, exercise_ids, load_id, plan_loads, recommend_load,
+    recommend_loads,
+)
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def test_catalog_and_name_resolution():
+    assert len(CATALOG_NAMES) == len(EQUIPMENT) == MULTIPLIERS.shape[1] - 1
+    assert all(target in CATALOG_NAMES for target in LOAD_ALIASES.values())
+    assert np.isnan(MULTIPLIERS[:, -1]).all() and not np.isnan(MULTIPLIERS[:, :-1]).any()
+    assert (np.diff(MULTIPLIERS[:, :-1], axis=2) > 0).all()  # 초급 < 중급 < 고급
+    assert (MULTIPLIERS[0, :-1] >= MULTIPLIERS[1, :-1]).all()  # 남성 ≥ 여성
+
+    assert CATALOG_NAMES[load_id("벤치 프레스 or 푸시업")] == "벤치 프레스"
+    assert CATALOG_NAMES[load_id("트라이셉스 푸시다운")] == "케이블 푸시다운"
+    assert CATALOG_NAMES[load_id("인클라인 벤치 프레스")] == "인클라인 벤치 프레스"
+    assert load_id("싱글 레그 데드리프트") is None and load_id("푸시업 (다양한 변형)") is None
+
+
+def test_existing_recommendations_unchanged():
+    male = FitnessPlanGenerator(UserProfile(175, 75, 28, "남성"), "근육 증가", "헬스장", 4, 60)
+    female = FitnessPlanGenerator(UserProfile(164, 57, 25, "여성"), "근육 증가", "헬스장", 4, 60)
+    assert male.get_weight_recommendation("바벨 스쿼트") == {"초급": 75.0, "중급": 112.5, "고급": 150.0}
+    assert female.get_weight_recommendation("덤벨 컬") == {"초급": 2.3, "중급": 3.4, "고급": 5.7}
+    assert male.get_weight_recommendation("레그 컬") == {"초급": 22.5, "중급": 33.8, "고급": 45.0}
+    assert male.get_weight_recommendation("푸시업") is None
+
+
+def test_vectorized_matches_scalar():
+    rng = np.random.default_rng(21)
+    weights = np.round(rng.uniform(40, 140, 500), 1)
+    genders = rng.choice(["남성", "여성"], 500)
+    names = list(CATALOG_NAMES) + ["덤벨 프레스", "플랭크"]
+    loads = recommend_loads(weights, genders, exercise_ids(names))
+    assert loads.shape == (500, len(names), 3)
+    for user, (weight, gender) in enumerate(zip(weights.tolist(), genders.tolist())):
+        for column, name in enumerate(names):
+            expected = recommend_load(weight, gender, name)
+            if expected is None:
+                assert np.isnan(loads[user, column]).all()
+            else:
+                assert loads[user, column].tolist() == list(expected.values())
+
+    planner = FitnessPlanGenerator(UserProfile(170, 68.3, 40, "여성"), "근육 증가", "홈트레이닝 (장비 있음)", 5, 60)
+    plan = planner.generate_weekly_plan()
+    loads = plan_loads(68.3, "여성", plan)
+    assert list(loads) == list(dict.fromkeys(e["이름"] for day in plan["주간_계획"] for e in day["운동"]))
+    assert loads == {name: planner.get_weight_recommendation(name) for name in loads}
+    assert loads["덤벨 고블릿 스쿼트"] == {"초급": 6.8, "중급": 13.7, "고급": 20.5}
+
+
+
+def test_generated_plans_embed_loads():
+    for age, environment in [(30, "헬스장"), (67, "헬스장"), (45, "홈트레이닝 (장비 있음)"), (45, "홈트레이닝 (장비 없음)")]:
+        planner = FitnessPlanGenerator(UserProfile(170, 72.5, age, "남성"), "근육 증가", environment, 4, 60)
+        plan = planner.generate_weekly_plan(with_loads=True)
+        assert planner.generate_weekly_plan(as_model=True, with_loads=True).to_dict() == plan
+        for day in plan["주간_계획"]:
+            for exercise in day["운동"]:
+                loads = planner.get_weight_recommendation(exercise["이름"])
+                assert exercise.get("무게") == loads
+                if loads and age >= 60:
+                    assert exercise["시작_무게"] == {
+                        level: [round(loads[level] * 0.5, 1), round(loads[level] * 0.6, 1)] for level in loads
+                    }
+                else:
+                    assert "시작_무게" not in exercise
+
+    # 기본 플랜과 템플릿은 그대로
+    plain = planner.generate_weekly_plan()
+    assert all("무게" not in exercise for day in plain["주간_계획"] for exercise in day["운동"])
+
+
+if __name__ == "__main__":
+    test_catalog_and_name_resolution()
+    test_existing_recommendations_unchanged()
+    test_vectorized_matches_scalar()
+    test_generated_plans_embed_loads()
+    print("✅ 권장 무게 표 테스트 통과")
@@ -0,0 +1,103 @@
+"""
+영양 목표 배치 계산 테스트 (compute_nutrition_targets_batch = 스칼라 계산, BMR 공식 3가지)
+실행: python -m pytest test_nutrition_batch.py  또는  python test_nutrition_batch.py
+"""
+
+import io
+import random
+import sys
+
+import numpy as np
+import pytest
+
+from fitness_plan_demo import ACTIVITY_MULTIPLIERS, UserProfile, compute_nutrition_targets, nutrition_goal_rules
+from nutrition_batch import BMR_FORMULAS, GOALS, compute_nutrition_targets_batch
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def _random_profiles(rows=1000, seed=3):
+    """임의 프로필 (체지방률은 일부만 입력 - 없으면 katch_mcardle이 BMI로 추정)"""
+    rng = random.Random(seed)
+    return [{
+        "height": round(rng.uniform(145, 200), 1),
+        "weight": round(rng.uniform(40, 140), 1),
+        "age": rng.randint(15, 90),
+        "gender": rng.choice(["남성", "여성"]),
+        "body_fat_percentage": round(rng.uniform(5, 50), 1) if rng.random() < 0.3 else None,
+    } for _ in range(rows)]
+
+
+def _scalar_targets(profile, goal, frequency, formula):
+    """compute_nutrition_targets와 같은 순서의 스칼라 계산 (BMR 공식만 바꿈)"""
+    if formula == "harris_benedict":
+        targets = compute_nutrition_targets.__wrapped__(
+            profile["weight"], profile["height"], profile["age"], profile["gender"], goal, frequency)
+        return {field: getattr(targets, field) for field in (
+            "bmr", "tdee", "target_calories", "protein_min", "protein_max",
+            "carb_min", "carb_max", "fat_min", "fat_max", "water_liters")}
+    weight = profile["weight"]
+    if formula == "mifflin_st_jeor":
+        bmr = (10 * weight) + (6.25 * profile["height"]) - (5 * profile["age"]) + (5.0 if profile["gender"] == "남성" else -161.0)
+    else:
+        bmr = 370 + (21.6 * UserProfile(**profile).calculate_lean_body_mass())
+    tdee = bmr * ACTIVITY_MULTIPLIERS.get(frequency, 1.55)
+    offset, _, _, protein, carb, fat = nutrition_goal_rules(goal)
+    return {
+        "bmr": bmr, "tdee": tdee, "target_calories": tdee + offset,
+        "protein_min": weight * protein[0], "protein_max": weight * protein[1],
+        "carb_min": weight * carb, "carb_max": weight * (carb + 0.5),
+        "fat_min": weight * fat, "fat_max": weight * (fat + 0.2),
+        "water_liters": weight * 0.035,
+    }
+
+
+@pytest.mark.parametrize("formula", BMR_FORMULAS)
+def test_nutrition_batch_matches_scalar(formula):
+    profiles = _random_profiles()
+    rng = random.Random(5)
+    goals = [rng.choice(GOALS + ("근력 향상",)) for _ in profiles]  # 선택지 밖 목표도 포함
+    frequencies = [rng.randint(0, 9) for _ in profiles]  # 표에 없는 빈도는 1.55
+    result = compute_nutrition_targets_batch(
+        weight=np.array([p["weight"] for p in profiles]),
+        height=np.array([p["height"] for p in profiles]),
+        age=np.array([p["age"] for p in profiles]),
+        gender=np.array([p["gender"] for p in profiles]),
+        goal=np.array(goals),
+        frequency=np.array(frequencies),
+        formula=formula,
+        body_fat_percentage=np.array([p["body_fat_percentage"] for p in profiles], dtype=np.float64),
+    )
+    for i, (profile, goal, frequency) in enumerate(zip(profiles, goals, frequencies)):
+        expected = _scalar_targets(profile, goal, frequency, formula)
+        assert {field: float(values[i]) for field, values in result.items()} == expected
+
+    # 목표/빈도가 스칼라여도 같은 결과
+    common = compute_nutrition_targets_batch(
+        [p["weight"] for p in profiles], [p["height"] for p in profiles], [p["age"] for p in profiles],
+        [p["gender"] for p in profiles], "근육 증가", 4, formula=formula,
+        body_fat_percentage=[p["body_fat_percentage"] for p in profiles],
+    )
+    assert float(common["target_calories"][0]) == _scalar_targets(profiles[0], "근육 증가", 4, formula)["target_calories"]
+
+
+def test_fractional_frequency_matches_scalar():
+    # 스칼라 계산은 ACTIVITY_MULTIPLIERS.get(빈도)이므로 4.0은 4와 같고, 3.9/2.5는 표에 없어 1.55
+    profile = _random_profiles(1)[0]
+    frequencies = [3.9, 4.0, 2.5, 3.0, 5.5, 7.0, -1.0, 5]
+    result = compute_nutrition_targets_batch(
+        [profile["weight"]] * len(frequencies), [profile["height"]] * len(frequencies),
+        [profile["age"]] * len(frequencies), [profile["gender"]] * len(frequencies),
+        "체중 감량", np.array(frequencies, dtype=np.float64),
+    )
+    expected = [_scalar_targets(profile, "체중 감량", frequency, "harris_benedict")["tdee"] for frequency in frequencies]
+    assert result["tdee"].tolist() == expected
+    assert result["tdee"][0] != _scalar_targets(profile, "체중 감량", 3, "harris_benedict")["tdee"]  # 3으로 잘리지 않음
+
+
+if __name__ == "__main__":
+    for formula in BMR_FORMULAS:
+        test_nutrition_batch_matches_scalar(formula)
+    test_fractional_frequency_matches_scalar()
+    print("✅ 영양 목표 배치 계산 테스트 통과")
@@ -0,0 +1,63 @@
+"""
+1RM 기반 반복 범위별 무게 테스트
+실행: python -m pytest test_one_rep_max.py  또는  python test_one_rep_max.py
+"""
+
+import math
+import sys
+import io
+
+import numpy as np
+
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+from one_rep_max import FORMULAS, PERCENT_OF_1RM, estimate_1rm, percent_of_1rm, working_loads
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def test_percent_tables():
+    assert percent_of_1rm(1, "epley") == percent_of_1rm(1, "brzycki") == 1.0
+    assert percent_of_1rm(10, "epley") == percent_of_1rm(10, "brzycki") == 0.75
+    assert math.isclose(percent_of_1rm(5, "brzycki"), 32 / 36)
+    assert math.isnan(percent_of_1rm(0))
+    assert percent_of_1rm(50) == percent_of_1rm(30)
+    for formula in FORMULAS:
+        table = PERCENT_OF_1RM[formula]
+        assert not table.flags.writeable and (np.diff(table[1:]) < 0).all()
+    assert math.isclose(estimate_1rm(75, 10), 100.0) and math.isclose(estimate_1rm(100, 1, "brzycki"), 100.0)
+    assert working_loads([[100.0, 120.0, 140.0]], [8]).tolist() == [[78.9, 94.7, 110.5]]
+    try:
+        percent_of_1rm(5, "lombardi")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("알 수 없는 공식은 ValueError")
+
+
+def test_plan_rep_range_loads():
+    planner = FitnessPlanGenerator(UserProfile(175, 80, 30, "남성"), "근육 증가", "헬스장", 4, 60)
+    plan = planner.generate_weekly_plan(with_loads=True)
+    for formula in FORMULAS:
+        days = planner.get_rep_range_loads(formula)
+        assert [len(day) for day in days] == [len(day["운동"]) for day in plan["주간_계획"]]
+        for day_plan, day_loads, day_numbers in zip(plan["주간_계획"], days, planner.weekly_numbers()):
+            for exercise, loads, numbers in zip(day_plan["운동"], day_loads, day_numbers):
+                if "무게" not in exercise or not numbers.reps_max:
+                    assert loads is None
+                    continue
+                percent = float(percent_of_1rm(numbers.reps_max, formula))
+                assert loads["반복"] == numbers.reps_max
+                for level in ("초급", "중급", "고급"):  # 권장 무게(0.1kg 반올림 전 1RM) × 비율
+                    assert math.isclose(loads[level], exercise["무게"][level] * percent, abs_tol=0.1)
+
+    # 같은 1RM 비율이라도 반복이 많을수록 가벼움: "6-8회" 스쿼트 vs "10-12회" 레그 컬
+    squat, _, _, leg_curl = planner.get_rep_range_loads()[0][:4]
+    assert squat["반복"] == 8 and leg_curl["반복"] == 12
+    assert squat["중급"] / 120.0 > leg_curl["중급"] / 36.0
+
+
+if __name__ == "__main__":
+    test_percent_tables()
+    test_plan_rep_range_loads()
+    print("✅ 1RM 반복 범위 무게 테스트 통과")
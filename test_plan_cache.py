@@ -0,0 +1,135 @@
+"""
+플랜 캐시 테스트 (적중/실패, LRU 제거, 저장/불러오기, 버전, 동시 저장)
+실행: python -m pytest test_plan_cache.py  또는  python test_plan_cache.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile, build_plan_bundle
+from plan_cache import PlanCache
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def _planner(weight=70, goal="근육 증가"):
+    return FitnessPlanGenerator(UserProfile(175, weight, 30, "남성"), goal, "헬스장", 4, 60, ["무릎"])
+
+
+def test_hit_miss_and_key_normalization():
+    cache = PlanCache()
+    calls = []
+
+    def factory(planner):
+        calls.append(planner)
+        return build_plan_bundle(planner)
+
+    first = cache.get_or_create(_planner(70), factory)
+    again = cache.get_or_create(_planner(70.0), factory)  # 70 == 70.0
+    other = cache.get_or_create(_planner(70, " 근육 증가 "), factory)  # 앞뒤 공백 무시
+    assert first is again is other and len(calls) == 1
+    cache.get_or_create(_planner(71), factory)
+    assert len(calls) == 2
+    assert cache.stats() == {"size": 2, "maxsize": 256, "hits": 2, "misses": 2, "hit_rate": 0.5}
+    assert cache.get("없는 키") is None and cache.stats()["misses"] == 3
+
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()["hits"] == 0
+
+
+def test_eviction_at_maxsize_is_least_recently_used():
+    cache = PlanCache(maxsize=3)
+    for key in "abc":
+        cache.put(key, {"value": key})
+    assert cache.get("a") == {"value": "a"}  # a를 가장 최근으로
+    cache.put("d", {"value": "d"})
+    assert "b" not in cache and list(cache._entries) == ["c", "a", "d"]
+    cache.put("c", {"value": "c2"})  # 덮어쓰기도 최근 사용
+    cache.put("e", {"value": "e"})
+    assert list(cache._entries) == ["d", "c", "e"] and len(cache) == 3
+
+
+def test_save_load_round_trip_and_version(tmp_path):
+    filename = str(tmp_path / "plan_cache.json")
+    cache = PlanCache(maxsize=8, filename=filename)
+    bundle = cache.get_or_create(_planner(), build_plan_bundle)
+    for key in "abc":
+        cache.put(key, {"value": key})
+    cache.save()
+
+    loaded = PlanCache(maxsize=8, filename=filename)
+    assert list(loaded._entries) == list(cache._entries)
+    assert loaded.get(PlanCache.make_key(_planner())) == bundle
+    assert PlanCache(maxsize=2, filename=filename)._entries.keys() == {"b", "c"}  # 작은 maxsize면 최근 항목만
+
+    # 버전이 다르거나 손상된 파일은 빈 캐시로 시작
+    data = json.loads(Path(filename).read_text(encoding='utf-8'))
+    data["version"] = PlanCache.VERSION - 1
+    Path(filename).write_text(json.dumps(data), encoding='utf-8')
+    assert len(PlanCache(filename=filename)) == 0
+    Path(filename).write_text('{"version": 2, "entr', encoding='utf-8')
+    assert len(PlanCache(filename=filename)) == 0
+    for text in ('[]', '"cache"', 'null', '{"version": %d, "entries": {"a": 1}}' % PlanCache.VERSION,
+                 '{"version": %d, "entries": [[1, 2, 3]]}' % PlanCache.VERSION):  # 최상위/항목 형식이 다른 JSON
+        Path(filename).write_text(text, encoding='utf-8')
+        assert len(PlanCache(filename=filename)) == 0
+
+
+def test_failed_save_is_retried(tmp_path):
+    filename = str(tmp_path / "plan_cache.json")
+    cache = PlanCache(filename=filename)
+    cache.put("a", {"value": 1})
+
+    with mock.patch("os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            cache.save()
+    assert cache._dirty and os.listdir(tmp_path) == []  # 임시 파일도 남지 않음
+    cache.save()
+    assert not cache._dirty and PlanCache(filename=filename).get("a") == {"value": 1}
+
+
+def test_concurrent_saves_from_threads(tmp_path):
+    filename = str(tmp_path / "plan_cache.json")
+    cache = PlanCache(maxsize=64, filename=filename)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(30):
+                cache.put(f"{n}-{i}", {"value": [n, i]})
+                cache.save()
+        except Exception as e:  # 스레드 안의 예외는 모아서 확인
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cache.save()
+
+    assert errors == []
+    assert os.listdir(tmp_path) == ["plan_cache.json"]
+    loaded = PlanCache(maxsize=64, filename=filename)
+    assert list(loaded._entries) == list(cache._entries) and len(loaded) == 64
+
+
+if __name__ == "__main__":
+    test_hit_miss_and_key_normalization()
+    test_eviction_at_maxsize_is_least_recently_used()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_save_load_round_trip_and_version(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_failed_save_is_retried(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_concurrent_saves_from_threads(Path(tmp))
+    print("✅ 플랜 캐시 테스트 통과")
@@ -0,0 +1,96 @@
+"""
+플랜 문서 렌더러 테스트
+터미널 텍스트가 print_* 출력과 같은지, Markdown/HTML/JSON이 같은 내용을 담는지 확인합니다.
+실행: python -m pytest test_plan_document.py  또는  python test_plan_document.py
+"""
+
+import contextlib
+import io
+import json
+import sys
+
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile, build_plan_bundle, print_recommendations
+from plan_document import SECTION_ORDER, Block, PlanDocument, render_html, render_markdown
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def _planner(age=65):
+    user = UserProfile(height=165, weight=70, age=age, gender="여성", body_fat_percentage=26, skeletal_muscle_mass=25)
+    return FitnessPlanGenerator(user, "체중 감량 + 근육 증가", "헬스장", 4, 60, ["손목", "무릎"], ["저혈당"])
+
+
+def test_text_matches_print_methods():
+    planner = _planner()
+    bundle = build_plan_bundle(planner)
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        planner.user.print_profile()
+        print_recommendations(bundle["recommendations"])
+        planner.print_weekly_plan(bundle["weekly_plan"])
+        planner.print_nutrition_guide()
+        planner.print_meal_plan()
+        planner.print_cardio_guide()
+        planner.print_weight_guide()
+        planner.print_medical_guidance()
+        planner.print_pain_guidance()
+        planner.print_tips()
+
+    document = planner.plan_document(bundle)
+    assert list(document.sections) == SECTION_ORDER
+    assert document.render() == printed.getvalue()
+    assert "    - 💡 권장 무게: 초급 35.0kg / 중급 56.0kg / 고급 84.0kg\n" in printed.getvalue()  # 바벨 스쿼트
+    assert "    - 👴 시작 무게 (추천의 50-60%): 초급 17.5-21.0kg / " in printed.getvalue()
+
+    written = io.StringIO()
+    document.write(written, sections=["tips"])
+    assert written.getvalue().startswith("\n" + "=" * 60 + "\n💡 운동 성공을 위한 팁\n")
+    assert "고령자 맞춤 운동 주의사항" in written.getvalue()
+    assert "고령자" not in _planner(age=30).plan_document(bundle).render(sections=["tips"])
+
+
+def test_markdown_html_json_share_content():
+    document = _planner().plan_document()
+    markdown = document.render("markdown")
+    assert markdown.startswith("## 📊 사용자 신체 정보 분석\n\n- 🔹 나이: 65세\n")
+    assert "### 📌 Day 1" in markdown and "#### 손목 관련 주의사항" in markdown
+    assert "=" * 60 not in markdown
+
+    page = document.render("html")
+    assert page.count("<ul>") == page.count("</ul>")
+    assert page.count("<section") == len(SECTION_ORDER)
+
+    data = json.loads(document.render("json"))
+    assert [section["name"] for section in data["sections"]] == SECTION_ORDER
+    texts = [block["text"] for section in data["sections"] for block in section["blocks"] if "text" in block]
+    assert "손목 관련 주의사항" in texts
+
+
+def test_nested_lists_and_escaping():
+    sections = {"plan": [
+        Block("title", "A & B"),
+        Block("item", "<운동>", indent=2, marker="✓"),
+        Block("item", "3세트", indent=4, marker="-"),
+        Block("link", "📹 ", indent=4, url="https://example.com/?a=1&b=2"),
+        Block("text", "끝"),
+    ]}
+    assert render_markdown(sections) == (
+        "## A & B\n\n- ✓ <운동>\n  - 3세트\n  - 📹 [https://example.com/?a=1&b=2](https://example.com/?a=1&b=2)\n\n끝\n"
+    )
+    page = render_html(sections)
+    assert "<h2>A &amp; B</h2>\n<ul>\n<li>✓ &lt;운동&gt;</li>\n<ul>\n<li>3세트</li>\n" in page
+    assert "</ul>\n</ul>\n<p>끝</p>" in page
+    try:
+        PlanDocument(sections).render("pdf")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("알 수 없는 형식은 ValueError")
+
+
+if __name__ == "__main__":
+    test_text_matches_print_methods()
+    test_markdown_html_json_share_content()
+    test_nested_lists_and_escaping()
+    print("✅ 플랜 문서 렌더러 테스트 통과")
@@ -0,0 +1,70 @@
+"""
+주간 플랜 모델 테스트
+실행: python -m pytest test_plan_model.py  또는  python test_plan_model.py
+"""
+
+import dataclasses
+import itertools
+import sys
+import io
+
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+from plan_model import DayPlan, Exercise, WeeklyPlan
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def test_models_match_dict_plans():
+    goals = ["체중 감량", "근육 증가", "체력 향상", "건강 유지"]
+    environments = ["헬스장", "홈트레이닝 (장비 있음)", "홈트레이닝 (장비 없음)"]
+    for goal, environment, frequency, age in itertools.product(goals, environments, range(3, 8), (30, 65)):
+        planner = FitnessPlanGenerator(UserProfile(170, 70, age, "여성"), goal, environment, frequency, 45)
+        plan = planner.generate_weekly_plan()
+        model = planner.generate_weekly_plan(as_model=True)
+        assert model.to_dict() == plan
+        assert list(model.to_dict()["주간_계획"][0]["운동"][0]) == list(plan["주간_계획"][0]["운동"][0])
+        assert WeeklyPlan.from_dict(plan) == model
+        assert model.numbers == planner.weekly_numbers()
+
+
+def test_models_are_immutable_and_shared():
+    user = UserProfile(180, 80, 30, "남성")
+    first = FitnessPlanGenerator(user, "근육 증가", "헬스장", 4, 60).generate_weekly_plan(as_model=True)
+    second = FitnessPlanGenerator(user, "근육 증가", "헬스장", 4, 90).generate_weekly_plan(as_model=True)
+    assert first.days is second.days and first != second
+    assert not hasattr(first, "__dict__") and not hasattr(first.days[0].exercises[0], "__dict__")
+    try:
+        first.days[0].exercises[0].sets = 10
+    except dataclasses.FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("Exercise는 수정할 수 없음")
+
+    # to_dict는 매번 새 dict라 수정해도 공유 객체에 영향 없음
+    first.to_dict()["주간_계획"][0]["운동"].clear()
+    assert first.days[0].exercises
+
+
+def test_exercise_round_trip():
+    lunge = Exercise("런지", sets=3, reps="각 다리 12-15회", rest="60초")
+    assert lunge.numbers.per_side and lunge.numbers.reps_max == 15
+    assert lunge.to_dict() == {"이름": "런지", "세트": 3, "횟수": "각 다리 12-15회", "휴식": "60초"}
+    cardio = Exercise.from_dict({"이름": "유산소 운동", "시간": "20-30분", "강도": "중강도"})
+    assert cardio.numbers.kind == "cardio" and cardio.sets is None
+    day = DayPlan("Day 1", "하체", (lunge, cardio))
+    assert DayPlan.from_dict(day.to_dict()) == day
+    assert day.numbers == (lunge.numbers, cardio.numbers)
+    try:
+        Exercise.from_dict({"이름": "런지", "메모": "천천히"})
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("모르는 키는 KeyError")
+
+
+if __name__ == "__main__":
+    test_models_match_dict_plans()
+    test_models_are_immutable_and_shared()
+    test_exercise_round_trip()
+    print("✅ 주간 플랜 모델 테스트 통과")
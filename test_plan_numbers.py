@@ -0,0 +1,59 @@
+"""
+운동 처방 수치 테스트
+실행: python -m pytest test_plan_numbers.py  또는  python test_plan_numbers.py
+"""
+
+import itertools
+import sys
+import io
+
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+from plan_numbers import ExerciseNumbers, VolumeSummary, parse_days, parse_exercise, summarize
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def test_parse_exercise():
+    assert parse_exercise({"이름": "런지", "세트": 3, "횟수": "각 다리 12-15회", "휴식": "60초"}) == ExerciseNumbers(
+        "reps", sets=3, reps_min=12, reps_max=15, per_side=True, rest_seconds=60)
+    assert parse_exercise({"이름": "푸시업", "세트": 4, "횟수": "최대한", "휴식": "90초"}) == ExerciseNumbers(
+        "reps", sets=4, to_failure=True, rest_seconds=90)
+    plank = parse_exercise({"이름": "플랭크", "세트": 3, "시간": "45-60초", "휴식": "60초"})
+    assert plank.kind == "timed" and (plank.duration_min_seconds, plank.duration_max_seconds) == (45, 60)
+    assert plank.work_seconds == (135, 180) and plank.total_rest_seconds == 120
+    cardio = parse_exercise({"이름": "유산소 운동", "시간": "20-30분", "강도": "중강도"})
+    assert cardio.kind == "cardio" and cardio.work_seconds == (1200, 1800) and cardio.total_rest_seconds == 0
+    big3 = parse_exercise({"이름": "맥길 빅3 (컬업, 사이드플랭크, 버드독)", "세트": 2, "각": "10회"})
+    assert big3.reps_max == 10 and not big3.per_side and big3.total_reps == (20, 20)
+    assert parse_exercise({"이름": "발목 알파벳 쓰기", "세트": 3, "횟수": "A-Z", "휴식": "30초"}).reps_max == 0
+
+
+def test_weekly_numbers_match_generated_plans():
+    goals = ["체중 감량", "근육 증가", "체력 향상", "건강 유지"]
+    environments = ["헬스장", "홈트레이닝 (장비 있음)", "홈트레이닝 (장비 없음)"]
+    for goal, environment, frequency, age, gender in itertools.product(goals, environments, range(3, 8), (30, 65), ("남성", "여성")):
+        planner = FitnessPlanGenerator(UserProfile(170, 70, age, gender), goal, environment, frequency, 60)
+        plan = planner.generate_weekly_plan()
+        numbers = planner.weekly_numbers()
+        assert numbers == parse_days(plan["주간_계획"])
+        assert [len(day) for day in numbers] == [len(day["운동"]) for day in plan["주간_계획"]]
+        assert planner.weekly_volume() == summarize(numbers)
+
+
+def test_summarize_day_and_week():
+    squat = ExerciseNumbers("reps", sets=4, reps_min=8, reps_max=10, rest_seconds=120)
+    lunge = ExerciseNumbers("reps", sets=3, reps_min=12, reps_max=12, per_side=True, rest_seconds=60)
+    cardio = ExerciseNumbers("cardio", duration_min_seconds=900, duration_max_seconds=1200)
+    day = summarize([squat, lunge, cardio])
+    assert day == VolumeSummary(exercises=3, sets=7, reps_min=104, reps_max=112,
+                                work_min_seconds=900, work_max_seconds=1200, rest_seconds=480)
+    assert summarize([[squat], [lunge, cardio]]) == day
+    assert summarize([]) == VolumeSummary()
+
+
+if __name__ == "__main__":
+    test_parse_exercise()
+    test_weekly_numbers_match_generated_plans()
+    test_summarize_day_and_week()
+    print("✅ 운동 처방 수치 테스트 통과")
@@ -0,0 +1,115 @@
+"""
+플랜 JSON 스키마 테스트
+모든 목표/환경/빈도 조합의 스키마 문서가 PLAN_JSON_SCHEMA에 맞고, 직렬화 후 다시 읽어도 같은지 확인합니다.
+실행: python -m pytest test_plan_schema.py  또는  python test_plan_schema.py
+"""
+
+import itertools
+import json
+import sys
+import io
+
+import plan_schema
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile, build_plan_bundle
+from plan_schema import exercise_to_schema, loads, parse_range, parse_seconds, plan_to_schema, validate
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+GOALS = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+ENVIRONMENTS = ["헬스장", "홈트레이닝 (장비 있음)", "홈트레이닝 (장비 없음)"]
+PAIN_AREAS = ["목/어깨", "허리", "무릎", "손목", "팔꿈치", "발목"]
+MEDICAL_CONDITIONS = ["저혈당", "당뇨병", "저혈압", "고혈압", "심장 질환", "천식", "기타"]
+
+
+def _documents():
+    for goal, environment, frequency, age in itertools.product(GOALS, ENVIRONMENTS, range(3, 7), (30, 65)):
+        user = UserProfile(height=170, weight=70, age=age, gender="여성")
+        planner = FitnessPlanGenerator(user, goal, environment, frequency, 60, PAIN_AREAS, MEDICAL_CONDITIONS)
+        yield plan_to_schema(planner, build_plan_bundle(planner))
+
+
+def test_parse_prescriptions():
+    assert parse_range("12-15회") == {"min": 12, "max": 15}
+    assert parse_range("155 bpm") == {"min": 155, "max": 155}
+    assert parse_range("최대한") is None and parse_range("A-Z") is None
+    assert parse_seconds("45-60초") == {"min": 45, "max": 60}
+    assert parse_seconds("20-30분") == {"min": 1200, "max": 1800}
+    assert parse_seconds("15-25분 (전력 20초 + 휴식 40초)") == {"min": 900, "max": 1500}
+
+    lunge = exercise_to_schema({"이름": "런지", "세트": 3, "횟수": "각 다리 12-15회", "휴식": "60초"})
+    assert lunge["kind"] == "reps" and lunge["per_side"] and lunge["reps"] == {"min": 12, "max": 15}
+    assert lunge["rest_seconds"] == 60 and lunge["label"] == "각 다리 12-15회"
+    plank = exercise_to_schema({"이름": "사이드 플랭크", "세트": 3, "시간": "각 사이드 45초", "휴식": "45초"})
+    assert plank["kind"] == "timed" and plank["per_side"] and plank["duration_seconds"] == {"min": 45, "max": 45}
+    cardio = exercise_to_schema({"이름": "유산소 운동", "시간": "15-20분", "강도": "중-고강도"})
+    assert cardio["kind"] == "cardio" and cardio["sets"] is None and cardio["intensity"] == "중-고강도"
+    assert exercise_to_schema({"이름": "푸시업", "세트": 4, "횟수": "최대한", "휴식": "90초"})["to_failure"]
+    assert lunge["load_kg"] is None and lunge["senior_start_kg"] is None
+
+    squat = exercise_to_schema({"이름": "바벨 스쿼트", "세트": 4, "횟수": "8-12회", "휴식": "90초",
+                                "무게": {"초급": 42.0, "중급": 70.0, "고급": 98.0},
+                                "시작_무게": {"초급": [21.0, 25.2], "중급": [35.0, 42.0], "고급": [49.0, 58.8]}})
+    assert squat["load_kg"] == {"beginner": 42.0, "intermediate": 70.0, "advanced": 98.0}
+    assert squat["senior_start_kg"] == {"beginner": {"min": 21.0, "max": 25.2}, "intermediate": {"min": 35.0, "max": 42.0},
+                                        "advanced": {"min": 49.0, "max": 58.8}}
+
+
+def test_plan_loads_in_documents():
+    for age in (30, 65):
+        user = UserProfile(height=175, weight=80, age=age, gender="남성")
+        planner = FitnessPlanGenerator(user, "근육 증가", "헬스장", 4, 60)
+        bundle = build_plan_bundle(planner)
+        document = plan_to_schema(planner, bundle)
+        assert document["version"] == plan_schema.SCHEMA_VERSION == 2
+        pairs = [
+            (exercise, schema)
+            for day, schema_day in zip(bundle["weekly_plan"]["주간_계획"], document["weekly_plan"]["days"])
+            for exercise, schema in zip(day["운동"], schema_day["exercises"])
+        ]
+        loaded = [(exercise, schema) for exercise, schema in pairs if "무게" in exercise]
+        assert loaded and any(schema["load_kg"] is None for _, schema in pairs)
+        for exercise, schema in loaded:
+            assert schema["load_kg"]["intermediate"] == exercise["무게"]["중급"]
+            if age >= 60:
+                assert schema["senior_start_kg"]["beginner"] == dict(zip(("min", "max"), exercise["시작_무게"]["초급"]))
+            else:
+                assert schema["senior_start_kg"] is None
+        assert validate(document) == []
+
+
+def test_documents_validate_and_round_trip(monkeypatch):
+    documents = list(_documents())
+    for document in documents:
+        assert validate(document) == []
+        assert loads(plan_schema.dumps(document)) == document
+
+    # orjson이 없을 때 표준 json으로도 같은 결과
+    encoded = plan_schema.dumps(documents[0])
+    monkeypatch.setattr(plan_schema, "orjson", None)
+    assert json.loads(plan_schema.dumps(documents[0])) == json.loads(encoded) == loads(encoded)
+
+
+def test_validate_reports_type_errors():
+    document = next(_documents())
+    document["weekly_plan"]["days"][0]["exercises"][0]["sets"] = "3"
+    document["nutrition"]["extra"] = 1
+    del document["cardio"]["type"]
+    errors = validate(document)
+    assert len(errors) == 3
+    assert any(error.startswith("$.weekly_plan.days[0].exercises[0].sets") for error in errors)
+    try:
+        loads(b'{"schema": "fitplan.plan", "version": 99}')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("다른 버전은 ValueError")
+
+
+if __name__ == "__main__":
+    test_parse_prescriptions()
+    test_plan_loads_in_documents()
+    for document in _documents():
+        assert validate(document) == [] and loads(plan_schema.dumps(document)) == document
+    test_validate_reports_type_errors()
+    print(f"✅ 플랜 JSON 스키마 테스트 통과 (백엔드: {plan_schema.JSON_BACKEND})")
@@ -0,0 +1,83 @@
+"""
+원판/덤벨 무게 맞추기 테스트
+실행: python -m pytest test_plate_loading.py  또는  python test_plate_loading.py
+"""
+
+import itertools
+import random
+import sys
+import io
+
+import numpy as np
+
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+from plate_loading import COMMERCIAL_GYM, HOME_GYM, EquipmentProfile, loadable_weights, loading_table
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def test_barbell_table_matches_brute_force():
+    profile = EquipmentProfile("테스트", bar_weight=20, plates=((20, 1), (10, 2), (2.5, 1), (1.25, 1)))
+    table = loading_table(profile)
+    expected = set()
+    for counts in itertools.product(range(2), range(3), range(2), range(2)):
+        side = sum(n * kg for n, kg in zip(counts, (20, 10, 2.5, 1.25)))
+        expected.add(round(20 + 2 * side, 3))
+    assert [kg / 1000 for kg in table.loads["barbell"]] == sorted(expected)
+    for total in expected:
+        plates = table.plate_breakdown(total)
+        assert 20 + 2 * sum(plates) == total and plates == sorted(plates, reverse=True)
+    assert table.plate_breakdown(60) == [20.0]  # 10 + 10보다 원판 수가 적은 구성
+    assert table.plate_breakdown(21) is None
+
+
+def test_rounding_modes_and_vectorized_lookup():
+    table = loading_table(COMMERCIAL_GYM)
+    assert table.round("barbell", 45.6) == 45.0
+    assert table.round("barbell", 46.3, "up") == 47.5 and table.round("barbell", 46.3, "down") == 45.0
+    assert table.round("barbell", 46.25) == 45.0  # 같은 거리면 가벼운 쪽
+    assert table.round("barbell", 5) == 20.0 and table.round("barbell", 1000) == table.loads["barbell"][-1] / 1000
+    assert table.round("dumbbell", 11.2) == 12.0 and table.round("dumbbell", 10.9, "down") == 10.0
+    assert table.round("machine", 47.4) == 45.0 and table.round("cable", 23.7) == 22.5
+    assert loading_table(HOME_GYM).round("machine", 50) is None
+    try:
+        table.round("barbell", 50, "ceil")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("알 수 없는 반올림 방식은 ValueError")
+
+    rng = random.Random(23)
+    targets = [rng.uniform(0, 250) for _ in range(2000)]
+    for equipment in ("barbell", "dumbbell", "machine", "cable"):
+        for mode in ("nearest", "down", "up"):
+            assert table.round_many(equipment, targets, mode).tolist() == [
+                table.round(equipment, kg, mode) for kg in targets
+            ]
+    assert np.isnan(loading_table(HOME_GYM).round_many("cable", [10, 20])).all()
+
+
+def test_warmup_and_plan_loads():
+    table = loading_table()
+    assert table.warmup("barbell", 102.5) == [(20.0, 10), (40.0, 8), (60.0, 5), (80.0, 3)]
+    assert table.warmup("barbell", 20) == []
+    assert table.warmup("dumbbell", 20) == [(8.0, 8), (12.0, 5), (16.0, 3)]
+
+    planner = FitnessPlanGenerator(UserProfile(175, 76.4, 30, "남성"), "근육 증가", "헬스장", 4, 60)
+    plan = planner.generate_weekly_plan(with_loads=True)
+    loads = loadable_weights(plan)
+    squat = loads["바벨 스쿼트"]
+    assert squat["기구"] == "barbell" and squat["초급"] == 77.5 and squat["원판"]["초급"] == [25.0, 2.5, 1.25]
+    assert all(value["고급"] >= value["초급"] for value in loads.values())
+    assert set(loads) == {e["이름"] for day in plan["주간_계획"] for e in day["운동"] if "무게" in e}
+
+    home = loadable_weights(plan, HOME_GYM)
+    assert home["레그 프레스"]["초급"] is None
+
+
+if __name__ == "__main__":
+    test_barbell_table_matches_brute_force()
+    test_rounding_modes_and_vectorized_lookup()
+    test_warmup_and_plan_loads()
+    print("✅ 원판/덤벨 무게 맞추기 테스트 통과")
@@ -0,0 +1,99 @@
+"""
+프로필 보조 색인 테스트
+임의 프로필을 추가/수정/삭제하면서 색인 조회 결과가 전체 검색 결과와 같은지 확인합니다.
+실행: python -m pytest test_profile_index.py  또는  python test_profile_index.py
+"""
+
+import random
+import sys
+import io
+
+from fitness_plan_demo import PROFILE_INDEX_FIELDS, ProfileManager, profile_bmi
+from profile_index import ProfileIndex
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+GOALS = ["체중 감량", "근육 증가", "체중 감량 + 근육 증가", "체력 향상", "건강 유지"]
+
+
+def _random_record(rng):
+    record = {
+        "height": rng.randint(150, 190),
+        "weight": rng.randint(45, 110),
+        "age": rng.randint(18, 80),
+        "gender": rng.choice(["남성", "여성"]),
+        "updated_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:00:00",
+    }
+    if rng.random() < 0.8:
+        record["goal"] = rng.choice(GOALS)
+    return record
+
+
+def _scan(profiles, prefix=None, **conditions):
+    """색인 없이 전체 프로필을 확인한 기준 결과"""
+    result = []
+    for nickname, record in profiles.items():
+        if prefix is not None and not nickname.startswith(prefix):
+            continue
+        values = {field: extract(record) for field, extract in PROFILE_INDEX_FIELDS.items()}
+        if all(ProfileIndex._matches(values[field], condition) for field, condition in conditions.items()):
+            result.append(nickname)
+    return sorted(result)
+
+
+QUERIES = [
+    {"gender": "여성", "age": (40, 60), "goal": "체중 감량"},
+    {"updated_at": (None, "2024-03-01 00:00:00")},
+    {"bmi": (25, None), "gender": "남성"},
+    {"age": 30},
+    {"prefix": "kim"},
+    {"prefix": "kim", "goal": "건강 유지"},
+    {"prefix": ""},
+    {},
+]
+
+
+def test_index_matches_full_scan():
+    rng = random.Random(7)
+    index = ProfileIndex(PROFILE_INDEX_FIELDS)
+    profiles = {}
+    for i in range(300):
+        nickname = f"{rng.choice(['kim', 'lee', 'park'])}{i}"
+        profiles[nickname] = _random_record(rng)
+    index.build(profiles.items())
+
+    for step in range(300):
+        nickname = rng.choice(list(profiles))
+        if step % 3 == 0:
+            del profiles[nickname]
+            index.remove(nickname)
+        else:
+            profiles[nickname] = _random_record(rng)
+            index.add(nickname, profiles[nickname])
+
+    assert len(index) == len(profiles)
+    for conditions in QUERIES:
+        assert index.query(**conditions) == _scan(profiles, **conditions), conditions
+
+
+def test_profile_manager_keeps_index_updated(tmp_path):
+    manager = ProfileManager(str(tmp_path / "profiles.json"))
+    manager.add_profile("kim", {"height": 160, "weight": 70, "age": 45, "gender": "여성", "goal": "체중 감량"})
+    manager.add_profile("lee", {"height": 175, "weight": 70, "age": 30, "gender": "남성"})
+    assert manager.query_profiles(gender="여성", age=(40, 60), goal="체중 감량") == ["kim"]
+
+    manager.update_profile("kim", {"height": 160, "weight": 70, "age": 61, "gender": "여성", "goal": "체중 감량"})
+    manager.add_profile("kimmy", {"height": 165, "weight": 55, "age": 50, "gender": "여성", "goal": "체중 감량"})
+    assert manager.query_profiles(gender="여성", age=(40, 60), goal="체중 감량") == ["kimmy"]
+    assert manager.query_profiles(prefix="kim") == ["kim", "kimmy"]
+    assert manager.query_profiles(bmi=(27, 28)) == ["kim"]
+    assert profile_bmi(manager.get_profile("kim")) == 27.34
+
+    manager.delete_profile("kimmy")
+    assert manager.query_profiles(prefix="kim") == ["kim"]
+
+
+if __name__ == "__main__":
+    test_index_matches_full_scan()
+    print("✅ 색인 조회 결과가 전체 검색과 일치합니다")
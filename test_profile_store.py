@@ -0,0 +1,392 @@
+"""
+프로필 저장소 동시 쓰기 스트레스 테스트
+여러 프로세스가 같은 profiles.json에 동시에 프로필을 추가/수정/삭제해도 변경이 사라지지 않는지 확인합니다.
+색인 기반(lazy) 저장소의 부분 읽기/색인 재생성/페이지 출력, SQLite 저장소/이전,
+저널 저장소의 재생/잘린 줄 복구/합치기 중단 복구도 함께 확인합니다.
+실행: python -m pytest test_profile_store.py  또는  python test_profile_store.py
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import io
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+from fitness_plan_demo import ProfileManager
+import pytest
+
+import profile_store
+from profile_store import (
+    JournalProfileStore,
+    JsonProfileStore,
+    LazyJsonProfileStore,
+    SQLiteProfileStore,
+    migrate_json_to_sqlite,
+    open_profile_store,
+    scan_offsets,
+)
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+WORKERS = 8
+PROFILES_PER_WORKER = 25
+
+
+def _writer(filename, worker, count):
+    """프로필 count개 추가 → 전부 수정 → 짝수 번째 삭제"""
+    manager = ProfileManager(filename)
+    for i in range(count):
+        manager.add_profile(f"w{worker}-{i}", {"height": 170, "weight": 60 + i, "age": 20 + worker, "gender": "남성"})
+    for i in range(count):
+        manager.update_profile(f"w{worker}-{i}", {"height": 171, "weight": 60 + i, "age": 20 + worker, "gender": "남성"})
+    for i in range(0, count, 2):
+        manager.delete_profile(f"w{worker}-{i}")
+
+
+def run_concurrent_writers(filename, workers=WORKERS, count=PROFILES_PER_WORKER):
+    processes = [
+        multiprocessing.Process(target=_writer, args=(filename, worker, count))
+        for worker in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return [process.exitcode for process in processes]
+
+
+def check_store(filename, workers=WORKERS, count=PROFILES_PER_WORKER):
+    """남아 있어야 할 프로필(홀수 번째, 수정된 값)이 정확히 있는지 확인"""
+    manager = ProfileManager(filename)
+    expected = {f"w{worker}-{i}" for worker in range(workers) for i in range(1, count, 2)}
+    assert set(manager.list_profiles()) == expected
+    for nickname in expected:
+        profile = manager.get_profile(nickname)
+        assert profile["height"] == 171
+        assert profile["created_at"] <= profile["updated_at"]
+
+
+def test_concurrent_writers_lose_no_updates(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    reader = ProfileManager(filename)
+    assert reader.list_profiles() == []
+
+    assert run_concurrent_writers(filename) == [0] * WORKERS
+    check_store(filename)
+
+    # 먼저 열어 둔 관리자도 다른 프로세스의 변경을 감지해 다시 불러옴
+    assert len(reader.list_profiles()) == WORKERS * (PROFILES_PER_WORKER // 2)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_reload_only_when_changed(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    writer = ProfileManager(filename)
+    reader = ProfileManager(filename)
+    writer.add_profile("a", {"height": 170})
+
+    assert reader.get_profile("a")["height"] == 170
+    profiles = reader.store.profiles
+    reader.get_profile("a")
+    assert reader.store.profiles is profiles  # 변경이 없으면 다시 읽지 않음
+
+    writer.update_profile("a", {"height": 180})
+    assert reader.get_profile("a")["height"] == 180
+
+
+@pytest.mark.parametrize("backend", ["json", "lazy", "sqlite", "journal"])
+def test_update_keeps_created_at_and_skips_missing(tmp_path, backend):
+    store = open_profile_store(str(tmp_path / f"profiles.{backend}"), backend)
+    store.put("a", {"height": 170, "created_at": "2024-01-01 00:00:00"})
+    record = store.update("a", lambda existing: {"height": existing["height"] + 1, "created_at": existing["created_at"]})
+    assert record == store.get("a") == {"height": 171, "created_at": "2024-01-01 00:00:00"}
+    assert store.update("없음", lambda existing: {"height": 0}) is None and "없음" not in store
+    store.close()
+
+
+@pytest.mark.parametrize("backend", ["json", "lazy", "sqlite"])
+def test_update_holds_lock_against_concurrent_delete(tmp_path, backend):
+    # 확인 → created_at 유지 → 저장이 잠금 하나 안에서 일어나므로, 그 사이 다른 저장소의 삭제는 기다렸다가 실행됨
+    filename = str(tmp_path / f"profiles.{backend}")
+    manager = ProfileManager(filename, backend)
+    manager.add_profile("a", {"height": 170})
+    deleted = []
+    deleter = threading.Thread(target=lambda: deleted.append(ProfileManager(filename, backend).delete_profile("a")))
+    blocked = []
+
+    def change(existing):
+        deleter.start()
+        deleter.join(0.3)
+        blocked.append(deleter.is_alive())
+        return {**existing, "height": 180}
+
+    assert manager.store.update("a", change)["height"] == 180
+    deleter.join()
+    assert blocked == [True] and deleted == [True]
+    assert manager.get_profile("a") is None  # 삭제가 수정 뒤에 적용되어 되살아나지 않음
+    assert not manager.update_profile("a", {"height": 190}) and manager.get_profile("a") is None
+    manager.close()
+
+
+def test_lazy_store_reads_only_touched_profiles(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    writer = ProfileManager(filename)
+    for i in range(30):
+        writer.add_profile(f"회원{i}", {"height": 160 + i, "gender": "여성"})
+    with open(filename, 'r', encoding='utf-8') as f:
+        assert json.load(f) == writer.profiles
+
+    lazy = ProfileManager(filename, backend="lazy")
+    assert lazy.list_profiles() == [f"회원{i}" for i in range(30)]
+    assert lazy.get_profile("회원7")["height"] == 167
+    assert lazy.get_profile("없음") is None
+    assert list(lazy.store._cache) == ["회원7"]
+
+    writer.update_profile("회원7", {"height": 200, "gender": "여성"})
+    assert lazy.get_profile("회원7")["height"] == 200
+    assert lazy.delete_profile("회원0")
+    assert len(writer.list_profiles()) == 29
+    assert lazy.profiles == writer.profiles
+
+
+def test_lazy_store_rebuilds_stale_index(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    profiles = {"가": {"memo": "한글 \"따옴표\" {}"}, "b": {"list": [1, 2]}, "다": {}}
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(profiles, f, ensure_ascii=False)  # 다른 도구가 쓴 파일 (색인 없음)
+
+    store = LazyJsonProfileStore(filename)
+    assert dict(store.items()) == profiles
+    assert os.path.exists(store.index_filename)
+    assert LazyJsonProfileStore(filename).get("다") == {}
+
+
+@pytest.mark.skipif(profile_store.fcntl is None, reason="fcntl 잠금 확인은 POSIX 전용")
+def test_lazy_store_rebuilds_index_under_write_lock(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    JsonProfileStore(filename).put("a", {"height": 170})
+    os.remove(f"{filename}.idx")
+    held = []
+
+    def scan(data):
+        # 색인을 다시 만드는 동안에는 다른 쓰기가 잠금 파일을 잡을 수 없어야 함
+        with open(f"{filename}.lock", 'a+b') as f:
+            try:
+                profile_store.fcntl.flock(f.fileno(), profile_store.fcntl.LOCK_EX | profile_store.fcntl.LOCK_NB)
+            except BlockingIOError:
+                held.append(True)
+            else:
+                profile_store.fcntl.flock(f.fileno(), profile_store.fcntl.LOCK_UN)
+                held.append(False)
+        return scan_offsets(data)
+
+    with mock.patch("profile_store.scan_offsets", side_effect=scan):
+        store = LazyJsonProfileStore(filename)
+    assert held == [True] and store.get("a") == {"height": 170}
+    with open(f"{filename}.idx", 'r', encoding='utf-8') as f:
+        assert tuple(json.load(f)["stamp"]) == store._stamp
+
+
+def test_print_profile_list_pages(tmp_path, capsys):
+    manager = ProfileManager(str(tmp_path / "profiles.json"), backend="lazy")
+    for i in range(5):
+        manager.add_profile(f"p{i}", {"age": 30})
+    manager.print_profile_list(page=2, page_size=2)
+    output = capsys.readouterr().out
+    assert "3. p2" in output and "4. p3" in output and "p4" not in output
+    assert "2/3 페이지 (전체 5명)" in output
+
+
+@pytest.mark.parametrize("backend", ["json", "lazy", "sqlite", "journal"])
+def test_page_is_read_with_one_get_many(tmp_path, backend, capsys):
+    filename = str(tmp_path / ("profiles.db" if backend == "sqlite" else "profiles.json"))
+    manager = ProfileManager(filename, backend=backend)
+    for i in range(7):
+        manager.add_profile(f"p{i}", {"age": 30 + i})
+    assert [n for n, _ in manager.store.get_many(["p5", "없음", "p1"])] == ["p5", "p1"]
+    assert manager.store.get_many([]) == []
+
+    with mock.patch.object(manager.store, "get", side_effect=AssertionError("페이지는 get_many로 읽어야 함")):
+        assert manager.print_profile_list(page=9, page_size=3) == (3, 3)  # 범위를 넘으면 마지막 페이지
+    output = capsys.readouterr().out
+    assert "7. p6" in output and "나이: 36세" in output and "p5" not in output
+    manager.close()
+
+
+def test_prompt_nickname_pages_with_n_and_p(tmp_path, capsys):
+    manager = ProfileManager(str(tmp_path / "profiles.json"))
+    for i in range(5):
+        manager.add_profile(f"p{i}", {"age": 30})
+
+    with mock.patch("builtins.input", side_effect=["n", "N", "p", "p3"]) as answers:
+        assert manager.prompt_nickname("별명", page_size=2) == "p3"
+    assert answers.call_count == 4
+    pages = [line for line in capsys.readouterr().out.splitlines() if "페이지 (전체" in line]
+    assert [line.split()[1] for line in pages] == ["1/3", "2/3", "3/3", "2/3"]
+    manager.add_profile("n", {"age": 40})
+    with mock.patch("builtins.input", side_effect=["n"]):
+        assert manager.prompt_nickname("별명", page_size=2) == "n"  # 같은 이름의 프로필이 있으면 별명
+
+
+def _record(i, **changes):
+    return {"height": 160 + i, "weight": 55.5 + i, "gender": "여성", "memo": f"회원 {i} \"메모\"",
+            "created_at": f"2024-01-{i + 1:02d}T09:00:00", "updated_at": f"2024-01-{i + 1:02d}T09:00:00", **changes}
+
+
+def test_sqlite_store_round_trip(tmp_path):
+    filename = str(tmp_path / "profiles.db")
+    store = SQLiteProfileStore(filename)
+    store.put_many([(f"회원{i}", _record(i)) for i in range(5)])
+    store.put("회원2", _record(2, height=190))  # 수정해도 목록 순서는 그대로
+    assert store.delete("회원0") and not store.delete("회원0")
+    assert store.keys() == ["회원1", "회원2", "회원3", "회원4"]
+    assert store.get("회원2") == _record(2, height=190) and store.get("없음") is None
+    assert "회원3" in store and "회원0" not in store and len(store) == 4
+    store.close()
+
+    reopened = open_profile_store(filename, backend="sqlite")
+    assert dict(reopened.items()) == {f"회원{i}": _record(i, height=190 if i == 2 else 160 + i) for i in range(1, 5)}
+    created_at = reopened.conn.execute("SELECT created_at FROM profiles WHERE nickname = '회원4'").fetchone()[0]
+    assert created_at == "2024-01-05T09:00:00"
+    reopened.close()
+    with pytest.raises(ValueError):
+        open_profile_store(filename, backend="csv")
+
+
+def test_migrate_json_to_sqlite(tmp_path):
+    json_filename = str(tmp_path / "profiles.json")
+    sqlite_filename = str(tmp_path / "profiles.db")
+    manager = ProfileManager(json_filename)
+    for i in range(20):
+        manager.add_profile(f"회원{i}", {"height": 150 + i, "gender": "남성"})
+
+    assert migrate_json_to_sqlite(json_filename, sqlite_filename) == 20
+    migrated = ProfileManager(sqlite_filename, backend="sqlite")
+    assert migrated.list_profiles() == manager.list_profiles()
+    assert {n: migrated.get_profile(n) for n in migrated.list_profiles()} == manager.profiles
+
+    # 다시 이전하면 같은 별명은 덮어쓰고 SQLite에만 있는 프로필은 유지
+    manager.update_profile("회원3", {"height": 199, "gender": "남성"})
+    migrated.add_profile("sqlite만", {"height": 170})
+    assert migrate_json_to_sqlite(json_filename, sqlite_filename) == 20
+    reopened = SQLiteProfileStore(sqlite_filename)
+    assert reopened.get("회원3")["height"] == 199 and "sqlite만" in reopened and len(reopened) == 21
+    reopened.close()
+    migrated.store.close()
+
+
+def test_journal_replays_and_drops_torn_line(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    store = JournalProfileStore(filename)
+    for i in range(5):
+        store.put(f"회원{i}", _record(i))
+    store.put("회원1", _record(1, height=200))
+    assert store.delete("회원4") and not store.delete("없음")
+    store.close()
+    expected = {f"회원{i}": _record(i, height=200 if i == 1 else 160 + i) for i in range(4)}
+
+    # 쓰는 도중 종료되어 마지막 줄이 잘린 저널
+    with open(store.journal_filename, 'a', encoding='utf-8') as f:
+        f.write('{"op": "put", "nickname": "잘린", "rec')
+    size = os.path.getsize(store.journal_filename)
+    reopened = JournalProfileStore(filename)
+    assert dict(reopened.items()) == expected and "잘린" not in reopened
+    assert os.path.getsize(store.journal_filename) < size  # 잘린 줄은 파일에서도 제거
+    reopened.put("회원9", _record(9))
+    reopened.close()
+    assert JournalProfileStore(filename).get("회원9") == _record(9)
+
+
+def test_journal_recovers_interrupted_compaction(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    JsonProfileStore(filename).put("스냅샷", _record(0))
+
+    # 합치는 중(.compacting)에 종료: 이전 저널과 그 뒤 새 저널이 모두 남아 있음
+    with open(f"{filename}.journal.compacting", 'w', encoding='utf-8') as f:
+        for entry in ({"op": "put", "nickname": "a", "record": _record(1)},
+                      {"op": "put", "nickname": "b", "record": _record(2)},
+                      {"op": "delete", "nickname": "스냅샷"}):
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    with open(f"{filename}.journal", 'w', encoding='utf-8') as f:
+        f.write(json.dumps({"op": "put", "nickname": "a", "record": _record(1, height=181)}, ensure_ascii=False) + "\n")
+        f.write('{"op": "delete", "nick')  # 새 저널의 잘린 줄
+
+    store = JournalProfileStore(filename)
+    expected = {"a": _record(1, height=181), "b": _record(2)}
+    assert dict(store.items()) == expected
+    assert not os.path.exists(f"{filename}.journal.compacting")
+    store.close()
+    with open(filename, 'r', encoding='utf-8') as f:
+        assert json.load(f) == expected  # 복구 시 스냅샷을 다시 만듦
+    assert JsonProfileStore(filename).profiles == expected
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_journal_background_compaction(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    store = JournalProfileStore(filename, compact_threshold=2048)
+    for i in range(200):
+        store.put(f"회원{i % 40}", _record(i % 40, weight=50 + i))
+    store.delete("회원0")
+    store.compact()
+    assert os.path.getsize(store.journal_filename) == 0
+    assert not os.path.exists(store.compacting_filename)
+    expected = dict(store.items())
+    store.close()
+
+    assert len(expected) == 39 and expected["회원39"]["weight"] == 50 + 199
+    assert JsonProfileStore(filename).profiles == expected  # 스냅샷만으로도 최신 상태
+    assert dict(JournalProfileStore(filename).items()) == expected
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_journal_keeps_entries_when_compaction_fails(tmp_path):
+    filename = str(tmp_path / "profiles.json")
+    store = JournalProfileStore(filename)
+    store.put("a", _record(1))
+    with mock.patch.object(store, "_write_snapshot", side_effect=OSError("disk full")):
+        store.compact()  # 실패는 스레드 안에서 출력만 하고 .compacting을 남김
+        assert os.path.exists(store.compacting_filename)
+        store.put("b", _record(2))
+        store.delete("a")
+        store.compact()  # 남은 .compacting 뒤에 이어 붙인 뒤 다시 실패
+    expected = {"b": _record(2)}
+    assert os.path.getsize(store.journal_filename) == 0 and dict(store.items()) == expected
+    store.close()
+
+    # 다시 열면 남은 .compacting을 재생해 복구하고 스냅샷을 만듦
+    reopened = JournalProfileStore(filename)
+    assert dict(reopened.items()) == expected and not os.path.exists(reopened.compacting_filename)
+    reopened.close()
+    assert JsonProfileStore(filename).profiles == expected
+
+    # 실패 후 같은 프로세스에서 다시 합치기에 성공해도 정리됨
+    store = JournalProfileStore(filename)
+    with mock.patch.object(store, "_write_snapshot", side_effect=OSError("disk full")):
+        store.put("c", _record(3))
+        store.compact()
+    store.compact()
+    assert not os.path.exists(store.compacting_filename)
+    store.close()
+    assert JsonProfileStore(filename).profiles == {"b": _record(2), "c": _record(3)}
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "profiles.json")
+        print(f"🧪 {WORKERS}개 프로세스 × 프로필 {PROFILES_PER_WORKER}개 동시 쓰기...")
+        exit_codes = run_concurrent_writers(filename)
+        check_store(filename)
+        print(f"✅ 종료 코드 {exit_codes}, 변경 누락 없음")
+
+    for test in (test_sqlite_store_round_trip, test_migrate_json_to_sqlite, test_journal_replays_and_drops_torn_line,
+                 test_journal_recovers_interrupted_compaction, test_journal_background_compaction,
+                 test_journal_keeps_entries_when_compaction_fails):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("✅ SQLite 저장소/이전, 저널 재생/복구/합치기 통과")
@@ -0,0 +1,210 @@
+"""
+신체 측정 기록 저장소 / 추세 그래프 다운샘플링 테스트
+실행: python -m pytest test_progress_store.py  또는  python test_progress_store.py
+"""
+
+import math
+import os
+import sys
+import io
+import tempfile
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fitness_plan_demo import ProfileManager, UserProfile
+from progress_charts import lttb, progress_chart, progress_series
+from progress_store import ProgressStore
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def _daily_store(days=120):
+    """2024-01-01부터 매일 체중 0.1kg 감소, 일요일마다 체지방률 측정"""
+    store = ProgressStore()
+    start = date(2024, 1, 1)  # 월요일
+    for i in range(days):
+        day = start + timedelta(days=i)
+        store.add("kim", day, weight=80 - i * 0.1,
+                  body_fat_percentage=25 - i * 0.02 if day.weekday() == 6 else None)
+    return store
+
+
+def test_range_aggregate_and_trend():
+    series = _daily_store().series("kim")
+    assert len(series) == 120
+
+    january = series.range("2024-01-01", "2024-01-31")
+    assert len(january["time"]) == 31
+    assert math.isnan(january["body_fat_percentage"][0])
+
+    weeks = series.aggregate("weight", "week")
+    assert weeks[0]["period"] == date(2024, 1, 1) and weeks[0]["count"] == 7
+    assert weeks[0]["mean"] == 79.7 and weeks[0]["max"] == 80.0
+    months = series.aggregate("weight", "month")
+    assert [m["count"] for m in months] == [31, 29, 31, 29]
+    assert len(series.aggregate("body_fat_percentage", "week")) == 17
+
+    assert series.trend("weight") == -0.7
+    assert series.trend("weight", "2024-02-01", "2024-02-01") is None
+
+
+def test_out_of_order_and_sparse_fields():
+    store = _daily_store(10)
+    store.add("kim", "2023-12-31 08:00:00", weight=81, waist=90)
+    series = store.series("kim")
+    assert series.range(end="2023-12-31 23:59:59")["weight"].tolist() == [81]
+    assert series.latest()["waist"] == 90
+    assert series.latest()["weight"] == 79.1
+    # 범위 조회 결과를 들고 있어도 계속 추가할 수 있음
+    held = series.range()
+    store.add("kim", "2024-01-11", weight=79)
+    assert len(held["weight"]) == 11 and len(series) == 12
+
+
+def test_user_profile_from_latest_point(tmp_path):
+    filename = str(tmp_path / "progress.npz")
+    store = _daily_store()
+    store.filename = filename
+    store.save()
+
+    series = ProgressStore(filename).series("kim")
+    assert series.aggregate("weight", "month") == store.series("kim").aggregate("weight", "month")
+    user = UserProfile.from_progress({"height": 175, "weight": 90, "age": 30, "gender": "남성"}, series)
+    assert user.weight == 68.1
+    assert user.body_fat_percentage == 22.64
+    assert user.skeletal_muscle_mass == round(68.1 * 0.45, 1)
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    filename = tmp_path / "progress.npz"
+    store = _daily_store(10)
+    store.filename = str(filename)
+    store.save()
+    data = filename.read_bytes()
+
+    filename.write_bytes(data[:len(data) // 2])  # 쓰다 끊긴 파일
+    assert len(ProgressStore(str(filename))) == 0
+    filename.write_bytes(b"not a zip file")
+    assert len(ProgressStore(str(filename))) == 0
+    filename.write_bytes(b"")
+    assert len(ProgressStore(str(filename))) == 0
+
+
+def test_concurrent_add_and_save(tmp_path):
+    filename = str(tmp_path / "progress.npz")
+    store = ProgressStore(filename)
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(200):
+                store.add(f"user{n % 2}", date(2024, 1, 1) + timedelta(days=i), weight=70 + n + i * 0.01)
+                if i % 20 == 0:
+                    store.save()
+        except Exception as e:  # 스레드 안의 예외(BufferError 등)는 모아서 확인
+            errors.append(e)
+
+    def reader():
+        try:
+            for _ in range(200):
+                series = store.series("user0")
+                if series is not None:
+                    series.latest()
+                    series.aggregate("weight", "week")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)] + [threading.Thread(target=reader)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.save()
+
+    assert errors == []
+    assert sorted(os.listdir(tmp_path)) == ["progress.npz", "progress.npz.lock"]  # 임시 파일이 남지 않음
+    loaded = ProgressStore(filename)
+    assert len(loaded.series("user0")) == len(loaded.series("user1")) == 400
+    assert loaded.series("user1").range()["weight"].tolist() == store.series("user1").range()["weight"].tolist()
+
+
+def test_profile_manager_records_measurements(tmp_path):
+    progress = ProgressStore(str(tmp_path / "progress.npz"))
+    manager = ProfileManager(str(tmp_path / "profiles.json"), progress_store=progress)
+    profile = {"height": 175, "weight": 80, "age": 30, "gender": "남성", "body_fat_percentage": 22.5,
+               "skeletal_muscle_mass": None, "goal": "체중 감량"}
+    assert manager.add_profile("kim", profile)
+    assert manager.update_profile("kim", {**profile, "weight": 79.5})
+    assert manager.add_profile("lee", {**profile, "weight": 60})
+    assert not (tmp_path / "progress.npz").exists() and progress.dirty  # 프로필 저장마다 파일을 다시 쓰지 않음
+    manager.save_progress()
+
+    series = ProgressStore(str(tmp_path / "progress.npz")).series("kim")
+    assert len(series) == 2
+    assert series.range()["weight"].tolist() == [80, 79.5]
+    assert set(series.columns) == {"weight", "body_fat_percentage"}  # 값이 없는 항목은 기록하지 않음
+    assert ProfileManager(str(tmp_path / "other.json")).progress_store is None
+
+    # 프로필을 삭제하면 측정 기록도 삭제 (close()에서 저장)
+    assert manager.delete_profile("kim") and "kim" not in progress
+    manager.close()
+    assert ProgressStore(str(tmp_path / "progress.npz")).nicknames() == ["lee"]
+
+
+def test_saves_from_two_stores_merge(tmp_path):
+    # CLI와 웹 앱처럼 같은 파일을 여는 두 저장소: 나중에 저장해도 먼저 저장한 기록을 덮어쓰지 않음
+    filename = str(tmp_path / "progress.npz")
+    first = ProgressStore(filename)
+    first.add("kim", "2024-01-01", weight=80)
+    first.add("park", "2024-01-01", weight=90)
+    first.save()
+    second = ProgressStore(filename)
+
+    first.add("kim", "2024-01-02", weight=79.8)
+    first.save()
+    second.add("kim", "2024-01-03", weight=79.5)
+    second.add("lee", "2024-01-03", weight=60)
+    second.remove("park")
+    second.save()
+    first.add("kim", "2024-01-04", weight=79.1)
+    first.save()
+
+    loaded = ProgressStore(filename)
+    assert sorted(loaded.nicknames()) == ["kim", "lee"]
+    assert loaded.series("kim").range()["weight"].tolist() == pytest.approx([80, 79.8, 79.5, 79.1])
+    # 저장하면서 다른 저장소의 기록(lee 추가, park 삭제)도 메모리에 반영
+    assert sorted(first.nicknames()) == ["kim", "lee"] and not first.dirty
+    assert first.series("kim").range()["weight"].tolist() == loaded.series("kim").range()["weight"].tolist()
+
+
+def test_lttb_keeps_shape_within_point_budget():
+    x = np.arange(10000)
+    y = np.sin(x / 500.0)
+    y[5000] = 5  # 튀는 값은 줄여도 남아야 함
+    keep = lttb(x, y, 100)
+    assert len(keep) == 100 and keep[0] == 0 and keep[-1] == 9999
+    assert np.all(np.diff(keep) > 0) and 5000 in keep
+    assert len(lttb(x[:50], y[:50], 100)) == 50
+
+    series = _daily_store(1000).series("kim")
+    times, values = progress_series(series, "weight", days=31)
+    assert len(values) == 32
+    fig = progress_chart("남성", "weight", *progress_series(series, "weight"), max_points=200, height_cm=175)
+    assert len(fig.data[0].x) == 200
+
+
+if __name__ == "__main__":
+    test_range_aggregate_and_trend()
+    test_out_of_order_and_sparse_fields()
+    for test in (test_user_profile_from_latest_point, test_corrupt_file_starts_empty,
+                 test_concurrent_add_and_save, test_profile_manager_records_measurements,
+                 test_saves_from_two_stores_merge):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    test_lttb_keeps_shape_within_point_budget()
+    print("✅ 측정 기록 저장소 테스트 통과")
@@ -0,0 +1,158 @@
+"""
+운동 기록 저장소 테스트 (추가할 때 갱신한 요약 = 전체 기록을 다시 계산한 값)
+실행: python -m pytest test_workout_log.py  또는  python test_workout_log.py
+"""
+
+import os
+import random
+import sys
+import io
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from fitness_plan_demo import FitnessPlanGenerator, UserProfile
+from one_rep_max import check_formula, estimate_1rm
+from workout_log import WorkoutLogStore, exercise_key, week_start
+
+if sys.platform == "win32" and __name__ == "__main__":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+EXERCISES = ("바벨 스쿼트", "벤치 프레스", "덤벨 컬", "푸시업")
+
+
+def _random_store(entries=600, seed=7):
+    """2024-01-01부터 하루 0-3건, 무게는 점점 늘어나며 가끔 떨어짐 (푸시업은 맨몸)"""
+    rng = random.Random(seed)
+    store = WorkoutLogStore()
+    time = datetime(2024, 1, 1, 7)
+    for _ in range(entries):
+        time += timedelta(hours=rng.choice((0, 0, 8, 24, 48)))
+        name = rng.choice(EXERCISES)
+        load = 0.0 if name == "푸시업" else round(rng.uniform(20, 60) + time.toordinal() % 200 * 0.2, 1)
+        store.add("kim", time, name, rng.randint(1, 5), rng.randint(1, 15), load)
+    return store
+
+
+def _rescan(store, nickname, window_days=28):
+    """range()로 전체 기록을 다시 읽어 요약 계산"""
+    columns = store.log(nickname).range()
+    seconds = columns["time"].astype(np.int64)
+    e1rm = estimate_1rm(columns["load"], columns["reps"])  # 맨몸(0kg)은 0
+    volume = {}
+    for second, sets, reps, load in zip(seconds.tolist(), columns["sets"].tolist(),
+                                        columns["reps"].tolist(), columns["load"].tolist()):
+        week = week_start(second)
+        volume[week] = volume.get(week, 0.0) + sets * reps * load
+    best, rolling = {}, {}
+    recent = seconds >= seconds[-1] - window_days * 86400
+    for exercise in set(columns["exercise"].tolist()):
+        mine = columns["exercise"] == exercise
+        best[exercise] = e1rm[mine].max()
+        rolling[exercise] = e1rm[mine & recent].max() if (mine & recent).any() else None
+    return volume, best, rolling
+
+
+def test_online_summary_matches_rescan():
+    store = _random_store()
+    log = store.log("kim")
+    volume, best, rolling = _rescan(store, "kim")
+
+    assert log.weekly_volume.keys() == volume.keys()
+    for week, total in volume.items():
+        assert log.weekly_volume[week] == pytest.approx(total)
+    for exercise, value in best.items():
+        assert log.best_e1rm.get(exercise, (0.0,))[0] == pytest.approx(value)  # 맨몸은 최고 기록 없음
+        assert log.rolling_e1rm(exercise) == pytest.approx(rolling[exercise])
+    assert sorted(store.exercise_names) == sorted(EXERCISES)
+    assert exercise_key("트라이셉스 푸시다운") == "케이블 푸시다운"
+
+
+def test_personal_records_and_append_only():
+    store = WorkoutLogStore()
+    assert store.add("kim", "2024-03-04", "벤치 프레스", 3, 8, 60) == []  # 첫 기록은 기록 갱신 아님
+    assert store.add("kim", "2024-03-06", "벤치 프레스", 3, 5, 62.5) == ["load"]  # 더 무겁지만 추정 1RM은 낮음
+    assert store.add("kim", "2024-03-08", "벤치 프레스", 3, 8, 62.5) == ["e1rm"]
+    assert store.add("kim", "2024-03-11", "벤치 프레스", 1, 1, 80) == ["e1rm", "load"]
+    assert store.add("kim", "2024-03-11 18:00", "푸시업", 3, 20) == []
+
+    summary = store.summary("kim", "벤치 프레스")
+    assert summary["entries"] == 5
+    assert summary["best_e1rm"] == summary["best_load"] == summary["rolling_e1rm"] == 80
+    assert summary["week_volume"] == 80  # 3월 11일 주: 80kg × 1 + 맨몸 0
+    assert [r["kind"] for r in summary["records"]] == ["load", "e1rm", "e1rm", "load"]
+    assert store.log("kim").week_volume(date(2024, 3, 4)) == 3 * 8 * 60 + 3 * 5 * 62.5 + 3 * 8 * 62.5
+
+    with pytest.raises(ValueError):
+        store.add("kim", "2024-03-10", "벤치 프레스", 3, 8, 60)
+    with pytest.raises(ValueError):
+        WorkoutLogStore(formula="lander")
+    assert len(store.log("kim")) == 5
+
+
+def test_rolling_window_drops_old_entries():
+    store = WorkoutLogStore(window_days=7)
+    store.add("kim", "2024-01-01", "데드리프트", 1, 1, 140)
+    store.add("kim", "2024-01-05", "데드리프트", 3, 5, 100)
+    log = store.log("kim")
+    exercise = store.exercise_id("데드리프트")
+    assert log.rolling_e1rm(exercise) == 140
+    store.add("kim", "2024-01-10", "벤치 프레스", 3, 5, 60)  # 다른 운동 기록으로 시간이 지나도 반영
+    assert log.rolling_e1rm(exercise) == pytest.approx(100 * (1 + 5 / 30))
+    store.add("kim", "2024-01-20", "벤치 프레스", 3, 5, 60)
+    assert log.rolling_e1rm(exercise) is None
+    assert log.best_e1rm[exercise][0] == 140
+
+
+def test_planned_exercise_and_save_load(tmp_path):
+    planner = FitnessPlanGenerator(UserProfile(175, 80, 30, "남성"), "근육 증가", "헬스장", 4, 60)
+    plan = planner.generate_weekly_plan(with_loads=True)
+    exercise = next(e for day in plan["주간_계획"] for e in day["운동"] if "무게" in e)
+    store = _random_store(200)
+    store.add_planned("lee", "2024-02-01", exercise, load=exercise["무게"]["초급"])
+    last = store.log("lee").range()
+    assert last["sets"][0] == exercise["세트"] and last["reps"][0] > 0 and last["load"][0] == np.float32(exercise["무게"]["초급"])
+
+    filename = str(tmp_path / "workouts.npz")
+    store.filename = filename
+    store.save()
+    loaded = WorkoutLogStore(filename)
+    assert loaded.nicknames() == ["kim", "lee"] and loaded.exercise_names == store.exercise_names
+    assert loaded.summary("kim", "벤치 프레스") == store.summary("kim", "벤치 프레스")
+    assert loaded.log("kim").weekly_volume == store.log("kim").weekly_volume
+    assert loaded.remove("lee") and not loaded.remove("lee") and "lee" not in loaded
+
+
+def test_corrupt_file_and_failed_save(tmp_path):
+    filename = tmp_path / "workouts.npz"
+    store = _random_store(50)
+    store.filename = str(filename)
+    with mock.patch("os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            store.save()
+    assert store._dirty and os.listdir(tmp_path) == []  # 임시 파일도 남지 않음
+    store.save()
+    assert os.listdir(tmp_path) == ["workouts.npz"] and len(WorkoutLogStore(str(filename))) == 1
+
+    data = filename.read_bytes()
+    for corrupt in (data[:len(data) // 2], b"not a zip file", b""):  # 쓰다 끊긴 파일, 다른 형식, 빈 파일
+        filename.write_bytes(corrupt)
+        assert len(WorkoutLogStore(str(filename))) == 0
+
+    assert check_formula("brzycki") == "brzycki"
+    with pytest.raises(ValueError):
+        WorkoutLogStore(formula="lombardi")
+
+
+if __name__ == "__main__":
+    test_online_summary_matches_rescan()
+    test_personal_records_and_append_only()
+    test_rolling_window_drops_old_entries()
+    for test in (test_planned_exercise_and_save_load, test_corrupt_file_and_failed_save):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(Path(tmp))
+    print("✅ 운동 기록 저장소 테스트 통과")
@@ -0,0 +1,313 @@
+"""
+FitPlan AI - 운동 기록 저장소
+플랜대로 실제로 한 운동(시각, 운동, 세트, 반복, 무게)을 프로필별로 시간순 열(column) 배열에 추가만 합니다.
+추가할 때 운동별 최고 추정 1RM/최고 무게(개인 기록 감지), 최근 기간 추정 1RM(슬라이딩 윈도 최대),
+주간 볼륨(세트 × 반복 × 무게)을 함께 갱신하므로 대시보드는 기록 전체를 다시 훑지 않고 요약을 O(1)로 읽습니다.
+"""
+
+import io
+import os
+import tempfile
+import zipfile
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import date
+
+import numpy as np
+
+from load_tables import CATALOG_NAMES, load_id
+from one_rep_max import MAX_REPS, PERCENT_OF_1RM, check_formula
+from plan_numbers import parse_exercise
+from progress_store import from_seconds, to_seconds
+
+WORKOUT_LOG_FILE = "workouts.npz"
+
+ROLLING_WINDOW_DAYS = 28  # 최근 추정 1RM 기간
+
+_SECONDS_PER_DAY = 86400
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_PERCENTS = {formula: table.tolist() for formula, table in PERCENT_OF_1RM.items()}
+
+
+def exercise_key(name):
+    """기록용 운동 이름 (무게 카탈로그에 있으면 카탈로그 이름으로 통일 - "트라이셉스 푸시다운" → "케이블 푸시다운")"""
+    catalog_id = load_id(name)
+    return name.strip() if catalog_id is None else CATALOG_NAMES[catalog_id]
+
+
+def week_start(seconds):
+    """저장용 초 → 그 주 월요일 (date)"""
+    day_number = seconds // _SECONDS_PER_DAY
+    # 1970-01-01은 목요일이므로 3일을 더해 월요일 기준 주로 맞춤
+    return date.fromordinal(_EPOCH_ORDINAL + day_number - (day_number + 3) % 7)
+
+
+class WorkoutLog:
+    """한 프로필의 운동 기록 (시간순 추가만 가능)
+
+    exercise 열은 WorkoutLogStore의 운동 이름 번호입니다. 무게 0은 맨몸 운동입니다.
+    """
+
+    def __init__(self, formula="epley", window_days=ROLLING_WINDOW_DAYS):
+        check_formula(formula)
+        self.percents = _PERCENTS[formula]
+        self.window = window_days * _SECONDS_PER_DAY
+        self.times = array('q')
+        self.exercises = array('i')
+        self.sets = array('h')
+        self.reps = array('h')
+        self.loads = array('f')
+        # 추가할 때 갱신하는 요약
+        self.best_e1rm = {}          # 운동 번호 → (추정 1RM, 시각)
+        self.best_load = {}          # 운동 번호 → (무게, 시각)
+        self.weekly_volume = {}      # 주 시작 date → 세트 × 반복 × 무게 합계 (kg)
+        self.records = []            # [(시각, 운동 번호, 종류, 값), ...] 개인 기록 갱신 순서
+        self.last_week = None        # 마지막 기록의 주 시작 date
+        self._recent = {}            # 운동 번호 → deque[(시각, 추정 1RM)] (추정 1RM 내림차순)
+
+    def __len__(self):
+        return len(self.times)
+
+    def estimate(self, load, reps):
+        """무게 × 반복 → 추정 1RM (반복 0회 또는 맨몸이면 0)"""
+        if reps <= 0 or load <= 0:
+            return 0.0
+        return load / self.percents[min(reps, MAX_REPS)]
+
+    def append(self, time, exercise, sets, reps, load):
+        """기록 한 건 추가 (마지막 기록 이전 시각이면 ValueError)
+
+        Returns:
+            이번 기록으로 갱신된 개인 기록 종류 목록 (예: ["e1rm", "load"], 첫 기록은 기록 갱신으로 보지 않음)
+        """
+        seconds = to_seconds(time)
+        if self.times and seconds < self.times[-1]:
+            raise ValueError(f"운동 기록은 시간순으로만 추가할 수 있습니다 (마지막 기록: {from_seconds(self.times[-1])})")
+        if sets < 1 or reps < 0 or load < 0:
+            raise ValueError(f"잘못된 기록: {sets}세트 × {reps}회 × {load}kg")
+        self.times.append(seconds)
+        self.exercises.append(exercise)
+        self.sets.append(sets)
+        self.reps.append(reps)
+        self.loads.append(load)
+        load = self.loads[-1]  # float32로 저장된 값 기준으로 집계 (불러온 뒤에도 같은 결과)
+
+        week = self.last_week = week_start(seconds)
+        self.weekly_volume[week] = self.weekly_volume.get(week, 0.0) + sets * reps * load
+
+        e1rm = self.estimate(load, reps)
+        recent = self._recent.setdefault(exercise, deque())
+        while recent and recent[-1][1] <= e1rm:
+            recent.pop()
+        recent.append((seconds, e1rm))
+
+        improved = []
+        for kind, best, value in (("e1rm", self.best_e1rm, e1rm), ("load", self.best_load, load)):
+            if value <= 0:
+                continue
+            previous = best.get(exercise)
+            if previous is None or value > previous[0]:
+                best[exercise] = (value, seconds)
+                if previous is not None:
+                    improved.append(kind)
+                    self.records.append((seconds, exercise, kind, value))
+        return improved
+
+    def rolling_e1rm(self, exercise):
+        """마지막 기록 시각 기준 최근 기간(window_days)의 최고 추정 1RM (기록이 없으면 None)"""
+        recent = self._recent.get(exercise)
+        if not recent:
+            return None
+        # 시간순 추가만 하므로 오래된 항목은 앞에서 버리면 되고, 버린 항목은 다시 필요하지 않음
+        oldest = self.times[-1] - self.window
+        while recent and recent[0][0] < oldest:
+            recent.popleft()
+        return recent[0][1] if recent else None
+
+    def week_volume(self, day=None):
+        """day가 속한 주의 볼륨 (kg, 생략하면 마지막 기록의 주)"""
+        week = self.last_week if day is None else week_start(to_seconds(day))
+        return self.weekly_volume.get(week, 0.0)
+
+    def range(self, start=None, end=None):
+        """시각 범위의 기록 (범위만 복사한 NumPy 배열)
+
+        Returns:
+            {"time": datetime64[s], "exercise": int32, "sets": int16, "reps": int16, "load": float32}
+        """
+        low = 0 if start is None else bisect_left(self.times, to_seconds(start))
+        high = len(self.times) if end is None else bisect_right(self.times, to_seconds(end))
+        return {
+            "time": np.frombuffer(self.times, dtype=np.int64)[low:high].astype("datetime64[s]"),
+            "exercise": np.frombuffer(self.exercises, dtype=np.int32)[low:high].copy(),
+            "sets": np.frombuffer(self.sets, dtype=np.int16)[low:high].copy(),
+            "reps": np.frombuffer(self.reps, dtype=np.int16)[low:high].copy(),
+            "load": np.frombuffer(self.loads, dtype=np.float32)[low:high].copy(),
+        }
+
+
+class WorkoutLogStore:
+    """프로필 별명 → WorkoutLog (운동 이름 번호는 모든 프로필이 공유)
+
+    filename을 지정하면 생성 시 파일에서 불러오고(요약은 기록을 다시 추가하며 계산), save() 호출 시 저장합니다.
+    파일은 모든 프로필의 열을 이어 붙인 NumPy .npz 형식입니다 (임시 파일에 쓴 뒤 교체).
+    """
+
+    VERSION = 1
+
+    def __init__(self, filename=None, formula="epley", window_days=ROLLING_WINDOW_DAYS):
+        check_formula(formula)
+        self.filename = filename
+        self.formula = formula
+        self.window_days = window_days
+        self.exercise_names = []
+        self._exercise_ids = {}
+        self._logs = {}
+        self._dirty = False
+        if filename:
+            self.load()
+
+    def __len__(self):
+        return len(self._logs)
+
+    def __contains__(self, nickname):
+        return nickname in self._logs
+
+    def nicknames(self):
+        return list(self._logs)
+
+    def log(self, nickname):
+        """프로필의 운동 기록 (없으면 None)"""
+        return self._logs.get(nickname)
+
+    def exercise_id(self, name, create=False):
+        """운동 이름 → 번호 (exercise_key로 통일, 처음 보는 이름은 create=True일 때만 추가, 아니면 None)"""
+        key = exercise_key(name)
+        exercise = self._exercise_ids.get(key)
+        if exercise is None and create:
+            exercise = self._exercise_ids[key] = len(self.exercise_names)
+            self.exercise_names.append(key)
+        return exercise
+
+    def add(self, nickname, time, exercise, sets, reps, load=0.0):
+        """운동 한 건 기록 (exercise는 운동 이름), 갱신된 개인 기록 종류 목록 반환"""
+        log = self._logs.get(nickname)
+        if log is None:
+            log = self._logs[nickname] = WorkoutLog(self.formula, self.window_days)
+        improved = log.append(time, self.exercise_id(exercise, create=True), sets, reps, load)
+        self._dirty = True
+        return improved
+
+    def add_planned(self, nickname, time, exercise, load=0.0, reps=None, sets=None):
+        """generate_weekly_plan()의 운동 dict 기준으로 기록 (세트/반복 생략 시 처방의 세트 수/최대 반복)"""
+        numbers = parse_exercise(exercise)
+        return self.add(
+            nickname, time, exercise["이름"],
+            (numbers.sets or 1) if sets is None else sets,
+            numbers.reps_max if reps is None else reps,
+            load,
+        )
+
+    def summary(self, nickname, exercise=None):
+        """대시보드 요약 (추가할 때 갱신한 값만 읽음)
+
+        Returns:
+            {"entries", "last_time", "week_volume", "records"(최근 5건)} + exercise를 주면
+            {"best_e1rm", "best_load", "rolling_e1rm"} (값은 소수점 첫째 자리, 기록이 없으면 None)
+        """
+        log = self._logs.get(nickname)
+        if log is None:
+            return None
+        result = {
+            "entries": len(log),
+            "last_time": from_seconds(log.times[-1]) if len(log) else None,
+            "week_volume": round(log.week_volume(), 1),
+            "records": [
+                {"time": from_seconds(seconds), "exercise": self.exercise_names[exercise_id], "kind": kind,
+                 "value": round(value, 1)}
+                for seconds, exercise_id, kind, value in reversed(log.records[-5:])
+            ],
+        }
+        if exercise is not None:
+            exercise_id = self.exercise_id(exercise)
+            best_e1rm = log.best_e1rm.get(exercise_id)
+            best_load = log.best_load.get(exercise_id)
+            rolling = log.rolling_e1rm(exercise_id)
+            result["best_e1rm"] = round(best_e1rm[0], 1) if best_e1rm else None
+            result["best_load"] = round(best_load[0], 1) if best_load else None
+            result["rolling_e1rm"] = round(rolling, 1) if rolling else None
+        return result
+
+    def remove(self, nickname):
+        """프로필의 운동 기록 전체 삭제"""
+        if self._logs.pop(nickname, None) is None:
+            return False
+        self._dirty = True
+        return True
+
+    def load(self):
+        """파일에서 불러오기 (파일이 없거나 손상되었으면 빈 저장소로 시작)"""
+        if not self.filename or not os.path.exists(self.filename):
+            return
+        try:
+            with np.load(self.filename, allow_pickle=False) as data:
+                if int(data["version"]) != self.VERSION:
+                    return
+                nicknames = data["nicknames"].tolist()
+                exercise_names = data["exercise_names"].tolist()
+                bounds = np.r_[0, np.cumsum(data["counts"])]
+                columns = [data[name].tolist() for name in ("times", "exercises", "sets", "reps", "loads")]
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            print(f"⚠️  운동 기록 파일을 읽는 중 오류가 발생했습니다: {e}")
+            return
+
+        self.exercise_names = exercise_names
+        self._exercise_ids = {name: i for i, name in enumerate(exercise_names)}
+        self._logs = {}
+        for i, nickname in enumerate(nicknames):
+            log = self._logs[nickname] = WorkoutLog(self.formula, self.window_days)
+            for row in zip(*(column[bounds[i]:bounds[i + 1]] for column in columns)):
+                log.append(*row)
+        self._dirty = False
+
+    def save(self):
+        """변경 사항이 있으면 파일에 저장 (고유한 임시 파일에 쓴 뒤 교체, 실패하면 다음 호출에서 다시 시도)"""
+        if not self.filename or not self._dirty:
+            return
+        nicknames = list(self._logs)
+        logs = [self._logs[nickname] for nickname in nicknames]
+
+        def joined(column, dtype):
+            return np.concatenate([np.frombuffer(getattr(log, column), dtype=dtype) for log in logs] or [np.empty(0, dtype)])
+
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            version=np.array(self.VERSION),
+            nicknames=np.array(nicknames, dtype=str),
+            exercise_names=np.array(self.exercise_names, dtype=str),
+            counts=np.array([len(log) for log in logs], dtype=np.int64),
+            times=joined("times", np.int64),
+            exercises=joined("exercises", np.int32),
+            sets=joined("sets", np.int16),
+            reps=joined("reps", np.int16),
+            loads=joined("loads", np.float32),
+        )
+        directory, name = os.path.split(os.path.abspath(self.filename))
+        with tempfile.NamedTemporaryFile('wb', dir=directory, prefix=f"{name}.", suffix=".tmp", delete=False) as f:
+            tmp_filename = f.name
+            try:
+                f.write(buffer.getbuffer())
+                f.flush()
+                os.fsync(f.fileno())
+            except BaseException:
+                f.close()
+                os.remove(tmp_filename)
+                raise
+        try:
+            os.replace(tmp_filename, self.filename)
+        except OSError:
+            os.remove(tmp_filename)
+            raise
+        self._dirty = False